@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Agenda benchmark: a 14-day agenda over a replica of 10k open tasks.
+
+Builds a replica of tasks spread over 20 lists, with due dates and reminders
+up to a year either side of today and every tenth task recurring, and saves
+it to a temporary file. The agenda is then built from the saved file, once
+after rebuilding the time index from the task records (parsing every date,
+as a replica without a stored index would have to), and once straight from
+the stored index, which build_agenda() bisects.
+
+Usage:
+    python benchmarks/bench_agenda.py [--count 10000] [--days 14] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from todocli.utils.agenda import build_agenda  # noqa: E402
+from todocli.utils.datetime_util import datetime_to_api_timestamp  # noqa: E402
+from todocli.utils.replica import Replica  # noqa: E402
+
+WEEKLY = {
+    "pattern": {"type": "weekly", "interval": 1, "daysOfWeek": ["monday"]},
+    "range": {"type": "noEnd", "startDate": "2026-01-05"},
+}
+
+
+def replica(count, today):
+    r = Replica()
+    for i in range(count):
+        list_id = f"list-{i % 20}"
+        todo_list = r.lists.setdefault(
+            list_id, {"name": f"List {i % 20}", "delta_link": None, "tasks": {}}
+        )
+        day = today + timedelta(days=i % 730 - 365)
+        due = datetime.combine(day, datetime.min.time())
+        record = {
+            "id": f"task-{i}",
+            "title": f"Task number {i}",
+            "status": "notStarted",
+            "importance": "normal",
+            "dueDateTime": datetime_to_api_timestamp(due),
+        }
+        if i % 2 == 0:
+            record["isReminderOn"] = True
+            record["reminderDateTime"] = datetime_to_api_timestamp(
+                due + timedelta(hours=9)
+            )
+        if i % 10 == 0:
+            record["recurrence"] = WEEKLY
+        todo_list["tasks"][record["id"]] = record
+    return r
+
+
+def rebuild(path, days, today):
+    r = Replica.load(path)
+    r.rebuild_index()
+    buckets = build_agenda(r, days=days, today=today)
+    return sum(len(items) for items in buckets.values())
+
+
+def indexed(path, days, today):
+    buckets = build_agenda(Replica.load(path), days=days, today=today)
+    return sum(len(items) for items in buckets.values())
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    today = date.today()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "replica.json")
+        replica(args.count, today).save(path)
+        print(f"{args.count} tasks, {args.days}-day window, best of {args.repeat}")
+        print(f"{'method':<16} {'ms':>8} {'items':>8}")
+        for name, fn in (("rebuild index", rebuild), ("stored index", indexed)):
+            elapsed, items = best_of(args.repeat, lambda: fn(path, args.days, today))
+            print(f"{name:<16} {elapsed:>8.1f} {items:>8}")
+
+
+if __name__ == "__main__":
+    main()
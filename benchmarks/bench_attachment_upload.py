@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Upload session throughput benchmark against a local stand-in server.
+
+Starts an HTTP server on localhost that mimics the Graph createUploadSession
+and chunk PUT endpoints (optionally adding per-request latency), then uploads
+a file through wrapper._create_attachment_upload_session and reports MB/s.
+
+Usage:
+    python benchmarks/bench_attachment_upload.py [--size-mb 25] [--latency-ms 50]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import todocli.graphapi.wrapper as wrapper  # noqa: E402
+
+
+def make_handler(latency):
+    class StandInHandler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _reply(self, status, body=None, headers=None):
+            payload = json.dumps(body or {}).encode()
+            self.send_response(status)
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            host, port = self.server.server_address
+            self._reply(200, {"uploadUrl": f"http://{host}:{port}/upload"})
+
+        def do_PUT(self):
+            time.sleep(latency)
+            self.rfile.read(int(self.headers["Content-Length"]))
+            start_end, total = self.headers["Content-Range"][6:].split("/")
+            end = int(start_end.split("-")[1])
+            if end + 1 >= int(total):
+                self._reply(201, {"id": "att-bench"})
+            else:
+                self._reply(200, {"nextExpectedRanges": [f"{end + 1}-"]})
+
+    return StandInHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=float, default=25)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.latency_ms / 1000))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+
+    size = int(args.size_mb * 1024 * 1024)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "payload.bin")
+        with open(file_path, "wb") as f:
+            f.write(os.urandom(size))
+
+        chunks = []
+
+        def progress(sent, total, mb_per_s):
+            chunks.append((sent, mb_per_s))
+
+        with patch.object(wrapper, "BASE_URL", f"http://{host}:{port}"), patch.object(
+            wrapper, "UPLOAD_SESSIONS_FILE", os.path.join(tmp_dir, "sessions.json")
+        ), patch.object(wrapper, "get_oauth_session", requests.Session):
+            started = time.perf_counter()
+            att_id = wrapper._create_attachment_upload_session(
+                file_path, "payload.bin", size, "lid", "tid", progress=progress
+            )
+            elapsed = time.perf_counter() - started
+
+    server.shutdown()
+    print(f"attachment id:  {att_id}")
+    print(f"size:           {size / (1024 * 1024):.1f} MB")
+    print(f"latency/PUT:    {args.latency_ms:.0f} ms")
+    print(f"chunk PUTs:     {len(chunks)}")
+    print(f"elapsed:        {elapsed:.2f} s")
+    print(f"throughput:     {size / (1024 * 1024) / elapsed:.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+JSON codec benchmark on a 10k-task Graph payload.
+
+Decodes a {"value": [...]} page of synthetic tasks from bytes and encodes
+the resulting models for --json output, comparing the previous stdlib calls
+(json.loads(content.decode()) and json.dumps(to_dict(), indent=2)) with
+json_codec on each available backend, pretty and compact.
+
+Usage:
+    python benchmarks/bench_json.py [--count 10000] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from bench_models import task_payload  # noqa: E402
+
+from todocli.models.todotask import Task  # noqa: E402
+from todocli.utils import json_codec  # noqa: E402
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    content = json.dumps({"value": [task_payload(i) for i in range(args.count)]})
+    content = content.encode()
+    tasks = [Task(record) for record in json.loads(content)["value"]]
+    for task in tasks:
+        task.to_tuple()
+
+    print(
+        f"{args.count} tasks, {len(content) / 1e6:.1f} MB page, "
+        f"best of {args.repeat} (ms)"
+    )
+    print(f"{'':<16} {'decode':>8} {'encode':>8} {'compact':>8}")
+
+    def report(name, *fns):
+        cells = [
+            f"{best_of(args.repeat, fn):8.1f}" if fn else f"{'-':>8}" for fn in fns
+        ]
+        print(f"{name:<16} {' '.join(cells)}")
+
+    report(
+        "stdlib (before)",
+        lambda: json.loads(content.decode()),
+        lambda: json.dumps([t.to_dict() for t in tasks], indent=2),
+        None,
+    )
+    for name in json_codec.BACKENDS:
+        if name == "orjson" and json_codec.orjson is None:
+            continue
+        json_codec.set_backend(name)
+        report(
+            f"codec {name}",
+            lambda: json_codec.loads(content),
+            lambda: json_codec.dumps(tasks),
+            lambda: json_codec.dumps(tasks, compact=True),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Model construction benchmark: lazy field decoding against eager decoding.
+
+Builds Task, ChecklistItem and TodoList objects from synthetic Graph
+payloads and times construction alone, construction plus reading id and
+title (what name lookups do), and construction plus to_dict() (every field
+decoded, which is what the eager constructor used to pay up front).
+
+Usage:
+    python benchmarks/bench_models.py [--count 10000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from todocli.models.checklistitem import ChecklistItem  # noqa: E402
+from todocli.models.todolist import TodoList  # noqa: E402
+from todocli.models.todotask import Task  # noqa: E402
+
+
+def task_payload(i):
+    return {
+        "id": f"AAMkAGI2TG93AAA{i:08d}",
+        "title": f"Task number {i}",
+        "importance": ("low", "normal", "high")[i % 3],
+        "status": "completed" if i % 4 == 0 else "notStarted",
+        "isReminderOn": i % 2 == 0,
+        "createdDateTime": "2026-01-25T10:00:00.1234567Z",
+        "lastModifiedDateTime": "2026-01-26T11:30:00.1234567Z",
+        "completedDateTime": {
+            "dateTime": "2026-01-27T00:00:00.0000000",
+            "timeZone": "UTC",
+        },
+        "dueDateTime": {"dateTime": "2026-02-01T00:00:00.0000000", "timeZone": "UTC"},
+        "reminderDateTime": {
+            "dateTime": "2026-01-31T09:00:00.0000000",
+            "timeZone": "UTC",
+        },
+        "body": {"content": "", "contentType": "text"},
+    }
+
+
+def step_payload(i):
+    return {
+        "id": f"step-{i}",
+        "displayName": f"Step {i}",
+        "isChecked": i % 2 == 0,
+        "createdDateTime": "2026-02-04T19:08:45Z",
+        "checkedDateTime": "2026-02-05T08:00:00Z" if i % 2 == 0 else None,
+    }
+
+
+def list_payload(i):
+    return {
+        "id": f"list-{i}",
+        "displayName": f"List {i}",
+        "isOwner": True,
+        "isShared": False,
+        "wellknownListName": "none",
+    }
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = [
+        ("Task", Task, [task_payload(i) for i in range(args.count)]),
+        ("ChecklistItem", ChecklistItem, [step_payload(i) for i in range(args.count)]),
+        ("TodoList", TodoList, [list_payload(i) for i in range(args.count)]),
+    ]
+    print(f"{args.count} objects, best of {args.repeat} (ms)")
+    print(f"{'model':<14} {'construct':>10} {'id+title':>10} {'to_dict':>10}")
+    for name, cls, payloads in cases:
+        label = "title" if cls is Task else "display_name"
+
+        def construct():
+            for payload in payloads:
+                cls(payload)
+
+        def read_names():
+            for payload in payloads:
+                obj = cls(payload)
+                obj.id, getattr(obj, label)
+
+        def decode_all():
+            for payload in payloads:
+                cls(payload).to_dict()
+
+        row = [
+            best_of(args.repeat, fn) * 1000
+            for fn in (construct, read_names, decode_all)
+        ]
+        print(f"{name:<14} {row[0]:>10.1f} {row[1]:>10.1f} {row[2]:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Recurrence expansion benchmark: a 14-day window over 10k recurring tasks.
+
+Every task gets one of the supported patterns (daily, weekly with days,
+weekdays, absolute/relative monthly and yearly), starting up to three years
+ago. Each is expanded into the dates that fall in the next 14 days, once by
+walking the series from its start and keeping the dates in the window, and
+once with expand_recurrence(after=...), which skips the earlier periods and
+stops at the window's end.
+
+Usage:
+    python benchmarks/bench_recurrence.py [--count 10000] [--days 14] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from todocli.utils.recurrence_util import expand_recurrence  # noqa: E402
+
+PATTERNS = [
+    {"type": "daily", "interval": 1},
+    {"type": "daily", "interval": 3},
+    {"type": "weekly", "interval": 1, "daysOfWeek": ["monday", "thursday"]},
+    {
+        "type": "weekly",
+        "interval": 1,
+        "daysOfWeek": ["monday", "tuesday", "wednesday", "thursday", "friday"],
+    },
+    {"type": "weekly", "interval": 2, "daysOfWeek": ["friday"]},
+    {"type": "absoluteMonthly", "interval": 1, "dayOfMonth": 31},
+    {
+        "type": "relativeMonthly",
+        "interval": 1,
+        "daysOfWeek": ["friday"],
+        "index": "last",
+    },
+    {"type": "absoluteYearly", "interval": 1, "month": 3, "dayOfMonth": 15},
+    {
+        "type": "relativeYearly",
+        "interval": 1,
+        "month": 11,
+        "daysOfWeek": ["thursday"],
+        "index": "fourth",
+    },
+]
+
+
+def recurrences(count, today):
+    return [
+        {
+            "pattern": PATTERNS[i % len(PATTERNS)],
+            "range": {
+                "type": "noEnd",
+                "startDate": (today - timedelta(days=i % 1095)).isoformat(),
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    today = date.today()
+    until = today + timedelta(days=args.days)
+    series = recurrences(args.count, today)
+
+    def walk_from_start():
+        return sum(
+            1
+            for recurrence in series
+            for day in expand_recurrence(recurrence, until=until)
+            if day >= today
+        )
+
+    def skip_to_window():
+        return sum(
+            1
+            for recurrence in series
+            for day in expand_recurrence(recurrence, after=today, until=until)
+        )
+
+    print(f"{args.count} series, {args.days}-day window, best of {args.repeat}")
+    print(f"{'method':<16} {'ms':>8} {'dates':>8}")
+    methods = (("walk from start", walk_from_start), ("skip to window", skip_to_window))
+    for name, fn in methods:
+        elapsed, dates = best_of(args.repeat, fn)
+        print(f"{name:<16} {elapsed:>8.1f} {dates:>8}")
+
+
+if __name__ == "__main__":
+    main()
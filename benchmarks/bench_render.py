@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Human-readable output benchmark: 10k task rows with steps.
+
+Renders a 'tasks' listing (every third task has two steps) the way lst used
+to, with one print() per task and per step, and with render.Renderer, which
+aligns the columns and writes in large chunks. Output goes to /dev/null
+through a line-buffered text stream, as stdout is on a terminal; the number
+of write() system calls is reported too.
+
+Usage:
+    python benchmarks/bench_render.py [--count 10000] [--repeat 5]
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from bench_models import step_payload, task_payload  # noqa: E402
+
+from todocli.cli import _get_enum_value, _task_cells  # noqa: E402
+from todocli.models.checklistitem import ChecklistItem  # noqa: E402
+from todocli.models.todotask import Task  # noqa: E402
+from todocli.utils import render  # noqa: E402
+from todocli.utils.datetime_util import format_date  # noqa: E402
+
+
+class CountingWriter(io.FileIO):
+    """/dev/null, counting the write() system calls made to it."""
+
+    def __init__(self):
+        super().__init__(os.devnull, "wb")
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+
+def print_per_line(tasks, steps, out):
+    for i, task in enumerate(tasks):
+        line = f"[{i}]\t{task.title}"
+        if _get_enum_value(task.importance) == "high":
+            line += " !"
+        if task.due_datetime is not None:
+            line += f" (due: {format_date(task.due_datetime, 'eu')})"
+        print(line, file=out)
+        for item in steps.get(task.id, []):
+            check = "x" if item.is_checked else " "
+            print(f"    [{check}] {item.display_name}", file=out)
+
+
+def renderer(tasks, steps, out):
+    rows = []
+    for i, task in enumerate(tasks):
+        title, due = _task_cells(task, "eu")
+        rows.append((f"[{i}]", title, due))
+        for item in steps.get(task.id, []):
+            check = "x" if item.is_checked else " "
+            rows.append(f"    [{check}] {item.display_name}")
+    with render.Renderer(out, width=None) as r:
+        r.table(rows, flex=1)
+
+
+def run(fn, tasks, steps):
+    raw = CountingWriter()
+    out = io.TextIOWrapper(io.BufferedWriter(raw), line_buffering=True)
+    started = time.perf_counter()
+    fn(tasks, steps, out)
+    out.flush()
+    elapsed = (time.perf_counter() - started) * 1000
+    out.close()
+    return elapsed, raw.writes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tasks = [Task(task_payload(i)) for i in range(args.count)]
+    for task in tasks:
+        task.to_tuple()
+    steps = {
+        task.id: [ChecklistItem(step_payload(2 * i)), ChecklistItem(step_payload(i))]
+        for i, task in enumerate(tasks)
+        if i % 3 == 0
+    }
+    lines = args.count + 2 * len(steps)
+
+    print(f"{args.count} tasks, {lines} lines, best of {args.repeat}")
+    print(f"{'method':<16} {'ms':>8} {'writes':>8}")
+    for name, fn in (("print per line", print_per_line), ("renderer", renderer)):
+        results = [run(fn, tasks, steps) for _ in range(args.repeat)]
+        elapsed = min(ms for ms, _ in results)
+        print(f"{name:<16} {elapsed:>8.1f} {results[0][1]:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Graph timestamp parsing benchmark.
+
+Parses synthetic Graph timestamps (both payload shapes: "...0000000Z"
+strings and {"dateTime", "timeZone"} dicts) with api_timestamp_to_datetime
+and with the strptime-based parser it replaced, and reports the rate.
+
+Usage:
+    python benchmarks/bench_timestamps.py [--count 1000000]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from todocli.utils.datetime_util import api_timestamp_to_datetime  # noqa: E402
+
+
+def strptime_parser(api_dt):
+    """The previous implementation, kept here as the baseline."""
+    dt_str = api_dt if isinstance(api_dt, str) else api_dt.get("dateTime", "")
+    dt_str = dt_str.rstrip("Z")
+    if "." in dt_str:
+        base, frac = dt_str.rsplit(".", 1)
+        dt_str = f"{base}.{frac[:6]}"
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S"):
+        try:
+            dt = datetime.strptime(dt_str, fmt)
+            return dt.replace(tzinfo=timezone.utc).astimezone(tz=None)
+        except ValueError:
+            continue
+    raise ValueError(f"Unable to parse datetime: {api_dt}")
+
+
+def payloads(count):
+    start = datetime(2024, 1, 1)
+    for i in range(count):
+        dt = start + timedelta(seconds=i * 997)
+        if i % 3 == 0:
+            yield {
+                "dateTime": dt.strftime("%Y-%m-%dT%H:%M:%S.0000000"),
+                "timeZone": "UTC",
+            }
+        elif i % 3 == 1:
+            yield dt.strftime("%Y-%m-%dT%H:%M:%S.%f0Z")
+        else:
+            yield dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def run(parser, values):
+    started = time.perf_counter()
+    for value in values:
+        parser(value)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    values = list(payloads(args.count))
+    sample = values[:1000]
+    assert [api_timestamp_to_datetime(v) for v in sample] == [
+        strptime_parser(v) for v in sample
+    ]
+
+    years = args.count * 997 / 86400 / 365
+    print(f"{args.count} timestamps spanning {years:.0f} years")
+    baseline = run(strptime_parser, values)
+    current = run(api_timestamp_to_datetime, values)
+    for name, elapsed in (("strptime", baseline), ("current", current)):
+        rate = args.count / elapsed / 1e6
+        print(f"{name:<10} {elapsed:7.2f} s  {rate:5.2f} M/s")
+    print(f"speedup    {baseline / current:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,10 +18,14 @@ setup(
         "requests>=2.28.1",
         "requests_oauthlib",
     ],
+    extras_require={
+        "fast": ["orjson>=3.8"],
+        "async": ["httpx>=0.24"],
+    },
     include_package_data=True,
     entry_points={
         "console_scripts": [
-            "todo=todocli.cli:main",
+            "todo=todocli.daemon:main",
         ],
     },
     python_requires=">=3.10",
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""Unit tests for the local replica and the agenda built from it"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+from requests import HTTPError
+
+from todocli.cli import agenda, setup_parser
+from todocli.utils import replica
+from todocli.utils.agenda import build_agenda
+from todocli.utils.datetime_util import datetime_to_api_timestamp
+
+BATCH = "todocli.graphapi.wrapper.get_task_deltas_batch"
+
+# A Monday
+TODAY = date(2026, 10, 19)
+
+
+def _at(year, month, day, hour=0, minute=0):
+    """An API timestamp for a local time."""
+    return datetime_to_api_timestamp(datetime(year, month, day, hour, minute))
+
+
+def _task(task_id, title, due=None, reminder=None, **extra):
+    record = {"id": task_id, "title": title, "status": "notStarted", **extra}
+    if due:
+        record["dueDateTime"] = _at(*due)
+    if reminder:
+        record["reminderDateTime"] = _at(*reminder)
+        record["isReminderOn"] = True
+    return record
+
+
+def _replica(*tasks, name="Tasks"):
+    r = replica.Replica()
+    r.lists["l1"] = {"name": name, "delta_link": "d", "tasks": {}}
+    r.apply("l1", tasks)
+    r.rebuild_index()
+    return r
+
+
+def _deltas_batch(changes, next_link, calls, name="Tasks"):
+    """Fake get_task_deltas_batch serving one list, l1, recording its calls."""
+    statuses = {"expired": 410, "broken": 500}
+
+    def get_task_deltas_batch(delta_links, include_lists=False):
+        calls.append(dict(delta_links))
+        deltas = {}
+        for list_id, link in delta_links.items():
+            status = statuses.get(link, 200)
+            deltas[list_id] = {
+                "status": status,
+                "changes": changes.get((list_id, link), []) if status == 200 else [],
+                "delta_link": next_link if status == 200 else None,
+            }
+        lists = [{"id": "l1", "displayName": name}] if include_lists else None
+        return lists, deltas
+
+    return get_task_deltas_batch
+
+
+class TestReplica(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "replica.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_apply_drops_completed_and_removed_and_trims(self):
+        r = _replica(
+            _task("t1", "Open", body={"content": "long"}),
+            _task("t2", "Done"),
+        )
+        r.apply(
+            "l1",
+            [
+                {"id": "t2", "title": "Done", "status": "completed"},
+                {"id": "t3", "@removed": {"reason": "deleted"}},
+            ],
+        )
+        self.assertEqual(list(r.lists["l1"]["tasks"]), ["t1"])
+        self.assertNotIn("body", r.task("l1", "t1"))
+
+    def test_index_is_sorted_and_bisected(self):
+        r = _replica(
+            _task("late", "Late", due=(2026, 10, 30)),
+            _task("early", "Early", due=(2026, 10, 20), reminder=(2026, 10, 19, 9)),
+            _task("quiet", "Quiet", reminder=(2026, 10, 21, 9)),
+        )
+        r.task("l1", "quiet")["isReminderOn"] = False
+        r.rebuild_index()
+
+        entries = [(kind, task_id) for _, kind, _, task_id in r.index]
+        self.assertEqual(
+            entries, [("reminder", "early"), ("due", "early"), ("due", "late")]
+        )
+        start = datetime(2026, 10, 20).timestamp()
+        end = datetime(2026, 10, 21).timestamp()
+        self.assertEqual([e[3] for e in r.between(start, end)], ["early"])
+        self.assertEqual(len(r.between()), 3)
+
+    def test_save_and_load(self):
+        self.assertIsNone(replica.Replica.load(self.path))
+        r = _replica(_task("t1", "One", due=(2026, 10, 20)))
+        r.synced_at = "2026-10-19T08:00:00+00:00"
+        r.save(self.path)
+
+        loaded = replica.Replica.load(self.path)
+        self.assertEqual(loaded.lists, r.lists)
+        self.assertEqual(loaded.index, r.index)
+        self.assertEqual(loaded.synced_at, r.synced_at)
+        self.assertEqual(os.listdir(self.dir), ["replica.json"])
+
+    def test_sync_full_then_delta(self):
+        changes = {
+            ("l1", None): [_task("t1", "One"), _task("t2", "Two")],
+            ("l1", "delta-1"): [{"id": "t1", "@removed": {"reason": "deleted"}}],
+        }
+        calls = []
+        r = replica.Replica()
+        with patch(BATCH, _deltas_batch(changes, "delta-1", calls)):
+            self.assertEqual(replica.sync(r), {("l1", "t1"), ("l1", "t2")})
+        self.assertEqual(r.lists["l1"]["delta_link"], "delta-1")
+        self.assertEqual(calls, [{}, {"l1": None}])
+
+        calls.clear()
+        with patch(BATCH, _deltas_batch(changes, "delta-2", calls)):
+            self.assertEqual(replica.sync(r), {("l1", "t1")})
+        self.assertEqual(list(r.lists["l1"]["tasks"]), ["t2"])
+        self.assertEqual(r.lists["l1"]["delta_link"], "delta-2")
+        self.assertEqual(calls, [{"l1": "delta-1"}])
+        self.assertIsNotNone(r.synced_at)
+
+    def test_sync_expired_link_and_removed_list(self):
+        r = _replica(_task("stale", "Stale"))
+        r.lists["l1"]["delta_link"] = "expired"
+        r.lists["gone"] = {"name": "Gone", "delta_link": "x", "tasks": {"g": {}}}
+        calls = []
+        changes = {("l1", None): [_task("t1", "One")]}
+
+        with patch(BATCH, _deltas_batch(changes, "new", calls, name="New")):
+            changed = replica.sync(r)
+
+        self.assertEqual(calls, [{"l1": "expired", "gone": "x"}, {"l1": None}])
+        self.assertEqual(changed, {("l1", "stale"), ("l1", "t1"), ("gone", "g")})
+        self.assertEqual(list(r.lists), ["l1"])
+        self.assertEqual(r.lists["l1"]["name"], "New")
+        self.assertEqual(list(r.lists["l1"]["tasks"]), ["t1"])
+        self.assertEqual(r.lists["l1"]["delta_link"], "new")
+
+    def test_sync_failure(self):
+        r = _replica(_task("t1", "One"))
+        r.lists["l1"]["delta_link"] = "broken"
+        with patch(BATCH, _deltas_batch({}, "new", [])):
+            with self.assertRaises(HTTPError):
+                replica.sync(r)
+
+
+class TestBuildAgenda(unittest.TestCase):
+    def test_buckets(self):
+        r = _replica(
+            _task("t0", "Late", due=(2026, 10, 15)),
+            _task("t1", "Old reminder", reminder=(2026, 10, 16, 9)),
+            _task("t2", "Call", reminder=(2026, 10, 19, 9), importance="high"),
+            _task("t3", "Pay", due=(2026, 10, 20)),
+            _task("t4", "Review", due=(2026, 10, 25)),
+            _task("t5", "Plan", due=(2026, 10, 26)),
+            _task("t6", "Far", due=(2026, 11, 20)),
+        )
+        buckets = build_agenda(r, days=14, today=TODAY)
+
+        ids = {name: [item["id"] for item in items] for name, items in buckets.items()}
+        self.assertEqual(
+            ids,
+            {
+                "overdue": ["t0"],
+                "today": ["t2"],
+                "tomorrow": ["t3"],
+                "this_week": ["t4"],
+                "later": ["t5"],
+            },
+        )
+        item = buckets["today"][0]
+        self.assertEqual(item["kind"], "reminder")
+        self.assertEqual(item["at"].hour, 9)
+        self.assertEqual(item["list"], "Tasks")
+        self.assertEqual(item["importance"], "high")
+
+    def test_recurring_task_occurrences(self):
+        weekly = {
+            "pattern": {"type": "weekly", "interval": 1, "daysOfWeek": ["monday"]},
+            "range": {"type": "noEnd", "startDate": "2026-10-12"},
+        }
+        r = _replica(_task("t1", "Standup", due=(2026, 10, 12), recurrence=weekly))
+        buckets = build_agenda(r, days=14, today=TODAY)
+
+        self.assertEqual([i["kind"] for i in buckets["overdue"]], ["due"])
+        self.assertEqual([i["kind"] for i in buckets["today"]], ["occurrence"])
+        self.assertEqual(
+            [i["at"].date() for i in buckets["later"]],
+            [date(2026, 10, 26), date(2026, 11, 2)],
+        )
+
+
+class TestAgendaCommand(unittest.TestCase):
+    def _args(self, **kwargs):
+        args = MagicMock()
+        args.days = 14
+        args.refresh = False
+        args.json = False
+        args.date_format = "iso"
+        for key, value in kwargs.items():
+            setattr(args, key, value)
+        return args
+
+    def test_parser(self):
+        args = setup_parser().parse_args(["agenda", "--days", "7", "--refresh"])
+        self.assertEqual(args.days, 7)
+        self.assertTrue(args.refresh)
+
+    @patch("todocli.utils.replica.Replica.load", return_value=None)
+    def test_missing_replica(self, mock_load):
+        with self.assertRaises(replica.ReplicaNotFound) as cm:
+            agenda(self._args())
+        self.assertIn("todo agenda --refresh", cm.exception.message)
+
+    @patch("todocli.utils.agenda.date")
+    @patch("todocli.utils.replica.Replica.load")
+    def test_human_output(self, mock_load, mock_date):
+        mock_date.today.return_value = TODAY
+        mock_load.return_value = _replica(
+            _task("t1", "Pay", due=(2026, 10, 15), importance="high"),
+            _task("t2", "Call", reminder=(2026, 10, 19, 9)),
+            _task("t3", "Review", due=(2026, 10, 20)),
+            name="Work",
+        )
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            agenda(self._args())
+
+        self.assertEqual(
+            out.getvalue().splitlines(),
+            [
+                "Overdue",
+                "  2026-10-15  Work/Pay !",
+                "Today",
+                "  09:00       Work/Call    (reminder)",
+                "Tomorrow",
+                "  all day     Work/Review",
+            ],
+        )
+
+    @patch("todocli.utils.agenda.date")
+    @patch("todocli.utils.replica.Replica.load")
+    def test_json_output(self, mock_load, mock_date):
+        mock_date.today.return_value = TODAY
+        mock_load.return_value = _replica(_task("t1", "Pay", due=(2026, 10, 20)))
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            agenda(self._args(json=True, compact=False))
+
+        self.assertIn('"tomorrow": [', out.getvalue())
+        self.assertIn('"at": "2026-10-20T00:00', out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Unit tests for the asyncio client"""
+
+import asyncio
+import json
+import time
+import unittest
+from unittest.mock import patch
+
+from requests import HTTPError
+
+from todocli.graphapi.async_client import AsyncTodoClient
+from todocli.graphapi.wrapper import BASE_URL, BATCH_URL, ListNotFound
+from todocli.models.todolist import TodoList
+
+TOKEN = {"access_token": "token", "expires_at": time.time() + 3600}
+
+
+class FakeResponse:
+    """The parts of httpx.Response the client reads."""
+
+    def __init__(self, url, status_code=200, body=None):
+        self.url = url
+        self.status_code = status_code
+        self.reason_phrase = "OK" if status_code < 400 else "Not Found"
+        self.headers = {"Content-Type": "application/json"}
+        self.content = json.dumps(body if body is not None else {}).encode()
+
+    async def aiter_bytes(self):
+        yield self.content
+
+    async def aclose(self):
+        pass
+
+
+class FakeHttpClient:
+    """Stands in for httpx.AsyncClient, answering from a dict of routes."""
+
+    def __init__(self, routes, delay=0):
+        self.routes = routes
+        self.delay = delay
+        self.requests = []
+        self.running = 0
+        self.peak = 0
+        self.closed = False
+
+    def build_request(self, method, url, content=None, headers=None, json=None):
+        return {"method": method, "url": url, "headers": headers, "json": json}
+
+    async def send(self, request, stream=False):
+        self.requests.append(request)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        status_code, body = self.routes.get(
+            (request["method"], request["url"]), (404, {})
+        )
+        return FakeResponse(request["url"], status_code, body)
+
+    async def aclose(self):
+        self.closed = True
+
+
+@patch("todocli.graphapi.oauth.get_token", return_value=TOKEN)
+class TestAsyncTodoClient(unittest.IsolatedAsyncioTestCase):
+    def make_client(self, routes, delay=0):
+        self.http = FakeHttpClient(routes, delay)
+        return AsyncTodoClient(max_concurrency=2, http_client=self.http)
+
+    async def test_sends_wrapper_requests_natively(self, mock_get_token):
+        client = self.make_client(
+            {("GET", BASE_URL): (200, {"value": [{"id": "l1", "displayName": "A"}]})}
+        )
+
+        lists = await client.get_lists()
+
+        self.assertIsInstance(lists[0], TodoList)
+        self.assertEqual(lists[0].id, "l1")
+        headers = self.http.requests[0]["headers"]
+        self.assertEqual(headers["Authorization"], "Bearer token")
+
+    async def test_resolves_names_through_nested_operations(self, mock_get_token):
+        list_url = f"{BASE_URL}?$filter=displayName eq 'Work'"
+        task_url = f"{BASE_URL}/l1/tasks?$filter=title eq 'Report'"
+        client = self.make_client(
+            {
+                ("GET", list_url): (200, {"value": [{"id": "l1"}]}),
+                ("GET", task_url): (200, {"value": [{"id": "t1", "title": "Report"}]}),
+                ("GET", f"{BASE_URL}/l1/tasks/t1"): (200, {"id": "t1"}),
+            }
+        )
+
+        task = await client.get_task(list_name="Work", task_name="Report")
+
+        self.assertEqual(task.id, "t1")
+        # Like the sync wrapper, get_task_id_by_name looks the list up again
+        self.assertEqual(
+            [r["url"] for r in self.http.requests],
+            [list_url, list_url, task_url, f"{BASE_URL}/l1/tasks/t1"],
+        )
+
+    async def test_raises_wrapper_exceptions(self, mock_get_token):
+        list_url = f"{BASE_URL}?$filter=displayName eq 'Missing'"
+        client = self.make_client({("GET", list_url): (200, {"value": []})})
+
+        with self.assertRaises(ListNotFound):
+            await client.get_list_id_by_name("Missing")
+
+    async def test_http_errors_are_requests_errors(self, mock_get_token):
+        client = self.make_client({})
+
+        with self.assertRaises(HTTPError) as cm:
+            await client.get_task(list_id="l1", task_id="gone")
+
+        self.assertEqual(cm.exception.response.status_code, 404)
+
+    async def test_concurrency_is_bounded(self, mock_get_token):
+        client = self.make_client(
+            {
+                ("GET", f"{BASE_URL}/l1/tasks/{i}"): (200, {"id": str(i)})
+                for i in range(6)
+            },
+            delay=0.01,
+        )
+
+        tasks = await asyncio.gather(
+            *(client.get_task(list_id="l1", task_id=i) for i in range(6))
+        )
+
+        self.assertEqual([t.id for t in tasks], [str(i) for i in range(6)])
+        self.assertEqual(self.http.peak, 2)
+        # The token is loaded once for all of them
+        mock_get_token.assert_called_once_with()
+
+    @patch("todocli.graphapi.wrapper.get_lists")
+    async def test_runs_plain_functions_in_executor(
+        self, mock_get_lists, mock_get_token
+    ):
+        mock_get_lists.return_value = ["list"]
+        client = self.make_client({})
+
+        result = await client.get_lists()
+
+        self.assertEqual(result, ["list"])
+        mock_get_lists.assert_called_once_with()
+
+    async def test_close_keeps_a_passed_in_client_open(self, mock_get_token):
+        client = self.make_client({})
+
+        await client.close()
+
+        self.assertFalse(self.http.closed)
+
+    async def test_close_closes_its_own_client(self, mock_get_token):
+        http = FakeHttpClient({})
+        with patch("todocli.graphapi.async_client.httpx") as mock_httpx:
+            mock_httpx.AsyncClient.return_value = http
+            async with AsyncTodoClient():
+                pass
+
+        self.assertTrue(http.closed)
+
+    async def test_requires_httpx_without_a_client(self, mock_get_token):
+        with patch("todocli.graphapi.async_client.httpx", None):
+            with self.assertRaises(ImportError):
+                AsyncTodoClient()
+
+    async def test_batch_rejects_too_many_requests(self, mock_get_token):
+        client = self.make_client({})
+
+        with self.assertRaises(ValueError):
+            await client.batch([{"id": str(i)} for i in range(21)])
+
+    async def test_batch_posts_sub_requests(self, mock_get_token):
+        client = self.make_client(
+            {("POST", BATCH_URL): (200, {"responses": [{"id": "0", "status": 200}]})}
+        )
+
+        result = await client.batch([{"id": "0"}])
+
+        self.assertEqual(result, {"0": {"id": "0", "status": 200}})
+        self.assertEqual(self.http.requests[0]["json"], {"requests": [{"id": "0"}]})
+
+
+if __name__ == "__main__":
+    unittest.main()
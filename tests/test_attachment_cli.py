@@ -36,6 +36,14 @@ class TestAttachmentCLIArgParsing(unittest.TestCase):
         self.assertEqual(args.task_id, "task123")
         self.assertEqual(args.file_path, "/tmp/list.txt")
 
+    def test_attach_from_stdin(self):
+        """Test attach command reading from stdin with --name"""
+        args = self.parser.parse_args(
+            ["attach", "Buy groceries", "-", "--name", "list.txt"]
+        )
+        self.assertEqual(args.file_path, "-")
+        self.assertEqual(args.name, "list.txt")
+
     def test_attach_with_json_flag(self):
         """Test attach command with --json flag"""
         args = self.parser.parse_args(
@@ -130,6 +138,24 @@ class TestAttachmentCLIArgParsing(unittest.TestCase):
         self.assertEqual(args.task_name, "Buy groceries")
         self.assertEqual(args.output, "/tmp/downloads")
 
+    def test_download_sync_flags(self):
+        """Test download command with --sync and --jobs"""
+        args = self.parser.parse_args(
+            ["download", "Buy groceries", "--sync", "--jobs", "8"]
+        )
+        self.assertTrue(args.sync)
+        self.assertEqual(args.jobs, 8)
+        self.assertFalse(args.all_tasks)
+
+    def test_download_all_tasks(self):
+        """Test download command for every task in a list"""
+        args = self.parser.parse_args(
+            ["download", "--all-tasks", "-l", "Work", "-o", "/backup"]
+        )
+        self.assertTrue(args.all_tasks)
+        self.assertIsNone(args.task_name)
+        self.assertEqual(args.list, "Work")
+
     def test_download_with_id_flag(self):
         """Test download command with --id flag"""
         args = self.parser.parse_args(["download", "--id", "task123"])
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Unit tests for skip-if-unchanged attachment sync"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+from todocli.utils.attachment_sync import (
+    MANIFEST_NAME,
+    load_manifest,
+    plan_sync,
+    safe_file_name,
+    sync_attachments,
+)
+
+
+def _att(att_id, name, size=10, modified="2026-01-01T00:00:00Z"):
+    return {
+        "id": att_id,
+        "name": name,
+        "size": size,
+        "lastModifiedDateTime": modified,
+    }
+
+
+def _fake_download(attachment_id, output_path, list_id, task_id, session):
+    with open(output_path, "wb") as f:
+        f.write(attachment_id.encode())
+    return len(attachment_id)
+
+
+class TestSafeFileName(unittest.TestCase):
+    def test_strips_directories(self):
+        self.assertEqual(safe_file_name("../../etc/passwd"), "passwd")
+        self.assertEqual(safe_file_name("a\\b.txt"), "b.txt")
+
+    def test_empty_uses_default(self):
+        self.assertEqual(safe_file_name(""), "attachment")
+        self.assertEqual(safe_file_name("..", default="t1"), "t1")
+
+
+class TestPlanSync(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.out = self.tmp_dir.name
+
+    def test_unchanged_attachment_is_skipped(self):
+        with open(os.path.join(self.out, "a.txt"), "w") as f:
+            f.write("x")
+        manifest = {
+            "att-1": {
+                "name": "a.txt",
+                "size": 10,
+                "last_modified": "2026-01-01T00:00:00Z",
+                "path": "a.txt",
+            }
+        }
+        to_download, unchanged = plan_sync(
+            self.out, [("t1", "", _att("att-1", "a.txt"))], manifest
+        )
+        self.assertEqual(to_download, [])
+        self.assertEqual(unchanged[0][2], "a.txt")
+
+    def test_modified_attachment_overwrites_its_own_file(self):
+        with open(os.path.join(self.out, "a.txt"), "w") as f:
+            f.write("x")
+        manifest = {
+            "att-1": {
+                "name": "a.txt",
+                "size": 10,
+                "last_modified": "2026-01-01T00:00:00Z",
+                "path": "a.txt",
+            }
+        }
+        att = _att("att-1", "a.txt", modified="2026-02-01T00:00:00Z")
+        to_download, unchanged = plan_sync(self.out, [("t1", "", att)], manifest)
+        self.assertEqual(unchanged, [])
+        self.assertEqual(to_download[0][2], "a.txt")
+
+    def test_untracked_file_is_not_overwritten(self):
+        with open(os.path.join(self.out, "a.txt"), "w") as f:
+            f.write("mine")
+        to_download, _ = plan_sync(self.out, [("t1", "", _att("att-1", "a.txt"))], {})
+        self.assertEqual(to_download[0][2], "a_1.txt")
+
+    def test_same_name_in_one_run_gets_suffix(self):
+        entries = [
+            ("t1", "Task", _att("att-1", "a.txt")),
+            ("t1", "Task", _att("att-2", "a.txt")),
+        ]
+        to_download, _ = plan_sync(self.out, entries, {})
+        paths = [p for _, _, p in to_download]
+        self.assertEqual(
+            paths, [os.path.join("Task", "a.txt"), os.path.join("Task", "a_1.txt")]
+        )
+
+
+class TestSyncAttachments(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.out = self.tmp_dir.name
+
+    @patch("todocli.utils.attachment_sync.get_oauth_session")
+    @patch("todocli.utils.attachment_sync.wrapper.download_attachment")
+    def test_second_run_skips_unchanged(self, mock_download, mock_session):
+        mock_download.side_effect = _fake_download
+        entries = [
+            ("t1", "Task A", _att("att-1", "a.txt")),
+            ("t2", "Task B", _att("att-2", "b.txt")),
+        ]
+
+        downloaded, unchanged, failed = sync_attachments(
+            "lid", entries, self.out, jobs=2
+        )
+        self.assertEqual(len(downloaded), 2)
+        self.assertEqual(unchanged, [])
+        self.assertEqual(failed, [])
+        self.assertTrue(os.path.isfile(os.path.join(self.out, "Task A", "a.txt")))
+        self.assertIn("att-2", load_manifest(self.out))
+
+        mock_download.reset_mock()
+        downloaded, unchanged, failed = sync_attachments(
+            "lid", entries, self.out, jobs=2
+        )
+        self.assertEqual(downloaded, [])
+        self.assertEqual(len(unchanged), 2)
+        mock_download.assert_not_called()
+
+    @patch("todocli.utils.attachment_sync.get_oauth_session")
+    @patch("todocli.utils.attachment_sync.wrapper.download_attachment")
+    def test_failed_download_is_not_recorded(self, mock_download, mock_session):
+        def flaky(attachment_id, **kwargs):
+            if attachment_id == "att-2":
+                raise ConnectionError("boom")
+            return _fake_download(attachment_id, **kwargs)
+
+        mock_download.side_effect = flaky
+        report = MagicMock()
+        entries = [
+            ("t1", "", _att("att-1", "a.txt")),
+            ("t1", "", _att("att-2", "b.txt")),
+        ]
+
+        downloaded, _, failed = sync_attachments(
+            "lid", entries, self.out, report=report
+        )
+
+        self.assertEqual(len(downloaded), 1)
+        self.assertEqual(len(failed), 1)
+        with open(os.path.join(self.out, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+        self.assertIn("att-1", manifest)
+        self.assertNotIn("att-2", manifest)
+        statuses = sorted(c.args[0] for c in report.call_args_list)
+        self.assertEqual(statuses, ["downloaded", "failed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
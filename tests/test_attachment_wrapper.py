@@ -5,7 +5,9 @@ import unittest
 from unittest.mock import patch, MagicMock
 import json
 import base64
+import io
 import os
+import stat
 import tempfile
 
 from todocli.graphapi.wrapper import (
@@ -18,6 +20,12 @@ from todocli.graphapi.wrapper import (
     get_attachment,
     create_attachment,
     delete_attachment,
+    download_attachment,
+    ATTACHMENT_CHUNK_UNIT,
+    ATTACHMENT_INITIAL_CHUNK_SIZE,
+    ATTACHMENT_MAX_CHUNK_SIZE,
+    _create_attachment_upload_session,
+    _next_chunk_size,
 )
 
 
@@ -128,18 +136,54 @@ class TestCreateAttachment(unittest.TestCase):
             self.assertEqual(task_id, "task-id-456")
             self.assertEqual(title, "My Task")
 
-            # Verify the POST request body
+            # Verify the POST request body (streamed, so join the parts)
             call_args = mock_session.return_value.post.call_args
-            req_body = call_args.kwargs["json"]
+            body = call_args.kwargs["data"]
+            raw = b"".join(body)
+            self.assertEqual(len(raw), len(body))
+            req_body = json.loads(raw)
             self.assertEqual(
                 req_body["@odata.type"], "#microsoft.graph.taskFileAttachment"
             )
-            self.assertIn("contentBytes", req_body)
+            self.assertEqual(
+                base64.b64decode(req_body["contentBytes"]), b"Hello, world!"
+            )
             self.assertIn("name", req_body)
             self.assertEqual(req_body["size"], os.path.getsize(temp_path))
         finally:
             os.unlink(temp_path)
 
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    @patch("todocli.graphapi.wrapper.get_task")
+    def test_create_attachment_from_stream(self, mock_get_task, mock_session):
+        mock_get_task.return_value = MagicMock(title="My Task")
+        post_response = MagicMock()
+        post_response.ok = True
+        post_response.content = json.dumps({"id": "att-stdin"}).encode()
+        mock_session.return_value.post.return_value = post_response
+
+        content = os.urandom(ATTACHMENT_DIRECT_UPLOAD_LIMIT // 2)
+        att_id, file_name, _, _ = create_attachment(
+            None,
+            list_id="lid",
+            task_id="tid",
+            stream=io.BytesIO(content),
+            file_name="notes.txt",
+        )
+
+        self.assertEqual(att_id, "att-stdin")
+        self.assertEqual(file_name, "notes.txt")
+        body = mock_session.return_value.post.call_args.kwargs["data"]
+        req_body = json.loads(b"".join(body))
+        self.assertEqual(base64.b64decode(req_body["contentBytes"]), content)
+        self.assertEqual(req_body["contentType"], "text/plain")
+
+    def test_create_attachment_from_stream_requires_name(self):
+        with self.assertRaises(ValueError):
+            create_attachment(
+                None, list_id="lid", task_id="tid", stream=io.BytesIO(b"data")
+            )
+
     def test_create_attachment_file_not_found(self):
         with self.assertRaises(FileNotFoundError):
             create_attachment(
@@ -285,6 +329,192 @@ class TestDeleteAttachment(unittest.TestCase):
             )
 
 
+class TestUploadSession(unittest.TestCase):
+    """Test resumable, adaptive upload session chunking"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.state_file = os.path.join(self.tmp_dir.name, "upload_sessions.json")
+        patcher = patch(
+            "todocli.graphapi.wrapper.UPLOAD_SESSIONS_FILE", self.state_file
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.file_size = 4 * 1024 * 1024
+        self.file_path = os.path.join(self.tmp_dir.name, "big.bin")
+        with open(self.file_path, "wb") as f:
+            f.write(os.urandom(self.file_size))
+
+    def _session_response(self):
+        resp = MagicMock()
+        resp.ok = True
+        resp.content = json.dumps(
+            {"uploadUrl": "https://upload.example/session-1"}
+        ).encode()
+        return resp
+
+    def _chunk_response(self, headers):
+        start, rest = headers["Content-Range"][len("bytes ") :].split("-")
+        end, total = rest.split("/")
+        resp = MagicMock()
+        resp.ok = True
+        if int(end) + 1 >= int(total):
+            resp.status_code = 201
+            resp.headers = {"Location": "https://graph/attachments/att-big"}
+            resp.content = b""
+        else:
+            resp.status_code = 200
+            resp.content = json.dumps(
+                {"nextExpectedRanges": [f"{int(end) + 1}-"]}
+            ).encode()
+        return resp
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_interrupted_upload_resumes_from_saved_offset(self, mock_session):
+        mock_session.return_value.post.return_value = self._session_response()
+        calls = []
+
+        def failing_put(url, data=None, headers=None):
+            calls.append(headers["Content-Range"])
+            if len(calls) == 2:
+                raise ConnectionError("network dropped")
+            return self._chunk_response(headers)
+
+        mock_session.return_value.put.side_effect = failing_put
+
+        with self.assertRaises(ConnectionError):
+            _create_attachment_upload_session(
+                self.file_path, "big.bin", self.file_size, "lid", "tid"
+            )
+
+        with open(self.state_file) as f:
+            saved = list(json.load(f).values())
+        self.assertEqual(len(saved), 1)
+        self.assertEqual(saved[0]["upload_url"], "https://upload.example/session-1")
+        self.assertEqual(saved[0]["next_offset"], ATTACHMENT_INITIAL_CHUNK_SIZE)
+
+        # Second run: no new session, first PUT starts at the saved offset
+        mock_session.return_value.post.reset_mock()
+        resumed = []
+
+        def ok_put(url, data=None, headers=None):
+            resumed.append(headers["Content-Range"])
+            return self._chunk_response(headers)
+
+        mock_session.return_value.put.side_effect = ok_put
+
+        att_id = _create_attachment_upload_session(
+            self.file_path, "big.bin", self.file_size, "lid", "tid"
+        )
+
+        self.assertEqual(att_id, "att-big")
+        mock_session.return_value.post.assert_not_called()
+        self.assertTrue(
+            resumed[0].startswith(f"bytes {ATTACHMENT_INITIAL_CHUNK_SIZE}-")
+        )
+        with open(self.state_file) as f:
+            self.assertEqual(json.load(f), {})
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_progress_callback_reports_completion(self, mock_session):
+        mock_session.return_value.post.return_value = self._session_response()
+        mock_session.return_value.put.side_effect = (
+            lambda url, data=None, headers=None: self._chunk_response(headers)
+        )
+        progress = MagicMock()
+
+        _create_attachment_upload_session(
+            self.file_path, "big.bin", self.file_size, "lid", "tid", progress=progress
+        )
+
+        sent, total, rate = progress.call_args.args
+        self.assertEqual(sent, self.file_size)
+        self.assertEqual(total, self.file_size)
+        self.assertGreater(rate, 0)
+
+    def test_next_chunk_size_adapts_to_throughput(self):
+        # Fast link: grows, but at most doubles per chunk
+        self.assertEqual(
+            _next_chunk_size(ATTACHMENT_INITIAL_CHUNK_SIZE, 0.01),
+            2 * ATTACHMENT_INITIAL_CHUNK_SIZE,
+        )
+        # Slow link: shrinks to what fits the target duration, never below one unit
+        self.assertEqual(
+            _next_chunk_size(ATTACHMENT_INITIAL_CHUNK_SIZE, 60.0),
+            ATTACHMENT_CHUNK_UNIT,
+        )
+        # Never exceeds the ceiling and stays aligned
+        size = _next_chunk_size(ATTACHMENT_MAX_CHUNK_SIZE, 0.01)
+        self.assertEqual(size, ATTACHMENT_MAX_CHUNK_SIZE)
+        self.assertEqual(size % ATTACHMENT_CHUNK_UNIT, 0)
+
+
+class TestDownloadAttachment(unittest.TestCase):
+    """Test download_attachment streaming wrapper function"""
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_download_streams_value_to_file(self, mock_session):
+        get_response = MagicMock()
+        get_response.ok = True
+        get_response.iter_content.return_value = iter([b"Hello, ", b"world!"])
+        mock_session.return_value.get.return_value = get_response
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "hello.txt")
+            written = download_attachment(
+                "att-1", output_path, list_id="list-id", task_id="task-id"
+            )
+
+            with open(output_path, "rb") as f:
+                self.assertEqual(f.read(), b"Hello, world!")
+            self.assertEqual(written, 13)
+            # No temporary files left behind
+            self.assertEqual(os.listdir(tmp_dir), ["hello.txt"])
+
+        call_args = mock_session.return_value.get.call_args
+        self.assertTrue(call_args.args[0].endswith("/attachments/att-1/$value"))
+        self.assertTrue(call_args.kwargs["stream"])
+        get_response.close.assert_called_once()
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_download_gets_default_file_mode(self, mock_session):
+        get_response = MagicMock()
+        get_response.ok = True
+        get_response.iter_content.return_value = iter([b"data"])
+        mock_session.return_value.get.return_value = get_response
+
+        old_umask = os.umask(0o027)
+        self.addCleanup(os.umask, old_umask)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "data.bin")
+            download_attachment(
+                "att-1", output_path, list_id="list-id", task_id="task-id"
+            )
+
+            self.assertEqual(stat.S_IMODE(os.stat(output_path).st_mode), 0o640)
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_download_failure_leaves_no_file(self, mock_session):
+        def broken_stream(chunk_size):
+            yield b"partial"
+            raise ConnectionError("connection dropped")
+
+        get_response = MagicMock()
+        get_response.ok = True
+        get_response.iter_content.side_effect = broken_stream
+        mock_session.return_value.get.return_value = get_response
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            output_path = os.path.join(tmp_dir, "hello.txt")
+            with self.assertRaises(ConnectionError):
+                download_attachment(
+                    "att-1", output_path, list_id="list-id", task_id="task-id"
+                )
+            self.assertEqual(os.listdir(tmp_dir), [])
+
+
 class TestAttachmentEndpointPattern(unittest.TestCase):
     """Test that attachment endpoint URLs are correctly constructed"""
 
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""Unit tests for incremental backup and restore"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from requests import HTTPError
+
+from todocli.utils import backup
+
+DELTA = "todocli.graphapi.wrapper.iter_task_delta"
+DOWNLOAD = "todocli.graphapi.wrapper.download_attachment"
+
+
+def _parts(list_id, task_ids, parts):
+    return {tid: {part: [] for part in parts} for tid in task_ids}
+
+
+def _delta(changes, next_link):
+    """Fake iter_task_delta returning changes per list and next_link."""
+
+    def iter_task_delta(list_id, delta_link=None, state=None):
+        yield from changes.get((list_id, delta_link), [])
+        state["delta_link"] = next_link
+
+    return iter_task_delta
+
+
+def _download(content):
+    def download_attachment(attachment_id, output_path, list_id, task_id):
+        with open(output_path, "wb") as f:
+            f.write(content)
+
+    return download_attachment
+
+
+@patch("todocli.graphapi.wrapper.get_task_parts_batch", side_effect=_parts)
+@patch("todocli.graphapi.wrapper.iter_list_records")
+class TestBackup(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_second_run_writes_only_changes(self, mock_lists, mock_parts):
+        mock_lists.side_effect = lambda: iter([{"id": "l1", "displayName": "A"}])
+        changes = {
+            ("l1", None): [{"id": "t1", "title": "One"}, {"id": "t2", "title": "Two"}],
+            ("l1", "delta-1"): [{"id": "t1", "@removed": {"reason": "deleted"}}],
+        }
+
+        with patch(DELTA, _delta(changes, "delta-1")):
+            path, records = backup.backup(self.dir)
+        self.assertTrue(path.endswith("000001.ndjson.gz"))
+        self.assertEqual(records, 3)
+        state = backup.load_state(self.dir)
+        self.assertEqual(state["lists"]["l1"]["delta_link"], "delta-1")
+
+        with patch(DELTA, _delta(changes, "delta-2")):
+            path, records = backup.backup(self.dir)
+        self.assertTrue(path.endswith("000002.ndjson.gz"))
+        self.assertEqual(records, 1)
+
+        lists, tasks = backup.read_backup(self.dir)
+        self.assertEqual(list(lists), ["l1"])
+        self.assertEqual(list(tasks["l1"]), ["t2"])
+
+    def test_no_changes_writes_no_segment(self, mock_lists, mock_parts):
+        mock_lists.side_effect = lambda: iter([{"id": "l1", "displayName": "A"}])
+        with patch(DELTA, _delta({}, "d")):
+            backup.backup(self.dir)
+            path, records = backup.backup(self.dir)
+
+        self.assertIsNone(path)
+        self.assertEqual(records, 0)
+        segments = os.listdir(os.path.join(self.dir, "segments"))
+        self.assertEqual(segments, ["000001.ndjson.gz"])
+
+    def test_expired_delta_link_falls_back_to_full_pass(self, mock_lists, mock_parts):
+        mock_lists.side_effect = lambda: iter([{"id": "l1", "displayName": "A"}])
+        backup.save_state(
+            self.dir,
+            {
+                "lists": {"l1": {"displayName": "A", "delta_link": "old"}},
+                "attachments": {},
+            },
+        )
+        calls = []
+
+        def iter_task_delta(list_id, delta_link=None, state=None):
+            calls.append(delta_link)
+            if delta_link == "old":
+                raise HTTPError(response=MagicMock(status_code=410))
+            yield {"id": "t1", "title": "One"}
+            state["delta_link"] = "new"
+
+        with patch(DELTA, iter_task_delta):
+            path, records = backup.backup(self.dir)
+
+        self.assertEqual(calls, ["old", None])
+        self.assertEqual(records, 1)
+        state = backup.load_state(self.dir)
+        self.assertEqual(state["lists"]["l1"]["delta_link"], "new")
+
+    def test_removed_list(self, mock_lists, mock_parts):
+        mock_lists.side_effect = [
+            iter([{"id": "l1", "displayName": "A"}, {"id": "l2", "displayName": "B"}]),
+            iter([{"id": "l1", "displayName": "A"}]),
+        ]
+        with patch(DELTA, _delta({}, "d")):
+            backup.backup(self.dir)
+            backup.backup(self.dir)
+
+        lists, _ = backup.read_backup(self.dir)
+        self.assertEqual(list(lists), ["l1"])
+        self.assertNotIn("l2", backup.load_state(self.dir)["lists"])
+
+
+class TestStoreAttachment(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.state = {"lists": {}, "attachments": {}}
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_known_fingerprint_is_not_fetched(self):
+        att = {"id": "a1", "size": 3, "lastModifiedDateTime": "2026-01-01T00:00:00Z"}
+        with patch(DOWNLOAD, side_effect=_download(b"abc")) as mock_download:
+            first = backup.store_attachment(self.dir, self.state, "l1", "t1", att)
+            second = backup.store_attachment(self.dir, self.state, "l1", "t1", att)
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_download.call_count, 1)
+        with open(backup.object_path(self.dir, first), "rb") as f:
+            self.assertEqual(f.read(), b"abc")
+
+    def test_identical_content_stored_once(self):
+        a1 = {"id": "a1", "size": 3, "lastModifiedDateTime": "x"}
+        a2 = {"id": "a2", "size": 3, "lastModifiedDateTime": "y"}
+        with patch(DOWNLOAD, side_effect=_download(b"abc")):
+            first = backup.store_attachment(self.dir, self.state, "l1", "t1", a1)
+            second = backup.store_attachment(self.dir, self.state, "l1", "t2", a2)
+
+        self.assertEqual(first, second)
+        objects = [files for _, _, files in os.walk(os.path.join(self.dir, "objects"))]
+        self.assertEqual(sum(len(files) for files in objects), 1)
+        leftovers = [n for n in os.listdir(self.dir) if n.endswith(".part")]
+        self.assertEqual(leftovers, [])
+
+
+@patch("todocli.utils.backup.get_oauth_session")
+@patch("todocli.graphapi.wrapper.create_attachment")
+@patch("todocli.utils.task_import.create_task_batch")
+@patch("todocli.graphapi.wrapper.create_list", return_value=("new-l1", "A"))
+@patch("todocli.graphapi.wrapper.get_lists", return_value=[])
+class TestRestore(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        segment = backup._Segment(
+            os.path.join(self.dir, "segments", "000001.ndjson.gz")
+        )
+        segment.write({"type": "list", "id": "l1", "displayName": "A"})
+        segment.write(
+            {
+                "type": "task",
+                "list_id": "l1",
+                "id": "t1",
+                "title": "One",
+                "status": "completed",
+                "createdDateTime": "2026-01-01T00:00:00Z",
+                "steps": [{"id": "s1", "displayName": "Step", "isChecked": True}],
+                "links": [{"id": "k1", "webUrl": "https://example.com"}],
+                "attachments": [{"id": "a1", "name": "f.txt", "sha256": "ab" * 32}],
+            }
+        )
+        segment.commit()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_tasks_before_steps_links_and_attachments(
+        self,
+        mock_get_lists,
+        mock_create_list,
+        mock_create_batch,
+        mock_create_attachment,
+        mock_session,
+    ):
+        mock_create_batch.return_value = {0: ("new-t1", None)}
+        report = MagicMock()
+
+        counts = backup.restore(self.dir, report=report)
+
+        self.assertEqual(counts["restored"], 1)
+        self.assertEqual(counts["lists"], 1)
+        ((_, items), kwargs) = mock_create_batch.call_args
+        number, list_id, body, steps, task_id = items[0]
+        self.assertEqual(list_id, "new-l1")
+        self.assertEqual(body, {"title": "One", "status": "completed"})
+        self.assertEqual(steps, [{"displayName": "Step", "isChecked": True}])
+        self.assertIsNone(task_id)
+
+        self.assertEqual(kwargs["links"][0], [{"webUrl": "https://example.com"}])
+        mock_create_attachment.assert_called_once_with(
+            backup.object_path(self.dir, "ab" * 32),
+            list_id="new-l1",
+            task_id="new-t1",
+            file_name="f.txt",
+        )
+        report.assert_called_once_with("restored", "One", None)
+
+    def test_failed_task_is_reported(
+        self,
+        mock_get_lists,
+        mock_create_list,
+        mock_create_batch,
+        mock_create_attachment,
+        mock_session,
+    ):
+        mock_create_batch.return_value = {0: (None, "Bad request")}
+        report = MagicMock()
+
+        counts = backup.restore(self.dir, report=report)
+
+        self.assertEqual(counts["failed"], 1)
+        report.assert_called_once_with("failed", "One", "Bad request")
+        mock_create_attachment.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
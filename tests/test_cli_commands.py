@@ -286,7 +286,13 @@ class TestCLIArgumentParsing(unittest.TestCase):
         """Test 'show' command with --id flag"""
         args = self.parser.parse_args(["show", "--id", "AAMkABC123"])
         self.assertEqual(args.task_id, "AAMkABC123")
-        self.assertIsNone(args.task_name)
+        self.assertEqual(args.task_names, [])
+
+    def test_show_multiple_tasks(self):
+        """Test 'show' command with several tasks"""
+        args = self.parser.parse_args(["show", "Task A", "1", "-l", "Work"])
+        self.assertEqual(args.task_names, ["Task A", "1"])
+        self.assertEqual(args.list, "Work")
 
     def test_update_with_id_flag(self):
         """Test 'update' command with --id flag"""
@@ -50,6 +50,10 @@ def _make_args(**kwargs):
         args.link = None
     if "attach" not in kwargs:
         args.attach = None
+    if "where" not in kwargs:
+        args.where = None
+    if "set" not in kwargs:
+        args.set = None
     return args
 
 
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""Unit tests for the background daemon and its thin client"""
+
+import io
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from todocli import cli, daemon
+
+
+class TestShouldForward(unittest.TestCase):
+    def test_regular_commands_are_forwarded(self):
+        self.assertTrue(daemon.should_forward(["tasks", "Work"]))
+        self.assertTrue(daemon.should_forward(["rm", "Task", "-y"]))
+
+    def test_local_only_commands(self):
+        self.assertFalse(daemon.should_forward([]))
+        self.assertFalse(daemon.should_forward(["daemon"]))
+        self.assertFalse(daemon.should_forward(["-i"]))
+        self.assertFalse(daemon.should_forward(["attach", "Task", "-"]))
+        self.assertFalse(daemon.should_forward(["rm", "Task"]))
+        self.assertFalse(daemon.should_forward(["remind", "--daemon"]))
+        self.assertTrue(daemon.should_forward(["remind"]))
+
+    def test_streaming_commands_stay_local(self):
+        for argv in (
+            ["export", "--gzip"],
+            ["backup", "/tmp/backup"],
+            ["restore", "/tmp/backup"],
+            ["import", "tasks.csv"],
+            ["download", "Task"],
+            ["run", "script.todo"],
+            ["lst", "Work", "--format", "ndjson"],
+            ["find", "due<today", "--format=csv"],
+        ):
+            self.assertFalse(daemon.should_forward(argv), argv)
+
+
+class TestNotifyChanged(unittest.TestCase):
+    @patch.object(daemon, "invalidate")
+    def test_only_commands_that_may_change_state(self, mock_invalidate):
+        daemon.notify_changed(["lists"])
+        daemon.notify_changed(["export", "--gzip"])
+        daemon.notify_changed(["remind", "--daemon"])
+        mock_invalidate.assert_not_called()
+
+        daemon.notify_changed(["rm", "Task"])
+        daemon.notify_changed(["-i"])
+        self.assertEqual(mock_invalidate.call_count, 2)
+
+    def test_invalidate_without_daemon(self):
+        daemon.invalidate(path="/nonexistent/d.sock")
+
+
+class TestDaemonState(unittest.TestCase):
+    def setUp(self):
+        self.now = [0.0]
+        self.state = daemon.DaemonState(
+            cli.setup_parser(), cache_ttl=30, clock=lambda: self.now[0]
+        )
+
+    @patch("todocli.cli.wrapper.get_lists")
+    def test_read_output_is_cached_until_ttl(self, mock_get_lists):
+        mock_get_lists.return_value = []
+
+        first = self.state.run(["lists", "--json"])
+        second = self.state.run(["lists", "--json"])
+        self.assertEqual(first, {"exit_code": 0, "stdout": "[]\n", "stderr": ""})
+        self.assertEqual(second, first)
+        self.assertEqual(mock_get_lists.call_count, 1)
+
+        self.now[0] = 31
+        self.state.run(["lists", "--json"])
+        self.assertEqual(mock_get_lists.call_count, 2)
+
+    @patch("todocli.cli.wrapper.create_list")
+    @patch("todocli.cli.wrapper.get_lists")
+    def test_mutation_clears_output_cache(self, mock_get_lists, mock_create_list):
+        mock_get_lists.return_value = []
+        mock_create_list.return_value = ("lid", "New")
+
+        self.state.run(["lists"])
+        self.state.run(["new-list", "New"])
+        self.state.run(["lists"])
+
+        self.assertEqual(mock_get_lists.call_count, 2)
+
+    @patch("todocli.cli.wrapper.get_lists")
+    def test_invalidate_clears_output_cache(self, mock_get_lists):
+        mock_get_lists.return_value = []
+
+        self.state.run(["lists"])
+        response = self.state.handle(
+            {"jsonrpc": "2.0", "id": 1, "method": "invalidate"}
+        )
+        self.state.run(["lists"])
+
+        self.assertEqual(response["result"], "invalidated")
+        self.assertEqual(mock_get_lists.call_count, 2)
+
+    def test_errors_are_captured(self):
+        result = self.state.run(["no-such-command"])
+
+        self.assertEqual(result["exit_code"], 2)
+        self.assertIn("invalid choice", result["stderr"])
+
+    def test_handle_rejects_missing_cwd(self):
+        response = self.state.handle(
+            {
+                "jsonrpc": "2.0",
+                "id": 3,
+                "method": "run",
+                "params": {"argv": ["lists"], "cwd": "/nonexistent/dir"},
+            }
+        )
+
+        self.assertEqual(response["id"], 3)
+        self.assertEqual(response["error"]["code"], -32602)
+
+    def test_handle_rejects_unknown_method(self):
+        response = self.state.handle({"jsonrpc": "2.0", "id": 7, "method": "nope"})
+
+        self.assertEqual(response["id"], 7)
+        self.assertEqual(response["error"]["code"], -32601)
+
+
+class TestSocketRoundTrip(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.mkdtemp(dir="/tmp")
+        self.addCleanup(os.rmdir, tmp_dir)
+        self.path = os.path.join(tmp_dir, "d.sock")
+
+    @patch("todocli.graphapi.oauth.create_pooled_session")
+    @patch("todocli.cli.wrapper.get_lists")
+    def test_forward_and_stop(self, mock_get_lists, mock_create_session):
+        mock_get_lists.return_value = []
+        thread = threading.Thread(target=daemon.serve, args=(self.path,))
+        thread.start()
+        for _ in range(100):
+            if os.path.exists(self.path):
+                break
+            threading.Event().wait(0.01)
+
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            exit_code = daemon.forward(["lists", "--json"], path=self.path)
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(stdout.getvalue(), "[]\n")
+
+        self.assertEqual(daemon.call("stop", path=self.path), "stopping")
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(os.path.exists(self.path))
+
+    @patch("todocli.graphapi.oauth.create_pooled_session")
+    @patch("todocli.cli.main")
+    def test_export_gzip_runs_locally_with_daemon_running(
+        self, mock_cli_main, mock_create_session
+    ):
+        thread = threading.Thread(target=daemon.serve, args=(self.path,))
+        thread.start()
+        self.addCleanup(thread.join, 5)
+        self.addCleanup(daemon.call, "stop", path=self.path)
+        for _ in range(100):
+            if os.path.exists(self.path):
+                break
+            threading.Event().wait(0.01)
+
+        with patch.dict(os.environ, {"TODO_DAEMON_SOCKET": self.path}), patch(
+            "sys.argv", ["todo", "export", "--gzip"]
+        ), patch.object(daemon, "forward") as mock_forward:
+            daemon.main()
+
+        mock_forward.assert_not_called()
+        mock_cli_main.assert_called_once_with()
+
+    @patch("todocli.graphapi.oauth.create_pooled_session")
+    @patch("todocli.cli.wrapper.get_lists")
+    def test_local_mutation_invalidates_daemon_cache(
+        self, mock_get_lists, mock_create_session
+    ):
+        mock_get_lists.return_value = []
+        thread = threading.Thread(target=daemon.serve, args=(self.path,))
+        thread.start()
+        self.addCleanup(thread.join, 5)
+        self.addCleanup(daemon.call, "stop", path=self.path)
+        for _ in range(100):
+            if os.path.exists(self.path):
+                break
+            threading.Event().wait(0.01)
+
+        with patch("sys.stdout", new_callable=io.StringIO):
+            daemon.forward(["lists"], path=self.path)
+            daemon.forward(["lists"], path=self.path)
+        self.assertEqual(mock_get_lists.call_count, 1)
+
+        # rm without -y prompts, so it runs here rather than in the daemon
+        with patch.dict(os.environ, {"TODO_DAEMON_SOCKET": self.path}), patch(
+            "sys.argv", ["todo", "rm", "Task"]
+        ), patch("todocli.cli.main"):
+            daemon.main()
+
+        with patch("sys.stdout", new_callable=io.StringIO):
+            daemon.forward(["lists"], path=self.path)
+        self.assertEqual(mock_get_lists.call_count, 2)
+
+    def _start(self):
+        thread = threading.Thread(target=daemon.serve, args=(self.path,))
+        thread.start()
+        self.addCleanup(thread.join, 5)
+        self.addCleanup(daemon.call, "stop", path=self.path)
+        for _ in range(100):
+            if os.path.exists(self.path):
+                break
+            threading.Event().wait(0.01)
+
+    def _connect(self):
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect(self.path)
+        self.addCleanup(client.close)
+        return client
+
+    @patch("todocli.daemon.REQUEST_TIMEOUT", 0.1)
+    @patch("todocli.graphapi.oauth.create_pooled_session")
+    def test_bad_clients_do_not_stop_the_daemon(self, mock_create_session):
+        self._start()
+
+        # Gone before the reply
+        client = self._connect()
+        client.sendall(b'{"jsonrpc": "2.0", "id": 1, "method": "ping"}\n')
+        client.close()
+        # Idle until the daemon gives up on it
+        self._connect()
+        with patch("sys.stderr", new_callable=io.StringIO):
+            self.assertEqual(daemon.call("ping", path=self.path, timeout=5), "pong")
+
+    @patch("todocli.daemon.DaemonState.handle", side_effect=KeyError("boom"))
+    @patch("todocli.graphapi.oauth.create_pooled_session")
+    def test_failing_request_answers_internal_error(
+        self, mock_create_session, mock_handle
+    ):
+        self._start()
+
+        with self.assertRaisesRegex(RuntimeError, "Internal error"):
+            daemon.call("ping", path=self.path, timeout=5)
+        mock_handle.side_effect = None
+        mock_handle.return_value = {"jsonrpc": "2.0", "id": 1, "result": "pong"}
+        self.assertEqual(daemon.call("ping", path=self.path, timeout=5), "pong")
+
+    def test_forward_without_daemon(self):
+        self.assertIsNone(daemon.forward(["lists"], path=self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,10 @@
+import os
+import time
 import unittest
 import todocli
 
 from unittest.mock import Mock, patch
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from todocli.utils.datetime_util import (
     parse_datetime,
@@ -228,6 +230,67 @@ class TestApiTimestampParsing(unittest.TestCase):
         with self.assertRaises(TypeError):
             api_timestamp_to_datetime(12345)
 
+    def test_short_fraction_and_invalid_strings(self):
+        """Test short fractions are padded and malformed strings rejected."""
+        from todocli.utils.datetime_util import api_timestamp_to_datetime
+
+        result = api_timestamp_to_datetime({"dateTime": "2024-01-25T10:30:45.12"})
+        self.assertEqual(result.microsecond, 120000)
+        for value in ("", "2024-01-25", "2024-01-25 10:30:45", "2024-01-25T10:30:45.x"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    api_timestamp_to_datetime(value)
+
+
+@unittest.skipUnless(hasattr(time, "tzset"), "needs time.tzset")
+class TestLocalOffsetCache(unittest.TestCase):
+    """Test cached UTC offsets agree with astimezone() across DST changes."""
+
+    def _use_timezone(self, name):
+        previous = os.environ.get("TZ")
+
+        def restore():
+            if previous is None:
+                os.environ.pop("TZ", None)
+            else:
+                os.environ["TZ"] = previous
+            time.tzset()
+
+        self.addCleanup(restore)
+        os.environ["TZ"] = name
+        time.tzset()
+
+    def _assert_matches_astimezone(self, utc_times):
+        from todocli.utils.datetime_util import utc_to_local
+
+        for naive in utc_times:
+            expected = naive.replace(tzinfo=timezone.utc).astimezone(tz=None)
+            result = utc_to_local(naive)
+            self.assertEqual(result, expected)
+            self.assertEqual(result.utcoffset(), expected.utcoffset())
+            self.assertEqual(result.tzname(), expected.tzname())
+
+    def test_dst_transitions(self):
+        """Test seconds around both 2026 transitions in Europe/Berlin."""
+        self._use_timezone("Europe/Berlin")
+        around = []
+        for change in (datetime(2026, 3, 29, 1), datetime(2026, 10, 25, 1)):
+            around += [change + timedelta(seconds=s) for s in (-3601, -1, 0, 1, 3600)]
+        self._assert_matches_astimezone(around)
+        # Alternating between periods and spanning several years
+        self._assert_matches_astimezone(
+            [datetime(2020, 1, 1) + timedelta(hours=h * 397) for h in range(200)]
+        )
+
+    def test_timezone_change_resets_cache(self):
+        """Test switching TZ is picked up on the next conversion."""
+        from todocli.utils.datetime_util import utc_to_local
+
+        self._use_timezone("America/New_York")
+        self.assertEqual(utc_to_local(datetime(2026, 7, 1)).utcoffset().seconds, 72000)
+        self._use_timezone("Asia/Kolkata")
+        self._assert_matches_astimezone([datetime(2026, 7, 1)])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Unit tests for --fields projection and the $select it sends"""
+
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import MagicMock, patch
+
+from todocli.cli import _run_command, setup_parser
+from todocli.graphapi.wrapper import (
+    BASE_URL,
+    get_task_details_batch,
+    get_tasks,
+    iter_task_records,
+)
+from todocli.models import serialize
+from todocli.models.checklistitem import ChecklistItem
+from todocli.models.todotask import Task
+from todocli.utils.field_projection import InvalidFields, Projection
+
+
+def _response(payload):
+    resp = MagicMock()
+    resp.ok = True
+    resp.content = json.dumps(payload).encode()
+    return resp
+
+
+class TestProjection(unittest.TestCase):
+    def test_keys_and_aliases(self):
+        projection = Projection(Task, "id, title,due,title,", extra=("steps",))
+        self.assertEqual(projection.keys, ["id", "title", "due_datetime"])
+        self.assertEqual(projection.select(), "id,title,dueDateTime")
+        self.assertEqual(
+            projection.select("importance"), "id,title,dueDateTime,importance"
+        )
+        self.assertFalse(projection.wants("steps"))
+
+    def test_note_selects_body(self):
+        self.assertEqual(Projection(Task, "note").select(), "id,body")
+
+    def test_apply_reads_only_projected_fields(self):
+        # Only title and due were fetched, other required fields are missing
+        task = Task(
+            {
+                "id": "t1",
+                "title": "Pay rent",
+                "dueDateTime": {"dateTime": "2026-03-01T00:00:00", "timeZone": "UTC"},
+            }
+        )
+        projection = Projection(Task, "title,due,steps", extra=("steps",))
+
+        record = projection.apply(serialize.WithFields(task, steps=[]))
+
+        self.assertEqual(list(record), ["title", "due_datetime", "steps"])
+        self.assertEqual(record["title"], "Pay rent")
+        self.assertEqual(record["steps"], [])
+
+    def test_apply_dict(self):
+        projection = Projection(Task, "title,id")
+        self.assertEqual(
+            projection.apply({"id": "t1", "title": "A", "status": "x"}),
+            {"title": "A", "id": "t1"},
+        )
+
+    def test_invalid(self):
+        for spec in ("id,colour", "", " , "):
+            with self.subTest(spec=spec), self.assertRaises(InvalidFields) as ctx:
+                Projection(ChecklistItem, spec)
+            self.assertIn("Invalid fields", ctx.exception.message)
+
+
+@patch("todocli.graphapi.wrapper.get_oauth_session")
+class TestSelectRequests(unittest.TestCase):
+    def test_iter_task_records_adds_select_after_filter(self, mock_session):
+        mock_session.return_value.get.return_value = _response({"value": []})
+
+        list(iter_task_records("lid", False, select="id,title"))
+
+        url = mock_session.return_value.get.call_args.args[0]
+        self.assertEqual(
+            url, f"{BASE_URL}/lid/tasks?$filter=status ne 'completed'&$select=id,title"
+        )
+
+    def test_get_tasks_select(self, mock_session):
+        mock_session.return_value.get.return_value = _response(
+            {"value": [{"id": "t1", "title": "A"}]}
+        )
+
+        tasks = get_tasks(list_id="lid", include_completed=True, select="id,title")
+
+        url = mock_session.return_value.get.call_args.args[0]
+        self.assertEqual(url, f"{BASE_URL}/lid/tasks?$top=100&$select=id,title")
+        self.assertEqual(tasks[0].title, "A")
+
+    def test_details_only_requested_parts(self, mock_session):
+        def mock_post(url, json=None):
+            responses = [
+                {
+                    "id": r["id"],
+                    "status": 200,
+                    "body": {"id": "t1", "title": "A"}
+                    if r["id"].endswith("-task")
+                    else {"value": [{"id": "s1"}]},
+                }
+                for r in json["requests"]
+            ]
+            return _response({"responses": responses})
+
+        mock_session.return_value.post.side_effect = mock_post
+
+        result = get_task_details_batch(
+            "lid", ["t1"], select="id,title", parts=["steps"]
+        )
+
+        requests = mock_session.return_value.post.call_args.kwargs["json"]["requests"]
+        self.assertEqual(
+            [r["url"] for r in requests],
+            [
+                "/me/todo/lists/lid/tasks/t1?$select=id,title",
+                "/me/todo/lists/lid/tasks/t1/checklistItems",
+            ],
+        )
+        self.assertEqual(result["t1"]["links"], [])
+        self.assertEqual(len(result["t1"]["steps"]), 1)
+
+
+@patch("todocli.graphapi.wrapper.get_list_id_by_name", return_value="lid")
+class TestFieldsOption(unittest.TestCase):
+    def _run(self, argv):
+        out = io.StringIO()
+        with redirect_stdout(out), patch("sys.argv", ["todo"] + argv):
+            _, ok = _run_command(setup_parser(), argv)
+        return ok, out.getvalue()
+
+    @patch("todocli.graphapi.wrapper.get_checklist_items_batch")
+    @patch("todocli.graphapi.wrapper.get_tasks")
+    def test_tasks_fields_implies_json_and_skips_steps(
+        self, mock_tasks, mock_steps, mock_list
+    ):
+        mock_tasks.return_value = [
+            Task({"id": "t1", "title": "A", "importance": "high"})
+        ]
+
+        ok, output = self._run(["tasks", "--fields", "id,title", "--important"])
+
+        self.assertTrue(ok)
+        self.assertEqual(json.loads(output)["tasks"], [{"id": "t1", "title": "A"}])
+        self.assertEqual(mock_tasks.call_args.kwargs["select"], "id,title,importance")
+        mock_steps.assert_not_called()
+
+    @patch("todocli.graphapi.wrapper.get_task_details_batch")
+    def test_show_fetches_only_requested_parts(self, mock_details, mock_list):
+        mock_details.return_value = {
+            "t1": {
+                "task": Task({"id": "t1", "title": "A"}),
+                "steps": [],
+                "links": [],
+                "attachments": [],
+            }
+        }
+
+        ok, output = self._run(["show", "--id", "t1", "--fields", "title,links"])
+
+        self.assertTrue(ok)
+        self.assertEqual(json.loads(output), {"title": "A", "links": []})
+        mock_details.assert_called_once_with(
+            "lid", ["t1"], select="id,title", parts=["links"]
+        )
+
+    @patch("todocli.cli.create_pooled_session")
+    @patch("todocli.graphapi.wrapper.iter_task_records")
+    def test_find_selects_queried_properties(
+        self, mock_records, mock_session, mock_list
+    ):
+        mock_records.return_value = iter([{"id": "t1", "title": "Pay rent"}])
+
+        ok, output = self._run(
+            ["find", "title ~ rent", "-l", "Work", "--fields", "due,title"]
+            + ["--format", "tsv"]
+        )
+
+        self.assertTrue(ok)
+        self.assertEqual(output.splitlines(), ["due_datetime\ttitle", "\tPay rent"])
+        select = mock_records.call_args.kwargs["select"]
+        self.assertEqual(select, "id,dueDateTime,title")
+
+    @patch("todocli.graphapi.wrapper.get_lists")
+    def test_unknown_field(self, mock_lists, mock_list):
+        ok, output = self._run(["lists", "--fields", "id,colour"])
+
+        self.assertFalse(ok)
+        self.assertEqual(json.loads(output)["code"], "invalid_fields")
+        mock_lists.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -31,6 +31,8 @@ def _make_args(**kwargs):
         "due_today": False,
         "overdue": False,
         "important": False,
+        "format": None,
+        "fields": None,
     }
     for k, v in defaults.items():
         setattr(args, k, v)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Unit tests for the JSON codec backends and --compact output"""
+
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from todocli.cli import _run_command, setup_parser
+from todocli.models import serialize
+from todocli.models.todolist import TodoList
+from todocli.models.todotask import Task
+from todocli.utils import json_codec
+
+TASK = {
+    "id": "t1",
+    "title": "Café ☕ \"quoted\"",
+    "importance": "high",
+    "status": "notStarted",
+    "isReminderOn": False,
+    "createdDateTime": "2026-01-25T10:00:00.1234567Z",
+    "lastModifiedDateTime": "2026-01-26T11:30:00Z",
+}
+
+VALUE = {
+    "tasks": [serialize.WithFields(Task(TASK), steps=[], list="Tasks")],
+    "empty": {},
+    "counts": [1, 2.5, None, True],
+}
+
+
+def _backends():
+    """Backends available here (orjson is optional)."""
+    return [
+        name
+        for name in json_codec.BACKENDS
+        if name != "orjson" or json_codec.orjson is not None
+    ]
+
+
+class TestCodec(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(json_codec.set_backend, json_codec.backend())
+
+    def test_backends_write_the_same_text(self):
+        expected = dict(Task(TASK).to_dict(), steps=[], list="Tasks")
+        expected = {"tasks": [expected], "empty": {}, "counts": [1, 2.5, None, True]}
+        for name in _backends():
+            json_codec.set_backend(name)
+            with self.subTest(backend=name):
+                self.assertEqual(
+                    json_codec.dumps(VALUE),
+                    json.dumps(expected, indent=2, ensure_ascii=False),
+                )
+                self.assertEqual(
+                    json_codec.dumps(VALUE, compact=True),
+                    json.dumps(expected, separators=(",", ":"), ensure_ascii=False),
+                )
+
+    def test_loads_bytes(self):
+        data = json.dumps({"value": [TASK]}, ensure_ascii=False).encode()
+        for name in _backends():
+            json_codec.set_backend(name)
+            with self.subTest(backend=name):
+                self.assertEqual(json_codec.loads(data)["value"][0], TASK)
+
+    def test_dump_writes_utf8_to_binary_buffer(self):
+        for name in _backends():
+            json_codec.set_backend(name)
+            with self.subTest(backend=name):
+                raw = io.BytesIO()
+                out = io.TextIOWrapper(raw, encoding="ascii")
+                json_codec.dump({"title": "☕"}, out, compact=True)
+                out.flush()
+                self.assertEqual(raw.getvalue().decode(), '{"title":"☕"}')
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            json_codec.set_backend("simplejson")
+
+
+class TestCompactOutput(unittest.TestCase):
+    @patch("todocli.cli.wrapper")
+    def test_compact_implies_json(self, mock_wrapper):
+        mock_wrapper.get_lists.return_value = [
+            TodoList(
+                {
+                    "id": "l1",
+                    "displayName": "Tasks",
+                    "isOwner": True,
+                    "isShared": False,
+                    "wellknownListName": "defaultList",
+                }
+            )
+        ]
+        out = io.StringIO()
+        with redirect_stdout(out):
+            _, ok = _run_command(setup_parser(), ["lists", "--compact"])
+
+        self.assertTrue(ok)
+        self.assertEqual(out.getvalue().count("\n"), 1)
+        self.assertEqual(json.loads(out.getvalue())[0]["display_name"], "Tasks")
+
+
+if __name__ == "__main__":
+    unittest.main()
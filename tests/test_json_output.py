@@ -95,6 +95,8 @@ def _make_args(**kwargs):
         "overdue": False,
         "important": False,
         "list": None,
+        "format": None,
+        "fields": None,
     }
     for k, v in defaults.items():
         setattr(args, k, v)
@@ -205,11 +207,19 @@ class TestJsonOutputShow(unittest.TestCase):
     @patch("todocli.cli.wrapper")
     def test_show_json_output(self, mock_wrapper):
         task = _make_task("Important task", importance="high")
-        mock_wrapper.get_task.return_value = task
-        mock_wrapper.get_checklist_items.return_value = [_make_step("Step 1")]
+        mock_wrapper.get_list_id_by_name.return_value = "lid"
+        mock_wrapper.get_task_ids_by_names.return_value = ["tid"]
+        mock_wrapper.get_task_details_batch.return_value = {
+            "tid": {
+                "task": task,
+                "steps": [_make_step("Step 1")],
+                "links": [],
+                "attachments": [],
+            }
+        }
 
         with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            show(_make_args(task_name="Important task", json=True))
+            show(_make_args(task_names=["Important task"], task_id=None, json=True))
             output = mock_stdout.getvalue()
 
         data = json.loads(output)
@@ -217,6 +227,79 @@ class TestJsonOutputShow(unittest.TestCase):
         self.assertEqual(data["importance"], "high")
         self.assertEqual(data["list"], "Tasks")
         self.assertEqual(len(data["steps"]), 1)
+        mock_wrapper.get_task_ids_by_names.assert_called_once_with(
+            "lid", "Tasks", ["Important task"]
+        )
+
+    @patch("todocli.cli.wrapper")
+    def test_show_multiple_tasks_json_output(self, mock_wrapper):
+        mock_wrapper.get_list_id_by_name.return_value = "lid"
+        mock_wrapper.get_task_ids_by_names.return_value = ["t1", "t2"]
+        mock_wrapper.get_task_details_batch.return_value = {
+            tid: {
+                "task": _make_task(title, task_id=tid),
+                "steps": [],
+                "links": [],
+                "attachments": [],
+            }
+            for tid, title in (("t1", "First"), ("t2", "Second"))
+        }
+
+        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+            show(_make_args(task_names=["First", "1"], task_id=None, json=True))
+            output = mock_stdout.getvalue()
+
+        data = json.loads(output)
+        self.assertEqual([d["title"] for d in data], ["First", "Second"])
+        mock_wrapper.get_task_ids_by_names.assert_called_once_with(
+            "lid", "Tasks", ["First", 1]
+        )
+        mock_wrapper.get_task_details_batch.assert_called_once_with(
+            "lid", ["t1", "t2"]
+        )
+
+
+    @patch("todocli.cli.wrapper")
+    def test_show_resolves_names_per_list(self, mock_wrapper):
+        def parse_task_path(task_input, list_name=None):
+            if "/" in task_input:
+                return tuple(task_input.split("/", 1))
+            return list_name or "Tasks", task_input
+
+        list_ids = {"Work": "wid", "Home": "hid"}
+        ids = {("wid", "Report"): "t1", ("hid", "Fix"): "t2", ("wid", "Call"): "t3"}
+        titles = {"t1": "Report", "t2": "Fix", "t3": "Call"}
+        mock_wrapper.get_list_id_by_name.side_effect = list_ids.get
+        mock_wrapper.get_task_ids_by_names.side_effect = lambda lid, name, names: [
+            ids[(lid, n)] for n in names
+        ]
+        mock_wrapper.get_task_details_batch.side_effect = lambda lid, tids: {
+            tid: {
+                "task": _make_task(titles[tid], task_id=tid),
+                "steps": [],
+                "links": [],
+                "attachments": [],
+            }
+            for tid in tids
+        }
+
+        args = _make_args(
+            task_names=["Work/Report", "Home/Fix", "Work/Call"], task_id=None, json=True
+        )
+        with patch("todocli.cli.parse_task_path", side_effect=parse_task_path), patch(
+            "sys.stdout", new_callable=StringIO
+        ) as mock_stdout:
+            show(args)
+            output = mock_stdout.getvalue()
+
+        data = json.loads(output)
+        self.assertEqual(
+            [(d["list"], d["title"]) for d in data],
+            [("Work", "Report"), ("Home", "Fix"), ("Work", "Call")],
+        )
+        mock_wrapper.get_task_details_batch.assert_has_calls(
+            [unittest.mock.call("wid", ["t1", "t3"]), unittest.mock.call("hid", ["t2"])]
+        )
 
 
 if __name__ == "__main__":
@@ -34,6 +34,8 @@ def _make_args(
     args.due_today = due_today
     args.overdue = overdue
     args.important = important
+    args.format = None
+    args.fields = None
     return args
 
 
@@ -130,6 +132,31 @@ class TestLstOutput(unittest.TestCase):
         # Batch should not have been called
         mock_wrapper.get_checklist_items_batch.assert_not_called()
 
+    @patch("todocli.cli.wrapper")
+    def test_lst_aligns_due_dates(self, mock_wrapper):
+        tasks = [
+            _make_task("Short", due_datetime=datetime(2026, 3, 1), task_id="t1"),
+            _make_task("A longer title", importance="high", task_id="t2"),
+            _make_task("Mid title", due_datetime=datetime(2026, 3, 2), task_id="t3"),
+        ]
+        mock_wrapper.get_list_id_by_name.return_value = "lid"
+        mock_wrapper.get_tasks.return_value = tasks
+
+        args = _make_args(no_steps=True)
+        args.show_id = False
+        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+            lst(args)
+            lines = mock_stdout.getvalue().splitlines()
+
+        self.assertEqual(
+            lines,
+            [
+                "[0]  Short             (due: 01.03.2026)",
+                "[1]  A longer title !",
+                "[2]  Mid title         (due: 02.03.2026)",
+            ],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
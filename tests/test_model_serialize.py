@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Unit tests for slotted models, tuple round-trips and direct JSON output"""
+
+import json
+import pickle
+import tracemalloc
+import unittest
+
+from todocli.models import serialize
+from todocli.models.checklistitem import ChecklistItem
+from todocli.models.todolist import TodoList
+from todocli.models.todotask import Task
+
+
+def _task(i):
+    return Task(
+        {
+            "id": f"AAMkAGI2TG93AAA{i:08d}",
+            "title": f"Task number {i} – café",
+            "importance": "high" if i % 2 else "normal",
+            "status": "notStarted",
+            "isReminderOn": bool(i % 2),
+            "createdDateTime": "2026-01-25T10:00:00.1234567Z",
+            "lastModifiedDateTime": "2026-01-26T11:30:00Z",
+            "dueDateTime": {
+                "dateTime": "2026-02-01T00:00:00.0000000",
+                "timeZone": "UTC",
+            },
+            "body": {"content": "a note" if i % 2 else "", "contentType": "text"},
+        }
+    )
+
+
+STEP = {
+    "id": "s1",
+    "displayName": "Step \"one\"",
+    "isChecked": True,
+    "createdDateTime": "2026-02-04T19:08:45Z",
+    "checkedDateTime": "2026-02-05T08:00:00Z",
+}
+
+LIST = {
+    "id": "l1",
+    "displayName": "Tasks",
+    "isOwner": True,
+    "isShared": False,
+    "wellknownListName": "defaultList",
+}
+
+
+class _Discard:
+    def write(self, text):
+        pass
+
+
+class TestSlottedModels(unittest.TestCase):
+    def test_no_instance_dict(self):
+        for model in (_task(1), ChecklistItem(STEP), TodoList(LIST)):
+            with self.subTest(model=type(model).__name__):
+                self.assertFalse(hasattr(model, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    model.unknown_attribute = 1
+
+    def test_tuple_round_trip(self):
+        for model in (_task(1), ChecklistItem(STEP), TodoList(LIST)):
+            with self.subTest(model=type(model).__name__):
+                values = model.to_tuple()
+                self.assertEqual(len(values), len(model.FIELDS))
+                copy = type(model).from_tuple(values)
+                self.assertEqual(copy.to_tuple(), values)
+                self.assertEqual(copy.to_dict(), model.to_dict())
+
+    def test_pickle_round_trip(self):
+        task = _task(1)
+        self.assertEqual(pickle.loads(pickle.dumps(task)).to_dict(), task.to_dict())
+
+
+class TestSerialize(unittest.TestCase):
+    def test_matches_json_dumps_of_to_dict(self):
+        tasks = [_task(i) for i in range(3)]
+        steps = [ChecklistItem(STEP)]
+        value = {
+            "list": TodoList(LIST),
+            "tasks": [serialize.WithFields(t, steps=steps) for t in tasks],
+            "empty": [],
+            "counts": {"n": 3, "ratio": 0.5, "none": None},
+        }
+        expected = {
+            "list": TodoList(LIST).to_dict(),
+            "tasks": [
+                dict(t.to_dict(), steps=[s.to_dict() for s in steps]) for t in tasks
+            ],
+            "empty": [],
+            "counts": {"n": 3, "ratio": 0.5, "none": None},
+        }
+        for indent in (None, 2):
+            with self.subTest(indent=indent):
+                self.assertEqual(
+                    serialize.dumps(value, indent=indent),
+                    json.dumps(expected, indent=indent),
+                )
+
+    def test_unsupported_type(self):
+        with self.assertRaises(TypeError):
+            serialize.dumps({"x": object()})
+
+
+class TestMemoryPerTask(unittest.TestCase):
+    COUNT = 1000
+
+    def setUp(self):
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+
+    def _bytes_per_task(self, build):
+        before = tracemalloc.get_traced_memory()[0]
+        objects = build()
+        used = tracemalloc.get_traced_memory()[0] - before
+        self.assertEqual(len(objects), self.COUNT)
+        return used / self.COUNT
+
+    def test_undecoded_task_is_small(self):
+        payloads = [_task(i)._raw for i in range(self.COUNT)]
+        per_task = self._bytes_per_task(lambda: [Task(p) for p in payloads])
+        self.assertLess(per_task, 250)
+
+    def test_task_from_tuple_shares_values(self):
+        values = [_task(i).to_tuple() for i in range(self.COUNT)]
+        per_task = self._bytes_per_task(lambda: [Task.from_tuple(v) for v in values])
+        self.assertLess(per_task, 250)
+
+    def test_serializer_peak_below_dict_round_trip(self):
+        tasks = [_task(i) for i in range(self.COUNT)]
+        for task in tasks:
+            task.to_tuple()
+
+        def peak_per_task(write):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            write()
+            return (tracemalloc.get_traced_memory()[1] - before) / self.COUNT
+
+        via_dicts = peak_per_task(
+            lambda: json.dump([t.to_dict() for t in tasks], _Discard(), indent=2)
+        )
+        direct = peak_per_task(lambda: serialize.dump(tasks, _Discard(), indent=2))
+        self.assertLess(direct, via_dicts / 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,8 @@
 
 import unittest
 from datetime import datetime, timezone
+from unittest.mock import patch
+from todocli.models.checklistitem import ChecklistItem
 from todocli.models.todolist import TodoList
 from todocli.models.todotask import Task, TaskStatus, TaskImportance
 
@@ -324,5 +326,62 @@ class TestTaskModel(unittest.TestCase):
         self.assertIsNone(task_dict["note"])
 
 
+
+class TestLazyDecoding(unittest.TestCase):
+    """Test that model fields are decoded on first access only"""
+
+    API_RESPONSE = {
+        "id": "task123",
+        "title": "Buy milk",
+        "importance": "high",
+        "status": "notStarted",
+        "createdDateTime": "2024-01-25T10:00:00.0000000Z",
+        "lastModifiedDateTime": "2024-01-25T10:00:00.0000000Z",
+        "dueDateTime": {"dateTime": "2024-01-26T00:00:00.0000000", "timeZone": "UTC"},
+        "isReminderOn": False,
+    }
+
+    def test_timestamps_parsed_on_first_access(self):
+        """Test reading id and title decodes nothing else, others only once"""
+        task = Task(self.API_RESPONSE)
+        self.assertEqual((task.id, task.title), ("task123", "Buy milk"))
+        decoded = [name for name in Task.FIELDS if hasattr(task, "_" + name)]
+        self.assertEqual(decoded, ["id", "title"])
+
+        with patch.object(Task.due_datetime, "decode") as mock_parse:
+            mock_parse.return_value = datetime(2024, 1, 26)
+            self.assertIs(task.due_datetime, task.due_datetime)
+        mock_parse.assert_called_once_with(self.API_RESPONSE["dueDateTime"])
+
+    def test_attributes_can_be_assigned(self):
+        """Test assigning an attribute replaces the decoded value"""
+        task = Task(self.API_RESPONSE)
+        task.importance = TaskImportance.LOW
+        task.due_datetime = None
+        self.assertEqual(task.to_dict()["importance"], "low")
+        self.assertIsNone(task.to_dict()["due_datetime"])
+
+    def test_missing_required_field_raises_on_access(self):
+        """Test a missing required key raises KeyError when read"""
+        task = Task({"id": "t1", "title": "Partial"})
+        self.assertEqual(task.title, "Partial")
+        with self.assertRaises(KeyError):
+            task.status
+
+    def test_checklist_item_empty_checked_datetime(self):
+        """Test an empty checkedDateTime decodes to None"""
+        item = ChecklistItem(
+            {
+                "id": "s1",
+                "displayName": "Step",
+                "isChecked": 0,
+                "createdDateTime": "2026-02-04T19:08:45Z",
+                "checkedDateTime": "",
+            }
+        )
+        self.assertIs(item.is_checked, False)
+        self.assertIsNone(item.checked_datetime)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Unit tests for ndjson/csv/tsv record output of listing commands"""
+
+import csv
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from todocli.cli import setup_parser
+from todocli.models.checklistitem import ChecklistItem
+from todocli.utils.record_output import RecordWriter
+
+
+def _task(i, **extra):
+    return dict(
+        {
+            "id": f"t{i}",
+            "title": f"Task {i}",
+            "importance": "normal",
+            "status": "notStarted",
+            "isReminderOn": False,
+            "createdDateTime": "2026-01-01T08:00:00Z",
+            "lastModifiedDateTime": "2026-01-01T08:00:00Z",
+        },
+        **extra,
+    )
+
+
+class TestRecordWriter(unittest.TestCase):
+    RECORDS = [
+        {"id": "1", "title": 'Tab\there, "quoted"', "done": True, "tags": ["a"]},
+        {"id": "2", "title": "Line\nbreak \\ slash", "done": False, "tags": None},
+    ]
+    FIELDS = ["id", "title", "done", "tags"]
+
+    def _write(self, fmt):
+        out = io.StringIO()
+        writer = RecordWriter(fmt, self.FIELDS, out)
+        self.assertEqual(writer.write_all(self.RECORDS), 2)
+        return out.getvalue()
+
+    def test_ndjson(self):
+        lines = self._write("ndjson").splitlines()
+        self.assertEqual([json.loads(line) for line in lines], self.RECORDS)
+
+    def test_csv_round_trips(self):
+        rows = list(csv.reader(io.StringIO(self._write("csv"))))
+        self.assertEqual(rows[0], self.FIELDS)
+        self.assertEqual(rows[1], ["1", 'Tab\there, "quoted"', "true", '["a"]'])
+        self.assertEqual(rows[2], ["2", "Line\nbreak \\ slash", "false", ""])
+
+    def test_tsv_escapes_separators(self):
+        lines = self._write("tsv").split("\n")
+        self.assertEqual(lines[0], "id\ttitle\tdone\ttags")
+        self.assertEqual(lines[1], '1\tTab\\there, "quoted"\ttrue\t["a"]')
+        self.assertEqual(lines[2], "2\tLine\\nbreak \\\\ slash\tfalse\t")
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            RecordWriter("xml", self.FIELDS, io.StringIO())
+
+
+@patch("todocli.graphapi.wrapper.get_list_id_by_name", return_value="l1")
+class TestListingFormats(unittest.TestCase):
+    def _run(self, argv):
+        args = setup_parser().parse_args(argv)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            args.func(args)
+        return out.getvalue()
+
+    @patch("todocli.graphapi.wrapper.iter_task_records")
+    def test_tasks_csv_streams_every_page(self, mock_records, mock_list):
+        out = io.StringIO()
+        seen_before_end = []
+
+        def records(list_id, include_completed, odata_filter=None, select=None):
+            for i in range(150):
+                if i == 149:
+                    seen_before_end.append(out.getvalue().count("\n"))
+                yield _task(i, importance="high" if i % 2 else "normal")
+
+        mock_records.side_effect = records
+        args = setup_parser().parse_args(["tasks", "--important", "--format", "csv"])
+        with redirect_stdout(out):
+            args.func(args)
+
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        self.assertEqual(len(rows), 75)
+        self.assertEqual(rows[0]["importance"], "high")
+        # Header and earlier rows were written before the last page arrived
+        self.assertEqual(seen_before_end, [75])
+        self.assertEqual(mock_records.call_args.args, ("l1", False))
+
+    @patch("todocli.graphapi.wrapper.get_checklist_items_batch")
+    @patch("todocli.graphapi.wrapper.iter_task_records")
+    def test_tasks_ndjson_with_steps_in_batches(
+        self, mock_records, mock_steps, mock_list
+    ):
+        mock_records.return_value = iter([_task(i) for i in range(25)])
+        step = ChecklistItem(
+            {
+                "id": "s1",
+                "displayName": "Step",
+                "isChecked": False,
+                "createdDateTime": "2026-01-01T08:00:00Z",
+            }
+        )
+        mock_steps.side_effect = lambda list_id, ids: {ids[0]: [step]}
+
+        lines = self._run(["tasks", "--format", "ndjson", "--completed"]).splitlines()
+
+        self.assertEqual(len(lines), 25)
+        self.assertEqual([len(c.args[1]) for c in mock_steps.call_args_list], [20, 5])
+        first = json.loads(lines[0])
+        self.assertEqual(first["steps"][0]["display_name"], "Step")
+        self.assertEqual(json.loads(lines[1])["steps"], [])
+        kwargs = mock_records.call_args.kwargs
+        self.assertEqual(kwargs["odata_filter"], "status eq 'completed'")
+
+    @patch("todocli.graphapi.wrapper.get_linked_resources")
+    def test_links_tsv(self, mock_links, mock_list):
+        mock_links.return_value = [
+            {"id": "r1", "webUrl": "https://a.example", "applicationName": "App"}
+        ]
+
+        output = self._run(["links", "Tasks/x", "--format", "tsv"])
+
+        self.assertEqual(
+            output.splitlines(),
+            ["id\turl\tapp\tdisplay_name", "r1\thttps://a.example\tApp\t"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
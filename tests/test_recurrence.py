@@ -5,7 +5,11 @@ import unittest
 from datetime import date
 from unittest.mock import patch
 
-from todocli.utils.recurrence_util import parse_recurrence, InvalidRecurrenceExpression
+from todocli.utils.recurrence_util import (
+    expand_recurrence,
+    parse_recurrence,
+    InvalidRecurrenceExpression,
+)
 
 
 class TestParseRecurrence(unittest.TestCase):
@@ -155,5 +159,108 @@ class TestParseRecurrence(unittest.TestCase):
         self.assertEqual(result["pattern"]["type"], "absoluteMonthly")
 
 
+def _recurrence(pattern, start="2026-01-31", **series):
+    series = series or {"type": "noEnd"}
+    return {"pattern": pattern, "range": dict(series, startDate=start)}
+
+
+class TestExpandRecurrence(unittest.TestCase):
+    """Test expand_recurrence function"""
+
+    def _dates(self, recurrence, **kwargs):
+        return [d.isoformat() for d in expand_recurrence(recurrence, **kwargs)]
+
+    def test_daily_interval_skips_to_after(self):
+        recurrence = _recurrence({"type": "daily", "interval": 3})
+        self.assertEqual(
+            self._dates(recurrence, after=date(2026, 3, 1), limit=3),
+            ["2026-03-02", "2026-03-05", "2026-03-08"],
+        )
+
+    def test_weekly_days_every_other_week(self):
+        # The week of the start date (from Sunday) is the first period
+        recurrence = _recurrence(
+            {"type": "weekly", "interval": 2, "daysOfWeek": ["monday", "friday"]}
+        )
+        self.assertEqual(
+            self._dates(recurrence, limit=4),
+            ["2026-02-09", "2026-02-13", "2026-02-23", "2026-02-27"],
+        )
+
+    def test_weekdays_preset_round_trip(self):
+        with patch("todocli.utils.recurrence_util.date", wraps=date) as mock_date:
+            mock_date.today.return_value = date(2026, 2, 6)
+            recurrence = parse_recurrence("weekdays")
+        self.assertEqual(
+            self._dates(recurrence, limit=3),
+            ["2026-02-06", "2026-02-09", "2026-02-10"],
+        )
+
+    def test_absolute_monthly_uses_last_day_of_short_months(self):
+        recurrence = _recurrence({"type": "absoluteMonthly", "dayOfMonth": 31})
+        self.assertEqual(
+            self._dates(recurrence, until=date(2026, 4, 30)),
+            ["2026-01-31", "2026-02-28", "2026-03-31", "2026-04-30"],
+        )
+
+    def test_relative_monthly(self):
+        recurrence = _recurrence(
+            {"type": "relativeMonthly", "daysOfWeek": ["friday"], "index": "last"}
+        )
+        self.assertEqual(
+            self._dates(recurrence, limit=2), ["2026-02-27", "2026-03-27"]
+        )
+
+    def test_yearly(self):
+        absolute = _recurrence(
+            {"type": "absoluteYearly", "month": 2, "dayOfMonth": 29}, start="2026-01-01"
+        )
+        relative = _recurrence(
+            {
+                "type": "relativeYearly",
+                "month": 11,
+                "daysOfWeek": ["thursday"],
+                "index": "fourth",
+            }
+        )
+        self.assertEqual(
+            self._dates(absolute, limit=3),
+            ["2026-02-28", "2027-02-28", "2028-02-29"],
+        )
+        self.assertEqual(
+            self._dates(relative, limit=2), ["2026-11-26", "2027-11-25"]
+        )
+
+    def test_numbered_range_counts_from_start(self):
+        recurrence = _recurrence(
+            {"type": "daily"}, type="numbered", numberOfOccurrences=5
+        )
+        self.assertEqual(
+            self._dates(recurrence, after=date(2026, 2, 2)),
+            ["2026-02-02", "2026-02-03", "2026-02-04"],
+        )
+
+    def test_end_date_and_start_override(self):
+        recurrence = _recurrence(
+            {"type": "weekly", "daysOfWeek": ["wednesday"]},
+            type="endDate",
+            endDate="2026-03-01",
+        )
+        self.assertEqual(
+            self._dates(recurrence, start=date(2026, 2, 10)),
+            ["2026-02-11", "2026-02-18", "2026-02-25"],
+        )
+
+    def test_generator_is_lazy(self):
+        # Endless series: taking a few dates must not expand the rest
+        recurrence = _recurrence({"type": "daily"})
+        dates = expand_recurrence(recurrence, after=date(9000, 1, 1))
+        self.assertEqual(next(dates), date(9000, 1, 1))
+
+    def test_unknown_or_missing(self):
+        self.assertEqual(self._dates(_recurrence({"type": "hourly"}), limit=5), [])
+        self.assertEqual(self._dates({"pattern": {"type": "daily"}}, limit=5), [])
+
+
 if __name__ == "__main__":
     unittest.main()
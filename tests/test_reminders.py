@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""Unit tests for the local reminder scheduler"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from requests import ConnectionError
+
+from todocli.cli import remind
+from todocli.utils import reminders, replica
+from todocli.utils.datetime_util import datetime_to_api_timestamp
+
+SYNC = "todocli.utils.replica.sync"
+
+START = datetime(2026, 10, 19, 8).timestamp()
+
+
+def _task(task_id, title, minutes=None):
+    record = {"id": task_id, "title": title, "status": "notStarted"}
+    if minutes is not None:
+        at = datetime.fromtimestamp(START + minutes * 60)
+        record["reminderDateTime"] = datetime_to_api_timestamp(at)
+        record["isReminderOn"] = True
+    return record
+
+
+def _replica(*tasks):
+    r = replica.Replica()
+    r.lists["l1"] = {"name": "Work", "delta_link": "d", "tasks": {}}
+    r.apply("l1", tasks)
+    r.rebuild_index()
+    return r
+
+
+class _FakeTime:
+    """A clock and a stop event whose wait() advances the clock."""
+
+    def __init__(self, now, until):
+        self.now = now
+        self.until = until
+        self.waits = []
+
+    def __call__(self):
+        return self.now
+
+    def is_set(self):
+        return self.now >= self.until
+
+    def wait(self, timeout):
+        self.waits.append(timeout)
+        self.now += timeout
+
+
+class TestReminderQueue(unittest.TestCase):
+    def test_load_skips_past_and_inactive(self):
+        r = _replica(
+            _task("past", "Past", minutes=-5),
+            _task("soon", "Soon", minutes=5),
+            _task("later", "Later", minutes=60),
+            _task("none", "None"),
+        )
+        queue = reminders.ReminderQueue()
+        queue.load(r, START)
+
+        self.assertEqual(len(queue), 2)
+        self.assertEqual(queue.next_time(), START + 300)
+        due = queue.pop_due(START + 300)
+        self.assertEqual([entry[2] for entry in due], ["soon"])
+        self.assertEqual(queue.next_time(), START + 3600)
+
+    def test_update_reschedules_and_cancels(self):
+        r = _replica(_task("a", "A", minutes=5), _task("b", "B", minutes=10))
+        queue = reminders.ReminderQueue()
+        queue.load(r, START)
+
+        r.apply("l1", [_task("a", "A", minutes=20), {"id": "b", "@removed": {}}])
+        queue.update(r, {("l1", "a"), ("l1", "b")}, START)
+
+        self.assertEqual(len(queue), 1)
+        self.assertEqual(queue.next_time(), START + 1200)
+        self.assertEqual(queue.pop_due(START + 600), [])
+        self.assertEqual([e[2] for e in queue.pop_due(START + 1200)], ["a"])
+
+
+class TestRun(unittest.TestCase):
+    def test_fires_reminders_and_syncs_once_per_interval(self):
+        r = _replica(_task("a", "Call", minutes=1), _task("b", "Pay", minutes=7))
+        r.save = MagicMock()
+        fake = _FakeTime(START, until=START + 601)
+        notify = MagicMock()
+
+        def sync(replica_arg):
+            # The second reminder moves from 8:07 to 8:08
+            replica_arg.apply("l1", [_task("b", "Pay", minutes=8)])
+            return {("l1", "b")}
+
+        with patch(SYNC, side_effect=sync) as mock_sync:
+            reminders.run(r, notify, interval=300, stop=fake, clock=fake)
+
+        self.assertEqual(mock_sync.call_count, 2)
+        self.assertEqual(r.save.call_count, 2)
+        self.assertEqual([c.args[1] for c in notify.call_args_list], ["Call", "Pay"])
+        self.assertEqual(notify.call_args_list[1].args[0], "Reminder (Work, 08:08)")
+        # Woken only for the reminders and the syncs
+        self.assertEqual(fake.waits, [60, 240, 180, 120, 300])
+
+    def test_on_change_after_sync_with_changes(self):
+        r = _replica(_task("a", "Call", minutes=60))
+        r.save = MagicMock()
+        fake = _FakeTime(START, until=START + 601)
+        on_change = MagicMock()
+        results = [{("l1", "a")}, set()]
+
+        with patch(SYNC, side_effect=lambda replica_arg: results.pop(0)):
+            reminders.run(
+                r, MagicMock(), interval=300, stop=fake, clock=fake, on_change=on_change
+            )
+
+        on_change.assert_called_once_with()
+
+    def test_sync_failure_is_logged(self):
+        r = _replica(_task("a", "Call", minutes=10))
+        fake = _FakeTime(START, until=START + 400)
+        log = io.StringIO()
+        notify = MagicMock()
+
+        with patch(SYNC, side_effect=ConnectionError("offline")):
+            reminders.run(r, notify, interval=300, stop=fake, clock=fake, log=log)
+
+        self.assertIn("Sync failed: offline", log.getvalue())
+        self.assertFalse(notify.called)
+
+    def test_failed_sync_reschedules_partial_changes(self):
+        r = _replica(_task("a", "Call", minutes=10))
+        fake = _FakeTime(START, until=START + 900)
+        notify = MagicMock()
+
+        def sync(replica_arg):
+            # The reminder moves to 8:12, then the next list fails
+            replica_arg.apply("l1", [_task("a", "Call", minutes=12)])
+            raise ConnectionError("offline")
+
+        with patch(SYNC, side_effect=sync):
+            reminders.run(
+                r, notify, interval=300, stop=fake, clock=fake, log=io.StringIO()
+            )
+
+        notify.assert_called_once()
+        self.assertEqual(notify.call_args.args[0], "Reminder (Work, 08:12)")
+
+    def test_notifier_failure_is_logged(self):
+        r = _replica(_task("a", "Call", minutes=1), _task("b", "Pay", minutes=2))
+        fake = _FakeTime(START, until=START + 180)
+        log = io.StringIO()
+        notify = MagicMock(side_effect=[OSError("no display"), None])
+
+        reminders.run(r, notify, interval=300, stop=fake, clock=fake, log=log)
+
+        self.assertIn("Notification failed: no display", log.getvalue())
+        self.assertEqual(notify.call_count, 2)
+
+
+class TestNotifier(unittest.TestCase):
+    @patch("shutil.which", return_value=None)
+    def test_stdout_without_desktop_command(self, mock_which):
+        self.assertIs(reminders.notifier("auto"), reminders.stdout_notifier)
+        with self.assertRaises(ValueError):
+            reminders.notifier("desktop")
+
+    @patch("subprocess.run")
+    @patch("shutil.which", return_value="/usr/bin/notify-send")
+    @patch("sys.platform", "linux")
+    def test_desktop(self, mock_which, mock_run):
+        with patch.dict("os.environ", {"DISPLAY": ":0"}):
+            notify = reminders.notifier("auto")
+        notify("Reminder", "Call mom")
+        mock_run.assert_called_once_with(
+            ["notify-send", "--app-name=todo", "Reminder", "Call mom"], check=False
+        )
+
+
+class TestRemindCommand(unittest.TestCase):
+    def _args(self, **kwargs):
+        args = MagicMock()
+        args.daemon = False
+        args.json = False
+        args.date_format = "iso"
+        for key, value in kwargs.items():
+            setattr(args, key, value)
+        return args
+
+    @patch("todocli.cli.time.time", return_value=START)
+    @patch("todocli.utils.replica.Replica.load")
+    def test_lists_pending_reminders(self, mock_load, mock_time):
+        mock_load.return_value = _replica(
+            _task("b", "Pay", minutes=90), _task("a", "Call", minutes=30)
+        )
+        out = io.StringIO()
+        with redirect_stdout(out):
+            remind(self._args())
+
+        self.assertEqual(
+            out.getvalue().splitlines(),
+            ["2026-10-19 08:30  Work/Call", "2026-10-19 09:30  Work/Pay"],
+        )
+
+    def test_rejects_non_positive_interval(self):
+        with self.assertRaises(ValueError):
+            remind(self._args(daemon=True, interval=0, notify="stdout"))
+
+
+if __name__ == "__main__":
+    unittest.main()
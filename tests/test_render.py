@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Unit tests for buffered, aligned human-readable output"""
+
+import io
+import os
+import unittest
+from unittest.mock import patch
+
+from todocli.utils import render
+from todocli.utils.render import Renderer, display_width, truncate
+
+
+class _CountingOut(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+class _Terminal(io.StringIO):
+    def isatty(self):
+        return True
+
+
+class TestText(unittest.TestCase):
+    def test_display_width(self):
+        self.assertEqual(display_width("abc"), 3)
+        self.assertEqual(display_width("café"), 4)
+        self.assertEqual(display_width("日本"), 4)
+
+    def test_truncate(self):
+        self.assertEqual(truncate("short", 10), "short")
+        self.assertEqual(truncate("a long title", 6), "a lon…")
+        self.assertEqual(truncate("日本語のタスク", 5), "日本…")
+        self.assertEqual(truncate("abc", 0), "")
+
+
+class TestRenderer(unittest.TestCase):
+    def test_table_aligns_columns(self):
+        out = io.StringIO()
+        with Renderer(out) as r:
+            r.table(
+                [
+                    ("[0]", "Buy milk !", "(due: 15.02.2026)"),
+                    "    [ ] Step",
+                    ("[10]", "Call the plumber", ""),
+                ],
+                flex=1,
+            )
+
+        self.assertEqual(
+            out.getvalue().splitlines(),
+            [
+                "[0]   Buy milk !        (due: 15.02.2026)",
+                "    [ ] Step",
+                "[10]  Call the plumber",
+            ],
+        )
+
+    def test_flex_column_shrinks_to_width(self):
+        out = io.StringIO()
+        with Renderer(out, width=24) as r:
+            r.table([("[0]", "A rather long task title", "(due: 1.2.)")], flex=1)
+
+        line = out.getvalue().rstrip("\n")
+        self.assertEqual(line, "[0]  A rat…  (due: 1.2.)")
+        self.assertLessEqual(display_width(line), 24)
+
+    def test_cut_only_on_terminal(self):
+        long_line = "x" * 200
+        size = os.terminal_size((50, 20))
+        for out, expected in ((io.StringIO(), 200), (_Terminal(), 50)):
+            with patch("shutil.get_terminal_size", return_value=size):
+                with Renderer(out) as r:
+                    r.line(long_line)
+                    r.line(long_line, cut=False)
+            first, second = out.getvalue().splitlines()
+            self.assertEqual(len(first), expected)
+            self.assertEqual(len(second), 200)
+
+    def test_writes_in_chunks(self):
+        out = _CountingOut()
+        with patch.object(render, "CHUNK_SIZE", 1000):
+            with Renderer(out) as r:
+                r.table((f"[{i}]", f"Task {i}") for i in range(500))
+
+        self.assertEqual(len(out.getvalue().splitlines()), 500)
+        self.assertLess(out.writes, 10)
+
+    def test_nothing_written_when_empty(self):
+        out = _CountingOut()
+        with Renderer(out) as r:
+            r.table([])
+        self.assertEqual(out.writes, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
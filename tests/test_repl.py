@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Unit tests for interactive mode"""
+
+import unittest
+from unittest.mock import patch
+
+from todocli import cli
+from todocli.graphapi import oauth
+from todocli.utils.repl_util import completion_candidates
+
+
+class TestCompletionCandidates(unittest.TestCase):
+    def test_prefix_match(self):
+        words = ["tasks", "lists", "Tasks", "Work"]
+        self.assertEqual(completion_candidates("ta", words), ["tasks"])
+
+    def test_names_with_spaces_are_quoted(self):
+        words = ["Buy milk", "Buy bread", "Call mom"]
+        self.assertEqual(
+            completion_candidates("Buy", words), ["'Buy bread'", "'Buy milk'"]
+        )
+        self.assertEqual(completion_candidates("'Call", words), ["'Call mom'"])
+
+
+class TestInteractive(unittest.TestCase):
+    def setUp(self):
+        self.parser = cli.setup_parser()
+        patches = [
+            patch("todocli.cli.repl_util.setup_readline", return_value=lambda: None),
+            patch("todocli.cli.create_pooled_session"),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    @patch("todocli.cli.wrapper.get_lists")
+    @patch("builtins.input")
+    def test_commands_share_session_and_cache(self, mock_input, mock_get_lists):
+        seen = []
+
+        def get_lists(select=None):
+            seen.append(
+                (oauth.get_oauth_session(), cli.wrapper._resolution_cache.get())
+            )
+            return []
+
+        mock_get_lists.side_effect = get_lists
+        mock_input.side_effect = ["lists", "lists", "exit"]
+
+        with patch("sys.stderr") as stderr:
+            cli._interactive(self.parser)
+
+        self.assertEqual(len(seen), 2)
+        self.assertEqual(seen[0], seen[1])
+        self.assertIsInstance(seen[0][1], cli.wrapper.ResolutionCache)
+        self.assertTrue(stderr.write.call_args_list[0].args[0].endswith("ms)"))
+
+    @patch("builtins.input")
+    def test_errors_do_not_end_session(self, mock_input):
+        # EOF after the last line ends the session
+        mock_input.side_effect = ["no-such-command", "'unclosed", EOFError()]
+
+        with patch("sys.stderr"), patch("builtins.print"):
+            cli._interactive(self.parser)
+
+        self.assertEqual(mock_input.call_count, 3)
+
+if __name__ == "__main__":
+    unittest.main()
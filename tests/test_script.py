@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Unit tests for script mode (todo run)"""
+
+import io
+import json
+import unittest
+from unittest.mock import patch
+
+from todocli import cli
+from todocli.graphapi import wrapper
+from todocli.script import run_script
+
+
+def _ok(sub_requests):
+    responses = {}
+    for req in sub_requests:
+        body = {"id": f"new-{req['id']}", "title": req["body"].get("title", "T")}
+        responses[req["id"]] = {"id": req["id"], "status": 200, "body": body}
+    return responses
+
+
+class TestRunScript(unittest.TestCase):
+    def setUp(self):
+        patches = [
+            patch("todocli.script.create_pooled_session"),
+            patch(
+                "todocli.graphapi.wrapper.get_list_id_by_name", return_value="lid"
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.out = io.StringIO()
+
+    def _run(self, text):
+        ok = run_script(text.splitlines(), cli.setup_parser(), self.out)
+        return ok, [json.loads(line) for line in self.out.getvalue().splitlines()]
+
+    @patch("todocli.graphapi.wrapper._send_batch")
+    def test_independent_creates_share_one_batch(self, mock_send_batch):
+        mock_send_batch.side_effect = lambda session, reqs: _ok(reqs)
+
+        ok, results = self._run('new "A"\n\n# comment\nnew "B" -N note\n')
+
+        self.assertTrue(ok)
+        self.assertEqual(mock_send_batch.call_count, 1)
+        self.assertEqual([r["line"] for r in results], [1, 4])
+        self.assertEqual(results[0]["result"]["action"], "created")
+        self.assertEqual(results[1]["result"]["note"], "note")
+
+    @patch("todocli.graphapi.wrapper._send_batch")
+    def test_list_task_form_resolves_like_the_cli(self, mock_send_batch):
+        mock_send_batch.side_effect = lambda session, reqs: _ok(reqs)
+
+        def parse_task_path(task_input, list_name=None):
+            if list_name is None and "/" in task_input:
+                return tuple(task_input.split("/", 1))
+            return list_name or "Tasks", task_input
+
+        list_ids = {"Work": "work-id", "Home": "home-id", "Tasks": "tasks-id"}
+        with patch.object(cli, "parse_task_path", side_effect=parse_task_path), patch(
+            "todocli.graphapi.wrapper.get_list_id_by_name", side_effect=list_ids.get
+        ) as mock_list_id, patch(
+            "todocli.graphapi.wrapper.get_task_id_by_name",
+            side_effect=lambda list_name, name: f"{list_name}-{name}",
+        ):
+            ok, results = self._run(
+                'new "Work/Buy milk"\ncomplete "Home/Fix" "Work/Call" "Home/Pay"\n'
+            )
+
+        self.assertTrue(ok)
+        created = results[0]["result"]
+        self.assertEqual((created["list"], created["title"]), ("Work", "Buy milk"))
+        reqs = mock_send_batch.call_args.args[1]
+        self.assertEqual(reqs[0]["url"], f"{wrapper.BASE_RELATE_URL}/work-id/tasks")
+        self.assertEqual(reqs[0]["body"]["title"], "Buy milk")
+        self.assertEqual(
+            [r["url"].split("/tasks/")[1] for r in reqs[1:]],
+            ["Home-Fix", "Work-Call", "Home-Pay"],
+        )
+        self.assertTrue(reqs[2]["url"].startswith(f"{wrapper.BASE_RELATE_URL}/work-id"))
+        lists = [r["list"] for r in results[1]["result"]]
+        self.assertEqual(lists, ["Home", "Work", "Home"])
+        # One lookup per list: Work (new) and Home, Work (complete)
+        self.assertEqual(mock_list_id.call_count, 3)
+
+    @patch("todocli.graphapi.wrapper._send_batch")
+    def test_slash_names_match_todo_new(self, mock_send_batch):
+        mock_send_batch.side_effect = lambda session, reqs: _ok(reqs)
+
+        ok, results = self._run('new "Work/Buy milk"\n')
+
+        self.assertTrue(ok)
+        created = results[0]["result"]
+        self.assertEqual(
+            (created["list"], created["title"]), cli.parse_task_path("Work/Buy milk")
+        )
+
+    @patch("todocli.graphapi.wrapper._send_batch")
+    def test_task_created_earlier_is_resolved_after_flush(self, mock_send_batch):
+        mock_send_batch.side_effect = lambda session, reqs: _ok(reqs)
+
+        ok, results = self._run('new "A"\ncomplete "A"\n')
+
+        self.assertTrue(ok)
+        self.assertEqual(mock_send_batch.call_count, 2)
+        # The id of the created task comes from the cache, not a lookup
+        patch_url = mock_send_batch.call_args_list[1].args[1][0]["url"]
+        self.assertTrue(patch_url.endswith("/tasks/new-0"))
+
+    @patch("todocli.graphapi.wrapper.get_task_id_by_name", return_value="tid")
+    @patch("todocli.graphapi.wrapper._send_batch")
+    def test_same_task_depends_on_earlier_request(
+        self, mock_send_batch, mock_get_task_id
+    ):
+        mock_send_batch.side_effect = lambda session, reqs: _ok(reqs)
+
+        ok, results = self._run("complete 0\nuncomplete Milk\n")
+
+        self.assertTrue(ok)
+        sub_requests = mock_send_batch.call_args.args[1]
+        self.assertNotIn("dependsOn", sub_requests[0])
+        self.assertEqual(sub_requests[1]["dependsOn"], ["0"])
+        self.assertEqual(results[1]["result"][0]["action"], "uncompleted")
+
+    @patch("todocli.cli.wrapper.get_lists", return_value=[])
+    @patch("todocli.graphapi.wrapper._send_batch")
+    def test_other_commands_flush_and_keep_order(self, mock_send_batch, _):
+        mock_send_batch.side_effect = lambda session, reqs: _ok(reqs)
+
+        ok, results = self._run('new "A"\nlists\nnew "B"\n')
+
+        self.assertTrue(ok)
+        self.assertEqual(mock_send_batch.call_count, 2)
+        self.assertEqual([r["line"] for r in results], [1, 2, 3])
+        self.assertEqual(results[1]["result"], [])
+
+    @patch("todocli.graphapi.wrapper._send_batch")
+    def test_failures_are_reported_per_line(self, mock_send_batch):
+        mock_send_batch.return_value = {
+            "0": {"id": "0", "status": 400, "body": {"error": {"message": "Bad"}}},
+            "1": {"id": "1", "status": 201, "body": {"id": "t1", "title": "B"}},
+        }
+
+        ok, results = self._run("new A\nnew B\n'unclosed\n")
+
+        self.assertFalse(ok)
+        self.assertEqual([r["ok"] for r in results], [False, True, False])
+        self.assertIn("Bad", results[0]["error"])
+        self.assertEqual(results[2]["code"], "argument_error")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Unit tests for NDJSON export"""
+
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from todocli.utils.task_export import export, open_output
+
+
+def _tasks(count):
+    for i in range(count):
+        yield {"id": f"t{i}", "title": f"Task {i}"}
+
+
+def _parts(list_id, task_ids, parts):
+    return {tid: {part: [{"of": tid}] for part in parts} for tid in task_ids}
+
+
+@patch("todocli.graphapi.wrapper.get_task_parts_batch", side_effect=_parts)
+@patch("todocli.graphapi.wrapper.iter_task_records")
+@patch("todocli.graphapi.wrapper.iter_list_records")
+class TestExport(unittest.TestCase):
+    def test_records_in_order(self, mock_lists, mock_tasks, mock_parts):
+        mock_lists.return_value = iter(
+            [{"id": "l1", "displayName": "A"}, {"id": "l2", "displayName": "B"}]
+        )
+        mock_tasks.side_effect = lambda list_id, include_completed: _tasks(2)
+        out = io.StringIO()
+
+        counts = export(out, parts=["steps"])
+
+        self.assertEqual(counts, (2, 4))
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(
+            [r["type"] for r in records],
+            ["list", "task", "task", "list", "task", "task"],
+        )
+        self.assertEqual(records[1]["list_id"], "l1")
+        self.assertEqual(records[1]["steps"], [{"of": "t0"}])
+        self.assertNotIn("links", records[1])
+
+    def test_details_fetched_one_batch_at_a_time(
+        self, mock_lists, mock_tasks, mock_parts
+    ):
+        mock_lists.return_value = iter([{"id": "l1", "displayName": "A"}])
+        mock_tasks.return_value = _tasks(50)
+
+        export(io.StringIO(), parts=["steps", "links", "attachments"])
+
+        sizes = [len(c.args[1]) for c in mock_parts.call_args_list]
+        self.assertEqual(sizes, [6] * 8 + [2])
+
+    def test_only_selected_list(self, mock_lists, mock_tasks, mock_parts):
+        mock_lists.return_value = iter(
+            [{"id": "l1", "displayName": "A"}, {"id": "l2", "displayName": "B"}]
+        )
+        mock_tasks.return_value = _tasks(1)
+
+        self.assertEqual(export(io.StringIO(), list_names=["B"]), (1, 1))
+        mock_tasks.assert_called_once_with("l2", True)
+
+
+class TestOpenOutput(unittest.TestCase):
+    def test_gz_path_is_compressed(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "out.ndjson.gz")
+            with open_output(path) as out:
+                out.write('{"a": 1}\n')
+            with gzip.open(path, "rt") as f:
+                self.assertEqual(f.read(), '{"a": 1}\n')
+
+
+if __name__ == "__main__":
+    unittest.main()
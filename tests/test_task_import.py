@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Unit tests for bulk task import"""
+
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+from todocli.utils.task_import import (
+    Checkpoint,
+    ImportRecordError,
+    build_task,
+    import_tasks,
+    map_record,
+    parse_mapping,
+    read_records,
+)
+
+
+def _fake_batch(sent):
+    def send(session, sub_requests):
+        sent.append([dict(r) for r in sub_requests])
+        return {
+            r["id"]: {"id": r["id"], "status": 201, "body": {"id": f"task-{r['id']}"}}
+            for r in sub_requests
+        }
+
+    return send
+
+
+class TestRecords(unittest.TestCase):
+    def test_csv_with_mapping(self):
+        stream = io.StringIO("Summary,Due,Steps\nBuy milk,2026-03-01,a;b\n")
+        mapping = parse_mapping(["title=Summary"])
+
+        records = [map_record(r, mapping) for r in read_records(stream, "csv")]
+
+        self.assertEqual(
+            records, [{"title": "Buy milk", "due": "2026-03-01", "steps": "a;b"}]
+        )
+
+    def test_invalid_mapping(self):
+        with self.assertRaises(ValueError):
+            parse_mapping(["colour=Red"])
+
+    def test_build_task(self):
+        list_name, body, steps = build_task(
+            1,
+            {
+                "title": "Report",
+                "due": "2026-03-01T09:30:00",
+                "importance": "High",
+                "steps": "Draft; Review",
+                "note": "Quarterly",
+            },
+            "Work",
+        )
+
+        self.assertEqual(list_name, "Work")
+        self.assertEqual(steps, ["Draft", "Review"])
+        self.assertEqual(body["importance"], "high")
+        self.assertEqual(body["body"]["content"], "Quarterly")
+        self.assertIn("2026-03-01", body["dueDateTime"]["dateTime"])
+
+    def test_missing_title(self):
+        with self.assertRaises(ImportRecordError):
+            build_task(3, {"note": "x"}, "Tasks")
+
+
+@patch("todocli.utils.task_import.get_oauth_session", MagicMock())
+@patch("todocli.graphapi.wrapper.get_list_id_by_name", return_value="lid")
+class TestImportTasks(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.checkpoint_path = os.path.join(tmp_dir.name, "checkpoint.json")
+
+    @patch("todocli.graphapi.wrapper._send_batch")
+    def test_tasks_then_chained_steps(self, mock_send_batch, _):
+        sent = []
+        mock_send_batch.side_effect = _fake_batch(sent)
+        records = [
+            {"title": "A", "steps": ["s1", "s2"]},
+            {"title": "B"},
+            {"note": "no title"},
+        ]
+        checkpoint = Checkpoint(self.checkpoint_path)
+
+        counts = import_tasks(records, checkpoint=checkpoint, jobs=2)
+
+        self.assertEqual(counts, {"created": 2, "skipped": 0, "failed": 1})
+        self.assertEqual(len(sent), 2)
+        self.assertEqual([r["method"] for r in sent[0]], ["POST", "POST"])
+        steps = sent[1]
+        self.assertTrue(steps[0]["url"].endswith("/tasks/task-0/checklistItems"))
+        self.assertNotIn("dependsOn", steps[0])
+        self.assertEqual(steps[1]["dependsOn"], [steps[0]["id"]])
+        self.assertEqual(Checkpoint(self.checkpoint_path).done, {1, 2})
+
+    @patch("todocli.graphapi.wrapper.get_checklist_items")
+    @patch("todocli.graphapi.wrapper.get_task_id_by_name", return_value="found")
+    @patch("todocli.graphapi.wrapper._send_batch")
+    def test_resume_does_not_duplicate(
+        self, mock_send_batch, mock_get_task_id, mock_get_items, _
+    ):
+        sent = []
+        mock_send_batch.side_effect = _fake_batch(sent)
+        existing = MagicMock()
+        existing.display_name = "s1"
+        mock_get_items.return_value = [existing]
+
+        checkpoint = Checkpoint(self.checkpoint_path)
+        checkpoint.done = {1}
+        checkpoint.created = {2: "task-2"}
+        checkpoint.in_flight = {3}
+        checkpoint.save()
+        records = [
+            {"title": "A"},
+            {"title": "B", "steps": ["s1", "s2"]},
+            {"title": "C"},
+        ]
+
+        report = MagicMock()
+        counts = import_tasks(
+            records, checkpoint=Checkpoint(self.checkpoint_path), report=report
+        )
+
+        self.assertEqual(counts, {"created": 2, "skipped": 1, "failed": 0})
+        # No task was created again, only the missing step
+        self.assertEqual(len(sent), 1)
+        self.assertEqual([r["body"] for r in sent[0]], [{"displayName": "s2"}])
+        mock_get_task_id.assert_called_once_with("Tasks", "C")
+        self.assertEqual(Checkpoint(self.checkpoint_path).created[3], "found")
+
+    @patch("todocli.graphapi.wrapper._send_batch")
+    def test_failed_create_is_retried_next_run(self, mock_send_batch, _):
+        mock_send_batch.return_value = {
+            "0": {"id": "0", "status": 429, "body": {"error": {"message": "Slow"}}}
+        }
+        checkpoint = Checkpoint(self.checkpoint_path)
+
+        counts = import_tasks([{"title": "A"}], checkpoint=checkpoint)
+
+        self.assertEqual(counts["failed"], 1)
+        saved = Checkpoint(self.checkpoint_path)
+        self.assertEqual(saved.done, set())
+        self.assertEqual(saved.created, {})
+        self.assertEqual(saved.in_flight, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
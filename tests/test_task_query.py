@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""Unit tests for task queries, 'todo find' and bulk updates by filter"""
+
+import io
+import json
+import unittest
+from contextlib import redirect_stdout
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from todocli.cli import setup_parser
+from todocli.utils.task_query import (
+    InvalidAssignment,
+    InvalidCondition,
+    Selection,
+    parse_assignments,
+    parse_query,
+)
+
+
+class TestCondition(unittest.TestCase):
+    def test_pushed_to_odata(self):
+        cases = {
+            "importance=high": "importance eq 'high'",
+            "status!=completed": "status ne 'completed'",
+            "title=it's": "title eq 'it''s'",
+            "title~report": "contains(title,'report')",
+        }
+        for expr, odata in cases.items():
+            with self.subTest(expr=expr):
+                self.assertEqual(parse_query(expr).odata(), odata)
+
+    def test_dates_compare_in_utc(self):
+        odata = parse_query("due<2026-03-01").odata()
+        self.assertTrue(odata.startswith("dueDateTime/dateTime lt '2026-0"))
+        self.assertTrue(parse_query("created>=2026-03-01").odata().endswith("Z"))
+
+    def test_none_is_checked_locally(self):
+        condition = parse_query("reminder=none")
+        self.assertIsNone(condition.odata())
+        self.assertTrue(condition.matches({"title": "a"}))
+        reminder = {"dateTime": "2026-01-01T00:00:00", "timeZone": "UTC"}
+        self.assertFalse(condition.matches({"reminderDateTime": reminder}))
+
+    def test_local_date_comparison(self):
+        condition = parse_query("due<2026-03-01")
+        early = {"dueDateTime": {"dateTime": "2026-02-01T12:00:00", "timeZone": "UTC"}}
+        late = {"dueDateTime": {"dateTime": "2026-04-01T12:00:00", "timeZone": "UTC"}}
+        self.assertTrue(condition.matches(early))
+        self.assertFalse(condition.matches(late))
+        self.assertFalse(condition.matches({}))
+
+    def test_invalid(self):
+        for expr in ("due", "color=red", "importance<high", "due~x", "status=done"):
+            with self.subTest(expr=expr):
+                with self.assertRaises(InvalidCondition):
+                    parse_query(expr)
+
+    def test_selection_splits_server_and_local(self):
+        selection = Selection(["due<today", "reminder=none", "importance=high"])
+        self.assertTrue(selection.odata_filter().startswith("dueDateTime/dateTime"))
+        self.assertIn(" and importance eq 'high'", selection.odata_filter())
+        self.assertEqual(str(selection.residual), "reminder = none")
+
+
+class TestQuery(unittest.TestCase):
+    def test_and_pushes_every_pushable_operand(self):
+        selection = Selection(
+            'due < 2026-11-01 and importance = high and title ~ "invoice"'
+        )
+        self.assertIn("importance eq 'high'", selection.odata_filter())
+        self.assertIn("contains(title,'invoice')", selection.odata_filter())
+        self.assertIsNone(selection.residual)
+
+    def test_or_pushed_only_when_complete(self):
+        pushed = Selection("importance=high or title~urgent")
+        self.assertEqual(
+            pushed.odata_filter(),
+            "(importance eq 'high') or (contains(title,'urgent'))",
+        )
+        mixed = Selection("importance=high and (title~a or reminder=none)")
+        self.assertEqual(mixed.odata_filter(), "importance eq 'high'")
+        self.assertEqual(str(mixed.residual), "title ~ a or reminder = none")
+
+    def test_not_runs_locally(self):
+        selection = Selection("not (title~draft or status=completed)")
+        self.assertIsNone(selection.odata_filter())
+        self.assertTrue(selection.matches({"title": "Final", "status": "notStarted"}))
+        self.assertFalse(selection.matches({"title": "A draft", "status": "x"}))
+
+    def test_precedence_and_quoting(self):
+        node = parse_query("title='a \\'b\\'' or importance=high and status=completed")
+        self.assertEqual(
+            str(node),
+            "title = \"a 'b'\" or (importance = high and status = completed)",
+        )
+        self.assertTrue(node.matches({"title": "A 'B'"}))
+
+    def test_syntax_errors(self):
+        for query in ("", "(due<today", "due<today)", "due<today and", "x ! y"):
+            with self.subTest(query=query):
+                with self.assertRaises(InvalidCondition):
+                    parse_query(query)
+
+
+class TestParseAssignments(unittest.TestCase):
+    def test_assignments(self):
+        kwargs = parse_assignments(
+            ["due=2026-03-01", "reminder=none", "important=yes", "title=New"]
+        )
+        self.assertEqual(kwargs["due_datetime"].date(), datetime(2026, 3, 1).date())
+        self.assertTrue(kwargs["clear_reminder"])
+        self.assertTrue(kwargs["important"])
+        self.assertEqual(kwargs["title"], "New")
+
+    def test_invalid(self):
+        for item in ("due", "color=red", "important=maybe"):
+            with self.subTest(item=item):
+                with self.assertRaises(InvalidAssignment):
+                    parse_assignments([item])
+
+
+def _task(task_id, title, reminder=None):
+    task = {
+        "id": task_id,
+        "title": title,
+        "status": "notStarted",
+        "importance": "normal",
+        "isReminderOn": bool(reminder),
+        "createdDateTime": "2026-01-01T08:00:00Z",
+        "lastModifiedDateTime": "2026-01-01T08:00:00Z",
+    }
+    if reminder:
+        task["reminderDateTime"] = {"dateTime": reminder, "timeZone": "UTC"}
+    return task
+
+
+@patch("todocli.graphapi.wrapper.get_list_id_by_name", return_value="l1")
+@patch("todocli.graphapi.wrapper.iter_task_records")
+class TestBulkUpdate(unittest.TestCase):
+    def _run(self, argv):
+        args = setup_parser().parse_args(argv)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            args.func(args)
+        return out.getvalue()
+
+    @patch("todocli.graphapi.wrapper._send_batch")
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_filter_pushed_down_and_patches_batched(
+        self, mock_session, mock_batch, mock_records, mock_list
+    ):
+        mock_records.return_value = iter(
+            [_task(f"t{i}", f"Task {i}") for i in range(25)]
+            + [_task("r", "Has reminder", reminder="2026-01-01T09:00:00")]
+        )
+        mock_batch.side_effect = lambda session, requests: {
+            r["id"]: {"id": r["id"], "status": 200, "body": {"title": "x"}}
+            for r in requests
+        }
+
+        output = self._run(
+            [
+                "update",
+                "--where",
+                "due<today",
+                "--where",
+                "reminder=none",
+                "--set",
+                "due=2026-03-01",
+                "--json",
+            ]
+        )
+
+        list_id, include_completed = mock_records.call_args.args
+        self.assertFalse(include_completed)
+        odata_filter = mock_records.call_args.kwargs["odata_filter"]
+        self.assertTrue(odata_filter.startswith("dueDateTime/dateTime lt"))
+        batches = [c.args[1] for c in mock_batch.call_args_list]
+        self.assertEqual([len(b) for b in batches], [20, 5])
+        self.assertEqual(batches[0][0]["method"], "PATCH")
+        self.assertIn("dueDateTime", batches[0][0]["body"])
+        result = json.loads(output)
+        self.assertEqual(result["matched"], 25)
+        self.assertEqual(result["updated"], 25)
+        self.assertIn("elapsed_ms", result)
+
+    @patch("todocli.graphapi.wrapper._send_batch")
+    def test_dry_run_sends_nothing(self, mock_batch, mock_records, mock_list):
+        mock_records.return_value = iter([_task("t1", "Overdue")])
+
+        output = self._run(
+            ["update", "--where", "due<today", "--important", "--dry-run"]
+        )
+
+        mock_batch.assert_not_called()
+        self.assertIn("Would update task 'Overdue'", output)
+        self.assertIn("Would update 1 task(s) in 'Tasks'", output)
+
+    def test_requires_a_change(self, mock_records, mock_list):
+        with self.assertRaises(ValueError):
+            self._run(["update", "--where", "due<today"])
+
+
+@patch("todocli.cli.create_pooled_session")
+@patch("todocli.graphapi.wrapper.iter_list_records")
+@patch("todocli.graphapi.wrapper.iter_task_records")
+class TestFind(unittest.TestCase):
+    def _run(self, argv):
+        args = setup_parser().parse_args(argv)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            args.func(args)
+        return out.getvalue()
+
+    def test_searches_all_lists_with_residual(
+        self, mock_records, mock_lists, mock_session
+    ):
+        mock_session.return_value.hooks = {"response": []}
+        mock_lists.return_value = iter(
+            [{"id": "l1", "displayName": "Work"}, {"id": "l2", "displayName": "Home"}]
+        )
+        mock_records.side_effect = lambda list_id, *args, **kwargs: iter(
+            [_task(f"{list_id}a", f"Invoice {list_id}")]
+            + [_task(f"{list_id}b", "Reminded", reminder="2026-01-01T09:00:00")]
+        )
+
+        output = self._run(
+            ["find", "importance=normal and reminder=none", "--explain", "--json"]
+        )
+
+        result = json.loads(output)
+        self.assertEqual(
+            [(t["list"], t["title"]) for t in result["tasks"]],
+            [("Work", "Invoice l1"), ("Home", "Invoice l2")],
+        )
+        self.assertEqual(
+            mock_records.call_args.kwargs["odata_filter"], "importance eq 'normal'"
+        )
+        # Completed tasks are not fetched unless the query asks about them
+        self.assertFalse(mock_records.call_args.args[1])
+        explain = result["explain"]
+        self.assertEqual(explain["local_filter"], "reminder = none")
+        self.assertEqual((explain["scanned"], explain["matched"]), (4, 2))
+        self.assertEqual(explain["lists"], 2)
+
+    @patch("todocli.graphapi.wrapper.get_list_id_by_name", return_value="l1")
+    def test_single_list_explain_text(
+        self, mock_list, mock_records, mock_lists, mock_session
+    ):
+        mock_session.return_value.hooks = {"response": []}
+
+        def records(list_id, include_completed, odata_filter=None, select=None):
+            response = Mock(content=b"x" * 42)
+            for hook in mock_session.return_value.hooks["response"]:
+                hook(response)
+            return iter([_task("t1", "Done thing")])
+
+        mock_records.side_effect = records
+
+        output = self._run(["find", "status!=completed", "-l", "Work", "--explain"])
+
+        mock_lists.assert_not_called()
+        self.assertIn("Work/Done thing", output)
+        self.assertIn("Server-side ($filter): status ne 'completed'", output)
+        self.assertIn("Fetched 42 bytes in 1 page(s) from 1 list(s)", output)
+        self.assertTrue(mock_records.call_args.args[1])
+        self.assertEqual(mock_session.return_value.hooks["response"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Unit tests for copying and moving tasks between lists"""
+
+import unittest
+from io import StringIO
+from unittest.mock import MagicMock, call, patch
+
+from todocli.cli import mv
+from todocli.utils.task_transfer import transfer
+
+
+def _expanded(list_id, task_ids):
+    return {
+        tid: {
+            "task": {"id": tid, "title": f"Task {tid}", "status": "notStarted"},
+            "steps": [{"id": "s1", "displayName": "Step"}] if tid == "t0" else [],
+            "links": [],
+        }
+        for tid in task_ids
+    }
+
+
+def _parts(list_id, task_ids, parts):
+    return {tid: {"attachments": [{"id": "a1", "name": "f.txt"}]} for tid in task_ids}
+
+
+def _batch_ok(session, sub_requests):
+    responses = {}
+    for request in sub_requests:
+        resp = {"id": request["id"], "status": 204}
+        if request["method"] == "POST":
+            resp = {"id": request["id"], "status": 201, "body": {"id": "new"}}
+        responses[request["id"]] = resp
+    return responses
+
+
+@patch("todocli.utils.task_transfer.get_oauth_session")
+@patch("todocli.graphapi.wrapper.get_tasks_expanded_batch", side_effect=_expanded)
+@patch("todocli.graphapi.wrapper.get_task_parts_batch", side_effect=_parts)
+@patch("todocli.graphapi.wrapper._send_batch")
+class TestTransfer(unittest.TestCase):
+    def test_move_creates_children_then_deletes_sources(
+        self, mock_batch, mock_parts, mock_expanded, mock_session
+    ):
+        sent = []
+
+        def batch(session, sub_requests):
+            sent.append(list(sub_requests))
+            return _batch_ok(session, sub_requests)
+
+        mock_batch.side_effect = batch
+
+        results = transfer("src", ["t0", "t1"], "dst", move=True)
+
+        self.assertTrue(all(r["ok"] for r in results))
+        create, steps, delete = sent
+        self.assertEqual([r["url"] for r in create], ["/me/todo/lists/dst/tasks"] * 2)
+        self.assertEqual(
+            create[0]["body"], {"title": "Task t0", "status": "notStarted"}
+        )
+        self.assertEqual(steps[0]["url"], "/me/todo/lists/dst/tasks/new/checklistItems")
+        self.assertEqual(
+            [(r["method"], r["url"]) for r in delete],
+            [
+                ("DELETE", "/me/todo/lists/src/tasks/t0"),
+                ("DELETE", "/me/todo/lists/src/tasks/t1"),
+            ],
+        )
+
+    def test_copy_keeps_sources(
+        self, mock_batch, mock_parts, mock_expanded, mock_session
+    ):
+        mock_batch.side_effect = _batch_ok
+
+        results = transfer("src", ["t1"], "dst")
+
+        self.assertEqual(results[0]["new_id"], "new")
+        self.assertEqual(mock_batch.call_count, 1)
+
+    def test_incomplete_copy_is_rolled_back_and_source_kept(
+        self, mock_batch, mock_parts, mock_expanded, mock_session
+    ):
+        def batch(session, sub_requests):
+            if sub_requests[0]["url"].endswith("/checklistItems"):
+                return {"0": {"id": "0", "status": 400, "body": {}}}
+            return _batch_ok(session, sub_requests)
+
+        mock_batch.side_effect = batch
+
+        results = transfer("src", ["t0"], "dst", move=True)
+
+        self.assertFalse(results[0]["ok"])
+        self.assertIsNone(results[0]["new_id"])
+        self.assertIn("Steps", results[0]["error"])
+        delete = mock_batch.call_args_list[-1].args[1]
+        self.assertEqual(delete[0]["url"], "/me/todo/lists/dst/tasks/new")
+
+    @patch("todocli.graphapi.wrapper.create_attachment")
+    @patch("todocli.graphapi.wrapper.download_attachment")
+    def test_attachments_copied(
+        self,
+        mock_download,
+        mock_create,
+        mock_batch,
+        mock_parts,
+        mock_expanded,
+        mock_session,
+    ):
+        def expanded(list_id, task_ids):
+            result = _expanded(list_id, task_ids)
+            result["t1"]["task"]["hasAttachments"] = True
+            return result
+
+        mock_expanded.side_effect = expanded
+        mock_batch.side_effect = _batch_ok
+
+        results = transfer("src", ["t1", "t2"], "dst")
+
+        self.assertTrue(all(r["ok"] for r in results))
+        # Attachment metadata is read only for the task that has attachments
+        self.assertEqual(mock_parts.call_args.args[1], ["t1"])
+        self.assertEqual(mock_download.call_count, 1)
+        self.assertEqual(mock_download.call_args.kwargs["task_id"], "t1")
+        self.assertEqual(mock_create.call_args.kwargs["task_id"], "new")
+        self.assertEqual(mock_create.call_args.kwargs["file_name"], "f.txt")
+
+    def test_hundred_tasks_in_few_round_trips(
+        self, mock_batch, mock_parts, mock_expanded, mock_session
+    ):
+        mock_batch.side_effect = _batch_ok
+        task_ids = [f"t{i}" for i in range(1, 101)]
+
+        results = transfer("src", task_ids, "dst", move=True)
+
+        self.assertEqual(len(results), 100)
+        # Twenty tasks per batch to read, to create and to delete
+        self.assertEqual(mock_expanded.call_count, 5)
+        self.assertTrue(all(len(c.args[1]) == 20 for c in mock_expanded.call_args_list))
+        self.assertEqual(mock_batch.call_count, 10)
+
+
+class TestTransferCommand(unittest.TestCase):
+    @patch("todocli.cli.task_transfer.transfer")
+    @patch("todocli.cli.wrapper")
+    def test_list_task_names_are_moved_per_list(self, mock_wrapper, mock_transfer):
+        def parse_task_path(task_input, list_name=None):
+            if "/" in task_input:
+                return tuple(task_input.split("/", 1))
+            return list_name or "Tasks", task_input
+
+        list_ids = {"Work": "wid", "Home": "hid", "Done": "did"}
+        mock_wrapper.get_list_id_by_name.side_effect = list_ids.get
+        mock_wrapper.get_task_ids_by_names.side_effect = lambda lid, name, names: [
+            f"{lid}-{n}" for n in names
+        ]
+        mock_transfer.side_effect = lambda lid, tids, target, move: [
+            {"id": tid, "new_id": "new", "title": tid, "ok": True, "error": None}
+            for tid in tids
+        ]
+
+        args = MagicMock(
+            task_names=["Work/Report", "Home/Fix", "Work/Call"],
+            list=None,
+            to="Done",
+            task_id=None,
+            task_index=None,
+            json=False,
+        )
+        with patch("todocli.cli.parse_task_path", side_effect=parse_task_path), patch(
+            "sys.stdout", new_callable=StringIO
+        ) as mock_stdout:
+            mv(args)
+
+        mock_transfer.assert_has_calls(
+            [
+                call("wid", ["wid-Report", "wid-Call"], "did", move=True),
+                call("hid", ["hid-Fix"], "did", move=True),
+            ]
+        )
+        self.assertIn("from 'Home' to 'Done'", mock_stdout.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
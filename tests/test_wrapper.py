@@ -4,6 +4,8 @@
 import unittest
 from unittest.mock import patch, MagicMock
 import json
+
+from requests import HTTPError
 from todocli.graphapi.wrapper import (
     ListNotFound,
     TaskNotFoundByName,
@@ -11,14 +13,39 @@ from todocli.graphapi.wrapper import (
     StepNotFoundByIndex,
     StepNotFoundByName,
     BASE_URL,
+    BASE_RELATE_URL,
     BATCH_URL,
     BATCH_MAX_REQUESTS,
     get_task_id_by_name,
     get_step_id,
     get_checklist_items_batch,
+    get_task_ids_by_names,
+    get_task_details_batch,
+    get_attachments_batch,
+    iter_tasks,
+    get_task_parts_batch,
+    get_tasks_expanded_batch,
+    get_task_deltas_batch,
+    BASE_API,
+    get_list_id_by_name,
+    ResolutionCache,
+    remove_task,
+    use_resolution_cache,
 )
 
 
+def _task_payload(task_id, title):
+    return {
+        "id": task_id,
+        "title": title,
+        "importance": "normal",
+        "status": "notStarted",
+        "isReminderOn": False,
+        "createdDateTime": "2026-01-01T00:00:00.0000000Z",
+        "lastModifiedDateTime": "2026-01-01T00:00:00.0000000Z",
+    }
+
+
 class TestWrapperExceptions(unittest.TestCase):
     """Test custom exception classes"""
 
@@ -187,5 +214,455 @@ class TestGetChecklistItemsBatch(unittest.TestCase):
             self.assertIn(tid, result)
 
 
+class TestGetTaskIdsByNames(unittest.TestCase):
+    """Test resolving several task names/indexes at once"""
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    @patch("todocli.graphapi.wrapper.get_tasks")
+    def test_names_share_one_batch(self, mock_get_tasks, mock_session):
+        def mock_post(url, json=None):
+            resp = MagicMock()
+            resp.ok = True
+            resp.content = (
+                __import__("json")
+                .dumps(
+                    {
+                        "responses": [
+                            {
+                                "id": r["id"],
+                                "status": 200,
+                                "body": {"value": [{"id": f"id-{r['id']}"}]},
+                            }
+                            for r in json["requests"]
+                        ]
+                    }
+                )
+                .encode()
+            )
+            return resp
+
+        mock_session.return_value.post.side_effect = mock_post
+        mock_get_tasks.return_value = [MagicMock(id="idx-0"), MagicMock(id="idx-1")]
+
+        result = get_task_ids_by_names("lid", "Tasks", ["A", 1, "B"])
+
+        self.assertEqual(result, ["id-0", "idx-1", "id-1"])
+        self.assertEqual(mock_session.return_value.post.call_count, 1)
+        mock_get_tasks.assert_called_once_with(list_id="lid")
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_missing_name_raises(self, mock_session):
+        mock_resp = MagicMock()
+        mock_resp.ok = True
+        mock_resp.content = json.dumps(
+            {"responses": [{"id": "0", "status": 200, "body": {"value": []}}]}
+        ).encode()
+        mock_session.return_value.post.return_value = mock_resp
+
+        with self.assertRaises(TaskNotFoundByName):
+            get_task_ids_by_names("lid", "Tasks", ["Missing"])
+
+    @patch("todocli.graphapi.wrapper.get_tasks")
+    def test_index_out_of_range_raises(self, mock_get_tasks):
+        mock_get_tasks.return_value = []
+        with self.assertRaises(TaskNotFoundByIndex):
+            get_task_ids_by_names("lid", "Tasks", [3])
+
+
+class TestGetTaskDetailsBatch(unittest.TestCase):
+    """Test fetching task details, steps, links and attachments in one batch"""
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_details_single_round_trip(self, mock_session):
+        batch_response = {
+            "responses": [
+                {"id": "0-task", "status": 200, "body": _task_payload("t1", "A")},
+                {"id": "0-steps", "status": 200, "body": {"value": []}},
+                {
+                    "id": "0-links",
+                    "status": 200,
+                    "body": {"value": [{"id": "l1", "webUrl": "https://x"}]},
+                },
+                {"id": "0-attachments", "status": 200, "body": {"value": []}},
+            ]
+        }
+        mock_resp = MagicMock()
+        mock_resp.ok = True
+        mock_resp.content = json.dumps(batch_response).encode()
+        mock_session.return_value.post.return_value = mock_resp
+
+        result = get_task_details_batch("lid", ["t1"])
+
+        self.assertEqual(result["t1"]["task"].title, "A")
+        self.assertEqual(result["t1"]["steps"], [])
+        self.assertEqual(result["t1"]["links"][0]["id"], "l1")
+        self.assertEqual(result["t1"]["attachments"], [])
+        req_body = mock_session.return_value.post.call_args.kwargs["json"]
+        self.assertEqual(len(req_body["requests"]), 4)
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_details_chunking(self, mock_session):
+        task_ids = [f"t{i}" for i in range(7)]
+
+        def mock_post(url, json=None):
+            responses = []
+            for r in json["requests"]:
+                idx, part = r["id"].split("-")
+                tid = r["url"].split("/tasks/")[1].split("/")[0]
+                body = _task_payload(tid, tid) if part == "task" else {"value": []}
+                responses.append({"id": r["id"], "status": 200, "body": body})
+            resp = MagicMock()
+            resp.ok = True
+            resp.content = __import__("json").dumps({"responses": responses}).encode()
+            return resp
+
+        mock_session.return_value.post.side_effect = mock_post
+
+        result = get_task_details_batch("lid", task_ids)
+
+        # 4 sub-requests per task, 20 per batch: 5 + 2 tasks
+        self.assertEqual(mock_session.return_value.post.call_count, 2)
+        self.assertEqual(sorted(result), sorted(task_ids))
+
+    def test_details_empty(self):
+        self.assertEqual(get_task_details_batch("lid", []), {})
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_failed_part_raises(self, mock_session):
+        batch_response = {
+            "responses": [
+                {"id": "0-task", "status": 200, "body": _task_payload("t1", "A")},
+                {
+                    "id": "0-steps",
+                    "status": 429,
+                    "body": {"error": {"message": "Too many requests"}},
+                },
+            ]
+        }
+        mock_resp = MagicMock()
+        mock_resp.ok = True
+        mock_resp.content = json.dumps(batch_response).encode()
+        mock_session.return_value.post.return_value = mock_resp
+
+        with self.assertRaises(HTTPError) as cm:
+            get_task_details_batch("lid", ["t1"], parts=("steps",))
+        self.assertIn("Could not fetch steps of task t1", str(cm.exception))
+        self.assertIn("Too many requests", str(cm.exception))
+
+
+class TestIterTasks(unittest.TestCase):
+    """Test paginated task iteration"""
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_follows_next_link(self, mock_session):
+        pages = [
+            {"value": [_task_payload("t1", "A")], "@odata.nextLink": "https://next"},
+            {"value": [_task_payload("t2", "B")]},
+        ]
+
+        def mock_get(url):
+            resp = MagicMock()
+            resp.ok = True
+            resp.content = json.dumps(pages.pop(0)).encode()
+            return resp
+
+        mock_session.return_value.get.side_effect = mock_get
+
+        titles = [t.title for t in iter_tasks("lid")]
+
+        self.assertEqual(titles, ["A", "B"])
+        second_url = mock_session.return_value.get.call_args_list[1].args[0]
+        self.assertEqual(second_url, "https://next")
+
+
+class TestGetAttachmentsBatch(unittest.TestCase):
+    """Test fetching attachment metadata for many tasks at once"""
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_batch_attachments(self, mock_session):
+        mock_resp = MagicMock()
+        mock_resp.ok = True
+        mock_resp.content = json.dumps(
+            {
+                "responses": [
+                    {"id": "0", "status": 200, "body": {"value": [{"id": "a1"}]}},
+                    {"id": "1", "status": 404, "body": {}},
+                ]
+            }
+        ).encode()
+        mock_session.return_value.post.return_value = mock_resp
+
+        result = get_attachments_batch("lid", ["t1", "t2"])
+
+        self.assertEqual(result, {"t1": [{"id": "a1"}], "t2": []})
+        req = mock_session.return_value.post.call_args.kwargs["json"]["requests"]
+        self.assertIn("$select=", req[0]["url"])
+
+
+class TestResolutionCache(unittest.TestCase):
+    """Test name resolution reuse within use_resolution_cache"""
+
+    def _response(self, payload):
+        response = MagicMock()
+        response.ok = True
+        response.content = json.dumps(payload).encode()
+        return response
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_names_resolve_once(self, mock_session):
+        session = MagicMock()
+        session.get.side_effect = [
+            self._response({"value": [{"id": "lid"}]}),
+            self._response({"value": [_task_payload("tid", "Milk")]}),
+        ]
+        mock_session.return_value = session
+
+        cache = ResolutionCache()
+        with use_resolution_cache(cache):
+            self.assertEqual(get_task_id_by_name("Shop", "Milk"), "tid")
+            self.assertEqual(get_task_id_by_name("Shop", "Milk"), "tid")
+
+        self.assertEqual(session.get.call_count, 2)
+        self.assertEqual(cache.list_ids, {"Shop": "lid"})
+        self.assertEqual(cache.task_titles(), ["Milk"])
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_index_uses_last_snapshot(self, mock_session):
+        session = MagicMock()
+        session.get.return_value = self._response(
+            {"value": [_task_payload("t0", "A"), _task_payload("t1", "B")]}
+        )
+        mock_session.return_value = session
+
+        cache = ResolutionCache()
+        cache.list_ids["Shop"] = "lid"
+        with use_resolution_cache(cache):
+            self.assertEqual(get_task_id_by_name("Shop", 1), "t1")
+            self.assertEqual(get_task_id_by_name("Shop", 0), "t0")
+
+        self.assertEqual(session.get.call_count, 1)
+        self.assertEqual(cache.index_snapshots["lid"], ["t0", "t1"])
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_removed_task_keeps_other_indexes(self, mock_session):
+        session = MagicMock()
+        session.get.return_value = self._response(_task_payload("t0", "A"))
+        session.delete.return_value = self._response({})
+        mock_session.return_value = session
+
+        cache = ResolutionCache()
+        cache.list_ids["Shop"] = "lid"
+        cache.task_ids[("lid", "A")] = "t0"
+        cache.index_snapshots["lid"] = ["t0", "t1"]
+        with use_resolution_cache(cache):
+            remove_task(list_name="Shop", task_name=0)
+            self.assertEqual(get_task_id_by_name("Shop", 1), "t1")
+            with self.assertRaises(TaskNotFoundByIndex):
+                get_task_id_by_name("Shop", 0)
+
+        self.assertEqual(cache.task_ids, {})
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_batch_indexes_use_last_snapshot(self, mock_session):
+        session = MagicMock()
+        session.get.return_value = self._response(
+            {"value": [_task_payload("t2", "C"), _task_payload("t1", "B")]}
+        )
+        mock_session.return_value = session
+
+        cache = ResolutionCache()
+        cache.index_snapshots["lid"] = ["t0", None, "t1"]
+        with use_resolution_cache(cache):
+            self.assertEqual(get_task_ids_by_names("lid", "Shop", [2, 0]), ["t1", "t0"])
+            with self.assertRaises(TaskNotFoundByIndex):
+                get_task_ids_by_names("lid", "Shop", [1])
+            self.assertEqual(get_task_ids_by_names("lid2", "Work", [0]), ["t2"])
+
+        session.get.assert_called_once()
+        self.assertIn("/lid2/tasks", session.get.call_args.args[0])
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_no_cache_outside_context(self, mock_session):
+        session = MagicMock()
+        session.get.return_value = self._response({"value": [{"id": "lid"}]})
+        mock_session.return_value = session
+
+        with use_resolution_cache(ResolutionCache()):
+            pass
+
+        get_list_id_by_name("Shop")
+        get_list_id_by_name("Shop")
+        self.assertEqual(session.get.call_count, 2)
+
+
+class TestGetTaskPartsBatch(unittest.TestCase):
+    """Test fetching task sub-collections with $batch"""
+
+    def _response(self, payload):
+        response = MagicMock()
+        response.ok = True
+        response.content = json.dumps(payload).encode()
+        return response
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_follows_next_link(self, mock_session):
+        session = MagicMock()
+        session.post.return_value = self._response(
+            {
+                "responses": [
+                    {
+                        "id": "0-steps",
+                        "status": 200,
+                        "body": {
+                            "value": [{"id": "s1"}],
+                            "@odata.nextLink": "https://next",
+                        },
+                    },
+                    {"id": "0-links", "status": 200, "body": {"value": []}},
+                ]
+            }
+        )
+        session.get.return_value = self._response({"value": [{"id": "s2"}]})
+        mock_session.return_value = session
+
+        result = get_task_parts_batch("lid", ["t0"], ["steps", "links"])
+
+        self.assertEqual(
+            result, {"t0": {"steps": [{"id": "s1"}, {"id": "s2"}], "links": []}}
+        )
+        session.get.assert_called_once_with("https://next")
+        urls = [r["url"] for r in session.post.call_args.kwargs["json"]["requests"]]
+        self.assertEqual(
+            urls,
+            [
+                f"{BASE_RELATE_URL}/lid/tasks/t0/checklistItems",
+                f"{BASE_RELATE_URL}/lid/tasks/t0/linkedResources",
+            ],
+        )
+
+
+class TestGetTasksExpandedBatch(unittest.TestCase):
+    """Test fetching tasks with expanded steps and links with $batch"""
+
+    @patch("todocli.graphapi.wrapper._send_batch")
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_one_sub_request_per_task(self, mock_session, mock_send_batch):
+        def send(session, sub_requests):
+            return {
+                r["id"]: {
+                    "id": r["id"],
+                    "status": 200,
+                    "body": {"id": f"t{r['id']}", "checklistItems": [{"id": "s1"}]},
+                }
+                for r in sub_requests
+            }
+
+        mock_send_batch.side_effect = send
+        task_ids = [f"t{i}" for i in range(BATCH_MAX_REQUESTS + 1)]
+
+        result = get_tasks_expanded_batch("lid", task_ids)
+
+        self.assertEqual(mock_send_batch.call_count, 2)
+        first = mock_send_batch.call_args_list[0].args[1]
+        self.assertEqual(len(first), BATCH_MAX_REQUESTS)
+        self.assertEqual(
+            first[0]["url"],
+            f"{BASE_RELATE_URL}/lid/tasks/t0"
+            "?$expand=checklistItems,linkedResources",
+        )
+        self.assertEqual(
+            result["t0"], {"task": {"id": "t0"}, "steps": [{"id": "s1"}], "links": []}
+        )
+
+    @patch("todocli.graphapi.wrapper._send_batch")
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_failed_task_raises(self, mock_session, mock_send_batch):
+        mock_send_batch.return_value = {"0": {"id": "0", "status": 404, "body": {}}}
+
+        with self.assertRaises(HTTPError):
+            get_tasks_expanded_batch("lid", ["t0"])
+
+
+class TestGetTaskDeltasBatch(unittest.TestCase):
+    """Test fetching the changes of every list with $batch"""
+
+    def _response(self, payload):
+        response = MagicMock()
+        response.ok = True
+        response.content = json.dumps(payload).encode()
+        return response
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_lists_and_deltas_in_one_request(self, mock_session):
+        session = MagicMock()
+        session.post.return_value = self._response(
+            {
+                "responses": [
+                    {"id": "lists", "status": 200, "body": {"value": [{"id": "a"}]}},
+                    {
+                        "id": "0",
+                        "status": 200,
+                        "body": {
+                            "value": [{"id": "t1"}],
+                            "@odata.nextLink": "https://next",
+                        },
+                    },
+                    {"id": "1", "status": 410, "body": {}},
+                ]
+            }
+        )
+        session.get.return_value = self._response(
+            {"value": [{"id": "t2"}], "@odata.deltaLink": "https://delta-2"}
+        )
+        mock_session.return_value = session
+
+        lists, deltas = get_task_deltas_batch(
+            {"a": f"{BASE_API}{BASE_RELATE_URL}/a/tasks/delta?$deltatoken=x", "b": "y"},
+            include_lists=True,
+        )
+
+        self.assertEqual(lists, [{"id": "a"}])
+        self.assertEqual(
+            deltas["a"],
+            {
+                "status": 200,
+                "changes": [{"id": "t1"}, {"id": "t2"}],
+                "delta_link": "https://delta-2",
+            },
+        )
+        self.assertEqual(deltas["b"]["status"], 410)
+        session.post.assert_called_once()
+        urls = [r["url"] for r in session.post.call_args.kwargs["json"]["requests"]]
+        self.assertEqual(
+            urls,
+            [BASE_RELATE_URL, f"{BASE_RELATE_URL}/a/tasks/delta?$deltatoken=x", "y"],
+        )
+
+    @patch("todocli.graphapi.wrapper.get_oauth_session")
+    def test_chunking(self, mock_session):
+        def mock_post(url, json=None):
+            return self._response(
+                {
+                    "responses": [
+                        {"id": r["id"], "status": 200, "body": {"value": []}}
+                        for r in json["requests"]
+                    ]
+                }
+            )
+
+        mock_session.return_value.post.side_effect = mock_post
+        list_ids = [f"l{i}" for i in range(BATCH_MAX_REQUESTS + 5)]
+
+        lists, deltas = get_task_deltas_batch(dict.fromkeys(list_ids))
+
+        self.assertIsNone(lists)
+        self.assertEqual(sorted(deltas), sorted(list_ids))
+        self.assertEqual(mock_session.return_value.post.call_count, 2)
+        first = mock_session.return_value.post.call_args_list[0].kwargs["json"]
+        self.assertEqual(
+            first["requests"][0]["url"], f"{BASE_RELATE_URL}/l0/tasks/delta"
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,17 +1,35 @@
 import argparse
-import json
+import contextlib
+import io
+import itertools
 import os
 import shlex
 import sys
+import time
 from datetime import datetime
 
 import requests
 
+import todocli.daemon as todo_daemon
 import todocli.graphapi.wrapper as wrapper
+import todocli.script as script
+from todocli.models import serialize
+from todocli.models.checklistitem import ChecklistItem
+from todocli.models.todolist import TodoList
+from todocli.models.todotask import Task
+from todocli.graphapi.oauth import config_dir, create_pooled_session, use_session
+from todocli.utils import attachment_sync, field_projection, json_codec, repl_util
+from todocli.utils import agenda as task_agenda
+from todocli.utils import task_export
+from todocli.utils import task_import
+from todocli.utils import backup as task_backup
+from todocli.utils import replica as task_replica
+from todocli.utils import record_output, reminders, render, task_query, task_transfer
 from todocli.utils.update_checker import check as update_checker
 from todocli.utils.datetime_util import (
     parse_datetime,
     format_date,
+    timestamp_to_local,
     TimeExpressionNotRecognized,
     ErrorParsingTime,
 )
@@ -37,15 +55,24 @@ def parse_task_path(task_input, list_name=None):
 def _output_result(args, result_dict):
     """Output result as JSON or human-readable text."""
     if getattr(args, "json", False):
-        print(json.dumps(result_dict, indent=2))
+        _print_json(result_dict, args)
     else:
         # Human readable - just show the message
         print(result_dict.get("message", "Done"))
 
 
+def _print_json(value, args=None):
+    """Print value as JSON, compact with --compact; models are written directly."""
+    json_codec.dump(value, sys.stdout, compact=getattr(args, "compact", False))
+    sys.stdout.write("\n")
+
+
 def _is_json_mode():
-    """Check if --json or -j flag is present in sys.argv."""
-    return "--json" in sys.argv or "-j" in sys.argv
+    """Check if --json, -j or --compact (or --fields without --format) is
+    present in sys.argv."""
+    if "--fields" in sys.argv and "--format" not in sys.argv:
+        return True
+    return any(flag in sys.argv for flag in ("--json", "-j", "--compact"))
 
 
 def _output_error(error_code: str, message: str):
@@ -56,21 +83,51 @@ def _output_error(error_code: str, message: str):
             "error": message,
             "code": error_code,
         }
-        print(json.dumps(error_dict, indent=2))
+        json_codec.dump(error_dict, sys.stdout, compact="--compact" in sys.argv)
+        sys.stdout.write("\n")
     else:
         print(message)
 
 
 def print_list(item_list):
-    for i, x in enumerate(item_list):
-        print(f"[{i}]\t{x}")
+    with render.Renderer() as out:
+        out.table(((f"[{i}]", x) for i, x in enumerate(item_list)), flex=1)
+
+
+def _write_records(args, fields, values, projection=None):
+    """Stream values to stdout in the --format record format."""
+    if projection is not None:
+        fields, values = projection.keys, map(projection.apply, values)
+    writer = record_output.RecordWriter(args.format, fields, sys.stdout)
+    return writer.write_all(values)
+
+
+def _projection(args, model_class, extra=()):
+    """The --fields projection for records of model_class, or None."""
+    spec = getattr(args, "fields", None)
+    if not spec:
+        return None
+    return field_projection.Projection(model_class, spec, extra)
+
+
+def _project(projection, values):
+    return values if projection is None else [projection.apply(v) for v in values]
 
 
 def ls(args):
-    lists = wrapper.get_lists()
+    projection = _projection(args, TodoList)
+    select = projection.select() if projection else None
+    if getattr(args, "format", None):
+        _write_records(
+            args,
+            record_output.model_fields(TodoList),
+            (TodoList(record) for record in wrapper.iter_list_records(select=select)),
+            projection,
+        )
+        return
+    lists = wrapper.get_lists(select=select)
     if getattr(args, "json", False):
-        output = [lst.to_dict() for lst in lists]
-        print(json.dumps(output, indent=2))
+        _print_json(_project(projection, lists), args)
     else:
         lists_names = [lst.display_name for lst in lists]
         print_list(lists_names)
@@ -87,23 +144,45 @@ def lst(args):
     list_name = getattr(args, "list", None) or getattr(args, "list_name", "Tasks")
 
     list_id = wrapper.get_list_id_by_name(list_name)
+    projection = _projection(args, Task, extra=("steps",))
+    select = None
+    if projection is not None:
+        # Fetch what the filters read too
+        filtered = []
+        if getattr(args, "due_today", False) or getattr(args, "overdue", False):
+            filtered.append("dueDateTime")
+        if getattr(args, "important", False):
+            filtered.append("importance")
+        select = projection.select(*filtered)
+        no_steps = no_steps or not projection.wants("steps")
+
+    if getattr(args, "format", None):
+        # Every page of the list, written as it arrives
+        tasks = (
+            task
+            for task in map(
+                Task,
+                wrapper.iter_task_records(
+                    list_id,
+                    include_completed or only_completed,
+                    odata_filter="status eq 'completed'" if only_completed else None,
+                    select=select,
+                ),
+            )
+            if _keep_task(args, task)
+        )
+        if not no_steps and (args.format == "ndjson" or projection is not None):
+            tasks = _with_steps(list_id, tasks)
+        _write_records(args, record_output.model_fields(Task), tasks, projection)
+        return
+
     tasks = wrapper.get_tasks(
         list_id=list_id,
         include_completed=include_completed,
         only_completed=only_completed,
+        select=select,
     )
-
-    # Apply filters
-    today = datetime.now().date()
-
-    if getattr(args, "due_today", False):
-        tasks = [t for t in tasks if t.due_datetime and t.due_datetime.date() == today]
-
-    if getattr(args, "overdue", False):
-        tasks = [t for t in tasks if t.due_datetime and t.due_datetime.date() < today]
-
-    if getattr(args, "important", False):
-        tasks = [t for t in tasks if _get_enum_value(t.importance) == "high"]
+    tasks = [task for task in tasks if _keep_task(args, task)]
 
     if not no_steps and tasks:
         steps_map = wrapper.get_checklist_items_batch(list_id, [t.id for t in tasks])
@@ -114,28 +193,70 @@ def lst(args):
         output = {
             "list_id": list_id,
             "list_name": list_name,
-            "tasks": [],
+            "tasks": _project(
+                projection,
+                [
+                    serialize.WithFields(task, steps=steps_map.get(task.id, []))
+                    for task in tasks
+                ],
+            ),
         }
-        for task in tasks:
-            task_dict = task.to_dict()
-            task_dict["steps"] = [s.to_dict() for s in steps_map.get(task.id, [])]
-            output["tasks"].append(task_dict)
-        print(json.dumps(output, indent=2))
+        _print_json(output, args)
     else:
+        rows = []
         for i, task in enumerate(tasks):
+            title, due = _task_cells(task, date_fmt)
             if show_id:
                 # Show full ID for scripting/agent use
-                line = f"[{i}] {task.id}  {task.title}"
+                rows.append((f"[{i}]", task.id, title, due))
             else:
-                line = f"[{i}]\t{task.title}"
-            if _get_enum_value(task.importance) == "high":
-                line += " !"
-            if task.due_datetime is not None:
-                line += f" (due: {format_date(task.due_datetime, date_fmt)})"
-            print(line)
+                rows.append((f"[{i}]", title, due))
             for item in steps_map.get(task.id, []):
                 check = "x" if item.is_checked else " "
-                print(f"    [{check}] {item.display_name}")
+                rows.append(f"    [{check}] {item.display_name}")
+        with render.Renderer() as out:
+            out.table(rows, flex=2 if show_id else 1)
+
+
+def _task_cells(task, date_fmt, prefix=""):
+    """The title (with "!" when important) and due cells of a task row."""
+    title = prefix + task.title
+    if _get_enum_value(task.importance) == "high":
+        title += " !"
+    due = ""
+    if task.due_datetime is not None:
+        due = f"(due: {format_date(task.due_datetime, date_fmt)})"
+    return title, due
+
+
+def _keep_task(args, task):
+    """Apply the --due-today, --overdue and --important filters of lst."""
+    today = datetime.now().date()
+    if getattr(args, "due_today", False):
+        if not (task.due_datetime and task.due_datetime.date() == today):
+            return False
+    if getattr(args, "overdue", False):
+        if not (task.due_datetime and task.due_datetime.date() < today):
+            return False
+    if getattr(args, "important", False):
+        if _get_enum_value(task.importance) != "high":
+            return False
+    return True
+
+
+def _with_steps(list_id, tasks):
+    """Yield tasks with their steps, fetched one $batch worth at a time."""
+    chunk = []
+    for task in itertools.chain(tasks, [None]):
+        if task is not None:
+            chunk.append(task)
+            if len(chunk) < wrapper.BATCH_MAX_REQUESTS:
+                continue
+        if chunk:
+            steps = wrapper.get_checklist_items_batch(list_id, [t.id for t in chunk])
+            for t in chunk:
+                yield serialize.WithFields(t, steps=steps.get(t.id, []))
+            chunk = []
 
 
 def new(args):
@@ -341,7 +462,7 @@ def complete(args):
             )
 
     if use_json:
-        print(json.dumps(results, indent=2))
+        _print_json(results, args)
     else:
         for r in results:
             print(r["message"])
@@ -404,7 +525,7 @@ def uncomplete(args):
             )
 
     if use_json:
-        print(json.dumps(results, indent=2))
+        _print_json(results, args)
     else:
         for r in results:
             print(r["message"])
@@ -507,7 +628,7 @@ def rm(args):
             )
 
     if use_json:
-        print(json.dumps(results, indent=2))
+        _print_json(results, args)
     else:
         for r in results:
             print(r["message"])
@@ -542,6 +663,25 @@ def update(args):
     clear_reminder = getattr(args, "clear_reminder", False)
     clear_recurrence = getattr(args, "clear_recurrence", False)
 
+    if getattr(args, "where", None):
+        if task_id or task_index is not None or args.task_name:
+            raise ValueError("Use either a task or --where, not both")
+        changes = {
+            "title": args.title,
+            "due_datetime": due_datetime,
+            "reminder_datetime": reminder_datetime,
+            "important": important,
+            "recurrence": recurrence,
+            "clear_due": clear_due,
+            "clear_reminder": clear_reminder,
+            "clear_recurrence": clear_recurrence,
+        }
+        changes.update(task_query.parse_assignments(getattr(args, "set", None) or []))
+        _bulk_update(args, list_name, changes)
+        return
+    if getattr(args, "set", None):
+        raise ValueError("--set requires --where")
+
     # If --id is provided, use it directly (-l/--list defaults to "Tasks")
     if task_id:
         returned_id, title = wrapper.update_task(
@@ -607,11 +747,211 @@ def update(args):
         }
 
     if use_json:
-        print(json.dumps(result, indent=2))
+        _print_json(result, args)
     else:
         print(result["message"])
 
 
+def _bulk_update(args, list_name, changes):
+    """Apply one set of changes to every task of a list matching --where."""
+    started = time.perf_counter()
+    dry_run = getattr(args, "dry_run", False)
+    selection = task_query.Selection(args.where)
+    request_body = wrapper.task_update_body(**changes)
+
+    list_id = wrapper.get_list_id_by_name(list_name)
+    # Completed tasks are left alone unless a condition asks about them
+    include_completed = selection.mentions("status", "completed")
+    matched = list(task_query.select_tasks(list_id, selection, include_completed))
+    if dry_run:
+        outcomes = {task["id"]: (task["title"], None) for task in matched}
+    else:
+        outcomes = wrapper.update_tasks_batch(
+            list_id, [task["id"] for task in matched], request_body
+        )
+
+    tasks = []
+    for task in matched:
+        title, error = outcomes[task["id"]]
+        entry = {"id": task["id"], "title": title or task["title"], "ok": not error}
+        if error:
+            entry["error"] = error
+        tasks.append(entry)
+    failed = sum(1 for entry in tasks if not entry["ok"])
+    elapsed = time.perf_counter() - started
+
+    if dry_run:
+        message = f"Would update {len(tasks)} task(s) in '{list_name}'"
+    else:
+        message = (
+            f"Updated {len(tasks) - failed} of {len(tasks)} task(s) in "
+            f"'{list_name}'"
+        )
+    message += f" in {elapsed:.2f}s"
+    if getattr(args, "json", False):
+        result = {
+            "action": "dry_run" if dry_run else "updated",
+            "list": list_name,
+            "matched": len(tasks),
+            "updated": 0 if dry_run else len(tasks) - failed,
+            "failed": failed,
+            "changes": request_body,
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "tasks": tasks,
+            "message": message,
+        }
+        _print_json(result, args)
+    else:
+        verb = "Would update" if dry_run else "Updated"
+        for entry in tasks:
+            if entry["ok"]:
+                print(f"{verb} task '{entry['title']}'")
+            else:
+                print(f"Failed to update task '{entry['title']}': {entry['error']}")
+        print(message)
+    if failed:
+        sys.exit(1)
+
+
+def find(args):
+    date_fmt = getattr(args, "date_format", "eu")
+    list_name = getattr(args, "list", None)
+    selection = task_query.Selection(args.query)
+    stats = task_query.QueryStats()
+    projection = _projection(args, Task, extra=("list",))
+
+    with use_session(create_pooled_session()):
+        if list_name:
+            list_names = {wrapper.get_list_id_by_name(list_name): list_name}
+        else:
+            list_names = {
+                record["id"]: record["displayName"]
+                for record in wrapper.iter_list_records()
+            }
+        found = (
+            (list_names[list_id], Task(record))
+            for list_id, record in task_query.find_tasks(
+                selection,
+                list_names,
+                stats=stats,
+                select=projection.select() if projection else None,
+            )
+        )
+        if getattr(args, "format", None):
+            _write_records(
+                args,
+                record_output.model_fields(Task) + ["list"],
+                (serialize.WithFields(task, list=name) for name, task in found),
+                projection,
+            )
+        else:
+            found = list(found)
+
+    residual = selection.residual
+    explain = {
+        "query": str(selection.query),
+        "server_filter": selection.odata_filter(),
+        "local_filter": str(residual) if residual is not None else None,
+        **stats.to_dict(),
+    }
+    if getattr(args, "format", None):
+        if getattr(args, "explain", False):
+            _print_explain(explain, file=sys.stderr)
+        return
+    if getattr(args, "json", False):
+        output = {
+            "tasks": _project(
+                projection,
+                [serialize.WithFields(task, list=name) for name, task in found],
+            ),
+        }
+        if getattr(args, "explain", False):
+            output["explain"] = explain
+        _print_json(output, args)
+        return
+
+    with render.Renderer() as out:
+        out.table(
+            (_task_cells(task, date_fmt, prefix=f"{name}/") for name, task in found),
+            flex=0,
+        )
+    if getattr(args, "explain", False):
+        _print_explain(explain)
+
+
+def _print_explain(explain, file=None):
+    print(f"Server-side ($filter): {explain['server_filter'] or '-'}", file=file)
+    print(f"Client-side:           {explain['local_filter'] or '-'}", file=file)
+    print(
+        f"Fetched {explain['bytes']} bytes in {explain['pages']} page(s) from "
+        f"{explain['lists']} list(s); {explain['matched']} of "
+        f"{explain['scanned']} task(s) matched",
+        file=file,
+    )
+
+
+def _agenda_when(item, bucket, date_fmt):
+    at = item["at"]
+    if bucket in ("today", "tomorrow"):
+        return at.strftime("%H:%M") if item["kind"] == "reminder" else "all day"
+    when = format_date(at, date_fmt)
+    if item["kind"] == "reminder":
+        when += at.strftime(" %H:%M")
+    return when
+
+
+AGENDA_TAGS = {"due": "", "reminder": "(reminder)", "occurrence": "(repeats)"}
+
+
+def agenda(args):
+    days = getattr(args, "days", 14)
+    date_fmt = getattr(args, "date_format", "eu")
+
+    replica = task_replica.Replica.load()
+    if getattr(args, "refresh", False):
+        replica = replica or task_replica.Replica()
+        with use_session(create_pooled_session()):
+            task_replica.sync(replica)
+        replica.save()
+    elif replica is None:
+        raise task_replica.ReplicaNotFound(task_replica.replica_path())
+
+    buckets = task_agenda.build_agenda(replica, days=days)
+
+    if getattr(args, "json", False):
+        output = {"synced_at": replica.synced_at, "days": days}
+        for bucket, items in buckets.items():
+            output[bucket] = [
+                dict(item, at=item["at"].isoformat(timespec="minutes"))
+                for item in items
+            ]
+        _print_json(output, args)
+        return
+
+    rows = []
+    for bucket, items in buckets.items():
+        if not items:
+            continue
+        rows.append(task_agenda.BUCKET_TITLES[bucket])
+        for item in items:
+            title = f"{item['list']}/{item['title']}"
+            if item["importance"] == "high":
+                title += " !"
+            when = _agenda_when(item, bucket, date_fmt)
+            rows.append((f"  {when}", title, AGENDA_TAGS[item["kind"]]))
+    with render.Renderer() as out:
+        if rows:
+            out.table(rows, flex=1)
+        else:
+            out.line(f"Nothing due in the next {days} days")
+        if replica.synced_at:
+            synced = datetime.fromisoformat(replica.synced_at).astimezone()
+            out.line(
+                f"(synced {format_date(synced, date_fmt)} "
+                f"{synced.strftime('%H:%M')}; 'todo agenda --refresh' to update)"
+            )
+
+
 def new_step(args):
     task_id = getattr(args, "task_id", None)
     use_json = getattr(args, "json", False)
@@ -651,18 +991,22 @@ def new_step(args):
         }
 
     if use_json:
-        print(json.dumps(result, indent=2))
+        _print_json(result, args)
     else:
         print(result["message"])
 
 
 def list_steps(args):
     task_id = getattr(args, "task_id", None)
+    projection = _projection(args, ChecklistItem)
+    select = projection.select() if projection else None
 
     # If --id is provided, use it directly (-l/--list defaults to "Tasks")
     if task_id:
         list_name = getattr(args, "list", None) or "Tasks"
-        items = wrapper.get_checklist_items(list_name=list_name, task_id=task_id)
+        items = wrapper.get_checklist_items(
+            list_name=list_name, task_id=task_id, select=select
+        )
     else:
         task_list, task_name = parse_task_path(
             args.task_name, getattr(args, "list", None)
@@ -670,15 +1014,24 @@ def list_steps(args):
         items = wrapper.get_checklist_items(
             list_name=task_list,
             task_name=try_parse_as_int(task_name),
+            select=select,
         )
 
-    if getattr(args, "json", False):
-        output = [item.to_dict() for item in items]
-        print(json.dumps(output, indent=2))
+    if getattr(args, "format", None):
+        _write_records(
+            args, record_output.model_fields(ChecklistItem), items, projection
+        )
+    elif getattr(args, "json", False):
+        _print_json(_project(projection, items), args)
     else:
-        for i, item in enumerate(items):
-            check = "x" if item.is_checked else " "
-            print(f"[{i}] [{check}] {item.display_name}")
+        with render.Renderer() as out:
+            out.table(
+                (
+                    (f"[{i}]", "[x]" if item.is_checked else "[ ]", item.display_name)
+                    for i, item in enumerate(items)
+                ),
+                flex=2,
+            )
 
 
 def complete_step(args):
@@ -741,7 +1094,7 @@ def complete_step(args):
         }
 
     if use_json:
-        print(json.dumps(result, indent=2))
+        _print_json(result, args)
     else:
         print(result["message"])
 
@@ -806,7 +1159,7 @@ def uncomplete_step(args):
         }
 
     if use_json:
-        print(json.dumps(result, indent=2))
+        _print_json(result, args)
     else:
         print(result["message"])
 
@@ -868,7 +1221,7 @@ def rm_step(args):
         }
 
     if use_json:
-        print(json.dumps(result, indent=2))
+        _print_json(result, args)
     else:
         print(result["message"])
 
@@ -913,7 +1266,7 @@ def note(args):
         }
 
     if use_json:
-        print(json.dumps(result, indent=2))
+        _print_json(result, args)
     else:
         print(result["message"])
 
@@ -941,7 +1294,7 @@ def show_note(args):
             "note": task.note if task.note else None,
             "list": task_list,
         }
-        print(json.dumps(output, indent=2))
+        _print_json(output, args)
     else:
         if task.note:
             print(task.note)
@@ -984,7 +1337,7 @@ def clear_note(args):
         }
 
     if use_json:
-        print(json.dumps(result, indent=2))
+        _print_json(result, args)
     else:
         print(result["message"])
 
@@ -1030,7 +1383,7 @@ def link(args):
         result["app"] = app_name
 
     if use_json:
-        print(json.dumps(result, indent=2))
+        _print_json(result, args)
     else:
         print(result["message"])
 
@@ -1074,7 +1427,7 @@ def unlink(args):
     }
 
     if use_json:
-        print(json.dumps(result, indent=2))
+        _print_json(result, args)
     else:
         print(result["message"])
 
@@ -1097,20 +1450,19 @@ def links(args):
         )
         list_name = task_list
 
-    if use_json:
-        output = {
-            "list": list_name,
-            "links": [
-                {
-                    "id": r.get("id", ""),
-                    "url": r.get("webUrl", ""),
-                    "app": r.get("applicationName", ""),
-                    "display_name": r.get("displayName", ""),
-                }
-                for r in resources
-            ],
+    records = [
+        {
+            "id": r.get("id", ""),
+            "url": r.get("webUrl", ""),
+            "app": r.get("applicationName", ""),
+            "display_name": r.get("displayName", ""),
         }
-        print(json.dumps(output, indent=2))
+        for r in resources
+    ]
+    if getattr(args, "format", None):
+        _write_records(args, ["id", "url", "app", "display_name"], records)
+    elif use_json:
+        _print_json({"list": list_name, "links": records}, args)
     else:
         if not resources:
             print("No links")
@@ -1128,103 +1480,158 @@ def links(args):
 
 
 def show(args):
-    """Display all details of a task."""
+    """Display all details of one or more tasks.
+
+    Names are parsed with parse_task_path and resolved once per list, then
+    every task's details, steps, links and attachments are fetched through
+    $batch, one run of batches per list.
+    """
     task_id = getattr(args, "task_id", None)
     date_fmt = getattr(args, "date_format", "eu")
 
-    # If --id is provided, use it directly (-l/--list defaults to "Tasks")
+    # (list name, task name, index or ID), in the order given
     if task_id:
-        task_list = getattr(args, "list", None) or "Tasks"
-        task = wrapper.get_task(list_name=task_list, task_id=task_id)
-        steps = wrapper.get_checklist_items(list_name=task_list, task_id=task_id)
+        # -l/--list defaults to "Tasks"
+        targets = [(getattr(args, "list", None) or "Tasks", None, task_id)]
     else:
-        task_list, task_name = parse_task_path(
-            args.task_name, getattr(args, "list", None)
-        )
-        task = wrapper.get_task(
-            list_name=task_list, task_name=try_parse_as_int(task_name)
-        )
-        steps = wrapper.get_checklist_items(
-            list_name=task_list, task_name=try_parse_as_int(task_name)
-        )
+        task_names = getattr(args, "task_names", None) or [
+            getattr(args, "task_name", None)
+        ]
+        targets = []
+        for task_name in task_names:
+            if task_name is None:
+                continue
+            task_list, name = parse_task_path(task_name, getattr(args, "list", None))
+            targets.append((task_list, try_parse_as_int(name), None))
+        if not targets:
+            raise ValueError("You must provide task_name or task_id")
 
-    # Fetch linked resources
-    try:
-        task_links = wrapper.get_linked_resources(
-            list_name=task_list, task_id=task.id
-        )
-    except Exception:
-        task_links = []
+    projection = _projection(
+        args, Task, extra=("list", "steps", "links", "attachments")
+    )
+    fetch = {}
+    if projection is not None:
+        fetch = {
+            "select": projection.select(),
+            "parts": [
+                part
+                for part in ("steps", "links", "attachments")
+                if projection.wants(part)
+            ],
+        }
 
-    # Fetch attachments
-    try:
-        task_attachments = wrapper.get_attachments(
-            list_name=task_list, task_id=task.id
+    by_list = {}
+    for position, (task_list, name, tid) in enumerate(targets):
+        by_list.setdefault(task_list, []).append((position, name, tid))
+    entries = [None] * len(targets)
+    for task_list, items in by_list.items():
+        list_id = wrapper.get_list_id_by_name(task_list)
+        names = [name for _, name, tid in items if tid is None]
+        resolved = iter(
+            wrapper.get_task_ids_by_names(list_id, task_list, names) if names else []
         )
-    except Exception:
-        task_attachments = []
+        task_ids = [tid if tid is not None else next(resolved) for _, _, tid in items]
+        details = wrapper.get_task_details_batch(list_id, task_ids, **fetch)
+        for (position, _, _), tid in zip(items, task_ids):
+            entries[position] = (task_list, details[tid])
 
     if getattr(args, "json", False):
-        output = task.to_dict()
-        output["list"] = task_list
-        output["steps"] = [s.to_dict() for s in steps]
-        output["links"] = [
-            {
-                "id": r.get("id", ""),
-                "url": r.get("webUrl", ""),
-                "app": r.get("applicationName", ""),
-                "display_name": r.get("displayName", ""),
-            }
-            for r in task_links
-        ]
-        output["attachments"] = [
-            {
-                "id": a.get("id", ""),
-                "name": a.get("name", ""),
-                "content_type": a.get("contentType", ""),
-                "size": a.get("size", 0),
-            }
-            for a in task_attachments
+        output = [
+            _task_details_dict(entry, task_list, projection)
+            for task_list, entry in entries
         ]
-        print(json.dumps(output, indent=2))
+        _print_json(output[0] if len(output) == 1 else output, args)
     else:
-        print(f"Title:      {task.title}")
-        print(f"List:       {task_list}")
-        print(f"Status:     {_get_enum_value(task.status)}")
-        imp_val = _get_enum_value(task.importance)
-        importance_str = "!" if imp_val == "high" else imp_val
-        print(f"Importance: {importance_str}")
-        if task.due_datetime:
-            print(f"Due:        {format_date(task.due_datetime, date_fmt)}")
-        if task.reminder_datetime:
-            print(f"Reminder:   {task.reminder_datetime.strftime('%Y-%m-%d %H:%M')}")
-        print(f"Created:    {format_date(task.created_datetime, date_fmt)}")
-        if task.note:
-            print(f"Note:       {task.note}")
-        if steps:
-            print("Steps:")
-            for i, step in enumerate(steps):
-                check = "x" if step.is_checked else " "
-                print(f"  [{i}] [{check}] {step.display_name}")
-        if task_links:
-            print("Links:")
-            for i, r in enumerate(task_links):
-                app = r.get("applicationName", "")
-                url = r.get("webUrl", "")
-                display = r.get("displayName", "")
-                if app and display != url:
-                    print(f"  [{i}] {display} ({app}) - {url}")
-                elif app:
-                    print(f"  [{i}] {app} - {url}")
-                else:
-                    print(f"  [{i}] {url}")
-        if task_attachments:
-            print("Attachments:")
-            for i, a in enumerate(task_attachments):
-                att_name = a.get("name", "")
-                att_size = a.get("size", 0)
-                size_str = _format_file_size(att_size)
-                print(f"  [{i}] {att_name} ({size_str})")
+        with render.Renderer() as out:
+            for i, (task_list, entry) in enumerate(entries):
+                if i > 0:
+                    out.line()
+                _render_task_details(out, entry, task_list, date_fmt)
+
+
+def _task_details_dict(entry, task_list, projection=None):
+    """Build the JSON representation of a task fetched for 'show'."""
+    extra = {"list": task_list}
+    extra["steps"] = [s.to_dict() for s in entry["steps"]]
+    extra["links"] = [
+        {
+            "id": r.get("id", ""),
+            "url": r.get("webUrl", ""),
+            "app": r.get("applicationName", ""),
+            "display_name": r.get("displayName", ""),
+        }
+        for r in entry["links"]
+    ]
+    extra["attachments"] = [
+        {
+            "id": a.get("id", ""),
+            "name": a.get("name", ""),
+            "content_type": a.get("contentType", ""),
+            "size": a.get("size", 0),
+        }
+        for a in entry["attachments"]
+    ]
+    if projection is not None:
+        return projection.apply(serialize.WithFields(entry["task"], **extra))
+    return dict(entry["task"].to_dict(), **extra)
+
+
+def _render_task_details(out, entry, task_list, date_fmt):
+    """Render a task fetched for 'show' in human-readable form."""
+    task = entry["task"]
+    steps = entry["steps"]
+    task_links = entry["links"]
+    task_attachments = entry["attachments"]
+
+    out.line(f"Title:      {task.title}")
+    out.line(f"List:       {task_list}")
+    out.line(f"Status:     {_get_enum_value(task.status)}")
+    imp_val = _get_enum_value(task.importance)
+    importance_str = "!" if imp_val == "high" else imp_val
+    out.line(f"Importance: {importance_str}")
+    if task.due_datetime:
+        out.line(f"Due:        {format_date(task.due_datetime, date_fmt)}")
+    if task.reminder_datetime:
+        out.line(f"Reminder:   {task.reminder_datetime.strftime('%Y-%m-%d %H:%M')}")
+    out.line(f"Created:    {format_date(task.created_datetime, date_fmt)}")
+    if task.note:
+        # Notes are shown whole, they may span several lines
+        out.line(f"Note:       {task.note}", cut=False)
+    if steps:
+        out.line("Steps:")
+        out.table(
+            (
+                (f"  [{i}]", "[x]" if step.is_checked else "[ ]", step.display_name)
+                for i, step in enumerate(steps)
+            ),
+            flex=2,
+        )
+    if task_links:
+        out.line("Links:")
+        # Kept whole so the URLs can be copied
+        for i, r in enumerate(task_links):
+            app = r.get("applicationName", "")
+            url = r.get("webUrl", "")
+            display = r.get("displayName", "")
+            if app and display != url:
+                out.line(f"  [{i}] {display} ({app}) - {url}", cut=False)
+            elif app:
+                out.line(f"  [{i}] {app} - {url}", cut=False)
+            else:
+                out.line(f"  [{i}] {url}", cut=False)
+    if task_attachments:
+        out.line("Attachments:")
+        out.table(
+            (
+                (
+                    f"  [{i}]",
+                    a.get("name", ""),
+                    f"({_format_file_size(a.get('size', 0))})",
+                )
+                for i, a in enumerate(task_attachments)
+            ),
+            flex=1,
+        )
 
 
 def attach(args):
@@ -1232,6 +1639,19 @@ def attach(args):
     task_id = getattr(args, "task_id", None)
     use_json = getattr(args, "json", False)
     file_path = args.file_path
+    file_name = getattr(args, "name", None)
+
+    # "-" reads the attachment content from stdin
+    stream = None
+    if file_path == "-":
+        stream = sys.stdin.buffer
+        file_path = None
+        file_name = file_name or "stdin"
+
+    # Show upload progress for large files when a human is watching
+    progress = None
+    if not use_json and sys.stderr.isatty():
+        progress = _print_upload_progress
 
     if task_id:
         list_name = getattr(args, "list", None) or "Tasks"
@@ -1239,6 +1659,9 @@ def attach(args):
             file_path=file_path,
             list_name=list_name,
             task_id=task_id,
+            progress=progress,
+            stream=stream,
+            file_name=file_name,
         )
     else:
         task_list, name = parse_task_path(args.task_name, getattr(args, "list", None))
@@ -1246,6 +1669,9 @@ def attach(args):
             file_path=file_path,
             list_name=task_list,
             task_name=try_parse_as_int(name),
+            progress=progress,
+            stream=stream,
+            file_name=file_name,
         )
         list_name = task_list
 
@@ -1260,11 +1686,22 @@ def attach(args):
     }
 
     if use_json:
-        print(json.dumps(result, indent=2))
+        _print_json(result, args)
     else:
         print(result["message"])
 
 
+def _print_upload_progress(sent, total, mb_per_s):
+    """Render upload progress on stderr, ending the line when done."""
+    sys.stderr.write(
+        f"\rUploading: {sent / (1024 * 1024):.1f}/{total / (1024 * 1024):.1f} MB"
+        f" ({mb_per_s:.1f} MB/s)"
+    )
+    if sent >= total:
+        sys.stderr.write("\n")
+    sys.stderr.flush()
+
+
 def attachments(args):
     """List all attachments on a task."""
     task_id = getattr(args, "task_id", None)
@@ -1283,20 +1720,19 @@ def attachments(args):
         )
         list_name = task_list
 
-    if use_json:
-        output = {
-            "list": list_name,
-            "attachments": [
-                {
-                    "id": a.get("id", ""),
-                    "name": a.get("name", ""),
-                    "content_type": a.get("contentType", ""),
-                    "size": a.get("size", 0),
-                }
-                for a in atts
-            ],
+    records = [
+        {
+            "id": a.get("id", ""),
+            "name": a.get("name", ""),
+            "content_type": a.get("contentType", ""),
+            "size": a.get("size", 0),
         }
-        print(json.dumps(output, indent=2))
+        for a in atts
+    ]
+    if getattr(args, "format", None):
+        _write_records(args, ["id", "name", "content_type", "size"], records)
+    elif use_json:
+        _print_json({"list": list_name, "attachments": records}, args)
     else:
         if not atts:
             print("No attachments")
@@ -1357,31 +1793,32 @@ def detach(args):
     }
 
     if use_json:
-        print(json.dumps(result, indent=2))
+        _print_json(result, args)
     else:
         print(result["message"])
 
 
 def download(args):
     """Download attachment(s) from a task to the current directory."""
-    import base64
-
     task_id = getattr(args, "task_id", None)
     att_index = getattr(args, "att_index", None)
     output_dir = getattr(args, "output", None) or "."
+    sync = getattr(args, "sync", False)
 
+    if getattr(args, "all_tasks", False):
+        _download_all_tasks(args, output_dir)
+        return
+
+    # Resolve list_id and task_id once for listing and fetching content
     if task_id:
         list_name = getattr(args, "list", None) or "Tasks"
-        atts = wrapper.get_attachments(
-            list_name=list_name, task_id=task_id
-        )
+        list_id = wrapper.get_list_id_by_name(list_name)
     else:
-        task_list, name = parse_task_path(args.task_name, getattr(args, "list", None))
-        atts = wrapper.get_attachments(
-            list_name=task_list,
-            task_name=try_parse_as_int(name),
-        )
-        list_name = task_list
+        list_name, name = parse_task_path(args.task_name, getattr(args, "list", None))
+        list_id = wrapper.get_list_id_by_name(list_name)
+        task_id = wrapper.get_task_id_by_name(list_name, try_parse_as_int(name))
+
+    atts = wrapper.get_attachments(list_id=list_id, task_id=task_id)
 
     if not atts:
         print("No attachments to download")
@@ -1394,30 +1831,14 @@ def download(args):
     else:
         atts_to_download = atts
 
-    # Resolve list_id and task_id for fetching content
-    if task_id:
-        list_id = wrapper.get_list_id_by_name(list_name)
-    else:
-        list_id = wrapper.get_list_id_by_name(list_name)
-        task_id_resolved = wrapper.get_task_id_by_name(
-            list_name, try_parse_as_int(name)
-        )
-        task_id = task_id_resolved
+    if sync:
+        entries = [(task_id, "", att) for att in atts_to_download]
+        _sync_attachments(args, list_id, entries, output_dir)
+        return
 
     downloaded = []
     for att in atts_to_download:
-        att_data = wrapper.get_attachment(
-            attachment_id=att["id"],
-            list_id=list_id,
-            task_id=task_id,
-        )
-        content_bytes_b64 = att_data.get("contentBytes", "")
-        if not content_bytes_b64:
-            print(f"Warning: No content bytes for '{att.get('name', '')}'")
-            continue
-
-        file_bytes = base64.b64decode(content_bytes_b64)
-        file_name = att_data.get("name", att.get("name", "attachment"))
+        file_name = att.get("name") or "attachment"
         output_path = os.path.join(output_dir, file_name)
 
         # Avoid overwriting
@@ -1428,8 +1849,12 @@ def download(args):
                 output_path = os.path.join(output_dir, f"{base}_{counter}{ext}")
                 counter += 1
 
-        with open(output_path, "wb") as f:
-            f.write(file_bytes)
+        wrapper.download_attachment(
+            attachment_id=att["id"],
+            output_path=output_path,
+            list_id=list_id,
+            task_id=task_id,
+        )
         downloaded.append(output_path)
         print(f"Downloaded: {output_path}")
 
@@ -1437,6 +1862,328 @@ def download(args):
         print("No files downloaded")
 
 
+def _download_all_tasks(args, output_dir):
+    """Sync the attachments of every task in a list, one subdirectory per task."""
+    list_name = getattr(args, "list", None) or "Tasks"
+    list_id = wrapper.get_list_id_by_name(list_name)
+
+    tasks = list(wrapper.iter_tasks(list_id, include_completed=True))
+    atts_map = wrapper.get_attachments_batch(list_id, [t.id for t in tasks])
+
+    entries = []
+    for task in tasks:
+        subdir = attachment_sync.safe_file_name(task.title, default=task.id)
+        for att in atts_map.get(task.id, []):
+            entries.append((task.id, subdir, att))
+
+    if not entries:
+        print(f"No attachments in '{list_name}'")
+        return
+
+    _sync_attachments(args, list_id, entries, output_dir)
+
+
+def _sync_attachments(args, list_id, entries, output_dir):
+    """Download new or changed attachments in parallel and print a summary."""
+    jobs = getattr(args, "jobs", None) or attachment_sync.DEFAULT_JOBS
+
+    def report(status, path, error):
+        if status == "downloaded":
+            print(f"Downloaded: {path}")
+        elif status == "unchanged":
+            print(f"Unchanged:  {path}")
+        else:
+            print(f"Failed:     {path} ({error})")
+
+    downloaded, unchanged, failed = attachment_sync.sync_attachments(
+        list_id, entries, output_dir, jobs=jobs, report=report
+    )
+    print(
+        f"Synced {len(downloaded)} downloaded, {len(unchanged)} unchanged, "
+        f"{len(failed)} failed"
+    )
+    if failed:
+        raise failed[0][1]
+
+
+def import_tasks(args):
+    use_json = getattr(args, "json", False)
+    path = args.file
+    fmt = task_import.detect_format(path, getattr(args, "format", None))
+    mapping = task_import.parse_mapping(getattr(args, "map", None))
+    jobs = getattr(args, "jobs", task_import.DEFAULT_JOBS)
+
+    checkpoint_path = getattr(args, "checkpoint", None)
+    if checkpoint_path is None and path != "-":
+        checkpoint_path = task_import.checkpoint_path_for(path)
+    checkpoint = task_import.Checkpoint(None)
+    if checkpoint_path:
+        if getattr(args, "restart", False) and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        checkpoint = task_import.Checkpoint(checkpoint_path)
+
+    errors = []
+
+    def report(status, number, detail):
+        if status == "failed":
+            errors.append({"record": number, "error": detail})
+            if not use_json:
+                print(f"Failed record {number}: {detail}", file=sys.stderr)
+
+    if path == "-":
+        source = contextlib.nullcontext(sys.stdin)
+    else:
+        source = open(path, "r", newline="", encoding="utf-8-sig")
+    with source as f, use_session(create_pooled_session(pool_size=jobs)):
+        counts = task_import.import_tasks(
+            task_import.read_records(f, fmt),
+            default_list=getattr(args, "list", None) or "Tasks",
+            mapping=mapping,
+            checkpoint=checkpoint,
+            jobs=jobs,
+            report=report,
+        )
+
+    msg = (
+        f"Imported {counts['created']} task(s), skipped {counts['skipped']} "
+        f"already imported, {counts['failed']} failed"
+    )
+    if counts["failed"] and checkpoint.path:
+        msg += "; run the same command again to retry the failed records"
+    elif not counts["failed"]:
+        checkpoint.remove()
+
+    result = dict(counts, action="imported", message=msg)
+    if errors:
+        result["errors"] = errors
+    _output_result(args, result)
+    if counts["failed"]:
+        sys.exit(1)
+
+
+def export(args):
+    list_name = getattr(args, "list", None)
+    parts = [
+        part for part in task_export.DETAIL_PARTS if getattr(args, part, False)
+    ]
+    output = getattr(args, "output", None)
+
+    with task_export.open_output(output, compress=getattr(args, "gzip", False)) as out:
+        list_count, task_count = task_export.export(
+            out,
+            list_names=[list_name] if list_name else None,
+            parts=parts,
+            include_completed=not getattr(args, "no_completed", False),
+        )
+
+    if list_name and not list_count:
+        raise wrapper.ListNotFound(list_name)
+    if output not in (None, "-"):
+        print(f"Exported {list_count} list(s) and {task_count} task(s) to {output}")
+
+
+def _transfer(args, move):
+    """Copy or move tasks to the list args.to.
+
+    Task names are parsed with parse_task_path, so they may name tasks of
+    several lists; each source list is resolved and transferred in turn.
+    """
+    default_list = getattr(args, "list", None)
+    target_name = args.to
+    use_json = getattr(args, "json", False)
+
+    # Source list name -> task ids (by_id) or names/indexes to resolve
+    sources = {}
+    by_id = bool(getattr(args, "task_id", None))
+    if by_id:
+        sources[default_list or "Tasks"] = [args.task_id]
+    elif getattr(args, "task_index", None) is not None:
+        sources[default_list or "Tasks"] = [args.task_index]
+    else:
+        if not args.task_names:
+            raise ValueError("Specify at least one task, --id or --index")
+        for task_name in args.task_names:
+            task_list, name = parse_task_path(task_name, default_list)
+            sources.setdefault(task_list, []).append(try_parse_as_int(name))
+
+    target_id = wrapper.get_list_id_by_name(target_name)
+    transferred = []
+    for list_name, items in sources.items():
+        list_id = wrapper.get_list_id_by_name(list_name)
+        if by_id:
+            task_ids = items
+        else:
+            task_ids = wrapper.get_task_ids_by_names(list_id, list_name, items)
+        for r in task_transfer.transfer(list_id, task_ids, target_id, move=move):
+            transferred.append((list_name, r))
+
+    action = "moved" if move else "copied"
+    results = []
+    for list_name, r in transferred:
+        if r["ok"]:
+            result = {
+                "action": action,
+                "id": r["new_id"],
+                "source_id": r["id"],
+                "title": r["title"],
+                "list": target_name,
+                "message": f"{action.capitalize()} task '{r['title']}' from "
+                f"'{list_name}' to '{target_name}'",
+            }
+        else:
+            result = {
+                "action": "failed",
+                "id": r["new_id"],
+                "source_id": r["id"],
+                "title": r["title"],
+                "error": r["error"],
+                "message": f"Failed to {'move' if move else 'copy'} task "
+                f"'{r['title']}': {r['error']}",
+            }
+        results.append(result)
+
+    if use_json:
+        _print_json(results, args)
+    else:
+        for r in results:
+            print(r["message"])
+    if any(r["action"] == "failed" for r in results):
+        sys.exit(1)
+
+
+def mv(args):
+    _transfer(args, move=True)
+
+
+def cp(args):
+    _transfer(args, move=False)
+
+
+def backup(args):
+    with use_session(create_pooled_session()):
+        path, records = task_backup.backup(
+            args.dir,
+            full=getattr(args, "full", False),
+            attachments=not getattr(args, "no_attachments", False),
+        )
+    if path is None:
+        print(f"No changes since the last backup in {args.dir}")
+    else:
+        print(f"Wrote {records} record(s) to {path}")
+
+
+def restore(args):
+    list_name = getattr(args, "list", None)
+    errors = []
+
+    def report(status, title, detail):
+        if status == "failed" or detail:
+            errors.append({"task": title, "error": detail})
+            if not getattr(args, "json", False):
+                print(f"Failed: {title} ({detail})", file=sys.stderr)
+
+    with use_session(create_pooled_session()):
+        counts = task_backup.restore(
+            args.dir, list_names=[list_name] if list_name else None, report=report
+        )
+    if list_name and not counts["lists"]:
+        raise wrapper.ListNotFound(list_name)
+
+    msg = (
+        f"Restored {counts['restored']} task(s) in {counts['lists']} list(s), "
+        f"{counts['failed']} failed"
+    )
+    result = dict(counts, action="restored", message=msg)
+    if errors:
+        result["errors"] = errors
+    _output_result(args, result)
+    if counts["failed"]:
+        sys.exit(1)
+
+
+def run(args):
+    if args.script == "-":
+        ok = script.run_script(sys.stdin, setup_parser(), sys.stdout)
+    else:
+        with open(args.script, "r") as f:
+            ok = script.run_script(f, setup_parser(), sys.stdout)
+    if not ok:
+        sys.exit(1)
+
+
+def daemon(args):
+    path = getattr(args, "socket", None) or todo_daemon.socket_path()
+
+    if getattr(args, "stop", False) or getattr(args, "status", False):
+        method = "stop" if args.stop else "ping"
+        try:
+            todo_daemon.call(method, path=path, timeout=5)
+        except OSError:
+            raise todo_daemon.DaemonNotRunning(path)
+        print("Daemon stopped" if args.stop else f"Daemon running on {path}")
+        return
+
+    print(f"Daemon listening on {path}", file=sys.stderr)
+    todo_daemon.serve(path, cache_ttl=getattr(args, "cache_ttl", None))
+
+
+def remind(args):
+    date_fmt = getattr(args, "date_format", "eu")
+    interval = getattr(args, "interval", 300)
+
+    if getattr(args, "daemon", False):
+        if interval <= 0:
+            raise ValueError("--interval must be a positive number of seconds")
+        notify = reminders.notifier(getattr(args, "notify", "auto"))
+        replica = task_replica.Replica.load() or task_replica.Replica()
+        with use_session(create_pooled_session()):
+            task_replica.sync(replica)
+            replica.save()
+            print(
+                f"Reminder scheduler running; syncing every {interval:g} s",
+                file=sys.stderr,
+            )
+            reminders.run(
+                replica,
+                notify,
+                interval=interval,
+                on_change=todo_daemon.invalidate,
+            )
+        return
+
+    replica = task_replica.Replica.load()
+    if replica is None:
+        raise task_replica.ReplicaNotFound(task_replica.replica_path())
+    queue = reminders.ReminderQueue()
+    queue.load(replica, time.time())
+    pending = queue.pop_due(float("inf"))
+
+    if getattr(args, "json", False):
+        output = [
+            {
+                "list": replica.list_name(list_id),
+                "list_id": list_id,
+                "id": task_id,
+                "title": replica.task(list_id, task_id).get("title", ""),
+                "at": timestamp_to_local(timestamp).isoformat(timespec="minutes"),
+            }
+            for timestamp, list_id, task_id in pending
+        ]
+        _print_json({"reminders": output}, args)
+        return
+
+    with render.Renderer() as out:
+        if not pending:
+            out.line("No pending reminders")
+        for timestamp, list_id, task_id in pending:
+            at = timestamp_to_local(timestamp)
+            title = replica.task(list_id, task_id).get("title", "")
+            out.line(
+                f"{format_date(at, date_fmt)} {at.strftime('%H:%M')}  "
+                f"{replica.list_name(list_id)}/{title}"
+            )
+
+
 def confirm_action(message, skip_confirm=False):
     """Prompt for confirmation. Returns True if confirmed."""
     if skip_confirm:
@@ -1471,12 +2218,43 @@ helptext_recurrence = (
     "every 2 days, every 3 weeks, weekly:mon,wed,fri"
 )
 
+helptext_query = (
+    f"Conditions FIELD OP VALUE with FIELD one of {', '.join(task_query.FIELDS)} "
+    f"and OP one of {' '.join(task_query.OPERATORS)}, combined with and, or, "
+    "not and parentheses, e.g. 'due<today and (importance=high or "
+    "title~\"invoice\")'; 'none' compares with an unset date"
+)
+
 
 def _add_json_flag(subparser):
     """Add --json flag to a subparser."""
     subparser.add_argument(
         "-j", "--json", action="store_true", help="Output in JSON format"
     )
+    subparser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Output JSON on a single line without whitespace (implies --json)",
+    )
+
+
+def _add_fields_flag(subparser):
+    """Add --fields, which limits output and fetched fields, to a subparser."""
+    subparser.add_argument(
+        "--fields",
+        metavar="FIELDS",
+        help="Comma-separated fields to output and fetch, e.g. id,title,due "
+        "(implies --json unless --format is given)",
+    )
+
+
+def _add_format_flag(subparser):
+    """Add --format for record-per-line output to a subparser."""
+    subparser.add_argument(
+        "--format",
+        choices=record_output.FORMATS,
+        help="Write one record per line as they are fetched: ndjson, csv or tsv",
+    )
 
 
 def _add_date_format_flag(subparser):
@@ -1544,6 +2322,8 @@ def setup_parser():
             help="Display all lists" if cmd_name == "lists" else argparse.SUPPRESS,
         )
         _add_json_flag(subparser)
+        _add_format_flag(subparser)
+        _add_fields_flag(subparser)
         subparser.set_defaults(func=ls)
 
     # 'tasks' command (primary) and 'lst'/'t' aliases
@@ -1602,15 +2382,25 @@ def setup_parser():
         )
         _add_json_flag(subparser)
         _add_date_format_flag(subparser)
+        _add_format_flag(subparser)
+        _add_fields_flag(subparser)
         subparser.set_defaults(func=lst)
 
     # 'show' command
-    subparser = subparsers.add_parser("show", help="Display all details of a task")
-    subparser.add_argument("task_name", nargs="?", help=helptext_task_name)
+    subparser = subparsers.add_parser(
+        "show", help="Display all details of one or more tasks"
+    )
+    subparser.add_argument(
+        "task_names",
+        nargs="*",
+        metavar="task",
+        help=helptext_task_name,
+    )
     _add_list_flag(subparser)
     _add_id_flag(subparser)
     _add_json_flag(subparser)
     _add_date_format_flag(subparser)
+    _add_fields_flag(subparser)
     subparser.set_defaults(func=show)
 
     # 'new' command and 'n' alias
@@ -1749,6 +2539,67 @@ def setup_parser():
         _add_json_flag(subparser)
         subparser.set_defaults(func=rm)
 
+    # 'mv' and 'cp' commands - move or copy tasks to another list
+    for cmd_name, func, verb in [("mv", mv, "Move"), ("cp", cp, "Copy")]:
+        subparser = subparsers.add_parser(
+            cmd_name,
+            help=f"{verb} task(s) with their steps, links, note and attachments "
+            "to another list",
+        )
+        subparser.add_argument(
+            "task_names",
+            nargs="*",
+            metavar="task",
+            help=helptext_task_name,
+        )
+        subparser.add_argument(
+            "-t", "--to", required=True, metavar="LIST", help="Target list"
+        )
+        _add_list_flag(subparser)
+        _add_id_flag(subparser)
+        _add_index_flag(subparser)
+        _add_json_flag(subparser)
+        subparser.set_defaults(func=func)
+
+    # 'find' command - query tasks in one list or all lists
+    subparser = subparsers.add_parser(
+        "find", help="Find tasks matching a query in one list or all lists"
+    )
+    subparser.add_argument("query", help=helptext_query)
+    subparser.add_argument(
+        "--explain",
+        action="store_true",
+        help="Show which parts of the query ran server-side and what was fetched",
+    )
+    subparser.add_argument(
+        "-l", "--list", help="Search only this list (default: all lists)"
+    )
+    _add_date_format_flag(subparser)
+    _add_json_flag(subparser)
+    _add_format_flag(subparser)
+    _add_fields_flag(subparser)
+    subparser.set_defaults(func=find)
+
+    # 'agenda' command - tasks of every list by time, from the local replica
+    subparser = subparsers.add_parser(
+        "agenda",
+        help="Show overdue and upcoming tasks of all lists from the local replica",
+    )
+    subparser.add_argument(
+        "--days",
+        type=int,
+        default=14,
+        help="How many days ahead to show (default: 14)",
+    )
+    subparser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Sync the local replica with the server first",
+    )
+    _add_date_format_flag(subparser)
+    _add_json_flag(subparser)
+    subparser.set_defaults(func=agenda)
+
     # 'update' command
     subparser = subparsers.add_parser("update", help="Update an existing task")
     subparser.add_argument("task_name", nargs="?", help=helptext_task_name)
@@ -1786,6 +2637,26 @@ def setup_parser():
         "--clear-recurrence", action="store_true", help="Remove recurrence"
     )
 
+    subparser.add_argument(
+        "--where",
+        action="append",
+        metavar="QUERY",
+        help="Update every task in the list matching QUERY instead of one "
+        "task; can be repeated (all must match). " + helptext_query,
+    )
+    subparser.add_argument(
+        "--set",
+        action="append",
+        metavar="FIELD=VALUE",
+        help="Change applied with --where; can be repeated. Fields: "
+        f"{', '.join(task_query.ASSIGNABLE)}; 'none' clears a date or recurrence",
+    )
+    subparser.add_argument(
+        "--dry-run",
+        dest="dry_run",
+        action="store_true",
+        help="With --where, show the matching tasks without changing them",
+    )
     _add_list_flag(subparser)
     _add_id_flag(subparser)
     _add_index_flag(subparser)
@@ -1811,6 +2682,8 @@ def setup_parser():
     _add_list_flag(subparser)
     _add_id_flag(subparser)
     _add_json_flag(subparser)
+    _add_format_flag(subparser)
+    _add_fields_flag(subparser)
     subparser.set_defaults(func=list_steps)
 
     # 'complete-step' command
@@ -1919,6 +2792,7 @@ def setup_parser():
     _add_list_flag(subparser)
     _add_id_flag(subparser)
     _add_json_flag(subparser)
+    _add_format_flag(subparser)
     subparser.set_defaults(func=links)
 
     # 'attach' command - attach a file to a task
@@ -1926,7 +2800,13 @@ def setup_parser():
         "attach", help="Attach a file to a task"
     )
     subparser.add_argument("task_name", nargs="?", help=helptext_task_name)
-    subparser.add_argument("file_path", help="Path to the file to attach")
+    subparser.add_argument(
+        "file_path", help="Path to the file to attach, or '-' to read from stdin"
+    )
+    subparser.add_argument(
+        "--name",
+        help="Attachment file name (default: the file's name, or 'stdin' for '-')",
+    )
     _add_list_flag(subparser)
     _add_id_flag(subparser)
     _add_json_flag(subparser)
@@ -1940,6 +2820,7 @@ def setup_parser():
     _add_list_flag(subparser)
     _add_id_flag(subparser)
     _add_json_flag(subparser)
+    _add_format_flag(subparser)
     subparser.set_defaults(func=attachments)
 
     # 'detach' command - remove attachment(s) from a task
@@ -1975,94 +2856,366 @@ def setup_parser():
         help="Output directory (default: current directory)",
         metavar="DIR",
     )
+    subparser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Download in parallel and skip files unchanged since the last sync "
+        "(tracked in a manifest in the output directory)",
+    )
+    subparser.add_argument(
+        "--all-tasks",
+        action="store_true",
+        help="Sync attachments of every task in the list, one subdirectory per "
+        "task (implies --sync)",
+    )
+    subparser.add_argument(
+        "--jobs",
+        type=int,
+        default=attachment_sync.DEFAULT_JOBS,
+        help=f"Parallel downloads for --sync (default: {attachment_sync.DEFAULT_JOBS})",
+    )
     _add_list_flag(subparser)
     _add_id_flag(subparser)
     subparser.set_defaults(func=download)
 
+    # 'import' command - bulk create tasks from a file
+    subparser = subparsers.add_parser(
+        "import", help="Import tasks from a CSV, JSON or NDJSON file"
+    )
+    subparser.add_argument(
+        "file", help="Input file, or '-' to read from stdin (NDJSON by default)"
+    )
+    subparser.add_argument(
+        "--format",
+        choices=task_import.FORMATS,
+        help="Input format (default: from the file extension)",
+    )
+    subparser.add_argument(
+        "--map",
+        action="append",
+        default=[],
+        metavar="FIELD=COLUMN",
+        help="Read FIELD from COLUMN; can be repeated. Fields: "
+        + ", ".join(task_import.FIELDS)
+        + ". Columns named like a field are used by default",
+    )
+    subparser.add_argument(
+        "--jobs",
+        type=int,
+        default=task_import.DEFAULT_JOBS,
+        help=f"Batches sent in parallel (default: {task_import.DEFAULT_JOBS})",
+    )
+    subparser.add_argument(
+        "--checkpoint",
+        metavar="PATH",
+        help="Checkpoint file for resuming (default: one per input file in the "
+        "config directory; none for stdin)",
+    )
+    subparser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore an existing checkpoint and import every record",
+    )
+    _add_list_flag(subparser)
+    _add_json_flag(subparser)
+    subparser.set_defaults(func=import_tasks)
+
+    # 'export' command - stream every list to NDJSON
+    subparser = subparsers.add_parser(
+        "export", help="Export lists and tasks as NDJSON (one record per line)"
+    )
+    subparser.add_argument(
+        "-o",
+        "--output",
+        metavar="FILE",
+        help="Output file (default: stdout); a .gz name implies --gzip",
+    )
+    subparser.add_argument(
+        "--gzip", action="store_true", help="Compress the output with gzip"
+    )
+    subparser.add_argument("--steps", action="store_true", help="Include steps")
+    subparser.add_argument("--links", action="store_true", help="Include links")
+    subparser.add_argument(
+        "--attachments",
+        action="store_true",
+        help="Include attachment metadata (not the file contents)",
+    )
+    subparser.add_argument(
+        "--no-completed",
+        dest="no_completed",
+        action="store_true",
+        help="Skip completed tasks",
+    )
+    subparser.add_argument(
+        "-l", "--list", help="Export only this list (default: all lists)"
+    )
+    subparser.set_defaults(func=export)
+
+    # 'backup' command - incremental backup into a directory
+    subparser = subparsers.add_parser(
+        "backup",
+        help="Back up every list into a directory, writing only what changed "
+        "since the last backup",
+    )
+    subparser.add_argument("dir", help="Backup directory")
+    subparser.add_argument(
+        "--full",
+        action="store_true",
+        help="Store every task again instead of only the changes",
+    )
+    subparser.add_argument(
+        "--no-attachments",
+        dest="no_attachments",
+        action="store_true",
+        help="Skip attachments",
+    )
+    subparser.set_defaults(func=backup)
+
+    # 'restore' command - replay a backup into the account
+    subparser = subparsers.add_parser(
+        "restore", help="Recreate the lists and tasks of a backup directory"
+    )
+    subparser.add_argument("dir", help="Backup directory")
+    subparser.add_argument(
+        "-l", "--list", help="Restore only this list (default: all lists)"
+    )
+    _add_json_flag(subparser)
+    subparser.set_defaults(func=restore)
+
+    # 'run' command - execute a script of commands
+    subparser = subparsers.add_parser(
+        "run",
+        help="Run a script of todo commands (one per line), printing NDJSON results",
+    )
+    subparser.add_argument(
+        "script", help="Script file, or '-' to read commands from stdin"
+    )
+    subparser.set_defaults(func=run)
+
+    # 'daemon' command - serve commands over a Unix socket
+    subparser = subparsers.add_parser(
+        "daemon",
+        help="Run a background daemon that serves todo commands over a Unix socket",
+    )
+    subparser.add_argument(
+        "--socket",
+        metavar="PATH",
+        help="Socket path (default: $TODO_DAEMON_SOCKET or the config directory)",
+    )
+    subparser.add_argument(
+        "--cache-ttl",
+        dest="cache_ttl",
+        type=float,
+        default=todo_daemon.DEFAULT_CACHE_TTL,
+        metavar="SECONDS",
+        help="Reuse read-only output and name lookups for this long "
+        f"(default: {todo_daemon.DEFAULT_CACHE_TTL:g})",
+    )
+    group = subparser.add_mutually_exclusive_group()
+    group.add_argument("--stop", action="store_true", help="Stop a running daemon")
+    group.add_argument(
+        "--status", action="store_true", help="Check whether a daemon is running"
+    )
+    subparser.set_defaults(func=daemon)
+
+    # 'remind' command - pending reminders, fired locally with --daemon
+    subparser = subparsers.add_parser(
+        "remind",
+        help="Show pending reminders, or fire them as notifications with --daemon",
+    )
+    subparser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run in the foreground, firing reminders as they come due",
+    )
+    subparser.add_argument(
+        "--interval",
+        type=float,
+        default=300,
+        metavar="SECONDS",
+        help="Seconds between syncs with the server (default: 300)",
+    )
+    subparser.add_argument(
+        "--notify",
+        choices=reminders.NOTIFIERS,
+        default="auto",
+        help="Where to show reminders (default: desktop if available, else stdout)",
+    )
+    _add_date_format_flag(subparser)
+    _add_json_flag(subparser)
+    subparser.set_defaults(func=remind)
+
     return parser
 
 
+def _run_command(parser, argv):
+    """Parse argv and run the selected command, reporting errors.
+
+    Returns (namespace, ok).
+    """
+    namespace = None
+    try:
+        namespace, args = parser.parse_known_args(argv)
+        parser.parse_args(args, namespace)
+        if getattr(namespace, "compact", False):
+            namespace.json = True
+        if getattr(namespace, "fields", None) and not getattr(
+            namespace, "format", None
+        ):
+            namespace.json = True
+
+        if namespace.func is not None:
+            namespace.func(namespace)
+        elif not namespace.interactive:
+            # No argument was provided
+            parser.print_usage()
+        return namespace, True
+
+    except argparse.ArgumentError as e:
+        _output_error("argument_error", f"Argument error: {e}")
+    except wrapper.TaskNotFoundByName as e:
+        _output_error("task_not_found", e.message)
+    except wrapper.ListNotFound as e:
+        _output_error("list_not_found", e.message)
+    except wrapper.TaskNotFoundByIndex as e:
+        _output_error("task_not_found", e.message)
+    except wrapper.StepNotFoundByName as e:
+        _output_error("step_not_found", e.message)
+    except wrapper.StepNotFoundByIndex as e:
+        _output_error("step_not_found", e.message)
+    except wrapper.LinkNotFoundByIndex as e:
+        _output_error("link_not_found", e.message)
+    except wrapper.AttachmentTooLarge as e:
+        _output_error("attachment_too_large", e.message)
+    except wrapper.AttachmentNotFoundByIndex as e:
+        _output_error("attachment_not_found", e.message)
+    except todo_daemon.DaemonAlreadyRunning as e:
+        _output_error("daemon_running", e.message)
+    except todo_daemon.DaemonNotRunning as e:
+        _output_error("daemon_not_running", e.message)
+    except FileNotFoundError as e:
+        _output_error("file_not_found", str(e))
+    except TimeExpressionNotRecognized as e:
+        _output_error("invalid_time", e.message)
+    except ErrorParsingTime as e:
+        _output_error("invalid_time", e.message)
+    except InvalidRecurrenceExpression as e:
+        _output_error("invalid_recurrence", e.message)
+    except task_query.InvalidCondition as e:
+        _output_error("invalid_condition", e.message)
+    except task_query.InvalidAssignment as e:
+        _output_error("invalid_assignment", e.message)
+    except field_projection.InvalidFields as e:
+        _output_error("invalid_fields", e.message)
+    except task_replica.ReplicaNotFound as e:
+        _output_error("replica_not_found", e.message)
+    except ValueError as e:
+        _output_error("value_error", f"Error: {e}")
+    except requests.RequestException as e:
+        _output_error("network_error", f"Network error: {e}")
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    return namespace, False
+
+
+def _capture_command(parser, argv):
+    """Run argv like _run_command, capturing its output.
+
+    stdin is empty, so confirmation prompts are declined. Returns
+    (exit_code, stdout, stderr).
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    saved = sys.argv, sys.stdin, sys.stdout, sys.stderr
+    sys.argv = ["todo"] + list(argv)
+    sys.stdin = io.StringIO("")
+    sys.stdout, sys.stderr = stdout, stderr
+    try:
+        _, ok = _run_command(parser, list(argv))
+        exit_code = 0 if ok else 1
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 1
+    except Exception as e:
+        print(f"Error: {e}", file=stderr)
+        exit_code = 1
+    finally:
+        sys.argv, sys.stdin, sys.stdout, sys.stderr = saved
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+# Interactive mode history, shared across sessions
+HISTORY_FILE = os.path.join(config_dir, "history")
+
+# Lines that leave interactive mode
+EXIT_COMMANDS = ("exit", "quit")
+
+
+def _command_names(parser):
+    for action in parser._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            return list(action.choices)
+    return []
+
+
+def _interactive(parser, cache=None):
+    """Read-eval loop keeping the session and name resolutions warm.
+
+    One pooled OAuth session and one resolution cache serve every command, so
+    list/task names and the last listed indexes resolve without extra
+    requests. Each command's latency is reported on stderr.
+    """
+    cache = cache or wrapper.ResolutionCache()
+    commands = _command_names(parser)
+
+    def completion_words():
+        return commands + list(cache.list_ids) + cache.task_titles()
+
+    save_history = repl_util.setup_readline(HISTORY_FILE, completion_words)
+    prog = sys.argv[0]
+    try:
+        with use_session(create_pooled_session()), wrapper.use_resolution_cache(
+            cache
+        ):
+            while True:
+                try:
+                    line = input("\nInput command: ")
+                except EOFError:
+                    print()
+                    break
+
+                try:
+                    args = shlex.split(line)
+                except ValueError as e:
+                    _output_error("argument_error", f"Argument error: {e}")
+                    continue
+                if not args:
+                    continue
+                if args[0] in EXIT_COMMANDS:
+                    break
+
+                sys.argv = [prog] + args
+                started = time.perf_counter()
+                try:
+                    _run_command(parser, args)
+                except SystemExit:
+                    # argparse exits on --help and invalid arguments
+                    pass
+                todo_daemon.notify_changed(args)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                print(f"({elapsed_ms:.0f} ms)", file=sys.stderr)
+    finally:
+        save_history()
+
+
 def main():
     try:
         parser = setup_parser()
-        first_run = True
-        interactive = False
-        error_occurred = False
-
-        while True:
-            try:
-                namespace, args = parser.parse_known_args()
-                parser.parse_args(args, namespace)
-
-                if namespace.func is not None:
-                    namespace.func(namespace)
-                else:
-                    # No argument was provided
-                    parser.print_usage()
-
-                if namespace.interactive and first_run:
-                    interactive = True
-                    first_run = False
-
-            except argparse.ArgumentError as e:
-                _output_error("argument_error", f"Argument error: {e}")
-                error_occurred = True
-            except wrapper.TaskNotFoundByName as e:
-                _output_error("task_not_found", e.message)
-                error_occurred = True
-            except wrapper.ListNotFound as e:
-                _output_error("list_not_found", e.message)
-                error_occurred = True
-            except wrapper.TaskNotFoundByIndex as e:
-                _output_error("task_not_found", e.message)
-                error_occurred = True
-            except wrapper.StepNotFoundByName as e:
-                _output_error("step_not_found", e.message)
-                error_occurred = True
-            except wrapper.StepNotFoundByIndex as e:
-                _output_error("step_not_found", e.message)
-                error_occurred = True
-            except wrapper.LinkNotFoundByIndex as e:
-                _output_error("link_not_found", e.message)
-                error_occurred = True
-            except wrapper.AttachmentTooLarge as e:
-                _output_error("attachment_too_large", e.message)
-                error_occurred = True
-            except wrapper.AttachmentNotFoundByIndex as e:
-                _output_error("attachment_not_found", e.message)
-                error_occurred = True
-            except FileNotFoundError as e:
-                _output_error("file_not_found", str(e))
-                error_occurred = True
-            except TimeExpressionNotRecognized as e:
-                _output_error("invalid_time", e.message)
-                error_occurred = True
-            except ErrorParsingTime as e:
-                _output_error("invalid_time", e.message)
-                error_occurred = True
-            except InvalidRecurrenceExpression as e:
-                _output_error("invalid_recurrence", e.message)
-                error_occurred = True
-            except ValueError as e:
-                _output_error("value_error", f"Error: {e}")
-                error_occurred = True
-            except requests.RequestException as e:
-                _output_error("network_error", f"Network error: {e}")
-                error_occurred = True
-            finally:
-                sys.stdout.flush()
-                sys.stderr.flush()
-
-            if not interactive:
-                break
-
-            arg = input("\nInput command: ")
-            args = shlex.split(arg)
-            sys.argv = sys.argv[:1]
-            sys.argv += args
-
-        # Exit with non-zero code if an error occurred in non-interactive mode
-        if error_occurred and not interactive:
+        namespace, ok = _run_command(parser, sys.argv[1:])
+
+        if namespace is not None and namespace.interactive:
+            _interactive(parser)
+        elif not ok:
+            # Exit with non-zero code if an error occurred in non-interactive mode
             sys.exit(1)
 
     except KeyboardInterrupt:
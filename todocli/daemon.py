@@ -0,0 +1,389 @@
+"""
+Background daemon serving `todo` commands over a Unix socket, and the thin
+client used by the `todo` entry point.
+
+The daemon keeps one pooled OAuth session, the name resolution cache and the
+output of recent read-only commands warm. Clients send one JSON-RPC 2.0
+request per line:
+
+    {"jsonrpc": "2.0", "id": 1, "method": "run",
+     "params": {"argv": ["tasks", "Work"], "cwd": "/home/me"}}
+
+and receive {"jsonrpc": "2.0", "id": 1, "result": {"exit_code": 0,
+"stdout": "...", "stderr": "..."}}. Other methods are "ping", "stop" and
+"invalidate", which drops the cached output after a command that ran
+outside the daemon (see notify_changed).
+
+Only the standard library is imported at module level so that forwarding a
+command does not pay for loading the CLI and its dependencies.
+"""
+
+import json
+import os
+import socket
+import sys
+import time
+
+# Socket location, overridable with the TODO_DAEMON_SOCKET environment variable
+DEFAULT_SOCKET_PATH = os.path.join(
+    os.path.expanduser("~"), ".config", "microsoft-todo-cli", "daemon.sock"
+)
+
+# Seconds cached read-only output and name resolutions are reused
+DEFAULT_CACHE_TTL = 30.0
+
+# Seconds the client waits for the daemon to answer
+CLIENT_TIMEOUT = 300.0
+
+# Commands whose output only depends on remote state and can be cached
+READ_COMMANDS = frozenset(
+    [
+        "lists",
+        "ls",
+        "tasks",
+        "lst",
+        "t",
+        "show",
+        "list-steps",
+        "show-note",
+        "sn",
+        "links",
+        "attachments",
+    ]
+)
+
+# Commands that never change remote state, wherever they run
+NON_MUTATING_COMMANDS = READ_COMMANDS | frozenset(
+    ["find", "agenda", "export", "backup", "download", "remind", "daemon"]
+)
+
+# Seconds the daemon waits on a client to send its request or read the reply
+REQUEST_TIMEOUT = 10.0
+
+# Seconds the client waits for the daemon to drop its cache
+INVALIDATE_TIMEOUT = 1.0
+
+# Commands that ask for confirmation unless -y/--yes is given
+PROMPTING_COMMANDS = frozenset(["rm", "d", "rm-list"])
+
+# Commands that stream output or read and write local files; in the daemon
+# their output would be buffered in full and stdout has no binary buffer
+STREAMING_COMMANDS = frozenset(
+    ["export", "backup", "restore", "import", "download", "run"]
+)
+
+
+class DaemonAlreadyRunning(Exception):
+    def __init__(self, path):
+        self.message = "A daemon is already running on '{}'".format(path)
+        super(DaemonAlreadyRunning, self).__init__(self.message)
+
+
+class DaemonNotRunning(Exception):
+    def __init__(self, path):
+        self.message = "No daemon is running on '{}'".format(path)
+        super(DaemonNotRunning, self).__init__(self.message)
+
+
+def socket_path():
+    return os.environ.get("TODO_DAEMON_SOCKET") or DEFAULT_SOCKET_PATH
+
+
+def _command(argv):
+    for arg in argv:
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
+def should_forward(argv):
+    """Return True if argv can run in the daemon instead of this process.
+
+    Interactive mode, the daemons themselves (including the reminder
+    scheduler, remind --daemon), reading from stdin ("-"), commands waiting
+    for a confirmation, and streaming or file-writing commands (see
+    STREAMING_COMMANDS, and any --format output) stay in the calling
+    process.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return False
+    command = _command(argv)
+    if command is None or command == "daemon":
+        return False
+    if command == "remind" and "--daemon" in argv:
+        return False
+    if "-i" in argv or "--interactive" in argv or "-" in argv:
+        return False
+    if command in PROMPTING_COMMANDS and not ("-y" in argv or "--yes" in argv):
+        return False
+    if command in STREAMING_COMMANDS:
+        return False
+    if any(arg == "--format" or arg.startswith("--format=") for arg in argv):
+        return False
+    return True
+
+
+def _read_line(sock):
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        if chunk.endswith(b"\n"):
+            break
+    return b"".join(chunks)
+
+
+def call(method, params=None, path=None, timeout=CLIENT_TIMEOUT):
+    """Send one JSON-RPC request to the daemon and return its result.
+
+    Raises OSError when no daemon listens on the socket and RuntimeError when
+    the daemon answers with an error.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(path or socket_path())
+        request = {"jsonrpc": "2.0", "id": 1, "method": method}
+        request["params"] = params or {}
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        response = json.loads(_read_line(sock).decode())
+    finally:
+        sock.close()
+
+    if "error" in response:
+        raise RuntimeError(response["error"].get("message", "Daemon error"))
+    return response["result"]
+
+
+def forward(argv, path=None):
+    """Run argv in the daemon, writing its output here.
+
+    Returns the exit code, or None when no daemon is running.
+    """
+    path = path or socket_path()
+    if not os.path.exists(path):
+        return None
+    try:
+        result = call("run", {"argv": argv, "cwd": os.getcwd()}, path=path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        # Stale socket left by a daemon that is gone
+        return None
+    sys.stdout.write(result["stdout"])
+    sys.stderr.write(result["stderr"])
+    return result["exit_code"]
+
+
+def invalidate(path=None):
+    """Tell a running daemon to drop its cached output and name resolutions.
+
+    Does nothing when no daemon is running.
+    """
+    path = path or socket_path()
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(path):
+        return
+    try:
+        call("invalidate", path=path, timeout=INVALIDATE_TIMEOUT)
+    except (OSError, RuntimeError, ValueError):
+        pass
+
+
+def notify_changed(argv, path=None):
+    """Invalidate the daemon's cache after argv ran in this process, unless
+    argv is known not to change remote state."""
+    if _command(argv) not in NON_MUTATING_COMMANDS:
+        invalidate(path)
+
+
+def main():
+    """Console entry point: forward to a running daemon, else run directly."""
+    argv = sys.argv[1:]
+    if should_forward(argv):
+        try:
+            exit_code = forward(argv)
+        except (OSError, RuntimeError, ValueError) as e:
+            print(f"Daemon error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if exit_code is not None:
+            sys.stdout.flush()
+            sys.exit(exit_code)
+
+    from todocli.cli import main as cli_main
+
+    try:
+        cli_main()
+    finally:
+        notify_changed(argv)
+
+
+class DaemonState:
+    """Warm state shared by the commands the daemon runs."""
+
+    def __init__(self, parser, cache_ttl=DEFAULT_CACHE_TTL, clock=time.monotonic):
+        import todocli.graphapi.wrapper as wrapper
+
+        self.parser = parser
+        self.cache_ttl = cache_ttl
+        self.clock = clock
+        self.resolution_cache = wrapper.ResolutionCache()
+        self.resolved_at = clock()
+        self.outputs = {}
+        self.running = True
+
+    def _expire(self):
+        import todocli.graphapi.wrapper as wrapper
+
+        now = self.clock()
+        if now - self.resolved_at > self.cache_ttl:
+            self.resolution_cache = wrapper.ResolutionCache()
+            self.resolved_at = now
+        self.outputs = {
+            key: value
+            for key, value in self.outputs.items()
+            if now - value[0] <= self.cache_ttl
+        }
+
+    def run(self, argv, cwd=None):
+        """Run one command, capturing its output. Returns the result dict."""
+        import todocli.graphapi.wrapper as wrapper
+        from todocli import cli
+
+        self._expire()
+        key = tuple(argv)
+        cacheable = _command(argv) in READ_COMMANDS
+        if cacheable and key in self.outputs:
+            return self.outputs[key][1]
+
+        saved_cwd = os.getcwd()
+        try:
+            if cwd:
+                os.chdir(cwd)
+            with wrapper.use_resolution_cache(self.resolution_cache):
+                exit_code, stdout, stderr = cli._capture_command(self.parser, argv)
+        finally:
+            os.chdir(saved_cwd)
+
+        result = {
+            "exit_code": exit_code,
+            "stdout": stdout,
+            "stderr": stderr,
+        }
+        if cacheable:
+            if exit_code == 0:
+                self.outputs[key] = (self.clock(), result)
+        else:
+            # Anything else may change remote state
+            self.outputs.clear()
+        return result
+
+    def invalidate(self):
+        """Forget cached output and name resolutions."""
+        import todocli.graphapi.wrapper as wrapper
+
+        self.outputs.clear()
+        self.resolution_cache = wrapper.ResolutionCache()
+        self.resolved_at = self.clock()
+
+    def handle(self, request):
+        """Answer one JSON-RPC request dict."""
+        if not isinstance(request, dict):
+            return _error(None, -32600, "Invalid request")
+        request_id = request.get("id")
+        method = request.get("method")
+        params = request.get("params") or {}
+
+        if method == "run":
+            argv = params.get("argv")
+            if not isinstance(argv, list):
+                return _error(request_id, -32602, "params.argv must be a list")
+            cwd = params.get("cwd")
+            if cwd is not None and not (isinstance(cwd, str) and os.path.isdir(cwd)):
+                return _error(
+                    request_id, -32602, "params.cwd must be an existing directory"
+                )
+            result = self.run(argv, cwd)
+        elif method == "ping":
+            result = "pong"
+        elif method == "invalidate":
+            self.invalidate()
+            result = "invalidated"
+        elif method == "stop":
+            self.running = False
+            result = "stopping"
+        else:
+            return _error(request_id, -32601, f"Unknown method: {method}")
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def _error(request_id, code, message):
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": code, "message": message},
+    }
+
+
+def _remove_stale_socket(path):
+    """Remove path if it is a socket nobody listens on. Raises if in use."""
+    if not os.path.exists(path):
+        return
+    try:
+        call("ping", path=path, timeout=1)
+    except OSError:
+        os.unlink(path)
+        return
+    raise DaemonAlreadyRunning(path)
+
+
+def _answer(conn, state):
+    """Read one request from conn and send the response."""
+    try:
+        request = json.loads(_read_line(conn).decode())
+    except ValueError:
+        response = _error(None, -32700, "Parse error")
+    else:
+        try:
+            response = state.handle(request)
+        except Exception as e:
+            request_id = request.get("id") if isinstance(request, dict) else None
+            response = _error(request_id, -32603, f"Internal error: {e}")
+    conn.sendall(json.dumps(response).encode() + b"\n")
+
+
+def serve(path=None, cache_ttl=None):
+    """Serve requests on the Unix socket at path until a "stop" request."""
+    from todocli import cli
+    from todocli.graphapi.oauth import create_pooled_session, use_session
+
+    path = path or socket_path()
+    _remove_stale_socket(path)
+    if cache_ttl is None:
+        cache_ttl = DEFAULT_CACHE_TTL
+    state = DaemonState(cli.setup_parser(), cache_ttl=cache_ttl)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        # Only the owner may connect: commands run with the owner's token
+        server.bind(path)
+    finally:
+        os.umask(old_umask)
+    server.listen()
+
+    try:
+        with use_session(create_pooled_session()):
+            while state.running:
+                conn, _ = server.accept()
+                # An idle client must not hold up every other client
+                conn.settimeout(REQUEST_TIMEOUT)
+                with conn:
+                    try:
+                        _answer(conn, state)
+                    except OSError as e:
+                        # The client went away or stalled; keep serving
+                        print(f"Client connection failed: {e}", file=sys.stderr)
+    finally:
+        server.close()
+        if os.path.exists(path):
+            os.unlink(path)
@@ -0,0 +1,229 @@
+"""
+Asyncio client exposing the same operations as todocli.graphapi.wrapper.
+
+The client drives the wrapper's operations (see transport.py) natively on
+the event loop: their HTTP requests are sent with one httpx.AsyncClient
+connection pool, and at most max_concurrency of them are in flight at a
+time. Request building, response parsing, models and exceptions are shared
+with the blocking wrapper; each response is handed to the operation as a
+requests.Response, so errors are the same requests.HTTPError.
+
+httpx is an optional dependency: pip install "microsoft-todo-cli[async]".
+
+    async with AsyncTodoClient(max_concurrency=8) as client:
+        lists = await client.get_lists()
+        tasks = await asyncio.gather(
+            *(client.get_tasks(list_id=lst.id) for lst in lists)
+        )
+"""
+
+import asyncio
+import contextvars
+import io
+import tempfile
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+import todocli.graphapi.wrapper as wrapper
+from todocli.graphapi import oauth, transport
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Streamed downloads are kept in memory up to this size, then spooled to disk
+STREAM_SPOOL_SIZE = 1024 * 1024
+
+
+def _mirror(name):
+    """Create an async method that runs wrapper.<name> on the client."""
+
+    async def method(self, *args, **kwargs):
+        # Looked up per call so the method always matches the wrapper module
+        return await self._call(transport.Call(getattr(wrapper, name), *args, **kwargs))
+
+    func = getattr(wrapper, name)
+    method.__name__ = name
+    method.__qualname__ = f"AsyncTodoClient.{name}"
+    method.__doc__ = func.__doc__
+    return method
+
+
+async def _aiter(iterable):
+    for block in iterable:
+        yield block
+
+
+class AsyncTodoClient:
+    def __init__(
+        self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, http_client=None
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if http_client is None and httpx is None:
+            raise ImportError(
+                "AsyncTodoClient needs httpx: "
+                'pip install "microsoft-todo-cli[async]"'
+            )
+        self.max_concurrency = max_concurrency
+        # Only a client created here is closed by close()
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=max_concurrency)
+            )
+        self._http = http_client
+        self._requests = asyncio.Semaphore(max_concurrency)
+        self._token = None
+        self._token_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close the connection pool, unless it was passed in."""
+        if self._owns_http_client:
+            await self._http.aclose()
+
+    async def _access_token(self):
+        async with self._token_lock:
+            # Refresh 5 minutes early, like oauth.refresh_token
+            if self._token is None or self._token["expires_at"] - 300 <= time.time():
+                # Token loading does file and network I/O, keep it off the loop
+                loop = asyncio.get_running_loop()
+                self._token = await loop.run_in_executor(None, oauth.get_token)
+            return self._token["access_token"]
+
+    async def _call(self, call):
+        if transport.is_operation(call.func):
+            return await self._drive(call.func.op(*call.args, **call.kwargs))
+        # Plain functions (the wrapper's iterators, test doubles) block
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(None, ctx.run, call)
+
+    async def _drive(self, gen):
+        """Async counterpart of transport.run()."""
+        send, value = gen.send, None
+        while True:
+            try:
+                step = send(value)
+            except StopIteration as stop:
+                return stop.value
+            try:
+                if isinstance(step, transport.Call):
+                    value = await self._call(step)
+                else:
+                    value = await self._send(step)
+                send = gen.send
+            except Exception as e:
+                send, value = gen.throw, e
+
+    async def _send(self, request):
+        """Send a transport.Request and return it as a requests.Response."""
+        kwargs = dict(request.kwargs)
+        stream = kwargs.pop("stream", False)
+        headers = dict(kwargs.pop("headers", None) or {})
+        data = kwargs.pop("data", None)
+        if data is not None and not isinstance(data, bytes):
+            # Iterable body of known length (wrapper._Base64JsonBody)
+            headers["Content-Length"] = str(len(data))
+            data = _aiter(data)
+        if request.url.startswith(wrapper.BASE_API):
+            # Other URLs (upload sessions) are pre-authenticated
+            headers["Authorization"] = f"Bearer {await self._access_token()}"
+
+        http_request = self._http.build_request(
+            request.method.upper(),
+            request.url,
+            content=data,
+            headers=headers,
+            **kwargs,
+        )
+        async with self._requests:
+            response = await self._http.send(http_request, stream=True)
+            if stream:
+                body = tempfile.SpooledTemporaryFile(max_size=STREAM_SPOOL_SIZE)
+            else:
+                body = io.BytesIO()
+            try:
+                async for block in response.aiter_bytes():
+                    body.write(block)
+            except BaseException:
+                body.close()
+                raise
+            finally:
+                await response.aclose()
+        body.seek(0)
+
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.headers = CaseInsensitiveDict(response.headers)
+        result.reason = response.reason_phrase
+        result.url = str(response.url)
+        result.raw = body
+        return result
+
+    async def batch(self, sub_requests: list[dict]):
+        """Send up to wrapper.BATCH_MAX_REQUESTS sub-requests as one $batch.
+
+        Returns dict mapping sub-request id -> sub-response.
+        """
+        if len(sub_requests) > wrapper.BATCH_MAX_REQUESTS:
+            raise ValueError(
+                f"A batch holds at most {wrapper.BATCH_MAX_REQUESTS} requests"
+            )
+        return await self._call(transport.Call(wrapper._send_batch, None, sub_requests))
+
+    # --- Lists ---
+    get_lists = _mirror("get_lists")
+    get_list_id_by_name = _mirror("get_list_id_by_name")
+    create_list = _mirror("create_list")
+    rename_list = _mirror("rename_list")
+    delete_list = _mirror("delete_list")
+
+    # --- Tasks ---
+    get_tasks = _mirror("get_tasks")
+    get_task = _mirror("get_task")
+    get_task_id_by_name = _mirror("get_task_id_by_name")
+    get_task_ids_by_names = _mirror("get_task_ids_by_names")
+    get_task_details_batch = _mirror("get_task_details_batch")
+    create_task = _mirror("create_task")
+    update_task = _mirror("update_task")
+    complete_task = _mirror("complete_task")
+    complete_tasks = _mirror("complete_tasks")
+    uncomplete_task = _mirror("uncomplete_task")
+    remove_task = _mirror("remove_task")
+
+    # --- Steps ---
+    get_checklist_items = _mirror("get_checklist_items")
+    get_checklist_items_batch = _mirror("get_checklist_items_batch")
+    create_checklist_item = _mirror("create_checklist_item")
+    complete_checklist_item = _mirror("complete_checklist_item")
+    uncomplete_checklist_item = _mirror("uncomplete_checklist_item")
+    delete_checklist_item = _mirror("delete_checklist_item")
+
+    # --- Notes ---
+    update_task_note = _mirror("update_task_note")
+    clear_task_note = _mirror("clear_task_note")
+
+    # --- Linked Resources ---
+    get_linked_resources = _mirror("get_linked_resources")
+    create_linked_resource = _mirror("create_linked_resource")
+    delete_linked_resource = _mirror("delete_linked_resource")
+
+    # --- Attachments ---
+    get_attachments = _mirror("get_attachments")
+    get_attachments_batch = _mirror("get_attachments_batch")
+    get_attachment = _mirror("get_attachment")
+    download_attachment = _mirror("download_attachment")
+    create_attachment = _mirror("create_attachment")
+    delete_attachment = _mirror("delete_attachment")
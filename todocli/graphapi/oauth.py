@@ -1,10 +1,13 @@
 # Oauth settings
+import contextlib
+import contextvars
 import json
 import os
 import sys
 import time
 
 import yaml
+from requests.adapters import HTTPAdapter
 from requests_oauthlib import OAuth2Session
 
 settings = {
@@ -139,6 +142,42 @@ def refresh_token(token):
     return token
 
 
+# Session shared by long-lived callers (async client, REPL, daemon)
+_active_session = contextvars.ContextVar("active_session", default=None)
+
+
+def create_pooled_session(pool_size=10):
+    """Create a long-lived OAuth session with a connection pool of pool_size.
+
+    The token is refreshed automatically when it expires and stored back to
+    the token file, so the session can outlive a single access token.
+    """
+    session = OAuth2Session(
+        client_id,
+        scope=scope,
+        token=get_token(),
+        auto_refresh_url=token_url,
+        auto_refresh_kwargs={"client_id": client_id, "client_secret": client_secret},
+        token_updater=store_token,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    return session
+
+
+@contextlib.contextmanager
+def use_session(session):
+    """Make get_oauth_session() return session within this context."""
+    reset_token = _active_session.set(session)
+    try:
+        yield session
+    finally:
+        _active_session.reset(reset_token)
+
+
 def get_oauth_session():
+    session = _active_session.get()
+    if session is not None:
+        return session
     token = get_token()
     return OAuth2Session(client_id, scope=scope, token=token)
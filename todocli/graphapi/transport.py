@@ -0,0 +1,110 @@
+"""
+Transport-neutral Graph API operations.
+
+Every wrapper operation is written once, as a generator function: it yields
+a Request for each HTTP round trip and receives the response (a
+requests.Response), or yields a Call to another wrapper function and
+receives its result, and finally returns its own result. Request building,
+response parsing, models and exceptions therefore do not depend on how the
+requests are sent.
+
+operation() turns such a generator function into the blocking function of
+the wrapper module, which sends the requests with a requests session (see
+run). The asyncio client (async_client.py) drives the same generators over
+an httpx connection pool.
+"""
+
+import functools
+import inspect
+
+
+class Request:
+    """One HTTP request: the requests.Session method name, url and keyword
+    arguments (json, data, headers, stream)."""
+
+    __slots__ = ("method", "url", "kwargs")
+
+    def __init__(self, method: str, url: str, **kwargs):
+        self.method = method
+        self.url = url
+        self.kwargs = kwargs
+
+    def __repr__(self):
+        return f"Request({self.method!r}, {self.url!r})"
+
+
+class Call:
+    """A call of another wrapper function with args.
+
+    Yielded instead of calling the function directly so that each driver can
+    run it its own way: run() calls it, the asyncio client drives its
+    operation (func.op) on the event loop.
+    """
+
+    __slots__ = ("func", "args", "kwargs")
+
+    def __init__(self, func, *args, **kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+
+    def __call__(self):
+        return self.func(*self.args, **self.kwargs)
+
+
+def run(gen, get_session):
+    """Drive the operation generator gen, sending its requests with the
+    requests session returned by get_session() (called on the first request
+    only). Returns the operation's result.
+
+    Errors raised by a request or a call are thrown into the generator, so
+    its cleanup code runs and the error surfaces where the request was made.
+    """
+    session = None
+    send, value = gen.send, None
+    while True:
+        try:
+            step = send(value)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            if isinstance(step, Call):
+                value = step()
+            else:
+                if session is None:
+                    session = get_session()
+                value = getattr(session, step.method)(step.url, **step.kwargs)
+            send = gen.send
+        except Exception as e:
+            send, value = gen.throw, e
+
+
+def operation(get_session):
+    """Decorator making a generator function a blocking wrapper function.
+
+    The blocking function drives the generator with run(), using the
+    session argument when the function has one and it is not None, else
+    get_session(). The generator function stays available as .op.
+    """
+
+    def decorate(func):
+        signature = inspect.signature(func)
+        takes_session = "session" in signature.parameters
+
+        @functools.wraps(func)
+        def blocking(*args, **kwargs):
+            session = None
+            if takes_session:
+                bound = signature.bind(*args, **kwargs)
+                session = bound.arguments.get("session")
+            return run(func(*args, **kwargs), lambda: session or get_session())
+
+        blocking.op = func
+        return blocking
+
+    return decorate
+
+
+def is_operation(func):
+    """True if func was made by operation() and can be driven natively."""
+    return inspect.isgeneratorfunction(getattr(func, "op", None))
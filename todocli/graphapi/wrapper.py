@@ -4,16 +4,28 @@ https://docs.microsoft.com/en-us/graph/api/resources/todo-overview?view=graph-re
 """
 
 import base64
+import contextlib
+import contextvars
+import hashlib
+import io
 import json
 import os
-from datetime import datetime
-from typing import Union
+import secrets
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+from requests import HTTPError
 
 from todocli.models.todolist import TodoList
 from todocli.models.todotask import Task, TaskImportance, TaskStatus
 from todocli.models.checklistitem import ChecklistItem
-from todocli.graphapi.oauth import get_oauth_session
+from todocli.graphapi import transport
+from todocli.graphapi.oauth import config_dir, get_oauth_session
+from todocli.graphapi.transport import Call, Request
 
+from todocli.utils import json_codec
 from todocli.utils.datetime_util import datetime_to_api_timestamp
 
 BASE_API = "https://graph.microsoft.com/v1.0"
@@ -21,6 +33,10 @@ BASE_RELATE_URL = "/me/todo/lists"
 BASE_URL = f"{BASE_API}{BASE_RELATE_URL}"
 BATCH_URL = f"{BASE_API}/$batch"
 
+# Operations are generator functions (see transport.py). The session is
+# looked up at call time so tests can patch get_oauth_session.
+operation = transport.operation(lambda: get_oauth_session())
+
 
 def _require_list(list_name, list_id):
     """Validate that list_name or list_id is provided."""
@@ -79,60 +95,78 @@ class StepNotFoundByIndex(Exception):
 
 
 def parse_response(response):
-    return json.loads(response.content.decode())["value"]
+    return json_codec.loads(response.content)["value"]
 
 
-def get_lists():
-    session = get_oauth_session()
-    response = session.get(BASE_URL)
+def _with_select(endpoint: str, select: str = None):
+    """Add $select (comma-separated properties) to endpoint, unless None."""
+    if not select:
+        return endpoint
+    return endpoint + ("&" if "?" in endpoint else "?") + f"$select={select}"
+
+
+@operation
+def get_lists(select: str = None):
+    """Fetch all lists; select limits the properties Graph returns."""
+    response = yield Request("get", _with_select(BASE_URL, select))
     response_value = parse_response(response)
-    return [TodoList(x) for x in response_value]
+    lists = [TodoList(x) for x in response_value]
+    cache = _resolution_cache.get()
+    if cache is not None and select is None:
+        cache.list_ids = {}
+        for todo_list in lists:
+            cache.list_ids.setdefault(todo_list.display_name, todo_list.id)
+    return lists
 
 
+@operation
 def create_list(title: str):
     """Create a new list. Returns (list_id, list_name)."""
     request_body = {"displayName": title}
-    session = get_oauth_session()
-    response = session.post(BASE_URL, json=request_body)
+    response = yield Request("post", BASE_URL, json=request_body)
     if response.ok:
-        data = json.loads(response.content.decode())
+        data = json_codec.loads(response.content)
         return data.get("id", ""), data.get("displayName", "")
     response.raise_for_status()
 
 
+@operation
 def rename_list(old_title: str, new_title: str):
     """Rename a list. Returns (list_id, new_title)."""
-    list_id = get_list_id_by_name(old_title)
+    list_id = yield Call(get_list_id_by_name, old_title)
     request_body = {"displayName": new_title}
-    session = get_oauth_session()
-    response = session.patch(f"{BASE_URL}/{list_id}", json=request_body)
+    response = yield Request("patch", f"{BASE_URL}/{list_id}", json=request_body)
     if response.ok:
-        data = json.loads(response.content.decode())
+        _forget_list(list_id)
+        data = json_codec.loads(response.content)
         return data.get("id", ""), data.get("displayName", "")
     response.raise_for_status()
 
 
+@operation
 def delete_list(list_name: str = None, list_id: str = None):
     """Delete a list. Returns list_id."""
     _require_list(list_name, list_id)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
 
     endpoint = f"{BASE_URL}/{list_id}"
-    session = get_oauth_session()
-    response = session.delete(endpoint)
+    response = yield Request("delete", endpoint)
     if response.ok:
+        _forget_list(list_id)
         return list_id
     response.raise_for_status()
 
 
+@operation
 def get_tasks(
     list_name: str = None,
     list_id: str = None,
     num_tasks: int = 100,
     include_completed: bool = False,
     only_completed: bool = False,
+    select: str = None,
 ):
     """Fetch tasks from a list.
 
@@ -142,12 +176,13 @@ def get_tasks(
         num_tasks: Maximum number of tasks to return
         include_completed: If True, include completed tasks
         only_completed: If True, return only completed tasks
+        select: Comma-separated properties to fetch (OData $select)
     """
     _require_list(list_name, list_id)
 
     # For compatibility with cli
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
 
     if only_completed:
         endpoint = (
@@ -160,33 +195,167 @@ def get_tasks(
             f"{BASE_URL}/{list_id}/tasks?$filter=status ne 'completed'&$top={num_tasks}"
         )
 
-    session = get_oauth_session()
-    response = session.get(endpoint)
+    response = yield Request("get", _with_select(endpoint, select))
     response_value = parse_response(response)
-    return [Task(x) for x in response_value]
+    tasks = [Task(x) for x in response_value]
+
+    cache = _resolution_cache.get()
+    if cache is not None and select is None:
+        listed = {task.id for task in tasks}
+        for key, task_id in list(cache.task_ids.items()):
+            if task_id in listed:
+                del cache.task_ids[key]
+        for task in tasks:
+            cache.task_ids.setdefault((list_id, task.title), task.id)
+        if not include_completed and not only_completed and num_tasks == 100:
+            # Same view that index lookups use
+            cache.index_snapshots[list_id] = [task.id for task in tasks]
+    return tasks
+
+
+def _iter_pages(session, endpoint: str):
+    """Yield items from a collection endpoint, following @odata.nextLink."""
+    while endpoint:
+        response = session.get(endpoint)
+        if not response.ok:
+            response.raise_for_status()
+        data = json_codec.loads(response.content)
+        yield from data.get("value", [])
+        endpoint = data.get("@odata.nextLink")
 
 
-def create_task(
-    task_name: str,
-    list_name: str | None = None,
-    list_id: str | None = None,
-    reminder_datetime: datetime | None = None,
-    due_datetime: datetime | None = None,
-    important: bool = False,
-    recurrence: dict | None = None,
-    note: str | None = None,
+def iter_list_records(select: str = None):
+    """Yield every list as the raw API dict, page by page."""
+    yield from _iter_pages(get_oauth_session(), _with_select(BASE_URL, select))
+
+
+def iter_task_records(
+    list_id: str,
+    include_completed: bool = True,
+    odata_filter: str = None,
+    select: str = None,
 ):
-    _require_list(list_name, list_id)
+    """Yield every task in a list as the raw API dict, page by page.
+
+    odata_filter is an OData $filter expression applied by the server, and
+    select the comma-separated properties it returns.
+    """
+    filters = [] if include_completed else ["status ne 'completed'"]
+    if odata_filter:
+        filters.append(f"({odata_filter})" if filters else odata_filter)
+    endpoint = f"{BASE_URL}/{list_id}/tasks"
+    if filters:
+        endpoint += "?$filter=" + " and ".join(filters)
+    yield from _iter_pages(get_oauth_session(), _with_select(endpoint, select))
+
+
+def iter_tasks(list_id: str, include_completed: bool = True):
+    """Yield every task in a list as Task objects, page by page."""
+    for item in iter_task_records(list_id, include_completed):
+        yield Task(item)
+
+
+def iter_task_delta(list_id: str, delta_link: str = None, state: dict = None):
+    """Yield tasks changed since delta_link (every task if None) as raw dicts.
+
+    Deleted tasks come as {"id": ..., "@removed": {...}}. Once the generator
+    is exhausted, state["delta_link"] holds the link for the next call. An
+    expired delta link raises HTTPError (status 410).
+    """
+    endpoint = delta_link or f"{BASE_URL}/{list_id}/tasks/delta"
+    session = get_oauth_session()
+    while endpoint:
+        response = session.get(endpoint)
+        if not response.ok:
+            response.raise_for_status()
+        data = json_codec.loads(response.content)
+        yield from data.get("value", [])
+        endpoint = data.get("@odata.nextLink")
+        if state is not None and "@odata.deltaLink" in data:
+            state["delta_link"] = data["@odata.deltaLink"]
+
+
+def get_task_deltas_batch(delta_links: dict, include_lists: bool = False):
+    """Fetch the task changes of several lists using $batch API.
+
+    delta_links maps list_id -> the delta link of its last sync, or None for
+    every task. Up to BATCH_MAX_REQUESTS lists share one round trip; with
+    include_lists the first one also fetches every list, so a sync of up to
+    19 lists costs a single request. Pages beyond the first are followed
+    with iter_task_delta.
+
+    Returns (lists, deltas). lists holds the raw list dicts (None without
+    include_lists). deltas maps list_id -> {"status", "changes", "delta_link"};
+    a failed sub-request (e.g. 410 for an expired link, 404 for a deleted
+    list) has its status and no changes.
+    """
+    session = get_oauth_session()
+    pending = list(delta_links)
+    lists = None
+    deltas = {}
+    sub_requests = []
+    if include_lists:
+        sub_requests.append({"id": "lists", "method": "GET", "url": BASE_RELATE_URL})
+
+    while True:
+        chunk = pending[: BATCH_MAX_REQUESTS - len(sub_requests)]
+        del pending[: len(chunk)]
+        for j, list_id in enumerate(chunk):
+            link = delta_links[list_id]
+            if link and link.startswith(BASE_API):
+                url = link[len(BASE_API) :]
+            else:
+                url = link or f"{BASE_RELATE_URL}/{list_id}/tasks/delta"
+            sub_requests.append({"id": str(j), "method": "GET", "url": url})
+        if not sub_requests:
+            break
+        responses = _send_batch(session, sub_requests)
+
+        if "lists" in responses:
+            resp = responses["lists"]
+            if resp.get("status") != 200:
+                raise HTTPError(f"Could not fetch lists: {_batch_error_message(resp)}")
+            body = resp.get("body") or {}
+            lists = body.get("value", [])
+            if body.get("@odata.nextLink"):
+                lists.extend(_iter_pages(session, body["@odata.nextLink"]))
+
+        for j, list_id in enumerate(chunk):
+            resp = responses.get(str(j), {})
+            status = resp.get("status")
+            if status != 200:
+                deltas[list_id] = {"status": status, "changes": [], "delta_link": None}
+                continue
+            body = resp.get("body") or {}
+            changes = body.get("value", [])
+            state = {"delta_link": body.get("@odata.deltaLink")}
+            if body.get("@odata.nextLink"):
+                changes.extend(iter_task_delta(list_id, body["@odata.nextLink"], state))
+            deltas[list_id] = {
+                "status": status,
+                "changes": changes,
+                "delta_link": state["delta_link"],
+            }
+
+        if not pending:
+            break
+        sub_requests = []
+    return lists, deltas
 
-    # For compatibility with cli
-    if list_id is None:
-        list_id = get_list_id_by_name(list_name)
 
+def task_create_body(
+    task_name: str,
+    reminder_datetime: Optional[datetime] = None,
+    due_datetime: Optional[datetime] = None,
+    important: bool = False,
+    recurrence: Optional[dict] = None,
+    note: Optional[str] = None,
+):
+    """Build the request body creating a task, shared by direct and batch calls."""
     # The Graph API requires dueDateTime when recurrence is set
     if due_datetime is None and recurrence is not None:
         due_datetime = datetime.now()
 
-    endpoint = f"{BASE_URL}/{list_id}/tasks"
     request_body = {
         "title": task_name,
         "reminderDateTime": datetime_to_api_timestamp(reminder_datetime),
@@ -196,14 +365,53 @@ def create_task(
     }
     if note:
         request_body["body"] = {"content": note, "contentType": "text"}
-    session = get_oauth_session()
-    response = session.post(endpoint, json=request_body)
+    return request_body
+
+
+def task_status_body(completed: bool):
+    """Build the request body marking a task completed or not completed."""
+    if completed:
+        return {
+            "status": TaskStatus.COMPLETED,
+            "completedDateTime": datetime_to_api_timestamp(datetime.now()),
+        }
+    return {"status": TaskStatus.NOT_STARTED, "completedDateTime": None}
+
+
+@operation
+def create_task(
+    task_name: str,
+    list_name: str | None = None,
+    list_id: str | None = None,
+    reminder_datetime: datetime | None = None,
+    due_datetime: datetime | None = None,
+    important: bool = False,
+    recurrence: dict | None = None,
+    note: str | None = None,
+):
+    _require_list(list_name, list_id)
+
+    # For compatibility with cli
+    if list_id is None:
+        list_id = yield Call(get_list_id_by_name, list_name)
+
+    endpoint = f"{BASE_URL}/{list_id}/tasks"
+    request_body = task_create_body(
+        task_name,
+        reminder_datetime=reminder_datetime,
+        due_datetime=due_datetime,
+        important=important,
+        recurrence=recurrence,
+        note=note,
+    )
+    response = yield Request("post", endpoint, json=request_body)
     if response.ok:
-        return json.loads(response.content.decode())["id"]
+        return json_codec.loads(response.content)["id"]
     else:
         response.raise_for_status()
 
 
+@operation
 def complete_task(
     list_name: str = None,
     task_name: Union[str, int] = None,
@@ -216,23 +424,20 @@ def complete_task(
 
     # For compatibility with cli
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
 
     endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}"
-    request_body = {
-        "status": TaskStatus.COMPLETED,
-        "completedDateTime": datetime_to_api_timestamp(datetime.now()),
-    }
-    session = get_oauth_session()
-    response = session.patch(endpoint, json=request_body)
+    request_body = task_status_body(completed=True)
+    response = yield Request("patch", endpoint, json=request_body)
     if response.ok:
-        data = json.loads(response.content.decode())
+        data = json_codec.loads(response.content)
         return task_id, data.get("title", "")
     response.raise_for_status()
 
 
+@operation
 def uncomplete_task(
     list_name: str = None,
     task_name: Union[str, int] = None,
@@ -244,23 +449,20 @@ def uncomplete_task(
     _require_task(task_name, task_id)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
 
     endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}"
-    request_body = {
-        "status": TaskStatus.NOT_STARTED,
-        "completedDateTime": None,
-    }
-    session = get_oauth_session()
-    response = session.patch(endpoint, json=request_body)
+    request_body = task_status_body(completed=False)
+    response = yield Request("patch", endpoint, json=request_body)
     if response.ok:
-        data = json.loads(response.content.decode())
+        data = json_codec.loads(response.content)
         return task_id, data.get("title", "")
     response.raise_for_status()
 
 
+@operation
 def complete_tasks(list_id, task_ids=None):
     if task_ids is None:
         task_ids = []
@@ -272,17 +474,14 @@ def complete_tasks(list_id, task_ids=None):
                 "method": "PATCH",
                 "url": f"{BASE_RELATE_URL}/{list_id}/tasks/{task_id}",
                 "headers": {"Content-Type": "application/json"},
-                "body": {
-                    "status": TaskStatus.COMPLETED,
-                    "completedDateTime": datetime_to_api_timestamp(datetime.now()),
-                },
+                "body": task_status_body(completed=True),
             }
         )
-    session = get_oauth_session()
-    response = session.post(BATCH_URL, json=body)
+    response = yield Request("post", BATCH_URL, json=body)
     return True if response.ok else response.raise_for_status()
 
 
+@operation
 def remove_task(
     list_name: str = None,
     task_name: Union[str, int] = None,
@@ -294,45 +493,36 @@ def remove_task(
     _require_task(task_name, task_id)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
 
     # Fetch task title before deletion
-    task = get_task(list_id=list_id, task_id=task_id)
+    task = yield Call(get_task, list_id=list_id, task_id=task_id)
     task_title = task.title
 
     endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}"
-    session = get_oauth_session()
-    response = session.delete(endpoint)
+    response = yield Request("delete", endpoint)
     if response.ok:
+        _forget_task(list_id, task_id, removed=True)
         return task_id, task_title
     response.raise_for_status()
 
 
-def update_task(
-    list_name: str = None,
-    task_name: Union[str, int] = None,
-    list_id: str = None,
-    task_id: str = None,
-    title: str | None = None,
-    due_datetime: datetime | None = None,
-    reminder_datetime: datetime | None = None,
-    important: bool | None = None,
-    recurrence: dict | None = None,
+def task_update_body(
+    title: Optional[str] = None,
+    due_datetime: Optional[datetime] = None,
+    reminder_datetime: Optional[datetime] = None,
+    important: Optional[bool] = None,
+    recurrence: Optional[dict] = None,
     clear_due: bool = False,
     clear_reminder: bool = False,
     clear_recurrence: bool = False,
 ):
-    """Update a task. Returns (task_id, task_title)."""
-    _require_list(list_name, list_id)
-    _require_task(task_name, task_id)
-
-    if list_id is None:
-        list_id = get_list_id_by_name(list_name)
-    if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+    """Build the PATCH body updating a task, shared by direct and batch calls.
 
+    Raises ValueError if nothing would change.
+    """
     request_body = {}
     if title is not None:
         request_body["title"] = title
@@ -356,27 +546,128 @@ def update_task(
 
     if not request_body:
         raise ValueError("No fields to update")
+    return request_body
+
+
+@operation
+def update_task(
+    list_name: str = None,
+    task_name: Union[str, int] = None,
+    list_id: str = None,
+    task_id: str = None,
+    title: str | None = None,
+    due_datetime: datetime | None = None,
+    reminder_datetime: datetime | None = None,
+    important: bool | None = None,
+    recurrence: dict | None = None,
+    clear_due: bool = False,
+    clear_reminder: bool = False,
+    clear_recurrence: bool = False,
+):
+    """Update a task. Returns (task_id, task_title)."""
+    _require_list(list_name, list_id)
+    _require_task(task_name, task_id)
+
+    if list_id is None:
+        list_id = yield Call(get_list_id_by_name, list_name)
+    if task_id is None:
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
+
+    request_body = task_update_body(
+        title=title,
+        due_datetime=due_datetime,
+        reminder_datetime=reminder_datetime,
+        important=important,
+        recurrence=recurrence,
+        clear_due=clear_due,
+        clear_reminder=clear_reminder,
+        clear_recurrence=clear_recurrence,
+    )
 
     endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}"
-    session = get_oauth_session()
-    response = session.patch(endpoint, json=request_body)
+    response = yield Request("patch", endpoint, json=request_body)
     if response.ok:
-        data = json.loads(response.content.decode())
+        if title is not None:
+            _forget_task(list_id, task_id)
+        data = json_codec.loads(response.content)
         return task_id, data.get("title", "")
     response.raise_for_status()
 
 
+class ResolutionCache:
+    """Name -> id resolutions reused across commands of a long-lived session.
+
+    list_ids maps list name -> id, task_ids maps (list_id, task title) -> id
+    and index_snapshots maps list_id -> task ids in the order they were last
+    listed, so an index keeps pointing at the task that was shown.
+    """
+
+    def __init__(self):
+        self.list_ids = {}
+        self.task_ids = {}
+        self.index_snapshots = {}
+
+    def task_titles(self):
+        return sorted({title for _, title in self.task_ids})
+
+    def forget_list(self, list_id):
+        self.list_ids = {k: v for k, v in self.list_ids.items() if v != list_id}
+        self.task_ids = {k: v for k, v in self.task_ids.items() if k[0] != list_id}
+        self.index_snapshots.pop(list_id, None)
+
+    def forget_task(self, list_id, task_id, removed=False):
+        self.task_ids = {k: v for k, v in self.task_ids.items() if v != task_id}
+        snapshot = self.index_snapshots.get(list_id)
+        if removed and snapshot:
+            # Keep the other indexes stable, the removed one no longer resolves
+            self.index_snapshots[list_id] = [
+                None if tid == task_id else tid for tid in snapshot
+            ]
+
+
+_resolution_cache = contextvars.ContextVar("resolution_cache", default=None)
+
+
+def _forget_list(list_id):
+    cache = _resolution_cache.get()
+    if cache is not None:
+        cache.forget_list(list_id)
+
+
+def _forget_task(list_id, task_id, removed=False):
+    cache = _resolution_cache.get()
+    if cache is not None:
+        cache.forget_task(list_id, task_id, removed=removed)
+
+
+@contextlib.contextmanager
+def use_resolution_cache(cache):
+    """Reuse list/task name resolutions from cache within this context."""
+    reset_token = _resolution_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _resolution_cache.reset(reset_token)
+
+
+@operation
 def get_list_id_by_name(list_name: str) -> str:
     """Get list ID by exact name match."""
+    cache = _resolution_cache.get()
+    if cache is not None and list_name in cache.list_ids:
+        return cache.list_ids[list_name]
+
     escaped_name = _escape_odata_string(list_name)
     endpoint = f"{BASE_URL}?$filter=displayName eq '{escaped_name}'"
-    session = get_oauth_session()
-    response = session.get(endpoint)
+    response = yield Request("get", endpoint)
     response_value = parse_response(response)
     try:
-        return response_value[0]["id"]
+        list_id = response_value[0]["id"]
     except IndexError:
         raise ListNotFound(list_name)
+    if cache is not None:
+        cache.list_ids[list_name] = list_id
+    return list_id
 
 
 def _escape_odata_string(value: str) -> str:
@@ -408,28 +699,45 @@ def _escape_odata_string(value: str) -> str:
     )
 
 
+@operation
 def get_task_id_by_name(list_name: str, task_name: str):
+    cache = _resolution_cache.get()
     if isinstance(task_name, str):
         try:
-            list_id = get_list_id_by_name(list_name)
+            list_id = yield Call(get_list_id_by_name, list_name)
+            if cache is not None and (list_id, task_name) in cache.task_ids:
+                return cache.task_ids[(list_id, task_name)]
             escaped_name = _escape_odata_string(task_name)
             endpoint = f"{BASE_URL}/{list_id}/tasks?$filter=title eq '{escaped_name}'"
-            session = get_oauth_session()
-            response = session.get(endpoint)
+            response = yield Request("get", endpoint)
             response_value = parse_response(response)
-            return [Task(x) for x in response_value][0].id
+            task_id = [Task(x) for x in response_value][0].id
         except IndexError:
             raise TaskNotFoundByName(task_name, list_name)
+        if cache is not None:
+            cache.task_ids[(list_id, task_name)] = task_id
+        return task_id
     elif isinstance(task_name, int):
-        tasks = get_tasks(list_name=list_name)
+        if cache is not None:
+            list_id = yield Call(get_list_id_by_name, list_name)
+            if list_id not in cache.index_snapshots:
+                yield Call(get_tasks, list_id=list_id)
+            task_ids = cache.index_snapshots[list_id]
+        else:
+            tasks = yield Call(get_tasks, list_name=list_name)
+            task_ids = [t.id for t in tasks]
         try:
-            return tasks[task_name].id
+            task_id = task_ids[task_name]
         except IndexError:
             raise TaskNotFoundByIndex(task_name, list_name)
+        if task_id is None:
+            raise TaskNotFoundByIndex(task_name, list_name)
+        return task_id
     else:
         raise TypeError(f"task_name must be str or int, got {type(task_name).__name__}")
 
 
+@operation
 def get_task(
     list_name: str = None,
     task_name: Union[str, int] = None,
@@ -441,35 +749,35 @@ def get_task(
     _require_task(task_name, task_id)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
 
     endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}"
-    session = get_oauth_session()
-    response = session.get(endpoint)
+    response = yield Request("get", endpoint)
     if response.ok:
-        return Task(json.loads(response.content.decode()))
+        return Task(json_codec.loads(response.content))
     response.raise_for_status()
 
 
+@operation
 def get_checklist_items(
     list_name: str = None,
     task_name: Union[str, int] = None,
     list_id: str = None,
     task_id: str = None,
+    select: str = None,
 ):
     _require_list(list_name, list_id)
     _require_task(task_name, task_id)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
 
     endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}/checklistItems"
-    session = get_oauth_session()
-    response = session.get(endpoint)
+    response = yield Request("get", _with_select(endpoint, select))
     response_value = parse_response(response)
     return [ChecklistItem(x) for x in response_value]
 
@@ -477,6 +785,7 @@ def get_checklist_items(
 BATCH_MAX_REQUESTS = 20
 
 
+@operation
 def get_checklist_items_batch(list_id: str, task_ids: list[str]):
     """Fetch checklist items for multiple tasks using $batch API.
 
@@ -486,7 +795,6 @@ def get_checklist_items_batch(list_id: str, task_ids: list[str]):
         return {}
 
     result = {}
-    session = get_oauth_session()
 
     # Chunk into groups of BATCH_MAX_REQUESTS
     for i in range(0, len(task_ids), BATCH_MAX_REQUESTS):
@@ -504,11 +812,11 @@ def get_checklist_items_batch(list_id: str, task_ids: list[str]):
                 for j, task_id in enumerate(chunk)
             ]
         }
-        response = session.post(BATCH_URL, json=body)
+        response = yield Request("post", BATCH_URL, json=body)
         if not response.ok:
             response.raise_for_status()
 
-        batch_response = json.loads(response.content.decode())
+        batch_response = json_codec.loads(response.content)
         for resp in batch_response.get("responses", []):
             tid = idx_to_task_id[resp["id"]]
             if resp.get("status") == 200:
@@ -520,6 +828,193 @@ def get_checklist_items_batch(list_id: str, task_ids: list[str]):
     return result
 
 
+@operation
+def _send_batch(session, sub_requests: list[dict]):
+    """POST up to BATCH_MAX_REQUESTS sub-requests to $batch.
+
+    Returns dict mapping sub-request id -> sub-response.
+    """
+    response = yield Request("post", BATCH_URL, json={"requests": sub_requests})
+    if not response.ok:
+        response.raise_for_status()
+
+    batch_response = json_codec.loads(response.content)
+    return {resp["id"]: resp for resp in batch_response.get("responses", [])}
+
+
+def _batch_error_message(resp):
+    """Extract a readable error message from a failed $batch sub-response."""
+    body = resp.get("body") or {}
+    error = body.get("error", {}) if isinstance(body, dict) else {}
+    return error.get("message") or f"Request failed with status {resp.get('status')}"
+
+
+def update_tasks_batch(list_id: str, task_ids: list[str], request_body: dict):
+    """PATCH several tasks with the same body using $batch API.
+
+    Returns dict mapping task_id -> (task title or None, error message or
+    None), in input order.
+    """
+    results = {}
+    session = get_oauth_session()
+    for i in range(0, len(task_ids), BATCH_MAX_REQUESTS):
+        chunk = task_ids[i : i + BATCH_MAX_REQUESTS]
+        sub_requests = [
+            {
+                "id": str(j),
+                "method": "PATCH",
+                "url": f"{BASE_RELATE_URL}/{list_id}/tasks/{task_id}",
+                "headers": {"Content-Type": "application/json"},
+                "body": request_body,
+            }
+            for j, task_id in enumerate(chunk)
+        ]
+        responses = _send_batch(session, sub_requests)
+        for j, task_id in enumerate(chunk):
+            resp = responses.get(str(j), {})
+            if resp.get("status", 500) >= 400:
+                results[task_id] = (None, _batch_error_message(resp))
+            else:
+                results[task_id] = ((resp.get("body") or {}).get("title", ""), None)
+                if "title" in request_body:
+                    _forget_task(list_id, task_id)
+    return results
+
+
+@operation
+def get_task_ids_by_names(list_id: str, list_name: str, task_names: list):
+    """Resolve several task names or indexes in one list to task IDs.
+
+    Indexes share a single task listing; names are looked up together in
+    one $batch request. Returns task IDs in input order.
+    """
+    for task_name in task_names:
+        if not isinstance(task_name, (str, int)):
+            raise TypeError(
+                f"task_name must be str or int, got {type(task_name).__name__}"
+            )
+
+    resolved = {}
+
+    if any(isinstance(t, int) for t in task_names):
+        # Same index view as get_task_id_by_name
+        cache = _resolution_cache.get()
+        if cache is not None:
+            if list_id not in cache.index_snapshots:
+                yield Call(get_tasks, list_id=list_id)
+            task_ids = cache.index_snapshots[list_id]
+        else:
+            tasks = yield Call(get_tasks, list_id=list_id)
+            task_ids = [t.id for t in tasks]
+        for task_name in task_names:
+            if isinstance(task_name, int):
+                try:
+                    task_id = task_ids[task_name]
+                except IndexError:
+                    raise TaskNotFoundByIndex(task_name, list_name)
+                if task_id is None:
+                    raise TaskNotFoundByIndex(task_name, list_name)
+                resolved[task_name] = task_id
+
+    names = list(dict.fromkeys(t for t in task_names if isinstance(t, str)))
+    if names:
+        for i in range(0, len(names), BATCH_MAX_REQUESTS):
+            chunk = names[i : i + BATCH_MAX_REQUESTS]
+            responses = yield Call(
+                _send_batch,
+                None,
+                [
+                    {
+                        "id": str(j),
+                        "method": "GET",
+                        "url": f"{BASE_RELATE_URL}/{list_id}/tasks"
+                        f"?$filter=title eq '{_escape_odata_string(name)}'",
+                    }
+                    for j, name in enumerate(chunk)
+                ],
+            )
+            for j, name in enumerate(chunk):
+                resp = responses.get(str(j), {})
+                value = (resp.get("body") or {}).get("value", [])
+                if resp.get("status") != 200 or not value:
+                    raise TaskNotFoundByName(name, list_name)
+                resolved[name] = value[0]["id"]
+
+    return [resolved[t] for t in task_names]
+
+
+# Sub-requests issued per task by get_task_details_batch
+_TASK_DETAIL_PARTS = ("task", "steps", "links", "attachments")
+
+
+@operation
+def get_task_details_batch(
+    list_id: str, task_ids: list[str], select: str = None, parts=_TASK_DETAIL_PARTS
+):
+    """Fetch tasks with their steps, links and attachments using $batch API.
+
+    Each task costs four sub-requests, so up to five tasks share one round trip.
+    Returns dict mapping task_id -> dict with keys "task" (Task), "steps"
+    (list[ChecklistItem]), "links" (list of dicts), "attachments" (list of dicts).
+    select limits the task properties fetched. Only the given parts are
+    requested (the task itself always is); the others are left empty. A
+    failed sub-request raises HTTPError rather than reading as empty.
+    """
+    if not task_ids:
+        return {}
+
+    task_ids = list(dict.fromkeys(task_ids))
+    parts = [part for part in _TASK_DETAIL_PARTS if part == "task" or part in parts]
+    per_batch = BATCH_MAX_REQUESTS // len(parts)
+    result = {}
+
+    for i in range(0, len(task_ids), per_batch):
+        chunk = task_ids[i : i + per_batch]
+        sub_requests = []
+        for j, task_id in enumerate(chunk):
+            task_url = f"{BASE_RELATE_URL}/{list_id}/tasks/{task_id}"
+            urls = {
+                "task": _with_select(task_url, select),
+                "steps": f"{task_url}/checklistItems",
+                "links": f"{task_url}/linkedResources",
+                "attachments": f"{task_url}/attachments",
+            }
+            for part in parts:
+                sub_requests.append(
+                    {"id": f"{j}-{part}", "method": "GET", "url": urls[part]}
+                )
+
+        responses = yield Call(_send_batch, None, sub_requests)
+
+        for j, task_id in enumerate(chunk):
+            task_resp = responses.get(f"{j}-task", {})
+            if task_resp.get("status") != 200:
+                raise HTTPError(
+                    f"Could not fetch task {task_id}: {_batch_error_message(task_resp)}"
+                )
+
+            def _values(part):
+                if part not in parts:
+                    return []
+                resp = responses.get(f"{j}-{part}", {})
+                if resp.get("status") != 200:
+                    raise HTTPError(
+                        f"Could not fetch {part} of task {task_id}: "
+                        f"{_batch_error_message(resp)}"
+                    )
+                return (resp.get("body") or {}).get("value", [])
+
+            result[task_id] = {
+                "task": Task(task_resp["body"]),
+                "steps": [ChecklistItem(x) for x in _values("steps")],
+                "links": _values("links"),
+                "attachments": _values("attachments"),
+            }
+
+    return result
+
+
+@operation
 def create_checklist_item(
     step_name: str,
     list_name: str = None,
@@ -531,20 +1026,20 @@ def create_checklist_item(
     _require_task(task_name, task_id)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
 
     endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}/checklistItems"
     request_body = {"displayName": step_name}
-    session = get_oauth_session()
-    response = session.post(endpoint, json=request_body)
+    response = yield Request("post", endpoint, json=request_body)
     if response.ok:
-        data = json.loads(response.content.decode())
+        data = json_codec.loads(response.content)
         return data.get("id", ""), data.get("displayName", "")
     response.raise_for_status()
 
 
+@operation
 def complete_checklist_item(
     list_name: str = None,
     task_name: Union[str, int] = None,
@@ -559,24 +1054,29 @@ def complete_checklist_item(
         _require_step(step_name)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
     if step_id is None:
-        step_id = get_step_id(
-            list_name, task_name, step_name, list_id=list_id, task_id=task_id
+        step_id = yield Call(
+            get_step_id,
+            list_name,
+            task_name,
+            step_name,
+            list_id=list_id,
+            task_id=task_id,
         )
 
     endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}/checklistItems/{step_id}"
     request_body = {"isChecked": True}
-    session = get_oauth_session()
-    response = session.patch(endpoint, json=request_body)
+    response = yield Request("patch", endpoint, json=request_body)
     if response.ok:
-        data = json.loads(response.content.decode())
+        data = json_codec.loads(response.content)
         return step_id, data.get("displayName", "")
     response.raise_for_status()
 
 
+@operation
 def uncomplete_checklist_item(
     list_name: str = None,
     task_name: Union[str, int] = None,
@@ -592,24 +1092,29 @@ def uncomplete_checklist_item(
         _require_step(step_name)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
     if step_id is None:
-        step_id = get_step_id(
-            list_name, task_name, step_name, list_id=list_id, task_id=task_id
+        step_id = yield Call(
+            get_step_id,
+            list_name,
+            task_name,
+            step_name,
+            list_id=list_id,
+            task_id=task_id,
         )
 
     endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}/checklistItems/{step_id}"
     request_body = {"isChecked": False}
-    session = get_oauth_session()
-    response = session.patch(endpoint, json=request_body)
+    response = yield Request("patch", endpoint, json=request_body)
     if response.ok:
-        data = json.loads(response.content.decode())
+        data = json_codec.loads(response.content)
         return step_id, data.get("displayName", "")
     response.raise_for_status()
 
 
+@operation
 def delete_checklist_item(
     list_name: str = None,
     task_name: Union[str, int] = None,
@@ -624,22 +1129,27 @@ def delete_checklist_item(
         _require_step(step_name)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
     if step_id is None:
-        step_id = get_step_id(
-            list_name, task_name, step_name, list_id=list_id, task_id=task_id
+        step_id = yield Call(
+            get_step_id,
+            list_name,
+            task_name,
+            step_name,
+            list_id=list_id,
+            task_id=task_id,
         )
 
     endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}/checklistItems/{step_id}"
-    session = get_oauth_session()
-    response = session.delete(endpoint)
+    response = yield Request("delete", endpoint)
     if response.ok:
         return step_id
     response.raise_for_status()
 
 
+@operation
 def get_step_id(
     list_name: str,
     task_name: Union[str, int],
@@ -648,11 +1158,11 @@ def get_step_id(
     task_id: str = None,
 ):
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
 
-    items = get_checklist_items(list_id=list_id, task_id=task_id)
+    items = yield Call(get_checklist_items, list_id=list_id, task_id=task_id)
 
     if isinstance(step_name, int):
         try:
@@ -671,6 +1181,7 @@ def get_step_id(
 # --- Note functions ---
 
 
+@operation
 def update_task_note(
     note_content: str,
     list_name: str = None,
@@ -684,9 +1195,9 @@ def update_task_note(
     _require_task(task_name, task_id)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
 
     endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}"
     request_body = {
@@ -695,15 +1206,15 @@ def update_task_note(
             "contentType": content_type,
         }
     }
-    session = get_oauth_session()
-    response = session.patch(endpoint, json=request_body)
+    response = yield Request("patch", endpoint, json=request_body)
     if response.ok:
-        data = json.loads(response.content.decode())
+        data = json_codec.loads(response.content)
         body = data.get("body", {})
         return task_id, data.get("title", ""), body.get("content", "")
     response.raise_for_status()
 
 
+@operation
 def clear_task_note(
     list_name: str = None,
     task_name: Union[str, int] = None,
@@ -715,9 +1226,9 @@ def clear_task_note(
     _require_task(task_name, task_id)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
 
     endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}"
     request_body = {
@@ -726,10 +1237,9 @@ def clear_task_note(
             "contentType": "text",
         }
     }
-    session = get_oauth_session()
-    response = session.patch(endpoint, json=request_body)
+    response = yield Request("patch", endpoint, json=request_body)
     if response.ok:
-        data = json.loads(response.content.decode())
+        data = json_codec.loads(response.content)
         return task_id, data.get("title", "")
     response.raise_for_status()
 
@@ -745,6 +1255,7 @@ class LinkNotFoundByIndex(Exception):
         super(LinkNotFoundByIndex, self).__init__(self.message)
 
 
+@operation
 def get_linked_resources(
     list_name: str = None,
     task_name: Union[str, int] = None,
@@ -756,18 +1267,18 @@ def get_linked_resources(
     _require_task(task_name, task_id)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
 
     endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}/linkedResources"
-    session = get_oauth_session()
-    response = session.get(endpoint)
+    response = yield Request("get", endpoint)
     if response.ok:
-        return json.loads(response.content.decode()).get("value", [])
+        return json_codec.loads(response.content).get("value", [])
     response.raise_for_status()
 
 
+@operation
 def create_linked_resource(
     web_url: str,
     list_name: str = None,
@@ -782,9 +1293,9 @@ def create_linked_resource(
     _require_task(task_name, task_id)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
 
     # Default application_name from URL domain
     if application_name is None:
@@ -811,15 +1322,15 @@ def create_linked_resource(
         "displayName": display_name,
         "externalId": web_url,
     }
-    session = get_oauth_session()
-    response = session.post(endpoint, json=request_body)
+    response = yield Request("post", endpoint, json=request_body)
     if response.ok:
-        data = json.loads(response.content.decode())
-        task = get_task(list_id=list_id, task_id=task_id)
+        data = json_codec.loads(response.content)
+        task = yield Call(get_task, list_id=list_id, task_id=task_id)
         return data.get("id", ""), task_id, task.title
     response.raise_for_status()
 
 
+@operation
 def delete_linked_resource(
     list_name: str = None,
     task_name: Union[str, int] = None,
@@ -837,12 +1348,12 @@ def delete_linked_resource(
     _require_task(task_name, task_id)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
 
-    task = get_task(list_id=list_id, task_id=task_id)
-    resources = get_linked_resources(list_id=list_id, task_id=task_id)
+    task = yield Call(get_task, list_id=list_id, task_id=task_id)
+    resources = yield Call(get_linked_resources, list_id=list_id, task_id=task_id)
 
     if link_index is not None:
         if link_index < 0 or link_index >= len(resources):
@@ -851,12 +1362,11 @@ def delete_linked_resource(
     else:
         resources_to_delete = resources
 
-    session = get_oauth_session()
     count = 0
     for r in resources_to_delete:
         lr_id = r["id"]
         endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}/linkedResources/{lr_id}"
-        response = session.delete(endpoint)
+        response = yield Request("delete", endpoint)
         if response.ok:
             count += 1
         else:
@@ -873,9 +1383,25 @@ ATTACHMENT_DIRECT_UPLOAD_LIMIT = 3 * 1024 * 1024
 # Maximum attachment size: 25 MB (26,214,400 bytes)
 ATTACHMENT_MAX_SIZE = 25 * 1024 * 1024
 
-# Upload session chunk size: 4 MB
+# Upload session chunk size ceiling: 4 MB
 ATTACHMENT_CHUNK_SIZE = 4 * 1024 * 1024
 
+# Upload session chunks are sized in multiples of 320 KiB
+ATTACHMENT_CHUNK_UNIT = 320 * 1024
+ATTACHMENT_MAX_CHUNK_SIZE = (
+    ATTACHMENT_CHUNK_SIZE // ATTACHMENT_CHUNK_UNIT * ATTACHMENT_CHUNK_UNIT
+)
+ATTACHMENT_INITIAL_CHUNK_SIZE = 3 * ATTACHMENT_CHUNK_UNIT
+
+# Adaptive chunking aims for one chunk PUT every this many seconds
+ATTACHMENT_CHUNK_TARGET_SECONDS = 2.0
+
+# Unfinished upload sessions, persisted so an interrupted upload can resume
+UPLOAD_SESSIONS_FILE = os.path.join(config_dir, "upload_sessions.json")
+
+# Download streaming chunk size: 64 KB
+ATTACHMENT_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
 
 class AttachmentTooLarge(Exception):
     def __init__(self, file_size, max_size=ATTACHMENT_MAX_SIZE):
@@ -898,6 +1424,7 @@ class AttachmentNotFoundByIndex(Exception):
         super().__init__(self.message)
 
 
+@operation
 def get_attachments(
     list_name: str = None,
     task_name: Union[str, int] = None,
@@ -909,18 +1436,160 @@ def get_attachments(
     _require_task(task_name, task_id)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
 
     endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}/attachments"
-    session = get_oauth_session()
-    response = session.get(endpoint)
+    response = yield Request("get", endpoint)
     if response.ok:
-        return json.loads(response.content.decode()).get("value", [])
+        return json_codec.loads(response.content).get("value", [])
     response.raise_for_status()
 
 
+# Attachment metadata fields; omits contentBytes
+ATTACHMENT_METADATA_FIELDS = "id,name,contentType,size,lastModifiedDateTime"
+
+
+@operation
+def get_attachments_batch(list_id: str, task_ids: list[str]):
+    """Fetch attachment metadata for multiple tasks using $batch API.
+
+    Returns dict mapping task_id -> list of attachment dicts.
+    """
+    if not task_ids:
+        return {}
+
+    result = {}
+
+    for i in range(0, len(task_ids), BATCH_MAX_REQUESTS):
+        chunk = task_ids[i : i + BATCH_MAX_REQUESTS]
+        responses = yield Call(
+            _send_batch,
+            None,
+            [
+                {
+                    "id": str(j),
+                    "method": "GET",
+                    "url": f"{BASE_RELATE_URL}/{list_id}/tasks/{task_id}/attachments"
+                    f"?$select={ATTACHMENT_METADATA_FIELDS}",
+                }
+                for j, task_id in enumerate(chunk)
+            ],
+        )
+        for j, task_id in enumerate(chunk):
+            resp = responses.get(str(j), {})
+            if resp.get("status") == 200:
+                result[task_id] = (resp.get("body") or {}).get("value", [])
+            else:
+                result[task_id] = []
+
+    return result
+
+
+# Parts of a task fetchable with get_task_parts_batch, by url relative to the
+# task ("task" is the task itself)
+TASK_PARTS = {
+    "task": "",
+    "steps": "checklistItems",
+    "links": "linkedResources",
+    "attachments": f"attachments?$select={ATTACHMENT_METADATA_FIELDS}",
+}
+
+
+def get_task_parts_batch(list_id: str, task_ids: list[str], parts):
+    """Fetch parts (see TASK_PARTS) of several tasks using $batch API.
+
+    Returns dict mapping task_id -> {part: list of raw dicts}, or the raw task
+    dict for the "task" part. Collections longer than one page are completed
+    by following @odata.nextLink.
+    """
+    parts = list(parts)
+    if not task_ids or not parts:
+        return {task_id: {} for task_id in task_ids}
+
+    per_batch = max(1, BATCH_MAX_REQUESTS // len(parts))
+    result = {}
+    session = get_oauth_session()
+
+    for i in range(0, len(task_ids), per_batch):
+        chunk = task_ids[i : i + per_batch]
+        sub_requests = [
+            {
+                "id": f"{j}-{part}",
+                "method": "GET",
+                "url": f"{BASE_RELATE_URL}/{list_id}/tasks/{task_id}"
+                + (f"/{TASK_PARTS[part]}" if TASK_PARTS[part] else ""),
+            }
+            for j, task_id in enumerate(chunk)
+            for part in parts
+        ]
+        responses = _send_batch(session, sub_requests)
+
+        for j, task_id in enumerate(chunk):
+            result[task_id] = {}
+            for part in parts:
+                resp = responses.get(f"{j}-{part}", {})
+                if resp.get("status") != 200:
+                    raise HTTPError(
+                        f"Could not fetch {part} of task {task_id}: "
+                        f"{_batch_error_message(resp)}"
+                    )
+                body = resp.get("body") or {}
+                if part == "task":
+                    result[task_id][part] = body
+                    continue
+                values = body.get("value", [])
+                if body.get("@odata.nextLink"):
+                    values.extend(_iter_pages(session, body["@odata.nextLink"]))
+                result[task_id][part] = values
+
+    return result
+
+
+# Parts returned inline by get_tasks_expanded_batch, by navigation property
+EXPANDABLE_PARTS = {"steps": "checklistItems", "links": "linkedResources"}
+
+
+def get_tasks_expanded_batch(list_id: str, task_ids: list[str]):
+    """Fetch tasks with their steps and links using $batch API.
+
+    Steps and links come inline ($expand), so each task costs one
+    sub-request and a $batch carries BATCH_MAX_REQUESTS tasks. Returns dict
+    mapping task_id -> {"task": raw task dict, "steps": [...], "links": [...]}
+    in the shape of get_task_parts_batch.
+    """
+    expand = ",".join(EXPANDABLE_PARTS.values())
+    result = {}
+    session = get_oauth_session()
+
+    for i in range(0, len(task_ids), BATCH_MAX_REQUESTS):
+        chunk = task_ids[i : i + BATCH_MAX_REQUESTS]
+        sub_requests = [
+            {
+                "id": str(j),
+                "method": "GET",
+                "url": f"{BASE_RELATE_URL}/{list_id}/tasks/{task_id}?$expand={expand}",
+            }
+            for j, task_id in enumerate(chunk)
+        ]
+        responses = _send_batch(session, sub_requests)
+
+        for j, task_id in enumerate(chunk):
+            resp = responses.get(str(j), {})
+            if resp.get("status") != 200:
+                raise HTTPError(
+                    f"Could not fetch task {task_id}: {_batch_error_message(resp)}"
+                )
+            body = dict(resp.get("body") or {})
+            result[task_id] = {"task": body}
+            for part, prop in EXPANDABLE_PARTS.items():
+                result[task_id][part] = body.pop(prop, None) or []
+
+    return result
+
+
+@operation
 def get_attachment(
     attachment_id: str,
     list_name: str = None,
@@ -933,94 +1602,328 @@ def get_attachment(
     _require_task(task_name, task_id)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
 
     endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}/attachments/{attachment_id}"
-    session = get_oauth_session()
-    response = session.get(endpoint)
+    response = yield Request("get", endpoint)
     if response.ok:
-        return json.loads(response.content.decode())
+        return json_codec.loads(response.content)
     response.raise_for_status()
 
 
+def _create_part_file(directory):
+    """Create a new hidden .part file in directory; returns (fd, path).
+
+    Unlike mkstemp (0600), the file gets the mode open() would give it:
+    0666 minus the process umask, applied by the kernel.
+    """
+    while True:
+        path = os.path.join(directory, f".{secrets.token_hex(8)}.part")
+        try:
+            return os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666), path
+        except FileExistsError:
+            continue
+
+
+@operation
+def download_attachment(
+    attachment_id: str,
+    output_path: str,
+    list_name: str = None,
+    task_name: Union[str, int] = None,
+    list_id: str = None,
+    task_id: str = None,
+    session=None,
+):
+    """Stream an attachment's raw bytes to output_path. Returns bytes written.
+
+    Uses the /$value endpoint so the content is never base64-decoded or held
+    in memory as a whole. Bytes go to a temporary file next to output_path,
+    which is renamed into place once the download is complete. An existing
+    session can be passed in to share one connection pool across threads.
+    """
+    _require_list(list_name, list_id)
+    _require_task(task_name, task_id)
+
+    if list_id is None:
+        list_id = yield Call(get_list_id_by_name, list_name)
+    if task_id is None:
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
+
+    endpoint = (
+        f"{BASE_URL}/{list_id}/tasks/{task_id}/attachments/{attachment_id}/$value"
+    )
+    response = yield Request("get", endpoint, stream=True)
+    try:
+        if not response.ok:
+            response.raise_for_status()
+
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        fd, temp_path = _create_part_file(output_dir)
+        written = 0
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in response.iter_content(ATTACHMENT_DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    written += len(chunk)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return written
+    finally:
+        response.close()
+
+
+@operation
 def create_attachment(
-    file_path: str,
+    file_path: Optional[str],
     list_name: str = None,
     task_name: Union[str, int] = None,
     list_id: str = None,
     task_id: str = None,
+    progress=None,
+    stream=None,
+    file_name: Optional[str] = None,
 ):
     """Attach a file to a task. Returns (attachment_id, file_name, task_id, task_title).
 
     For files <= 3MB, uses direct upload with base64 contentBytes.
-    For files > 3MB (up to 25MB), uses upload session.
+    For files > 3MB (up to 25MB), uses a resumable upload session; the
+    optional progress callback is called as progress(bytes_sent, total, mb_per_s).
+
+    Instead of file_path, a binary stream (e.g. stdin) can be given together
+    with file_name. Stream uploads cannot be resumed.
     """
     _require_list(list_name, list_id)
     _require_task(task_name, task_id)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
-
-    file_path = os.path.expanduser(file_path)
-    if not os.path.isfile(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
+
+    if stream is not None:
+        if not file_name:
+            raise ValueError("A file name is required when attaching from a stream")
+        # Reading one byte past the limit is enough to reject oversized input
+        content = stream.read(ATTACHMENT_MAX_SIZE + 1)
+        file_size = len(content)
+        source = io.BytesIO(content)
+        display_path = file_name
+    else:
+        file_path = os.path.expanduser(file_path)
+        if not os.path.isfile(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
 
-    file_size = os.path.getsize(file_path)
-    file_name = os.path.basename(file_path)
+        file_size = os.path.getsize(file_path)
+        file_name = file_name or os.path.basename(file_path)
+        source = file_path
+        display_path = file_path
 
     if file_size > ATTACHMENT_MAX_SIZE:
         raise AttachmentTooLarge(file_size)
 
     if file_size == 0:
-        raise ValueError(f"Cannot attach empty file: {file_path}")
+        raise ValueError(f"Cannot attach empty file: {display_path}")
 
-    task = get_task(list_id=list_id, task_id=task_id)
+    task = yield Call(get_task, list_id=list_id, task_id=task_id)
 
     if file_size <= ATTACHMENT_DIRECT_UPLOAD_LIMIT:
-        attachment_id = _create_attachment_direct(
-            file_path, file_name, file_size, list_id, task_id
+        attachment_id = yield Call(
+            _create_attachment_direct, source, file_name, file_size, list_id, task_id
         )
     else:
-        attachment_id = _create_attachment_upload_session(
-            file_path, file_name, file_size, list_id, task_id
+        attachment_id = yield Call(
+            _create_attachment_upload_session,
+            source,
+            file_name,
+            file_size,
+            list_id,
+            task_id,
+            progress=progress,
         )
 
     return attachment_id, file_name, task_id, task.title
 
 
-def _create_attachment_direct(file_path, file_name, file_size, list_id, task_id):
-    """Upload a file attachment directly (< 3MB)."""
-    import mimetypes
+def _open_source(source):
+    """Open a file path for binary reading, or pass a file object through."""
+    if isinstance(source, str):
+        return open(source, "rb")
+    return contextlib.nullcontext(source)
+
+
+# Raw bytes per base64 block when streaming; a multiple of 3 so that
+# blocks encode independently without padding in between
+ATTACHMENT_ENCODE_BLOCK_SIZE = 3 * 64 * 1024
+
+
+class _Base64JsonBody:
+    """JSON request body that base64-encodes file content while it is sent.
 
-    content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+    The body is a JSON object whose last member is "contentBytes". Its exact
+    length is known up front, so requests sends it with a Content-Length
+    header while iterating over the encoded blocks.
+    """
 
-    with open(file_path, "rb") as f:
-        content_bytes = base64.b64encode(f.read()).decode("ascii")
+    def __init__(self, fields: dict, source, size: int):
+        prefix = json.dumps(fields)[:-1]
+        self._prefix = f'{prefix}, "contentBytes": "'.encode()
+        self._suffix = b'"}'
+        self._source = source
+        self._size = size
+
+    def __len__(self):
+        encoded = (self._size + 2) // 3 * 4
+        return len(self._prefix) + encoded + len(self._suffix)
+
+    def __iter__(self):
+        yield self._prefix
+        with _open_source(self._source) as f:
+            while True:
+                block = f.read(ATTACHMENT_ENCODE_BLOCK_SIZE)
+                if not block:
+                    break
+                yield base64.b64encode(block)
+        yield self._suffix
+
+
+@operation
+def _create_attachment_direct(source, file_name, file_size, list_id, task_id):
+    """Upload a file attachment directly (< 3MB).
+
+    The base64 contentBytes are encoded block by block while the request is
+    being sent, so the file is never held in memory as a whole.
+    """
+    import mimetypes
+
+    content_type = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
 
     endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}/attachments"
-    request_body = {
-        "@odata.type": "#microsoft.graph.taskFileAttachment",
-        "name": file_name,
-        "contentBytes": content_bytes,
-        "contentType": content_type,
-        "size": file_size,
-    }
-    session = get_oauth_session()
-    response = session.post(endpoint, json=request_body)
+    body = _Base64JsonBody(
+        {
+            "@odata.type": "#microsoft.graph.taskFileAttachment",
+            "name": file_name,
+            "contentType": content_type,
+            "size": file_size,
+        },
+        source,
+        file_size,
+    )
+    response = yield Request(
+        "post", endpoint, data=body, headers={"Content-Type": "application/json"}
+    )
     if response.ok:
-        data = json.loads(response.content.decode())
+        data = json_codec.loads(response.content)
         return data.get("id", "")
     response.raise_for_status()
 
 
+class _UploadSessionExpired(Exception):
+    """A persisted upload session is no longer accepted by the server."""
+
+
+def _upload_session_key(file_path, file_size, list_id, task_id):
+    """Identify an upload by target task and file identity (path, size, mtime).
+
+    Returns None for streams, which cannot be resumed.
+    """
+    if not isinstance(file_path, str):
+        return None
+    mtime = os.stat(file_path).st_mtime_ns
+    raw = f"{list_id}|{task_id}|{os.path.abspath(file_path)}|{file_size}|{mtime}"
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _load_upload_sessions():
+    try:
+        with open(UPLOAD_SESSIONS_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_upload_session(key, state):
+    """Persist (or with state=None, forget) one upload session."""
+    if key is None:
+        return
+    sessions = _load_upload_sessions()
+    if state is None:
+        if sessions.pop(key, None) is None:
+            return
+    else:
+        sessions[key] = state
+
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(UPLOAD_SESSIONS_FILE), suffix=".tmp"
+    )
+    with os.fdopen(fd, "w") as f:
+        json.dump(sessions, f)
+    os.replace(temp_path, UPLOAD_SESSIONS_FILE)
+
+
+def _upload_session_expired(state):
+    expiration = state.get("expiration")
+    if not expiration:
+        return False
+    try:
+        expires_at = datetime.fromisoformat(expiration.rstrip("Z")[:26])
+    except ValueError:
+        return True
+    return expires_at <= datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _next_chunk_size(sent, elapsed):
+    """Size the next chunk so a PUT takes about ATTACHMENT_CHUNK_TARGET_SECONDS.
+
+    Growth is limited to doubling per chunk; sizes stay 320 KiB aligned.
+    """
+    if elapsed <= 0:
+        ideal = sent * 2
+    else:
+        ideal = min(sent * 2, sent / elapsed * ATTACHMENT_CHUNK_TARGET_SECONDS)
+    aligned = int(ideal) // ATTACHMENT_CHUNK_UNIT * ATTACHMENT_CHUNK_UNIT
+    return max(ATTACHMENT_CHUNK_UNIT, min(ATTACHMENT_MAX_CHUNK_SIZE, aligned))
+
+
+def _next_expected_offset(response, default):
+    """Read the server-acknowledged offset from a chunk PUT response."""
+    try:
+        data = json_codec.loads(response.content)
+        ranges = data.get("nextExpectedRanges") or data.get("NextExpectedRanges")
+        if ranges:
+            return int(ranges[0].split("-")[0])
+    except (AttributeError, TypeError, ValueError, UnicodeDecodeError):
+        pass
+    return default
+
+
+@operation
 def _create_attachment_upload_session(
-    file_path, file_name, file_size, list_id, task_id
+    source, file_name, file_size, list_id, task_id, progress=None
 ):
-    """Upload a file attachment via upload session (3MB - 25MB)."""
+    """Upload a file attachment via upload session (3MB - 25MB).
+
+    source is a file path or a binary file object. For file paths the session
+    URL and acknowledged offset are persisted after every chunk, so running
+    the same upload again after a crash resumes where it stopped.
+    """
+    key = _upload_session_key(source, file_size, list_id, task_id)
+
+    state = _load_upload_sessions().get(key) if key is not None else None
+    if state is not None and _upload_session_expired(state):
+        state = None
+
+    if state is not None:
+        try:
+            return (yield from _upload_chunks(key, state, source, file_size, progress))
+        except _UploadSessionExpired:
+            _save_upload_session(key, None)
+
     # Step 1: Create upload session
     endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}/attachments/createUploadSession"
     request_body = {
@@ -1030,37 +1933,73 @@ def _create_attachment_upload_session(
             "size": file_size,
         }
     }
-    session = get_oauth_session()
-    response = session.post(endpoint, json=request_body)
+    response = yield Request("post", endpoint, json=request_body)
     if not response.ok:
         response.raise_for_status()
 
-    session_data = json.loads(response.content.decode())
-    upload_url = session_data["uploadUrl"]
+    session_data = json_codec.loads(response.content)
+    state = {
+        "upload_url": session_data["uploadUrl"],
+        "expiration": session_data.get("expirationDateTime"),
+        "next_offset": 0,
+    }
+    _save_upload_session(key, state)
 
     # Step 2: Upload in chunks
-    with open(file_path, "rb") as f:
-        offset = 0
+    try:
+        return (yield from _upload_chunks(key, state, source, file_size, progress))
+    except _UploadSessionExpired:
+        _save_upload_session(key, None)
+        raise
+
+
+def _upload_chunks(key, state, source, file_size, progress=None):
+    """PUT the file to an upload session from state["next_offset"] onwards."""
+    upload_url = state["upload_url"]
+    offset = state["next_offset"]
+    chunk_size = ATTACHMENT_INITIAL_CHUNK_SIZE
+    started = time.monotonic()
+    sent_total = 0
+    response = None
+
+    with _open_source(source) as f:
         while offset < file_size:
-            chunk = f.read(ATTACHMENT_CHUNK_SIZE)
-            chunk_size = len(chunk)
-            end = offset + chunk_size - 1
+            f.seek(offset)
+            chunk = f.read(chunk_size)
+            end = offset + len(chunk) - 1
 
             headers = {
-                "Content-Length": str(chunk_size),
+                "Content-Length": str(len(chunk)),
                 "Content-Range": f"bytes {offset}-{end}/{file_size}",
                 "Content-Type": "application/octet-stream",
             }
 
-            response = session.put(upload_url, data=chunk, headers=headers)
+            chunk_started = time.monotonic()
+            response = yield Request("put", upload_url, data=chunk, headers=headers)
+            if response.status_code in (404, 410):
+                raise _UploadSessionExpired()
             if not response.ok:
                 response.raise_for_status()
+            elapsed = time.monotonic() - chunk_started
+
+            sent_total += len(chunk)
+            offset = _next_expected_offset(response, offset + len(chunk))
+            if offset < file_size:
+                state["next_offset"] = offset
+                _save_upload_session(key, state)
+
+            chunk_size = _next_chunk_size(len(chunk), elapsed)
 
-            offset += chunk_size
+            if progress is not None:
+                total_elapsed = time.monotonic() - started
+                rate = sent_total / (1024 * 1024) / max(total_elapsed, 1e-9)
+                progress(min(offset, file_size), file_size, rate)
+
+    _save_upload_session(key, None)
 
     # The final PUT response should contain the attachment ID in Location header
     # or response body
-    if response.status_code == 201:
+    if response is not None and response.status_code == 201:
         # Try to extract from Location header
         location = response.headers.get("Location", "")
         if location:
@@ -1068,13 +2007,14 @@ def _create_attachment_upload_session(
             return location.rstrip("/").split("/")[-1]
         # Try response body
         try:
-            data = json.loads(response.content.decode())
+            data = json_codec.loads(response.content)
             return data.get("id", "")
         except (json.JSONDecodeError, UnicodeDecodeError):
             return ""
     return ""
 
 
+@operation
 def delete_attachment(
     list_name: str = None,
     task_name: Union[str, int] = None,
@@ -1092,12 +2032,12 @@ def delete_attachment(
     _require_task(task_name, task_id)
 
     if list_id is None:
-        list_id = get_list_id_by_name(list_name)
+        list_id = yield Call(get_list_id_by_name, list_name)
     if task_id is None:
-        task_id = get_task_id_by_name(list_name, task_name)
+        task_id = yield Call(get_task_id_by_name, list_name, task_name)
 
-    task = get_task(list_id=list_id, task_id=task_id)
-    attachments = get_attachments(list_id=list_id, task_id=task_id)
+    task = yield Call(get_task, list_id=list_id, task_id=task_id)
+    attachments = yield Call(get_attachments, list_id=list_id, task_id=task_id)
 
     if attachment_index is not None:
         if attachment_index < 0 or attachment_index >= len(attachments):
@@ -1106,12 +2046,11 @@ def delete_attachment(
     else:
         attachments_to_delete = attachments
 
-    session = get_oauth_session()
     count = 0
     for att in attachments_to_delete:
         att_id = att["id"]
         endpoint = f"{BASE_URL}/{list_id}/tasks/{task_id}/attachments/{att_id}"
-        response = session.delete(endpoint)
+        response = yield Request("delete", endpoint)
         if response.ok:
             count += 1
         else:
@@ -1,59 +1,25 @@
-from datetime import datetime, timezone
-
-
-def _parse_datetime(dt_str):
-    """Parse datetime string from checklist items API.
-
-    The checklistItems endpoint returns datetimes without fractional seconds
-    (e.g. "2026-02-04T19:08:45Z"), unlike tasks which include 7 digits
-    (e.g. "2024-01-25T10:00:00.0000000Z").
-    """
-    if dt_str is None:
-        return None
-
-    if isinstance(dt_str, dict):
-        dt_str = dt_str["dateTime"]
-
-    # Strip trailing Z
-    dt_str = dt_str.rstrip("Z")
-
-    # Truncate fractional seconds to 6 digits (Python's %f limit)
-    if "." in dt_str:
-        base, frac = dt_str.rsplit(".", 1)
-        dt_str = f"{base}.{frac[:6]}"
-
-    for fmt in ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S"):
-        try:
-            dt = datetime.strptime(dt_str, fmt)
-            return dt.replace(tzinfo=timezone.utc).astimezone(tz=None)
-        except ValueError:
-            continue
-
-    return None
-
-
-class ChecklistItem:
-    def __init__(self, query_result):
-        self.id: str = query_result["id"]
-        self.display_name: str = query_result["displayName"]
-        self.is_checked: bool = bool(query_result["isChecked"])
-        self.created_datetime = _parse_datetime(query_result["createdDateTime"])
-
-        if "checkedDateTime" in query_result and query_result["checkedDateTime"]:
-            self.checked_datetime = _parse_datetime(query_result["checkedDateTime"])
-        else:
-            self.checked_datetime = None
-
-    def to_dict(self):
-        """Convert checklist item to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "display_name": self.display_name,
-            "is_checked": self.is_checked,
-            "created_datetime": (
-                self.created_datetime.isoformat() if self.created_datetime else None
-            ),
-            "checked_datetime": (
-                self.checked_datetime.isoformat() if self.checked_datetime else None
-            ),
-        }
+from todocli.models.lazy import LazyModel, field_slots, lazy_field
+from todocli.utils.datetime_util import api_timestamp_to_datetime
+
+
+class ChecklistItem(LazyModel):
+    """A step; fields are decoded from the API dict when first read."""
+
+    FIELDS = (
+        "id",
+        "display_name",
+        "is_checked",
+        "created_datetime",
+        "checked_datetime",
+    )
+    __slots__ = field_slots(FIELDS)
+
+    id: str = lazy_field("id")
+    display_name: str = lazy_field("displayName")
+    is_checked: bool = lazy_field("isChecked", bool)
+    created_datetime = lazy_field("createdDateTime", api_timestamp_to_datetime)
+    checked_datetime = lazy_field(
+        "checkedDateTime", api_timestamp_to_datetime, default=None, skip_empty=True
+    )
+
+    JSON_FIELDS = tuple((name, name) for name in FIELDS)
@@ -0,0 +1,119 @@
+"""
+Compact models whose fields are decoded from the raw API dict on first access.
+
+Listings build thousands of models of which callers often read only id and
+title, so models keep the API dict and decode each attribute when it is
+first read. Models use __slots__: every field has a private slot ("_" plus
+its name) holding the decoded value, and an unset slot means "not decoded
+yet". Models convert to and from a plain tuple of field values, and share
+one to_dict() built from their JSON_FIELDS.
+"""
+
+from datetime import datetime
+from enum import Enum
+
+_REQUIRED = object()
+
+
+class lazy_field:
+    """Attribute read from instance._raw[key], passed through decode.
+
+    A missing key raises KeyError on access unless a default is given; the
+    default is used as is, without decoding. With skip_empty, falsy raw
+    values count as missing too. Assigning the attribute stores the value
+    without decoding.
+    """
+
+    def __init__(self, key, decode=None, default=_REQUIRED, skip_empty=False):
+        self.key = key
+        self.decode = decode
+        self.default = default
+        self.skip_empty = skip_empty
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        # The slot's member descriptor, created with the class
+        self.slot = owner.__dict__["_" + name]
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            pass
+        raw = instance._raw
+        if self.key in raw and not (self.skip_empty and not raw[self.key]):
+            value = raw[self.key]
+            if self.decode is not None:
+                value = self.decode(value)
+        elif self.default is _REQUIRED:
+            raise KeyError(self.key)
+        else:
+            value = self.default
+        self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+
+def field_slots(fields):
+    """__slots__ for a LazyModel subclass with the given lazy fields."""
+    return tuple("_" + name for name in fields)
+
+
+def json_value(value):
+    """The JSON form of a decoded field value."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class LazyModel:
+    """Base of the API models.
+
+    Subclasses list their lazy fields in FIELDS (which fixes the tuple
+    layout) and JSON_FIELDS as (key, field) or (key, field, convert) in
+    to_dict() order; convert defaults to json_value.
+    """
+
+    __slots__ = ("_raw",)
+
+    FIELDS = ()
+    JSON_FIELDS = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._json_fields = tuple(
+            (key, name, convert[0] if convert else json_value)
+            for key, name, *convert in cls.JSON_FIELDS
+        )
+
+    def __init__(self, query_result):
+        self._raw = query_result
+
+    def to_tuple(self):
+        """Every field, decoded, in FIELDS order."""
+        return tuple([getattr(self, name) for name in self.FIELDS])
+
+    @classmethod
+    def from_tuple(cls, values):
+        """Rebuild a model from to_tuple() output without an API dict."""
+        obj = cls.__new__(cls)
+        obj._raw = None
+        for name, value in zip(cls.FIELDS, values):
+            setattr(obj, name, value)
+        return obj
+
+    def __reduce__(self):
+        return self.__class__.from_tuple, (self.to_tuple(),)
+
+    def to_dict(self):
+        """Convert to a dictionary for JSON serialization."""
+        return {
+            key: convert(getattr(self, name))
+            for key, name, convert in self._json_fields
+        }
@@ -0,0 +1,137 @@
+"""
+JSON output written straight from models.
+
+dump() produces the same text as json.dump() with the same indent,
+separators and ensure_ascii, with models replaced by their to_dict(), but
+reads model fields directly instead of building a dict per model (and per
+wrapper adding keys such as "steps"), and writes the output in chunks as it
+goes. Other objects with a to_dict() are
+written as what it returns.
+"""
+
+import io
+from json.encoder import encode_basestring, encode_basestring_ascii
+
+from todocli.models.lazy import LazyModel
+
+# Flush to the file after this many pieces of text
+_CHUNK_PARTS = 4096
+
+
+class WithFields:
+    """A model plus extra keys appended after its own, e.g. a task's steps."""
+
+    __slots__ = ("model", "extra")
+
+    def __init__(self, model, **extra):
+        self.model = model
+        self.extra = extra
+
+
+class _Writer:
+    def __init__(self, fp, indent, separators, ensure_ascii):
+        self.fp = fp
+        self.parts = []
+        self.indent = " " * indent if isinstance(indent, int) else indent
+        if separators is None:
+            separators = ("," if indent is not None else ", ", ": ")
+        self.item_separator, self.key_separator = separators
+        self.encode = encode_basestring_ascii if ensure_ascii else encode_basestring
+
+    def flush(self):
+        self.fp.write("".join(self.parts))
+        self.parts.clear()
+
+    def _newline(self, level):
+        return "" if self.indent is None else "\n" + self.indent * level
+
+    def _items(self, pairs, level):
+        """Write the members of an object; pairs yields (key, value)."""
+        parts = self.parts
+        first = True
+        for key, value in pairs:
+            if first:
+                parts.append("{")
+                first = False
+            else:
+                parts.append(self.item_separator)
+            parts.append(self._newline(level + 1))
+            parts.append(self.encode(key))
+            parts.append(self.key_separator)
+            self.write(value, level + 1)
+        parts.append("{}" if first else self._newline(level) + "}")
+
+    def write(self, value, level=0):
+        parts = self.parts
+        if isinstance(value, str):
+            parts.append(self.encode(value))
+        elif value is None:
+            parts.append("null")
+        elif value is True:
+            parts.append("true")
+        elif value is False:
+            parts.append("false")
+        elif isinstance(value, int):
+            parts.append(int.__repr__(value))
+        elif isinstance(value, float):
+            parts.append(_float(value))
+        elif isinstance(value, LazyModel) or hasattr(value, "to_dict"):
+            self._items(_model_pairs(value), level)
+        elif isinstance(value, WithFields):
+            self._items(
+                _chain(_model_pairs(value.model), value.extra.items()), level
+            )
+        elif isinstance(value, dict):
+            self._items(((str(k), v) for k, v in value.items()), level)
+        elif isinstance(value, (list, tuple)):
+            if not value:
+                parts.append("[]")
+                return
+            parts.append("[")
+            for i, item in enumerate(value):
+                if i:
+                    parts.append(self.item_separator)
+                parts.append(self._newline(level + 1))
+                self.write(item, level + 1)
+                if len(parts) > _CHUNK_PARTS:
+                    self.flush()
+            parts.append(self._newline(level) + "]")
+        else:
+            raise TypeError(
+                f"Object of type {type(value).__name__} is not JSON serializable"
+            )
+
+
+def _model_pairs(model):
+    if not isinstance(model, LazyModel):
+        yield from model.to_dict().items()
+        return
+    for key, name, convert in model._json_fields:
+        yield key, convert(getattr(model, name))
+
+
+def _chain(first, second):
+    yield from first
+    yield from second
+
+
+def _float(value):
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "Infinity" if value > 0 else "-Infinity"
+    return float.__repr__(value)
+
+
+def dump(value, fp, indent=None, separators=None, ensure_ascii=True):
+    """Write value as JSON to fp; models are written as their to_dict()."""
+    writer = _Writer(fp, indent, separators, ensure_ascii)
+    writer.write(value)
+    writer.flush()
+
+
+def dumps(value, indent=None, separators=None, ensure_ascii=True):
+    """Return value as a JSON string; see dump()."""
+    out = io.StringIO()
+    dump(value, out, indent, separators, ensure_ascii)
+    return out.getvalue()
@@ -1,27 +1,21 @@
 from enum import Enum
 
+from todocli.models.lazy import LazyModel, field_slots, lazy_field
 
-class TodoList:
+
+class TodoList(LazyModel):
     class WellKnownListName(Enum):
         none = "none"
         DefaultList = "defaultList"
         FlaggedEmails = "flaggedEmails"
 
-    def __init__(self, query_result_list):
-        self.id: str = query_result_list["id"]
-        self.display_name: str = query_result_list["displayName"]
-        self.is_owner = bool(query_result_list["isOwner"])
-        self.is_shared = bool(query_result_list["isShared"])
-        self.well_known_list_name = TodoList.WellKnownListName(
-            query_result_list["wellknownListName"]
-        )
+    FIELDS = ("id", "display_name", "is_owner", "is_shared", "well_known_list_name")
+    __slots__ = field_slots(FIELDS)
+
+    id: str = lazy_field("id")
+    display_name: str = lazy_field("displayName")
+    is_owner = lazy_field("isOwner", bool)
+    is_shared = lazy_field("isShared", bool)
+    well_known_list_name = lazy_field("wellknownListName", WellKnownListName)
 
-    def to_dict(self):
-        """Convert list to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "display_name": self.display_name,
-            "is_owner": self.is_owner,
-            "is_shared": self.is_shared,
-            "well_known_list_name": self.well_known_list_name.value,
-        }
+    JSON_FIELDS = tuple((name, name) for name in FIELDS)
@@ -1,4 +1,5 @@
 from enum import Enum
+from todocli.models.lazy import LazyModel, field_slots, lazy_field
 from todocli.utils.datetime_util import api_timestamp_to_datetime
 
 
@@ -35,80 +36,70 @@ class DayOfWeek(str, Enum):
     SUNDAY = "sunday"
 
 
-class Task:
-    def __init__(self, query_result):
-        self.title = query_result["title"]
-        self.id = query_result["id"]
-        self.importance = TaskImportance(query_result["importance"])
-        self.status = TaskStatus(query_result["status"])
-        self.created_datetime = api_timestamp_to_datetime(
-            query_result["createdDateTime"]
-        )
-
-        if "completedDateTime" in query_result:
-            self.completed_datetime = api_timestamp_to_datetime(
-                query_result["completedDateTime"]
-            )
-        else:
-            self.completed_datetime = None
-
-        self.is_reminder_on: bool = bool(query_result["isReminderOn"])
-
-        if "dueDateTime" in query_result:
-            self.due_datetime = api_timestamp_to_datetime(query_result["dueDateTime"])
-        else:
-            self.due_datetime = None
-
-        if "reminderDateTime" in query_result:
-            self.reminder_datetime = api_timestamp_to_datetime(
-                query_result["reminderDateTime"]
-            )
-        else:
-            self.reminder_datetime = None
-
-        self.last_modified_datetime = api_timestamp_to_datetime(
-            query_result["lastModifiedDateTime"]
-        )
-
-        if "bodyLastModifiedDateTime" in query_result:
-            self.body_last_modified_datetime = api_timestamp_to_datetime(
-                query_result["bodyLastModifiedDateTime"]
-            )
-        else:
-            self.body_last_modified_datetime = None
-
-        # Note (body content)
-        if "body" in query_result and query_result["body"]:
-            self.note = query_result["body"].get("content", "")
-            self.note_content_type = query_result["body"].get("contentType", "text")
-        else:
-            self.note = ""
-            self.note_content_type = "text"
-
-    def to_dict(self):
-        """Convert task to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "status": self.status.value,
-            "importance": self.importance.value,
-            "is_reminder_on": self.is_reminder_on,
-            "note": self.note if self.note else None,
-            "created_datetime": (
-                self.created_datetime.isoformat() if self.created_datetime else None
-            ),
-            "due_datetime": (
-                self.due_datetime.isoformat() if self.due_datetime else None
-            ),
-            "reminder_datetime": (
-                self.reminder_datetime.isoformat() if self.reminder_datetime else None
-            ),
-            "completed_datetime": (
-                self.completed_datetime.isoformat() if self.completed_datetime else None
-            ),
-            "last_modified_datetime": (
-                self.last_modified_datetime.isoformat()
-                if self.last_modified_datetime
-                else None
-            ),
-        }
+def _note(body):
+    return body.get("content", "") if body else ""
+
+
+def _note_content_type(body):
+    return body.get("contentType", "text") if body else "text"
+
+
+class Task(LazyModel):
+    """A task; fields are decoded from the API dict when first read."""
+
+    FIELDS = (
+        "id",
+        "title",
+        "importance",
+        "status",
+        "created_datetime",
+        "completed_datetime",
+        "is_reminder_on",
+        "due_datetime",
+        "reminder_datetime",
+        "last_modified_datetime",
+        "body_last_modified_datetime",
+        "note",
+        "note_content_type",
+        "recurrence",
+    )
+    __slots__ = field_slots(FIELDS)
+
+    id = lazy_field("id")
+    title = lazy_field("title")
+    importance = lazy_field("importance", TaskImportance)
+    status = lazy_field("status", TaskStatus)
+    created_datetime = lazy_field("createdDateTime", api_timestamp_to_datetime)
+    completed_datetime = lazy_field(
+        "completedDateTime", api_timestamp_to_datetime, default=None
+    )
+    is_reminder_on = lazy_field("isReminderOn", bool)
+    due_datetime = lazy_field("dueDateTime", api_timestamp_to_datetime, default=None)
+    reminder_datetime = lazy_field(
+        "reminderDateTime", api_timestamp_to_datetime, default=None
+    )
+    last_modified_datetime = lazy_field(
+        "lastModifiedDateTime", api_timestamp_to_datetime
+    )
+    body_last_modified_datetime = lazy_field(
+        "bodyLastModifiedDateTime", api_timestamp_to_datetime, default=None
+    )
+    # Note (body content)
+    note = lazy_field("body", _note, default="")
+    note_content_type = lazy_field("body", _note_content_type, default="text")
+    # Graph patternedRecurrence dict, see recurrence_util.expand_recurrence
+    recurrence = lazy_field("recurrence", default=None)
+
+    JSON_FIELDS = (
+        ("id", "id"),
+        ("title", "title"),
+        ("status", "status"),
+        ("importance", "importance"),
+        ("is_reminder_on", "is_reminder_on"),
+        ("note", "note", lambda note: note if note else None),
+        ("created_datetime", "created_datetime"),
+        ("due_datetime", "due_datetime"),
+        ("reminder_datetime", "reminder_datetime"),
+        ("completed_datetime", "completed_datetime"),
+        ("last_modified_datetime", "last_modified_datetime"),
+    )
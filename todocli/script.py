@@ -0,0 +1,306 @@
+"""
+Script mode: run a sequence of todo commands in one process.
+
+Each non-empty line of a script is a todo command line ("#" starts a comment
+line). Names are resolved once through a shared resolution cache. Runs of
+`new`, `complete` and `uncomplete` lines are sent together as $batch
+requests; a command touching a task changed earlier in the same batch
+depends on that request (dependsOn), and a command naming a task created by
+a pending `new` waits for that batch to be sent. Every other command flushes
+the pending batch and then runs on its own. One JSON result per script line
+is written as it becomes known (NDJSON), in script order.
+"""
+
+import json
+import shlex
+
+import todocli.graphapi.wrapper as wrapper
+from todocli.graphapi.oauth import create_pooled_session, use_session
+from todocli.utils.datetime_util import parse_datetime
+from todocli.utils.recurrence_util import parse_recurrence
+
+# Commands that cannot run inside a script
+UNSUPPORTED_COMMANDS = ("run", "daemon")
+
+# Messages of batched commands, as printed by the commands themselves
+_MESSAGES = {
+    "created": "Created task '{title}' in '{list}'",
+    "completed": "Completed task '{title}' in '{list}'",
+    "uncompleted": "Uncompleted task '{title}' in '{list}'",
+}
+
+
+class _Op:
+    """One $batch sub-request planned for a script line."""
+
+    def __init__(self, request, list_id, list_name, task_id=None, title=None):
+        self.request = request
+        self.list_id = list_id
+        self.list_name = list_name
+        self.task_id = task_id
+        self.title = title
+        self.result = None
+
+
+class _Line:
+    def __init__(self, number, text, action):
+        self.number = number
+        self.text = text
+        self.action = action
+        self.ops = []
+
+
+def _line_result(line, ok, **fields):
+    return dict({"line": line.number, "command": line.text, "ok": ok}, **fields)
+
+
+class ScriptRunner:
+    def __init__(self, parser, out):
+        from todocli import cli
+
+        self.cli = cli
+        self.parser = parser
+        self.out = out
+        self.pending = []
+        self.failed = False
+
+    # --- Output ---
+
+    def _emit(self, result):
+        if not result["ok"]:
+            self.failed = True
+        self.out.write(json.dumps(result) + "\n")
+        self.out.flush()
+
+    # --- Batching ---
+
+    def _pending_ops(self):
+        return [op for line in self.pending for op in line.ops]
+
+    def flush(self):
+        """Send the pending batch and emit the results of its lines."""
+        ops = self._pending_ops()
+        if ops:
+            session = wrapper.get_oauth_session()
+            try:
+                responses = wrapper._send_batch(session, [op.request for op in ops])
+            except Exception as e:
+                responses = {}
+                for op in ops:
+                    op.result = e
+            for op in ops:
+                if op.request["id"] in responses:
+                    op.result = responses[op.request["id"]]
+
+        for line in self.pending:
+            self._emit(self._batched_line_result(line))
+        self.pending = []
+
+    def _batched_line_result(self, line):
+        results = []
+        for op in line.ops:
+            resp = op.result
+            if isinstance(resp, Exception):
+                return _line_result(line, False, error=str(resp), code="network_error")
+            if resp is None or resp.get("status", 500) >= 400:
+                if resp is not None and resp.get("status") == 424:
+                    message = "Not run: an earlier command on this task failed"
+                else:
+                    message = wrapper._batch_error_message(resp or {})
+                return _line_result(line, False, error=message, code="api_error")
+            results.append(self._op_result(line.action, op, resp.get("body") or {}))
+
+        if line.action == "created":
+            return _line_result(line, True, result=results[0])
+        return _line_result(line, True, result=results)
+
+    def _op_result(self, action, op, body):
+        task_id = body.get("id", op.task_id)
+        title = body.get("title", op.title or "")
+        result = {
+            "action": action,
+            "id": task_id,
+            "title": title,
+            "list": op.list_name,
+            "message": _MESSAGES[action].format(title=title, list=op.list_name),
+        }
+        if action == "created":
+            cache = wrapper._resolution_cache.get()
+            if cache is not None:
+                cache.task_ids.setdefault((op.list_id, title), task_id)
+            note = (op.request["body"].get("body") or {}).get("content")
+            if note:
+                result["message"] += " with note"
+                result["note"] = note
+        return result
+
+    def _add(self, line):
+        """Queue a planned line, ordering it after ops on the same tasks."""
+        ops = self._pending_ops()
+        if len(ops) + len(line.ops) > wrapper.BATCH_MAX_REQUESTS:
+            self.flush()
+            ops = []
+
+        last_by_task = {op.task_id: op.request["id"] for op in ops if op.task_id}
+        next_id = len(ops)
+        for op in line.ops:
+            op.request["id"] = str(next_id)
+            next_id += 1
+            if op.task_id in last_by_task:
+                op.request["dependsOn"] = [last_by_task[op.task_id]]
+            if op.task_id:
+                last_by_task[op.task_id] = op.request["id"]
+        self.pending.append(line)
+
+    # --- Planning ---
+
+    def _waits_for_pending_new(self, targets):
+        """True if a (list_name, task_name) target is created by a pending op."""
+        created = {(op.list_name, op.title) for op in self._pending_ops()}
+        return any(target in created for target in targets)
+
+    def _plan_new(self, line, args):
+        if args.step or args.link or args.attach:
+            return False
+        list_name, name = self.cli.parse_task_path(args.task_name, args.list)
+        body = wrapper.task_create_body(
+            name,
+            reminder_datetime=parse_datetime(args.reminder) if args.reminder else None,
+            due_datetime=parse_datetime(args.due) if args.due else None,
+            important=args.important,
+            recurrence=parse_recurrence(args.recurrence),
+            note=args.note,
+        )
+        list_id = wrapper.get_list_id_by_name(list_name)
+        request = {
+            "method": "POST",
+            "url": f"{wrapper.BASE_RELATE_URL}/{list_id}/tasks",
+            "headers": {"Content-Type": "application/json"},
+            "body": body,
+        }
+        line.ops.append(_Op(request, list_id, list_name, title=name))
+        return True
+
+    def _plan_status(self, line, args, completed):
+        # (list_name, task name or index, task_id), resolved like the CLI does
+        if args.task_id:
+            targets = [(args.list or "Tasks", None, args.task_id)]
+        elif args.task_index is not None:
+            targets = [(args.list or "Tasks", args.task_index, None)]
+        else:
+            targets = []
+            for task_name in args.task_names:
+                list_name, name = self.cli.parse_task_path(task_name, args.list)
+                targets.append((list_name, self.cli.try_parse_as_int(name), None))
+
+        if self._waits_for_pending_new([(l, n) for l, n, _ in targets]):
+            self.flush()
+
+        list_ids = {}
+        for list_name, _, _ in targets:
+            if list_name not in list_ids:
+                list_ids[list_name] = wrapper.get_list_id_by_name(list_name)
+        for list_name, task_name, task_id in targets:
+            list_id = list_ids[list_name]
+            if task_id is None:
+                task_id = wrapper.get_task_id_by_name(list_name, task_name)
+            request = {
+                "method": "PATCH",
+                "url": f"{wrapper.BASE_RELATE_URL}/{list_id}/tasks/{task_id}",
+                "headers": {"Content-Type": "application/json"},
+                "body": wrapper.task_status_body(completed),
+            }
+            line.ops.append(_Op(request, list_id, list_name, task_id=task_id))
+        return True
+
+    def _plan(self, line, args):
+        """Add batch ops for line. Returns False if it must run on its own."""
+        if args.func is self.cli.new:
+            return self._plan_new(line, args)
+        if args.func is self.cli.complete:
+            return self._plan_status(line, args, completed=True)
+        if args.func is self.cli.uncomplete:
+            return self._plan_status(line, args, completed=False)
+        return False
+
+    # --- Execution ---
+
+    def _run_alone(self, line, argv, args):
+        self.flush()
+        if hasattr(args, "json") and "--json" not in argv and "-j" not in argv:
+            argv = argv + ["--json"]
+        exit_code, stdout, stderr = self.cli._capture_command(self.parser, argv)
+        try:
+            output = json.loads(stdout) if stdout.strip() else None
+        except ValueError:
+            output = stdout
+        if exit_code == 0:
+            self._emit(_line_result(line, True, result=output))
+        elif isinstance(output, dict) and "error" in output:
+            self._emit(
+                _line_result(line, False, error=output["error"], code=output["code"])
+            )
+        else:
+            message = (stderr or stdout).strip() or f"Exit code {exit_code}"
+            self._emit(_line_result(line, False, error=message, code="error"))
+
+    def run_line(self, number, text):
+        try:
+            argv = shlex.split(text)
+        except ValueError as e:
+            line = _Line(number, text, None)
+            self.flush()
+            self._emit(_line_result(line, False, error=str(e), code="argument_error"))
+            return
+
+        line = _Line(number, text, None)
+        if not argv or argv[0] in UNSUPPORTED_COMMANDS or "-i" in argv:
+            self.flush()
+            message = "Command is not supported in scripts"
+            self._emit(_line_result(line, False, error=message, code="argument_error"))
+            return
+
+        try:
+            args = self.parser.parse_args(argv)
+        except SystemExit:
+            self._run_alone(line, argv, None)
+            return
+
+        line.action = {
+            self.cli.new: "created",
+            self.cli.complete: "completed",
+            self.cli.uncomplete: "uncompleted",
+        }.get(args.func)
+        try:
+            planned = self._plan(line, args)
+        except Exception:
+            # Resolution failed: run the command itself so it reports the
+            # error exactly as it would outside a script
+            line.ops = []
+            planned = False
+        if planned:
+            self._add(line)
+        else:
+            self._run_alone(line, argv, args)
+
+    def run(self, lines):
+        """Run the script lines. Returns True if every line succeeded."""
+        for number, text in enumerate(lines, start=1):
+            text = text.strip()
+            if not text or text.startswith("#"):
+                continue
+            self.run_line(number, text)
+        self.flush()
+        return not self.failed
+
+
+def run_script(lines, parser, out):
+    """Run script lines with one session and resolution cache.
+
+    Returns True if every line succeeded.
+    """
+    runner = ScriptRunner(parser, out)
+    with use_session(create_pooled_session()), wrapper.use_resolution_cache(
+        wrapper.ResolutionCache()
+    ):
+        return runner.run(lines)
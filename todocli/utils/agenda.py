@@ -0,0 +1,97 @@
+"""
+Time-bucketed view of the open tasks of every list, built from the local
+replica (see replica.py) without touching the network.
+
+Items are due dates, active reminders and, for recurring tasks, the later
+occurrences of the series that fall in the window. The replica's sorted
+time index gives the due dates and reminders of the window by bisection;
+only the recurring tasks are expanded.
+"""
+
+from datetime import date, datetime, time, timedelta
+
+from todocli.utils.datetime_util import api_timestamp_to_datetime, timestamp_to_local
+from todocli.utils.recurrence_util import expand_recurrence
+
+BUCKETS = ("overdue", "today", "tomorrow", "this_week", "later")
+
+BUCKET_TITLES = {
+    "overdue": "Overdue",
+    "today": "Today",
+    "tomorrow": "Tomorrow",
+    "this_week": "This week",
+    "later": "Later",
+}
+
+
+def _bucket(day, today):
+    if day < today:
+        return "overdue"
+    if day == today:
+        return "today"
+    if day == today + timedelta(days=1):
+        return "tomorrow"
+    # Weeks end on Sunday
+    if day <= today + timedelta(days=6 - today.weekday()):
+        return "this_week"
+    return "later"
+
+
+def _item(replica, kind, at, list_id, task_id):
+    record = replica.task(list_id, task_id)
+    return {
+        "kind": kind,
+        "at": at,
+        "list": replica.list_name(list_id),
+        "list_id": list_id,
+        "id": task_id,
+        "title": record.get("title", ""),
+        "importance": record.get("importance", "normal"),
+    }
+
+
+def _local_midnight(day):
+    return datetime.combine(day, time()).astimezone()
+
+
+def build_agenda(replica, days=14, today=None):
+    """Bucket the replica's items from the past up to `days` after today.
+
+    Returns {bucket: [item, ...]} for every name in BUCKETS, each list in
+    time order. An item is a dict with kind ("due", "reminder" or
+    "occurrence"), at (an aware local datetime; midnight for due dates and
+    occurrences), list, list_id, id, title and importance. Overdue holds due
+    dates only: a reminder that has gone off is not late.
+    """
+    today = today or date.today()
+    last_day = today + timedelta(days=days)
+    window_end = _local_midnight(last_day + timedelta(days=1)).timestamp()
+    buckets = {name: [] for name in BUCKETS}
+
+    for timestamp, kind, list_id, task_id in replica.between(None, window_end):
+        at = timestamp_to_local(timestamp)
+        bucket = _bucket(at.date(), today)
+        if bucket == "overdue" and kind != "due":
+            continue
+        buckets[bucket].append(_item(replica, kind, at, list_id, task_id))
+
+    occurrences = []
+    midnights = {}
+    for list_id, task_id in replica.recurring:
+        record = replica.task(list_id, task_id)
+        due = api_timestamp_to_datetime(record["dueDateTime"]).date()
+        after = max(due + timedelta(days=1), today)
+        days_in_window = expand_recurrence(
+            record["recurrence"], start=due, after=after, until=last_day
+        )
+        for day in days_in_window:
+            if day not in midnights:
+                midnights[day] = _local_midnight(day)
+            item = _item(replica, "occurrence", midnights[day], list_id, task_id)
+            occurrences.append((_bucket(day, today), item))
+    if occurrences:
+        for bucket, item in occurrences:
+            buckets[bucket].append(item)
+        for items in buckets.values():
+            items.sort(key=lambda item: item["at"])
+    return buckets
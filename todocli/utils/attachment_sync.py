@@ -0,0 +1,155 @@
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import todocli.graphapi.wrapper as wrapper
+from todocli.graphapi.oauth import get_oauth_session
+
+# Manifest of synced attachments, stored in the output directory
+MANIFEST_NAME = ".todo-attachments.json"
+
+# Default number of parallel downloads
+DEFAULT_JOBS = 4
+
+
+def load_manifest(output_dir):
+    """Load the sync manifest of output_dir. Returns {} if there is none."""
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), "r") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(output_dir, manifest):
+    """Atomically write the sync manifest of output_dir."""
+    fd, temp_path = tempfile.mkstemp(dir=output_dir, prefix=".", suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(temp_path, os.path.join(output_dir, MANIFEST_NAME))
+
+
+def safe_file_name(name, default="attachment"):
+    """Strip directory parts so a remote name cannot escape the output dir."""
+    name = (name or "").replace("\\", "/").split("/")[-1].strip()
+    if name in ("", ".", ".."):
+        return default
+    return name
+
+
+def _fingerprint(att):
+    return {
+        "name": att.get("name", ""),
+        "size": att.get("size", 0),
+        "last_modified": att.get("lastModifiedDateTime"),
+    }
+
+
+def plan_sync(output_dir, entries, manifest):
+    """Split entries into attachments to download and ones that are unchanged.
+
+    entries is a list of (task_id, subdir, attachment dict). An attachment is
+    unchanged when its name, size and lastModifiedDateTime match the manifest
+    and the file recorded there still exists. Files not tracked by the
+    manifest are never overwritten. Returns (to_download, unchanged) where
+    each item is (task_id, attachment, relative path).
+    """
+    to_download = []
+    unchanged = []
+    claimed = set()
+    owners = {entry.get("path"): att_id for att_id, entry in manifest.items()}
+
+    pending = []
+    for task_id, subdir, att in entries:
+        known = manifest.get(att["id"])
+        if (
+            known
+            and {k: known.get(k) for k in ("name", "size", "last_modified")}
+            == _fingerprint(att)
+            and os.path.isfile(os.path.join(output_dir, known["path"]))
+        ):
+            unchanged.append((task_id, att, known["path"]))
+            claimed.add(known["path"])
+        else:
+            pending.append((task_id, subdir, att))
+
+    for task_id, subdir, att in pending:
+        known = manifest.get(att["id"])
+        if known and known["path"] not in claimed:
+            rel_path = known["path"]
+        else:
+            file_name = safe_file_name(att.get("name"))
+            rel_path = os.path.join(subdir, file_name) if subdir else file_name
+            base, ext = os.path.splitext(rel_path)
+            counter = 1
+            while rel_path in claimed or (
+                owners.get(rel_path) != att["id"]
+                and os.path.exists(os.path.join(output_dir, rel_path))
+            ):
+                rel_path = f"{base}_{counter}{ext}"
+                counter += 1
+        claimed.add(rel_path)
+        to_download.append((task_id, att, rel_path))
+
+    return to_download, unchanged
+
+
+def sync_attachments(list_id, entries, output_dir, jobs=DEFAULT_JOBS, report=None):
+    """Download new or changed attachments into output_dir in parallel.
+
+    Downloads run on a pool of at most `jobs` threads sharing one session.
+    report(status, path, error) is called from the calling thread with status
+    "downloaded", "unchanged" or "failed". The manifest is updated for every
+    successful download. Returns (downloaded, unchanged, failed) lists of paths,
+    with failed holding (path, exception) tuples.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = load_manifest(output_dir)
+    to_download, unchanged = plan_sync(output_dir, entries, manifest)
+
+    for _, _, rel_path in unchanged:
+        if report:
+            report("unchanged", os.path.join(output_dir, rel_path), None)
+
+    downloaded = []
+    failed = []
+    if to_download:
+        session = get_oauth_session()
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            futures = {}
+            for task_id, att, rel_path in to_download:
+                path = os.path.join(output_dir, rel_path)
+                os.makedirs(os.path.dirname(path) or output_dir, exist_ok=True)
+                future = pool.submit(
+                    wrapper.download_attachment,
+                    attachment_id=att["id"],
+                    output_path=path,
+                    list_id=list_id,
+                    task_id=task_id,
+                    session=session,
+                )
+                futures[future] = (att, rel_path, path)
+
+            for future in as_completed(futures):
+                att, rel_path, path = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    failed.append((path, e))
+                    if report:
+                        report("failed", path, e)
+                    continue
+                manifest[att["id"]] = dict(_fingerprint(att), path=rel_path)
+                downloaded.append(path)
+                if report:
+                    report("downloaded", path, None)
+
+        save_manifest(output_dir, manifest)
+
+    return (
+        downloaded,
+        [os.path.join(output_dir, p) for _, _, p in unchanged],
+        failed,
+    )
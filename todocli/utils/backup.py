@@ -0,0 +1,329 @@
+"""
+Incremental backups of all lists into a directory, and restoring them.
+
+Layout of a backup directory:
+
+    state.json                  delta links per list, attachment hashes
+    segments/000001.ndjson.gz   one segment per run with changed records
+    objects/ab/ab12...          attachment contents, named by SHA-256
+
+Segment records are {"type": "list", ...}, {"type": "list_removed", "id"},
+{"type": "task", "list_id", ..., "steps", "links", "attachments"} and
+{"type": "task_removed", "list_id", "id"}. Replaying the segments in order
+gives the latest state.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+
+from requests import HTTPError
+
+import todocli.graphapi.wrapper as wrapper
+from todocli.graphapi.oauth import get_oauth_session
+from todocli.utils import json_codec, task_import
+
+STATE_NAME = "state.json"
+SEGMENTS_DIR = "segments"
+OBJECTS_DIR = "objects"
+
+# Per-task details stored in a backup
+BACKUP_PARTS = ("steps", "links", "attachments")
+
+# Task fields that can be set when recreating a task
+TASK_RESTORE_FIELDS = (
+    "title",
+    "body",
+    "importance",
+    "status",
+    "categories",
+    "dueDateTime",
+    "startDateTime",
+    "reminderDateTime",
+    "isReminderOn",
+    "completedDateTime",
+    "recurrence",
+)
+
+STEP_RESTORE_FIELDS = ("displayName", "isChecked", "checkedDateTime")
+
+LINK_RESTORE_FIELDS = ("webUrl", "applicationName", "displayName", "externalId")
+
+
+def load_state(backup_dir):
+    try:
+        with open(os.path.join(backup_dir, STATE_NAME), "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {"lists": {}, "attachments": {}, "segments": 0}
+
+
+def save_state(backup_dir, state):
+    """Atomically write the backup state."""
+    fd, temp_path = tempfile.mkstemp(dir=backup_dir, prefix=".", suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(temp_path, os.path.join(backup_dir, STATE_NAME))
+
+
+def object_path(backup_dir, digest):
+    return os.path.join(backup_dir, OBJECTS_DIR, digest[:2], digest)
+
+
+def _fingerprint(att):
+    return [att.get("size"), att.get("lastModifiedDateTime")]
+
+
+def store_attachment(backup_dir, state, list_id, task_id, att):
+    """Make sure att's content is in the object store. Returns its SHA-256.
+
+    Attachments whose size and modification time match a stored one are not
+    fetched again; content already in the store is not written again.
+    """
+    known = state["attachments"].get(att["id"])
+    if known and known["fingerprint"] == _fingerprint(att):
+        if os.path.exists(object_path(backup_dir, known["sha256"])):
+            return known["sha256"]
+
+    fd, temp_path = tempfile.mkstemp(dir=backup_dir, prefix=".", suffix=".part")
+    os.close(fd)
+    try:
+        wrapper.download_attachment(
+            attachment_id=att["id"],
+            output_path=temp_path,
+            list_id=list_id,
+            task_id=task_id,
+        )
+        digest = hashlib.sha256()
+        with open(temp_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        sha256 = digest.hexdigest()
+        path = object_path(backup_dir, sha256)
+        if os.path.exists(path):
+            os.remove(temp_path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    state["attachments"][att["id"]] = {
+        "fingerprint": _fingerprint(att),
+        "sha256": sha256,
+    }
+    return sha256
+
+
+class _Segment:
+    """Segment file that is only created once a record is written."""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+        self.records = 0
+
+    def write(self, record):
+        if self.file is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self.file = gzip.open(self.path + ".part", "wt", encoding="utf-8")
+        self.file.write(json_codec.dumps(record, compact=True) + "\n")
+        self.records += 1
+
+    def commit(self):
+        if self.file is not None:
+            self.file.close()
+            os.replace(self.path + ".part", self.path)
+
+    def discard(self):
+        if self.file is not None:
+            self.file.close()
+            os.remove(self.path + ".part")
+
+
+def _backup_list(backup_dir, state, segment, list_id, full, attachments):
+    """Write changed tasks of one list. Returns the number of task records."""
+    list_state = state["lists"][list_id]
+    delta_link = None if full else list_state.get("delta_link")
+    delta = {}
+    changed = []
+    count = 0
+
+    def flush():
+        parts = BACKUP_PARTS if attachments else BACKUP_PARTS[:2]
+        details = wrapper.get_task_parts_batch(
+            list_id, [task["id"] for task in changed], parts
+        )
+        for task in changed:
+            record = dict(task, type="task", list_id=list_id)
+            record.update(details[task["id"]])
+            for att in record.get("attachments", []):
+                att["sha256"] = store_attachment(
+                    backup_dir, state, list_id, task["id"], att
+                )
+            segment.write(record)
+        changed.clear()
+
+    try:
+        changes = wrapper.iter_task_delta(list_id, delta_link, state=delta)
+        for task in changes:
+            if "@removed" in task:
+                segment.write(
+                    {"type": "task_removed", "list_id": list_id, "id": task["id"]}
+                )
+            else:
+                changed.append(task)
+                if len(changed) == wrapper.BATCH_MAX_REQUESTS // len(BACKUP_PARTS):
+                    flush()
+            count += 1
+    except HTTPError as e:
+        if delta_link is None or getattr(e.response, "status_code", None) != 410:
+            raise
+        # Delta link expired: start over with a full pass for this list
+        return _backup_list(backup_dir, state, segment, list_id, True, attachments)
+    if changed:
+        flush()
+
+    list_state["delta_link"] = delta.get("delta_link")
+    return count
+
+
+def backup(backup_dir, full=False, attachments=True):
+    """Write an incremental backup segment of every list into backup_dir.
+
+    The first run (or full=True) stores every task; later runs only store
+    what changed since the previous run, using one delta link per list.
+    Returns (segment path or None if nothing changed, number of records).
+    """
+    os.makedirs(backup_dir, exist_ok=True)
+    state = load_state(backup_dir)
+    number = state.get("segments", 0) + 1
+    segment = _Segment(
+        os.path.join(backup_dir, SEGMENTS_DIR, f"{number:06d}.ndjson.gz")
+    )
+
+    try:
+        seen = set()
+        for todo_list in wrapper.iter_list_records():
+            list_id = todo_list["id"]
+            seen.add(list_id)
+            list_state = state["lists"].setdefault(list_id, {})
+            if full or list_state.get("displayName") != todo_list.get("displayName"):
+                segment.write(dict(todo_list, type="list"))
+                list_state["displayName"] = todo_list.get("displayName")
+            _backup_list(backup_dir, state, segment, list_id, full, attachments)
+
+        for list_id in list(state["lists"]):
+            if list_id not in seen:
+                segment.write({"type": "list_removed", "id": list_id})
+                del state["lists"][list_id]
+    except BaseException:
+        segment.discard()
+        raise
+
+    segment.commit()
+    if segment.records:
+        state["segments"] = number
+    save_state(backup_dir, state)
+    return (segment.path if segment.records else None), segment.records
+
+
+def read_backup(backup_dir):
+    """Replay every segment. Returns (lists, tasks) of the latest state.
+
+    lists maps list id -> list record, tasks maps list id -> {task id: record}.
+    """
+    lists, tasks = {}, {}
+    segments_dir = os.path.join(backup_dir, SEGMENTS_DIR)
+    names = sorted(os.listdir(segments_dir)) if os.path.isdir(segments_dir) else []
+    for name in names:
+        if not name.endswith(".ndjson.gz"):
+            continue
+        with gzip.open(os.path.join(segments_dir, name), "rb") as f:
+            for line in f:
+                record = json_codec.loads(line)
+                kind = record.get("type")
+                if kind == "list":
+                    lists[record["id"]] = record
+                    tasks.setdefault(record["id"], {})
+                elif kind == "list_removed":
+                    lists.pop(record["id"], None)
+                    tasks.pop(record["id"], None)
+                elif kind == "task":
+                    tasks.setdefault(record["list_id"], {})[record["id"]] = record
+                elif kind == "task_removed":
+                    tasks.get(record["list_id"], {}).pop(record["id"], None)
+    return lists, tasks
+
+
+def _pick(record, fields):
+    return {k: record[k] for k in fields if record.get(k) is not None}
+
+
+def creation_bodies(record):
+    """Request bodies recreating a task record with its steps and links.
+
+    Returns (task body, [step bodies], [link bodies]).
+    """
+    return (
+        _pick(record, TASK_RESTORE_FIELDS),
+        [_pick(step, STEP_RESTORE_FIELDS) for step in record.get("steps", [])],
+        [_pick(link, LINK_RESTORE_FIELDS) for link in record.get("links", [])],
+    )
+
+
+def restore(backup_dir, list_names=None, report=None):
+    """Recreate the backed-up lists and tasks in the account.
+
+    Lists are matched by name and created when missing. Tasks are created in
+    $batch requests before their steps and links (see
+    task_import.create_task_batch), then attachments are uploaded from the
+    object store. report(status, title, detail) is called per task with
+    status "restored" (detail: None or a step/link error) or "failed".
+    Returns a dict of counts.
+    """
+    lists, tasks = read_backup(backup_dir)
+    counts = {"lists": 0, "restored": 0, "failed": 0}
+    existing = {lst.display_name: lst.id for lst in wrapper.get_lists()}
+    session = get_oauth_session()
+
+    for old_list_id, list_record in lists.items():
+        name = list_record.get("displayName", "")
+        if list_names and name not in list_names:
+            continue
+        list_id = existing.get(name)
+        if list_id is None:
+            list_id, _ = wrapper.create_list(name)
+        counts["lists"] += 1
+
+        records = list(tasks.get(old_list_id, {}).values())
+        for start in range(0, len(records), wrapper.BATCH_MAX_REQUESTS):
+            chunk = records[start : start + wrapper.BATCH_MAX_REQUESTS]
+            items, links = [], {}
+            for n, record in enumerate(chunk):
+                body, steps, links[n] = creation_bodies(record)
+                items.append((n, list_id, body, steps, None))
+            results = task_import.create_task_batch(session, items, links=links)
+
+            for n, record in enumerate(chunk):
+                task_id, error = results[n]
+                if task_id is None:
+                    counts["failed"] += 1
+                    if report:
+                        report("failed", record.get("title", ""), error)
+                    continue
+                for att in record.get("attachments", []):
+                    wrapper.create_attachment(
+                        object_path(backup_dir, att["sha256"]),
+                        list_id=list_id,
+                        task_id=task_id,
+                        file_name=att.get("name"),
+                    )
+                counts["restored"] += 1
+                if report:
+                    report("restored", record.get("title", ""), error)
+
+    return counts
@@ -1,4 +1,6 @@
+import bisect
 import re
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Union
 
@@ -286,6 +288,10 @@ def api_timestamp_to_datetime(api_dt: Union[str, dict]):
     - With 7-digit microseconds: "2024-01-25T10:00:00.0000000Z"
     - Without microseconds: "2024-01-25T10:00:00Z"
     - Dict format: {"dateTime": "...", "timeZone": "UTC"}
+
+    The fixed-width date and time, the fraction cut to microseconds and a
+    UTC offset are joined into one string for fromisoformat, so each
+    timestamp is parsed in a single pass.
     """
     if api_dt is None:
         return None
@@ -298,24 +304,110 @@ def api_timestamp_to_datetime(api_dt: Union[str, dict]):
     else:
         raise TypeError(f"Expected str or dict, got {type(api_dt).__name__}")
 
-    # Strip trailing Z
-    dt_str = dt_str.rstrip("Z")
+    rest = dt_str[19:]
+    if rest[-1:] == "Z":
+        rest = rest[:-1]
+    if rest:
+        # Fractional seconds, truncated to 6 digits (Python's limit)
+        if rest[0] != "." or not rest[1:].isdigit():
+            raise ValueError(f"Unable to parse datetime: {api_dt}")
+        rest = rest[:7].ljust(7, "0")
+    try:
+        if dt_str[10] != "T":
+            raise ValueError
+        utc_dt = datetime.fromisoformat(dt_str[:19] + rest + "+00:00")
+    except (ValueError, IndexError):
+        raise ValueError(f"Unable to parse datetime: {api_dt}") from None
+    return _utc_to_local(utc_dt)
+
 
-    # Truncate fractional seconds to 6 digits (Python's %f limit)
-    if "." in dt_str:
-        base, frac = dt_str.rsplit(".", 1)
-        dt_str = f"{base}.{frac[:6]}"
+def _period_start(period):
+    return period[0]
 
-    # Try parsing with and without fractional seconds
-    for fmt in ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S"):
-        try:
-            dt = datetime.strptime(dt_str, fmt)
-            return utc_to_local(dt)
-        except ValueError:
-            continue
 
-    raise ValueError(f"Unable to parse datetime: {api_dt}")
+class _LocalOffsets:
+    """The local UTC offset, cached per period in which it does not change.
+
+    A period (e.g. a DST season) is found once, by probing time.localtime()
+    a day at a time and bisecting the day it changes, so converting many
+    timestamps does not query the OS timezone each time. The cache is
+    dropped when time.tzset() changes the local timezone.
+    """
+
+    # Periods are scanned a day at a time, up to SEARCH_DAYS either side
+    STEP = 86400
+    SEARCH_DAYS = 400
+
+    def __init__(self):
+        self.tzname = None
+        self.periods = []  # (start, end, tzinfo); end exclusive, sorted
+        self.last = (0, 0, None)
+
+    @staticmethod
+    def _zone_at(ts):
+        local = time.localtime(ts)
+        return local.tm_gmtoff, local.tm_zone
+
+    def _scan(self, ts, step, zone):
+        """Walk from ts by step while zone applies.
+
+        Returns (last second zone applies, first second it does not), the
+        latter None when no change was found within SEARCH_DAYS.
+        """
+        holds = ts
+        for _ in range(self.SEARCH_DAYS):
+            other = holds + step
+            if self._zone_at(other) != zone:
+                while abs(other - holds) > 1:
+                    middle = (holds + other) // 2
+                    if self._zone_at(middle) == zone:
+                        holds = middle
+                    else:
+                        other = middle
+                return holds, other
+            holds = other
+        return holds, None
+
+    def _period(self, ts):
+        zone = self._zone_at(ts)
+        start, _ = self._scan(ts, -self.STEP, zone)
+        last, end = self._scan(ts, self.STEP, zone)
+        if end is None:
+            end = last + 1
+        return start, end, timezone(timedelta(seconds=zone[0]), zone[1])
+
+    def tzinfo(self, ts):
+        start, end, tzinfo = self.last
+        if start <= ts < end and time.tzname is self.tzname:
+            return tzinfo
+        if time.tzname is not self.tzname:
+            self.tzname = time.tzname
+            self.periods = []
+        index = bisect.bisect_right(self.periods, ts, key=_period_start)
+        if index and ts < self.periods[index - 1][1]:
+            self.last = self.periods[index - 1]
+        else:
+            self.last = self._period(ts)
+            bisect.insort(self.periods, self.last, key=_period_start)
+        return self.last[2]
+
+
+_local_offsets = _LocalOffsets()
 
 
 def utc_to_local(_dt):
-    return _dt.replace(tzinfo=timezone.utc).astimezone(tz=None)
+    return _utc_to_local(_dt.replace(tzinfo=timezone.utc))
+
+
+def timestamp_to_local(ts):
+    """The aware local datetime of a POSIX timestamp."""
+    return _utc_to_local(datetime.fromtimestamp(ts, timezone.utc))
+
+
+def _utc_to_local(utc_dt):
+    try:
+        tzinfo = _local_offsets.tzinfo(int(utc_dt.timestamp()))
+    except (OverflowError, OSError, ValueError):
+        # Outside the range the OS can convert
+        return utc_dt.astimezone(tz=None)
+    return utc_dt.astimezone(tzinfo)
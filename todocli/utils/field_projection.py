@@ -0,0 +1,82 @@
+"""
+Field projection for --fields.
+
+A projection names the record keys a command outputs, e.g. "id,title,due".
+The same names decide what is fetched: the API properties behind them are
+sent to Graph as $select, so a narrow listing downloads and decodes only
+those fields (and no note bodies unless "note" is asked for).
+
+Keys are those of the model's to_dict(), plus keys a command adds, such as
+"steps" or "list". Date fields can be named without their "_datetime"
+suffix ("due" for "due_datetime"); output always uses the full key.
+"""
+
+from todocli.models import serialize
+
+
+class InvalidFields(Exception):
+    def __init__(self, spec, reason):
+        self.message = f"Invalid fields '{spec}': {reason}"
+        super(InvalidFields, self).__init__(self.message)
+
+
+_DATETIME_SUFFIX = "_datetime"
+
+
+class Projection:
+    """The keys named by spec for records of model_class.
+
+    extra lists keys a command adds to the model's own, e.g. ("steps",).
+    """
+
+    def __init__(self, model_class, spec, extra=()):
+        own = {key: (name, convert) for key, name, convert in model_class._json_fields}
+        known = list(own) + [key for key in extra if key not in own]
+        aliases = {
+            key[: -len(_DATETIME_SUFFIX)]: key
+            for key in known
+            if key.endswith(_DATETIME_SUFFIX)
+        }
+
+        self.keys = []
+        for part in spec.split(","):
+            name = part.strip()
+            if not name:
+                continue
+            key = aliases.get(name, name)
+            if key not in known:
+                raise InvalidFields(
+                    spec, f"unknown field '{name}', expected one of {', '.join(known)}"
+                )
+            if key not in self.keys:
+                self.keys.append(key)
+        if not self.keys:
+            raise InvalidFields(spec, "no fields given")
+
+        self._own = [(key, *own[key]) for key in self.keys if key in own]
+        self.api_keys = list(
+            dict.fromkeys(getattr(model_class, name).key for _, name, _ in self._own)
+        )
+
+    def wants(self, key):
+        return key in self.keys
+
+    def select(self, *more):
+        """The $select value: id, the projected properties and more."""
+        return ",".join(dict.fromkeys(["id", *self.api_keys, *more]))
+
+    def apply(self, value):
+        """The projected record of a model, serialize.WithFields or dict."""
+        if isinstance(value, dict):
+            return {key: value[key] for key in self.keys if key in value}
+        extra = {}
+        if isinstance(value, serialize.WithFields):
+            value, extra = value.model, value.extra
+        record = {
+            key: convert(getattr(value, name)) for key, name, convert in self._own
+        }
+        return {
+            key: record[key] if key in record else extra[key]
+            for key in self.keys
+            if key in record or key in extra
+        }
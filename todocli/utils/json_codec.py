@@ -0,0 +1,120 @@
+"""
+JSON encoding and decoding with an optional accelerated backend.
+
+orjson is used when it is installed, the standard library otherwise; the
+TODO_JSON_BACKEND environment variable ("json" or "orjson") overrides the
+choice. orjson parses response bytes without decoding them first. Both
+backends write the same text: indented by two spaces, or compact without
+any whitespace, with non-ASCII characters left unescaped. Models (anything
+with to_dict(), and serialize.WithFields) can be written directly.
+"""
+
+import json
+import os
+
+from todocli.models import serialize
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+BACKENDS = ("orjson", "json")
+
+_COMPACT_SEPARATORS = (",", ":")
+
+
+def _default_backend():
+    name = os.environ.get("TODO_JSON_BACKEND")
+    if name in BACKENDS and (name != "orjson" or orjson is not None):
+        return name
+    return "orjson" if orjson is not None else "json"
+
+
+_backend = _default_backend()
+
+
+def backend():
+    """Name of the backend in use."""
+    return _backend
+
+
+def set_backend(name):
+    """Switch to backend name ("orjson" or "json")."""
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend '{name}'")
+    if name == "orjson" and orjson is None:
+        raise ValueError("The orjson backend is not installed")
+    _backend = name
+
+
+def loads(data):
+    """Parse JSON from bytes or str."""
+    if _backend == "orjson":
+        return orjson.loads(data)
+    # Faster than json.loads(bytes), which detects the encoding first
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode()
+    return json.loads(data)
+
+
+def _to_builtin(value):
+    """orjson's fallback for models."""
+    if isinstance(value, serialize.WithFields):
+        return dict(_to_builtin(value.model), **value.extra)
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _orjson_options(compact):
+    options = orjson.OPT_NON_STR_KEYS
+    return options if compact else options | orjson.OPT_INDENT_2
+
+
+def dumps(value, compact=False):
+    """Return value as a JSON string."""
+    if _backend == "orjson":
+        return orjson.dumps(
+            value, default=_to_builtin, option=_orjson_options(compact)
+        ).decode()
+    return serialize.dumps(
+        value,
+        indent=None if compact else 2,
+        separators=_COMPACT_SEPARATORS if compact else None,
+        ensure_ascii=False,
+    )
+
+
+class _Utf8Writer:
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+    def write(self, text):
+        self.buffer.write(text.encode())
+
+
+def dump(value, fp, compact=False):
+    """Write value as JSON to the text file fp.
+
+    When fp has a binary buffer (like sys.stdout) the output is written to it
+    as UTF-8, whatever the text encoding of fp.
+    """
+    buffer = getattr(fp, "buffer", None)
+    if buffer is not None:
+        fp.flush()
+    if _backend == "orjson":
+        data = orjson.dumps(value, default=_to_builtin, option=_orjson_options(compact))
+        if buffer is not None:
+            buffer.write(data)
+        else:
+            fp.write(data.decode())
+        return
+    serialize.dump(
+        value,
+        _Utf8Writer(buffer) if buffer is not None else fp,
+        indent=None if compact else 2,
+        separators=_COMPACT_SEPARATORS if compact else None,
+        ensure_ascii=False,
+    )
@@ -0,0 +1,83 @@
+"""
+Record-per-line output formats for listing commands.
+
+Records are written as soon as they are produced, so consumers such as jq
+or awk can start before a long listing finishes:
+
+    ndjson  one compact JSON object per line
+    csv     RFC 4180, with a header row
+    tsv     tab-separated with a header row; backslash, tab, newline and
+            carriage return in values are escaped as \\\\, \\t, \\n and \\r
+
+In csv and tsv, None is written as an empty value, booleans as true/false,
+and lists or objects as compact JSON.
+"""
+
+import csv
+
+from todocli.models import serialize
+from todocli.utils import json_codec
+
+FORMATS = ("ndjson", "csv", "tsv")
+
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def model_fields(model_class):
+    """The record keys of a model's to_dict(), in order."""
+    return [key for key, *_ in model_class.JSON_FIELDS]
+
+
+def as_record(value):
+    """A dict for value: a dict, a model, or serialize.WithFields."""
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, serialize.WithFields):
+        return dict(as_record(value.model), **value.extra)
+    return value.to_dict()
+
+
+def _cell(value):
+    if value is None:
+        return ""
+    if value is True or value is False:
+        return "true" if value else "false"
+    if isinstance(value, (list, dict)):
+        return json_codec.dumps(value, compact=True)
+    return str(value)
+
+
+class RecordWriter:
+    """Write records to out in fmt, with columns fields (csv and tsv)."""
+
+    def __init__(self, fmt, fields, out):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format '{fmt}', expected one of {FORMATS}")
+        self.fmt = fmt
+        self.fields = list(fields)
+        self.out = out
+        self.count = 0
+        if fmt == "csv":
+            self._csv = csv.writer(out, lineterminator="\n")
+            self._csv.writerow(self.fields)
+        elif fmt == "tsv":
+            out.write("\t".join(self.fields) + "\n")
+
+    def write(self, value):
+        self.count += 1
+        if self.fmt == "ndjson":
+            self.out.write(json_codec.dumps(value, compact=True) + "\n")
+            return
+        record = as_record(value)
+        cells = [_cell(record.get(field)) for field in self.fields]
+        if self.fmt == "csv":
+            self._csv.writerow(cells)
+        else:
+            self.out.write(
+                "\t".join(cell.translate(_TSV_ESCAPES) for cell in cells) + "\n"
+            )
+
+    def write_all(self, values):
+        for value in values:
+            self.write(value)
+        return self.count
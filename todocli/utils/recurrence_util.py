@@ -1,5 +1,6 @@
 import re
-from datetime import date
+from calendar import monthrange
+from datetime import date, timedelta
 
 from todocli.models.todotask import RecurrencePatternType, DayOfWeek
 
@@ -120,3 +121,141 @@ def parse_recurrence(expr):
             "startDate": today.isoformat(),
         },
     }
+
+
+# Expansion of a Graph patternedRecurrence into the dates it occurs on.
+
+# date.weekday() of each DayOfWeek value
+_WEEKDAY_NUMBERS = {day.value: i for i, day in enumerate(DayOfWeek)}
+
+# patternedRecurrence "index" -> position among the matching days of a month
+_WEEK_INDEX = {"first": 0, "second": 1, "third": 2, "fourth": 3, "last": -1}
+
+
+def _iso_date(value):
+    return date.fromisoformat(value[:10]) if value else None
+
+
+def _weekdays(pattern, start):
+    days = pattern.get("daysOfWeek") or []
+    return sorted({_WEEKDAY_NUMBERS[d] for d in days if d in _WEEKDAY_NUMBERS}) or [
+        start.weekday()
+    ]
+
+
+def _month_day(year, month, pattern, start, weekdays):
+    """The pattern's day in a month, or None if the month has none.
+
+    Absolute patterns use dayOfMonth, moved to the last day of shorter
+    months; relative patterns the index-th day of the month that is one of
+    daysOfWeek (e.g. the last Friday, or with all weekdays, the first
+    working day).
+    """
+    last = monthrange(year, month)[1]
+    if not pattern["type"].startswith("relative"):
+        return date(year, month, min(pattern.get("dayOfMonth") or start.day, last))
+    first_weekday = date(year, month, 1).weekday()
+    days = [d for d in range(1, last + 1) if (first_weekday + d - 1) % 7 in weekdays]
+    index = _WEEK_INDEX.get(pattern.get("index"), 0)
+    if not days or index >= len(days):
+        return None
+    return date(year, month, days[index])
+
+
+def _candidates(pattern, start, skip_to):
+    """Yield the pattern's dates in order, endlessly.
+
+    Periods before the one containing skip_to are skipped. Dates before
+    start may come first; the caller drops them.
+    """
+    kind = pattern.get("type")
+    interval = max(int(pattern.get("interval") or 1), 1)
+    weekdays = _weekdays(pattern, start)
+
+    if kind == "daily":
+        # First multiple of interval days from start that is not before skip_to
+        periods = max(0, -(-(skip_to - start).days // interval))
+        day, step = start + timedelta(days=periods * interval), timedelta(interval)
+        while True:
+            yield day
+            day += step
+
+    elif kind == "weekly":
+        first_day = _WEEKDAY_NUMBERS.get(pattern.get("firstDayOfWeek"), 6)
+        week = start - timedelta(days=(start.weekday() - first_day) % 7)
+        offsets = sorted((weekday - first_day) % 7 for weekday in weekdays)
+        periods = max(0, (skip_to - week).days // 7 // interval)
+        week += timedelta(weeks=periods * interval)
+        step = timedelta(weeks=interval)
+        while True:
+            for offset in offsets:
+                yield week + timedelta(days=offset)
+            week += step
+
+    elif kind in ("absoluteMonthly", "relativeMonthly"):
+        months = (skip_to.year - start.year) * 12 + skip_to.month - start.month
+        index = start.year * 12 + start.month - 1
+        index += max(0, months // interval) * interval
+        while True:
+            year, month = divmod(index, 12)
+            day = _month_day(year, month + 1, pattern, start, weekdays)
+            if day is not None:
+                yield day
+            index += interval
+
+    elif kind in ("absoluteYearly", "relativeYearly"):
+        month = pattern.get("month") or start.month
+        year = start.year + max(0, (skip_to.year - start.year) // interval) * interval
+        while True:
+            day = _month_day(year, month, pattern, start, weekdays)
+            if day is not None:
+                yield day
+            year += interval
+
+
+def expand_recurrence(recurrence, start=None, after=None, until=None, limit=None):
+    """Yield the dates a Graph patternedRecurrence occurs on, in order.
+
+    start replaces the range's startDate (e.g. with a task's due date, from
+    which To Do schedules the next instance). Only dates from after (default
+    start) up to until, both included, are yielded, and at most limit of
+    them. The range's endDate or numberOfOccurrences also ends the series.
+    Periods before after are skipped arithmetically rather than walked,
+    except for numbered ranges, which are counted from the start. Without
+    until, limit or a range end the generator does not end.
+    """
+    pattern = recurrence.get("pattern") or {}
+    series = recurrence.get("range") or {}
+    start = start or _iso_date(series.get("startDate"))
+    if start is None or not pattern.get("type"):
+        return
+
+    end = _iso_date(series.get("endDate")) if series.get("type") == "endDate" else None
+    if until is not None:
+        end = until if end is None else min(end, until)
+    count = None
+    if series.get("type") == "numbered":
+        count = series.get("numberOfOccurrences") or 0
+    after = start if after is None or after < start else after
+    if limit is not None and limit <= 0:
+        return
+
+    seen = yielded = 0
+    try:
+        for day in _candidates(pattern, start, start if count is not None else after):
+            if end is not None and day > end:
+                return
+            if day < start:
+                continue
+            seen += 1
+            if count is not None and seen > count:
+                return
+            if day < after:
+                continue
+            yield day
+            yielded += 1
+            if yielded == limit:
+                return
+    except (OverflowError, ValueError):
+        # Past the last representable date
+        return
@@ -0,0 +1,192 @@
+"""
+Fire task reminders locally, from the reminderDateTime values of the
+replica (see replica.py), for `todo remind --daemon`.
+
+Pending reminders sit in a heap keyed by time, so the scheduler sleeps
+until the earliest one or the next sync, whichever comes first. A sync
+reports the tasks that changed; only those are rescheduled. Superseded heap
+entries are not searched for and removed but left in place and skipped
+when they reach the top.
+"""
+
+import heapq
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+from requests import RequestException
+
+from todocli.utils import replica as task_replica
+from todocli.utils.datetime_util import api_timestamp_to_datetime, timestamp_to_local
+
+NOTIFIERS = ("auto", "desktop", "stdout")
+
+
+def _record(replica, list_id, task_id):
+    return replica.lists.get(list_id, {}).get("tasks", {}).get(task_id)
+
+
+class ReminderQueue:
+    """Pending reminders of a replica, earliest first."""
+
+    def __init__(self):
+        self.heap = []  # (timestamp, list_id, task_id)
+        self.scheduled = {}  # (list_id, task_id) -> timestamp
+
+    def __len__(self):
+        return len(self.scheduled)
+
+    def load(self, replica, after):
+        """Schedule every active reminder of replica later than after."""
+        self.scheduled = {
+            (list_id, task_id): timestamp
+            for timestamp, kind, list_id, task_id in replica.between(after, None)
+            if kind == "reminder" and timestamp > after
+        }
+        self.heap = [(ts, *key) for key, ts in self.scheduled.items()]
+        heapq.heapify(self.heap)
+
+    def update(self, replica, keys, after):
+        """Reschedule the tasks with the given (list_id, task_id) keys."""
+        for key in keys:
+            list_id, task_id = key
+            record = _record(replica, list_id, task_id)
+            timestamp = None
+            if record and record.get("isReminderOn") and record.get("reminderDateTime"):
+                reminder = api_timestamp_to_datetime(record["reminderDateTime"])
+                timestamp = reminder.timestamp()
+            if timestamp is None or timestamp <= after:
+                self.scheduled.pop(key, None)
+            elif self.scheduled.get(key) != timestamp:
+                self.scheduled[key] = timestamp
+                heapq.heappush(self.heap, (timestamp, list_id, task_id))
+
+    def _drop_stale(self):
+        heap = self.heap
+        while heap and self.scheduled.get(heap[0][1:]) != heap[0][0]:
+            heapq.heappop(heap)
+
+    def next_time(self):
+        """The timestamp of the earliest pending reminder, or None."""
+        self._drop_stale()
+        return self.heap[0][0] if self.heap else None
+
+    def pop_due(self, now):
+        """Remove and return the (timestamp, list_id, task_id) entries due by now."""
+        due = []
+        self._drop_stale()
+        while self.heap and self.heap[0][0] <= now:
+            entry = heapq.heappop(self.heap)
+            del self.scheduled[entry[1:]]
+            due.append(entry)
+            self._drop_stale()
+        return due
+
+
+def _desktop_command():
+    if sys.platform == "darwin" and shutil.which("osascript"):
+        return "osascript"
+    if shutil.which("notify-send"):
+        return "notify-send"
+    return None
+
+
+def stdout_notifier(title, message):
+    print(f"{title}: {message}", flush=True)
+
+
+def desktop_notifier(command):
+    """A notifier showing a desktop notification with command."""
+
+    def notify(title, message):
+        if command == "osascript":
+            script = f"display notification {_applescript(message)} with title "
+            argv = ["osascript", "-e", script + _applescript(title)]
+        else:
+            argv = [command, "--app-name=todo", title, message]
+        subprocess.run(argv, check=False)
+
+    return notify
+
+
+def _applescript(text):
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def notifier(kind="auto"):
+    """The notify(title, message) function for kind (see NOTIFIERS).
+
+    "auto" uses a desktop notification where notify-send (or osascript on
+    macOS) is available and a display is attached, stdout otherwise.
+    """
+    command = _desktop_command() if kind != "stdout" else None
+    if kind == "desktop" and command is None:
+        raise ValueError("No desktop notifier found (notify-send or osascript)")
+    has_display = sys.platform == "darwin" or any(
+        os.environ.get(name) for name in ("DISPLAY", "WAYLAND_DISPLAY")
+    )
+    if command and (kind == "desktop" or has_display):
+        return desktop_notifier(command)
+    return stdout_notifier
+
+
+def run(
+    replica,
+    notify,
+    interval=300,
+    stop=None,
+    clock=time.time,
+    log=None,
+    on_change=None,
+):
+    """Fire the replica's reminders as they come due until stop is set.
+
+    Every interval seconds the replica is synced (one $batch request, see
+    replica.sync), saved, and the changed tasks are rescheduled. Network
+    errors are logged and the sync is retried at the next interval; so are
+    notifier errors.
+    on_change, if given, is called with no arguments after a sync that
+    found changes.
+    """
+    stop = stop or threading.Event()
+    log = log or sys.stderr
+    queue = ReminderQueue()
+    queue.load(replica, clock())
+    next_sync = clock() + interval
+
+    while not stop.is_set():
+        now = clock()
+        for timestamp, list_id, task_id in queue.pop_due(now):
+            record = _record(replica, list_id, task_id)
+            if record is None:
+                # Removed by a sync that failed before rescheduling
+                continue
+            at = timestamp_to_local(timestamp).strftime("%H:%M")
+            title = f"Reminder ({replica.list_name(list_id)}, {at})"
+            try:
+                notify(title, record.get("title", ""))
+            except (OSError, subprocess.SubprocessError) as e:
+                print(f"Notification failed: {e}", file=log, flush=True)
+
+        if now >= next_sync:
+            try:
+                changed = task_replica.sync(replica)
+                replica.save()
+                queue.update(replica, changed, now)
+                if changed and on_change is not None:
+                    on_change()
+            except (RequestException, OSError) as e:
+                print(f"Sync failed: {e}", file=log, flush=True)
+                # The replica may be partly updated; schedule what it holds
+                replica.rebuild_index()
+                queue.load(replica, now)
+            next_sync = now + interval
+
+        wake = next_sync
+        if queue.next_time() is not None:
+            wake = min(wake, queue.next_time())
+        stop.wait(max(0.0, wake - clock()))
+    return queue
@@ -0,0 +1,148 @@
+"""
+Buffered rendering of human-readable output.
+
+Listing commands build their output with a Renderer instead of calling
+print() per line: lines are collected and written in large chunks, so a
+long listing costs a few writes rather than one (or several) per task.
+Tables align their columns. When the output is a terminal, lines are cut
+to its width, shrinking a table's flexible column (usually the title)
+first; piped output is never cut.
+"""
+
+import shutil
+import sys
+import unicodedata
+
+# Write to the output once this many characters are pending
+CHUNK_SIZE = 1 << 16
+
+ELLIPSIS = "…"
+
+_AUTO = object()
+
+
+def _char_width(char):
+    if unicodedata.combining(char):
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+
+
+def display_width(text):
+    """Terminal columns text takes up (wide characters count twice)."""
+    if text.isascii():
+        return len(text)
+    return sum(map(_char_width, text))
+
+
+def truncate(text, width):
+    """text cut to width columns, ending in an ellipsis when it was cut."""
+    if display_width(text) <= width:
+        return text
+    if width < 1:
+        return ""
+    if text.isascii():
+        return text[: width - 1] + ELLIPSIS
+    used = 0
+    for i, char in enumerate(text):
+        used += _char_width(char)
+        if used > width - 1:
+            return text[:i] + ELLIPSIS
+    return text
+
+
+def pad(text, width):
+    """text padded with spaces to width columns."""
+    if text.isascii():
+        return text.ljust(width)
+    return text + " " * (width - display_width(text))
+
+
+def terminal_width(out):
+    """Columns of the terminal out writes to, or None if it is not one."""
+    isatty = getattr(out, "isatty", None)
+    if isatty is None or not isatty():
+        return None
+    return shutil.get_terminal_size().columns
+
+
+class Renderer:
+    """Collect output lines and write them to out (sys.stdout) in chunks.
+
+    Lines are cut to width columns; by default that is the terminal width
+    when out is a terminal and no limit otherwise (width=None). Use it as a
+    context manager, or call flush() when done.
+    """
+
+    def __init__(self, out=None, width=_AUTO):
+        self.out = sys.stdout if out is None else out
+        self.width = terminal_width(self.out) if width is _AUTO else width
+        self._parts = []
+        self._pending = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+
+    def line(self, text="", cut=True):
+        """Add a line; with cut=False it is kept whole on a terminal too."""
+        self.lines([text], cut)
+
+    def lines(self, texts, cut=True):
+        """Add several lines, see line()."""
+        if cut and self.width is not None:
+            texts = [truncate(text, self.width) for text in texts]
+        self._parts.extend(texts)
+        self._pending += sum(map(len, texts)) + len(texts)
+        if self._pending >= CHUNK_SIZE:
+            self.flush()
+
+    def table(self, rows, flex=None, sep="  "):
+        """Add rows with their cells aligned in columns.
+
+        A row is a tuple of cell strings, or a string added as a line of its
+        own (such as a step under its task). Empty trailing cells are left
+        out and the last cell of a row is not padded. When rows are wider
+        than the line width, column flex is narrowed to fit.
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        cell_rows = [row for row in rows if not isinstance(row, str)]
+        widths = [
+            max(map(display_width, [row[i] for row in cell_rows if i < len(row)]))
+            for i in range(max(map(len, cell_rows), default=0))
+        ]
+
+        cut_flex = False
+        if self.width is not None and flex is not None and flex < len(widths):
+            excess = sum(widths) + len(sep) * (len(widths) - 1) - self.width
+            if excess > 0:
+                widths[flex] = max(widths[flex] - excess, 1)
+                cut_flex = True
+
+        texts = []
+        for row in rows:
+            if isinstance(row, str):
+                texts.append(row)
+                continue
+            last = len(row) - 1
+            while last > 0 and not row[last]:
+                last -= 1
+            if cut_flex and flex <= last:
+                row = list(row)
+                row[flex] = truncate(row[flex], widths[flex])
+            cells = [pad(row[i], widths[i]) for i in range(last)]
+            cells.append(row[last])
+            texts.append(sep.join(cells))
+            if len(texts) >= 1024:
+                self.lines(texts)
+                texts = []
+        self.lines(texts)
+
+    def flush(self):
+        """Write the pending lines."""
+        if self._parts:
+            self._parts.append("")
+            self.out.write("\n".join(self._parts))
+            self._parts.clear()
+            self._pending = 0
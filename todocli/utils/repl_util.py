@@ -0,0 +1,59 @@
+import os
+import shlex
+
+try:
+    import readline
+except ImportError:  # pragma: no cover - not available on every platform
+    readline = None
+
+# Number of lines kept in the interactive history file
+HISTORY_LENGTH = 1000
+
+
+def completion_candidates(text, words):
+    """Return the words starting with text, quoting ones that contain spaces."""
+    candidates = []
+    for word in words:
+        quoted = shlex.quote(word) if " " in word else word
+        if quoted.startswith(text) or word.startswith(text):
+            candidates.append(quoted)
+    return sorted(set(candidates))
+
+
+def make_completer(get_words):
+    """Create a readline completer over the words returned by get_words()."""
+    matches = []
+
+    def complete(text, state):
+        if state == 0:
+            matches[:] = completion_candidates(text, get_words())
+        return matches[state] if state < len(matches) else None
+
+    return complete
+
+
+def setup_readline(history_file, get_words):
+    """Load history and enable tab completion. Returns a function saving history.
+
+    Does nothing (and returns a no-op) when readline is not available.
+    """
+    if readline is None:
+        return lambda: None
+
+    try:
+        readline.read_history_file(history_file)
+    except OSError:
+        pass
+    readline.set_history_length(HISTORY_LENGTH)
+    readline.set_completer_delims(" \t\n")
+    readline.set_completer(make_completer(get_words))
+    readline.parse_and_bind("tab: complete")
+
+    def save_history():
+        try:
+            os.makedirs(os.path.dirname(history_file), exist_ok=True)
+            readline.write_history_file(history_file)
+        except OSError:
+            pass
+
+    return save_history
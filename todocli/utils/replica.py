@@ -0,0 +1,215 @@
+"""
+A local replica of the open tasks of every list, for views that must not
+wait for the network, such as `todo agenda`, and for the reminder
+scheduler (`todo remind --daemon`).
+
+The replica is one JSON file in the config directory:
+
+    {"version": 1, "synced_at": "2026-10-19T08:00:00+00:00",
+     "lists": {list_id: {"name": ..., "delta_link": ...,
+                         "tasks": {task_id: record}}},
+     "index": [[timestamp, kind, list_id, task_id], ...],
+     "recurring": [[list_id, task_id], ...]}
+
+sync() updates it from every list's task delta link in one $batch request.
+Completed and deleted tasks are dropped, and records keep only
+RECORD_FIELDS. The index holds the due date ("due") and active reminder
+("reminder") of every task as POSIX timestamps, sorted, so a time window is
+found by bisection instead of a scan; it is rebuilt whenever the replica
+is saved.
+"""
+
+import bisect
+import os
+import tempfile
+from datetime import datetime, timezone
+
+from requests import HTTPError
+
+import todocli.graphapi.wrapper as wrapper
+from todocli.graphapi.oauth import config_dir
+from todocli.utils import json_codec
+from todocli.utils.datetime_util import api_timestamp_to_datetime
+
+REPLICA_NAME = "replica.json"
+
+VERSION = 1
+
+# Task properties kept in the replica
+RECORD_FIELDS = (
+    "id",
+    "title",
+    "status",
+    "importance",
+    "isReminderOn",
+    "createdDateTime",
+    "lastModifiedDateTime",
+    "dueDateTime",
+    "reminderDateTime",
+    "recurrence",
+)
+
+
+class ReplicaNotFound(Exception):
+    def __init__(self, path):
+        self.message = (
+            f"No local replica at '{path}' yet; "
+            "run 'todo agenda --refresh' to download your tasks"
+        )
+        super(ReplicaNotFound, self).__init__(self.message)
+
+
+def replica_path():
+    return os.path.join(config_dir, REPLICA_NAME)
+
+
+def _timestamp(entry):
+    return entry[0]
+
+
+class Replica:
+    """Open tasks by list, with the time index of their dates."""
+
+    def __init__(self, data=None):
+        data = data or {}
+        self.synced_at = data.get("synced_at")
+        self.lists = data.get("lists", {})
+        self.index = data.get("index", [])
+        self.recurring = data.get("recurring", [])
+
+    @classmethod
+    def load(cls, path=None):
+        """The replica saved at path (default replica_path()), or None."""
+        try:
+            with open(path or replica_path(), "rb") as f:
+                data = json_codec.loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != VERSION:
+            return None
+        return cls(data)
+
+    def save(self, path=None):
+        """Rebuild the index and atomically write the replica."""
+        self.rebuild_index()
+        path = path or replica_path()
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        data = {
+            "version": VERSION,
+            "synced_at": self.synced_at,
+            "lists": self.lists,
+            "index": self.index,
+            "recurring": self.recurring,
+        }
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json_codec.dump(data, f, compact=True)
+        os.replace(temp_path, path)
+
+    def task(self, list_id, task_id):
+        return self.lists[list_id]["tasks"][task_id]
+
+    def list_name(self, list_id):
+        return self.lists[list_id]["name"]
+
+    def apply(self, list_id, changes):
+        """Apply task delta records to a list's tasks."""
+        tasks = self.lists[list_id]["tasks"]
+        for change in changes:
+            if "@removed" in change or change.get("status") == "completed":
+                tasks.pop(change["id"], None)
+            else:
+                tasks[change["id"]] = {
+                    key: change[key] for key in RECORD_FIELDS if key in change
+                }
+
+    def rebuild_index(self):
+        index = []
+        recurring = []
+        for list_id, todo_list in self.lists.items():
+            for task_id, record in todo_list["tasks"].items():
+                due = record.get("dueDateTime")
+                if due:
+                    timestamp = api_timestamp_to_datetime(due).timestamp()
+                    index.append([timestamp, "due", list_id, task_id])
+                    if record.get("recurrence"):
+                        recurring.append([list_id, task_id])
+                reminder = record.get("reminderDateTime")
+                if reminder and record.get("isReminderOn"):
+                    timestamp = api_timestamp_to_datetime(reminder).timestamp()
+                    index.append([timestamp, "reminder", list_id, task_id])
+        index.sort()
+        self.index = index
+        self.recurring = recurring
+
+    def between(self, start=None, end=None):
+        """Index entries with start <= timestamp < end; None is unbounded."""
+        low = 0
+        if start is not None:
+            low = bisect.bisect_left(self.index, start, key=_timestamp)
+        high = len(self.index)
+        if end is not None:
+            high = bisect.bisect_left(self.index, end, lo=low, key=_timestamp)
+        return self.index[low:high]
+
+
+def _apply_delta(replica, list_id, delta, changed):
+    """Apply one list's delta (see wrapper.get_task_deltas_batch), adding the
+    keys of the tasks it touches to changed."""
+    todo_list = replica.lists[list_id]
+    if delta["status"] != 200:
+        raise HTTPError(
+            f"Could not sync list '{todo_list['name']}': "
+            f"request failed with status {delta['status']}"
+        )
+    if todo_list["delta_link"] is None:
+        # A full pass lists every task, so it replaces what was there
+        changed.update((list_id, task_id) for task_id in todo_list["tasks"])
+        todo_list["tasks"] = {}
+    replica.apply(list_id, delta["changes"])
+    changed.update((list_id, change["id"]) for change in delta["changes"])
+    todo_list["delta_link"] = delta["delta_link"]
+
+
+def sync(replica):
+    """Bring replica up to date with the server.
+
+    The lists and the changes of every known list since its delta link come
+    in one $batch request (one per 19 lists), however many lists there are.
+    New lists, and lists whose delta link expired, then get a full pass,
+    batched the same way. Returns the (list_id, task_id) keys of the tasks
+    added, changed or removed. The replica is not saved.
+    """
+    delta_links = {
+        list_id: todo_list["delta_link"] for list_id, todo_list in replica.lists.items()
+    }
+    records, deltas = wrapper.get_task_deltas_batch(delta_links, include_lists=True)
+    names = {record["id"]: record.get("displayName", "") for record in records}
+    changed = set()
+    for list_id in list(replica.lists):
+        if list_id not in names:
+            removed = replica.lists.pop(list_id)["tasks"]
+            changed.update((list_id, task_id) for task_id in removed)
+
+    full_pass = []
+    for list_id, name in names.items():
+        todo_list = replica.lists.setdefault(
+            list_id, {"name": name, "delta_link": None, "tasks": {}}
+        )
+        todo_list["name"] = name
+        delta = deltas.get(list_id)
+        if delta is None or delta["status"] == 410:
+            # A new list, or an expired delta link
+            todo_list["delta_link"] = None
+            full_pass.append(list_id)
+        else:
+            _apply_delta(replica, list_id, delta, changed)
+
+    if full_pass:
+        _, deltas = wrapper.get_task_deltas_batch(dict.fromkeys(full_pass))
+        for list_id in full_pass:
+            _apply_delta(replica, list_id, deltas[list_id], changed)
+
+    replica.synced_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    return changed
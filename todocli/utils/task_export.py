@@ -0,0 +1,89 @@
+import gzip
+import io
+import sys
+
+import todocli.graphapi.wrapper as wrapper
+from todocli.utils import json_codec
+
+# Optional per-task details, in output order
+DETAIL_PARTS = ("steps", "links", "attachments")
+
+
+def open_output(path, compress=False):
+    """Open a text stream for NDJSON output; path "-" (or None) is stdout.
+
+    With compress, or a path ending in ".gz", the stream is gzip-compressed.
+    """
+    compress = compress or bool(path and path.endswith(".gz"))
+    to_stdout = path in (None, "-")
+    if not compress:
+        if to_stdout:
+            return _KeepOpen(sys.stdout)
+        return open(path, "w", encoding="utf-8")
+    binary = gzip.GzipFile(
+        fileobj=sys.stdout.buffer if to_stdout else None,
+        filename=None if to_stdout else path,
+        mode="wb",
+    )
+    return io.TextIOWrapper(binary, encoding="utf-8")
+
+
+class _KeepOpen:
+    """Context manager around a stream that must not be closed (stdout)."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def __enter__(self):
+        return self.stream
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stream.flush()
+
+
+def _write(out, record):
+    out.write(json_codec.dumps(record, compact=True) + "\n")
+
+
+def export(out, list_names=None, parts=(), include_completed=True):
+    """Write lists and their tasks to out as NDJSON, one record per line.
+
+    Records are {"type": "list", ...} followed by {"type": "task",
+    "list_id": ..., ...} for each of its tasks, as returned by the API, with
+    the requested DETAIL_PARTS added per task. Lists and tasks are read page
+    by page and details are fetched for one $batch worth of tasks at a time,
+    so memory use does not grow with the account size. Returns (number of
+    lists, number of tasks).
+    """
+    parts = [part for part in DETAIL_PARTS if part in parts]
+    per_batch = wrapper.BATCH_MAX_REQUESTS // max(1, len(parts))
+    list_count = task_count = 0
+
+    for todo_list in wrapper.iter_list_records():
+        if list_names and todo_list.get("displayName") not in list_names:
+            continue
+        list_id = todo_list["id"]
+        _write(out, dict(todo_list, type="list"))
+        list_count += 1
+
+        pending = []
+
+        def flush():
+            details = wrapper.get_task_parts_batch(
+                list_id, [task["id"] for task in pending], parts
+            )
+            for task in pending:
+                record = dict(task, type="task", list_id=list_id)
+                record.update(details[task["id"]])
+                _write(out, record)
+            pending.clear()
+
+        for task in wrapper.iter_task_records(list_id, include_completed):
+            pending.append(task)
+            task_count += 1
+            if len(pending) == per_batch:
+                flush()
+        if pending:
+            flush()
+
+    return list_count, task_count
@@ -0,0 +1,426 @@
+import csv
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+
+import todocli.graphapi.wrapper as wrapper
+from todocli.graphapi.oauth import config_dir, get_oauth_session
+from todocli.utils import json_codec
+from todocli.utils.datetime_util import parse_datetime
+from todocli.utils.recurrence_util import parse_recurrence
+
+# Task fields an input record can map to
+FIELDS = (
+    "title",
+    "list",
+    "due",
+    "reminder",
+    "importance",
+    "recurrence",
+    "note",
+    "steps",
+)
+
+FORMATS = ("csv", "json", "ndjson")
+
+# Separator of several steps in one CSV cell
+STEP_SEPARATOR = ";"
+
+# Default number of $batch requests in flight
+DEFAULT_JOBS = 4
+
+# Checkpoints of imports from files, keyed by content hash
+CHECKPOINT_DIR = os.path.join(config_dir, "imports")
+
+_IMPORTANT_VALUES = ("high", "important", "true", "yes", "1")
+
+
+class ImportRecordError(Exception):
+    def __init__(self, number, reason):
+        self.message = "Record {}: {}".format(number, reason)
+        super(ImportRecordError, self).__init__(self.message)
+
+
+def detect_format(path, fmt=None):
+    """Return the input format from fmt or the file extension (stdin: ndjson)."""
+    if fmt:
+        return fmt
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    if ext in ("jsonl", "ndjson"):
+        return "ndjson"
+    if ext in FORMATS:
+        return ext
+    return "ndjson" if path == "-" else "csv"
+
+
+def read_records(stream, fmt):
+    """Yield raw record dicts from a text stream.
+
+    CSV and NDJSON are read record by record; a JSON array is loaded whole.
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+    elif fmt == "json":
+        data = json_codec.loads(stream.read())
+        if not isinstance(data, list):
+            raise ValueError("JSON input must be an array of objects")
+        yield from data
+    else:
+        for line in stream:
+            if line.strip():
+                yield json_codec.loads(line)
+
+
+def parse_mapping(pairs):
+    """Turn ["title=Summary", ...] into {"title": "Summary"}."""
+    mapping = {}
+    for pair in pairs or []:
+        field, sep, column = pair.partition("=")
+        if not sep or field not in FIELDS:
+            raise ValueError(
+                f"Invalid mapping '{pair}', expected FIELD=COLUMN with FIELD "
+                f"one of: {', '.join(FIELDS)}"
+            )
+        mapping[field] = column
+    return mapping
+
+
+def map_record(raw, mapping):
+    """Pick task fields from a raw record by mapped or same-named columns."""
+    if not isinstance(raw, dict):
+        return {}
+    columns = {str(k).strip().lower(): v for k, v in raw.items()}
+    record = {}
+    for field in FIELDS:
+        column = mapping.get(field, field)
+        value = raw.get(column, columns.get(column.lower()))
+        if value not in (None, ""):
+            record[field] = value
+    return record
+
+
+def _parse_when(value):
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return parse_datetime(value)
+
+
+def build_task(number, record, default_list):
+    """Convert a mapped record into (list_name, request body, steps)."""
+    title = str(record.get("title", "")).strip()
+    if not title:
+        raise ImportRecordError(number, "missing title")
+
+    steps = record.get("steps") or []
+    if isinstance(steps, str):
+        steps = [s.strip() for s in steps.split(STEP_SEPARATOR)]
+    steps = [str(s) for s in steps if str(s).strip()]
+
+    try:
+        due = _parse_when(record["due"]) if "due" in record else None
+        reminder = _parse_when(record["reminder"]) if "reminder" in record else None
+        recurrence = parse_recurrence(record.get("recurrence"))
+    except Exception as e:
+        raise ImportRecordError(number, getattr(e, "message", None) or str(e))
+
+    importance = str(record.get("importance", "")).strip().lower()
+    body = wrapper.task_create_body(
+        title,
+        reminder_datetime=reminder,
+        due_datetime=due,
+        important=importance in _IMPORTANT_VALUES,
+        recurrence=recurrence,
+        note=record.get("note"),
+    )
+    return record.get("list") or default_list, body, steps
+
+
+def checkpoint_path_for(file_path):
+    """Checkpoint location for an input file, keyed by its content."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return os.path.join(CHECKPOINT_DIR, digest.hexdigest()[:32] + ".json")
+
+
+class Checkpoint:
+    """Import progress by record number, saved atomically.
+
+    created maps record -> task id once the task exists, done lists records
+    whose steps are created too, and in_flight lists records sent but not yet
+    answered (they are looked up by title on resume).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.created = {}
+        self.done = set()
+        self.in_flight = set()
+        if path and os.path.isfile(path):
+            with open(path, "r") as f:
+                data = json.load(f)
+            self.created = {int(k): v for k, v in data.get("created", {}).items()}
+            self.done = set(data.get("done", []))
+            self.in_flight = set(data.get("in_flight", []))
+
+    def save(self):
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {
+                    "created": {str(k): v for k, v in self.created.items()},
+                    "done": sorted(self.done),
+                    "in_flight": sorted(self.in_flight),
+                },
+                f,
+            )
+        os.replace(temp_path, self.path)
+
+    def remove(self):
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+# Task sub-collections created after their task, with the error label used
+CHILD_COLLECTIONS = {"checklistItems": "Steps", "linkedResources": "Links"}
+
+
+def _child_requests(list_id, task_id, children, first_id):
+    """Sub-requests creating children in order, each depending on the previous.
+
+    children is a list of (collection, request body) pairs.
+    """
+    task_url = f"{wrapper.BASE_RELATE_URL}/{list_id}/tasks/{task_id}"
+    requests = []
+    for i, (collection, body) in enumerate(children):
+        request = {
+            "id": str(first_id + i),
+            "method": "POST",
+            "url": f"{task_url}/{collection}",
+            "headers": {"Content-Type": "application/json"},
+            "body": body,
+        }
+        if i > 0:
+            request["dependsOn"] = [str(first_id + i - 1)]
+        requests.append(request)
+    return requests
+
+
+def _create_children(session, items):
+    """Create steps and links for [(number, list_id, task_id, children)].
+
+    Children of one task are chained with dependsOn so they keep their order.
+    A task's children never span two batches unless it has more than
+    BATCH_MAX_REQUESTS of them. Returns {number: error message or None}.
+    """
+    errors = {number: None for number, _, _, _ in items}
+    batch, owners = [], {}
+
+    def send():
+        if not batch:
+            return
+        try:
+            responses = wrapper._send_batch(session, batch)
+        except Exception as e:
+            responses = {}
+            for number, label in owners.values():
+                errors[number] = errors[number] or f"{label}: {e}"
+        for sub_id, resp in responses.items():
+            number, label = owners[sub_id]
+            if resp.get("status", 500) >= 400 and not errors[number]:
+                errors[number] = f"{label}: {wrapper._batch_error_message(resp)}"
+        batch.clear()
+        owners.clear()
+
+    for number, list_id, task_id, children in items:
+        for start in range(0, len(children), wrapper.BATCH_MAX_REQUESTS):
+            chunk = children[start : start + wrapper.BATCH_MAX_REQUESTS]
+            if len(batch) + len(chunk) > wrapper.BATCH_MAX_REQUESTS:
+                send()
+            requests = _child_requests(list_id, task_id, chunk, len(batch))
+            for request, (collection, _) in zip(requests, chunk):
+                batch.append(request)
+                owners[request["id"]] = (number, CHILD_COLLECTIONS[collection])
+        if len(children) > wrapper.BATCH_MAX_REQUESTS:
+            send()
+    send()
+    return errors
+
+
+def create_task_batch(session, items, links=None):
+    """Create the tasks of one batch, then their steps and links.
+
+    items is a list of (number, list_id, body, steps, task_id) where task_id
+    is set for tasks created by an earlier run. A step is its name or a full
+    checklistItem request body; links optionally maps number -> list of
+    linkedResource request bodies. Returns {number: (task_id, error)};
+    task_id is None when the task could not be created.
+    """
+    links = links or {}
+    results = {}
+    to_create = [item for item in items if item[4] is None]
+    if to_create:
+        sub_requests = [
+            {
+                "id": str(i),
+                "method": "POST",
+                "url": f"{wrapper.BASE_RELATE_URL}/{list_id}/tasks",
+                "headers": {"Content-Type": "application/json"},
+                "body": body,
+            }
+            for i, (_, list_id, body, _, _) in enumerate(to_create)
+        ]
+        try:
+            responses = wrapper._send_batch(session, sub_requests)
+        except Exception as e:
+            responses = {}
+            for number, *_ in to_create:
+                results[number] = (None, str(e))
+        for i, (number, *_) in enumerate(to_create):
+            resp = responses.get(str(i))
+            if resp is None:
+                results.setdefault(number, (None, "No response for this record"))
+            elif resp.get("status", 500) >= 400:
+                results[number] = (None, wrapper._batch_error_message(resp))
+            else:
+                results[number] = (resp["body"]["id"], None)
+
+    child_items = []
+    for number, list_id, _, steps, task_id in items:
+        task_id = task_id or results[number][0]
+        results[number] = (task_id, results.get(number, (None, None))[1])
+        children = [
+            ("checklistItems", {"displayName": step} if isinstance(step, str) else step)
+            for step in steps
+        ]
+        children += [("linkedResources", link) for link in links.get(number, [])]
+        if task_id and children:
+            child_items.append((number, list_id, task_id, children))
+    for number, error in _create_children(session, child_items).items():
+        if error:
+            results[number] = (results[number][0], error)
+    return results
+
+
+def _remaining_steps(list_id, task_id, steps):
+    """Steps not yet present on a task created by an interrupted run."""
+    existing = [
+        item.display_name
+        for item in wrapper.get_checklist_items(list_id=list_id, task_id=task_id)
+    ]
+    remaining = list(steps)
+    for name in existing:
+        if name in remaining:
+            remaining.remove(name)
+    return remaining
+
+
+def import_tasks(
+    records,
+    default_list="Tasks",
+    mapping=None,
+    checkpoint=None,
+    jobs=DEFAULT_JOBS,
+    report=None,
+):
+    """Create tasks from raw records, pipelined through $batch requests.
+
+    At most `jobs` batches are in flight at once and records are read only as
+    batches complete, so memory stays bounded. Progress is checkpointed after
+    every batch; records already created by an earlier run are skipped, and
+    records interrupted in flight are matched by title instead of created
+    again. report(status, number, detail) is called with status "created",
+    "skipped" or "failed". Returns a dict of counts.
+    """
+    checkpoint = checkpoint or Checkpoint(None)
+    mapping = mapping or {}
+    counts = {"created": 0, "skipped": 0, "failed": 0}
+    list_ids = {}
+    session = get_oauth_session()
+
+    def notify(status, number, detail=None):
+        counts[status] += 1
+        if report:
+            report(status, number, detail)
+
+    def collect(future):
+        for number, (task_id, error) in future.result().items():
+            checkpoint.in_flight.discard(number)
+            if task_id:
+                checkpoint.created[number] = task_id
+            if task_id and not error:
+                checkpoint.done.add(number)
+                notify("created", number, task_id)
+            else:
+                notify("failed", number, error)
+        checkpoint.save()
+
+    def prepare(number, raw):
+        """Return a batch item for the record, or None if nothing to do."""
+        if number in checkpoint.done:
+            notify("skipped", number)
+            return None
+        list_name, body, steps = build_task(
+            number, map_record(raw, mapping), default_list
+        )
+        if list_name not in list_ids:
+            list_ids[list_name] = wrapper.get_list_id_by_name(list_name)
+        list_id = list_ids[list_name]
+
+        task_id = checkpoint.created.get(number)
+        if task_id is None and number in checkpoint.in_flight:
+            # Sent by an interrupted run: the task may exist already
+            try:
+                task_id = wrapper.get_task_id_by_name(list_name, body["title"])
+            except wrapper.TaskNotFoundByName:
+                pass
+        if task_id is not None:
+            steps = _remaining_steps(list_id, task_id, steps)
+        return number, list_id, body, steps, task_id
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        in_flight = set()
+        batch = []
+
+        def submit():
+            for item in batch:
+                checkpoint.in_flight.add(item[0])
+            checkpoint.save()
+            in_flight.add(pool.submit(create_task_batch, session, list(batch)))
+            batch.clear()
+
+        for number, raw in enumerate(records, start=1):
+            try:
+                item = prepare(number, raw)
+            except ImportRecordError as e:
+                notify("failed", number, e.message)
+                continue
+            except wrapper.ListNotFound as e:
+                notify("failed", number, e.message)
+                continue
+            if item is None:
+                continue
+            batch.append(item)
+            if len(batch) == wrapper.BATCH_MAX_REQUESTS:
+                while len(in_flight) >= max(1, jobs):
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        in_flight.discard(future)
+                        collect(future)
+                submit()
+
+        if batch:
+            submit()
+        for future in list(in_flight):
+            collect(future)
+
+    return counts
@@ -0,0 +1,480 @@
+"""
+Task queries compiled to OData, and the field assignments of bulk updates.
+
+A query combines conditions FIELD OP VALUE with "and", "or", "not" and
+parentheses, e.g.
+
+    due < 2026-11-01 and importance = high and title ~ "invoice"
+
+The planner splits a query into the part Graph's $filter can evaluate, which
+is sent with the task listing, and a residual that is evaluated locally on
+each returned page. An "and" pushes every pushable operand; an "or" is pushed
+only when all of its operands are; "not" and comparisons with none always
+run locally.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+import todocli.graphapi.wrapper as wrapper
+from todocli.models.todotask import TaskImportance, TaskStatus
+from todocli.utils.datetime_util import api_timestamp_to_datetime, parse_datetime
+from todocli.utils.recurrence_util import parse_recurrence
+
+
+class InvalidCondition(Exception):
+    def __init__(self, expr, reason):
+        self.message = f"Invalid condition '{expr}': {reason}"
+        super(InvalidCondition, self).__init__(self.message)
+
+
+class InvalidAssignment(Exception):
+    def __init__(self, expr, reason):
+        self.message = f"Invalid assignment '{expr}': {reason}"
+        super(InvalidAssignment, self).__init__(self.message)
+
+
+# Condition field -> (API property, kind)
+FIELDS = {
+    "title": ("title", "string"),
+    "status": ("status", "status"),
+    "importance": ("importance", "importance"),
+    "due": ("dueDateTime", "datetime"),
+    "reminder": ("reminderDateTime", "datetime"),
+    "completed": ("completedDateTime", "datetime"),
+    "created": ("createdDateTime", "timestamp"),
+    "modified": ("lastModifiedDateTime", "timestamp"),
+}
+
+# Longest first, so "<=" is not read as "<"
+OPERATORS = ("<=", ">=", "!=", "=", "<", ">", "~")
+
+_ODATA_OPERATORS = {
+    "=": "eq",
+    "!=": "ne",
+    "<": "lt",
+    "<=": "le",
+    ">": "gt",
+    ">=": "ge",
+}
+
+_ENUMS = {
+    "status": {status.value.lower(): status.value for status in TaskStatus},
+    "importance": {imp.value: imp.value for imp in TaskImportance},
+}
+
+# Values that mean "not set"
+NONE_VALUES = ("none", "null", "")
+
+KEYWORDS = ("and", "or", "not")
+
+_TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<paren>[()])
+        | (?P<op>""" + "|".join(re.escape(op) for op in OPERATORS) + r""")
+        | "(?P<dquoted>(?:[^"\\]|\\.)*)"
+        | '(?P<squoted>(?:[^'\\]|\\.)*)'
+        | (?P<word>[^\s()<>=!~]+)
+    )""",
+    re.VERBOSE,
+)
+
+
+def _parse_when(text):
+    """Parse a date/time value; bare dates and day words mean midnight."""
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    days = {"today": 0, "tomorrow": 1, "yesterday": -1}
+    if text in days:
+        return today + timedelta(days=days[text])
+    if text == "now":
+        return datetime.now()
+    if re.match(r"\d{4}-\d{1,2}-\d{1,2}$", text):
+        return datetime.strptime(text, "%Y-%m-%d")
+    return parse_datetime(text)
+
+
+def _quote(value):
+    if value and re.match(r"[^\s()<>=!~\"']+$", value):
+        return value
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+class Condition:
+    """One FIELD OP VALUE comparison."""
+
+    def __init__(self, field, op, raw, expr=None):
+        expr = expr or f"{field}{op}{raw}"
+        self.field, self.op, self.raw = field, op, raw
+        if field not in FIELDS:
+            raise InvalidCondition(
+                expr, f"unknown field, expected one of {', '.join(FIELDS)}"
+            )
+        self.property, self.kind = FIELDS[field]
+
+        if op == "~" and self.kind != "string":
+            raise InvalidCondition(expr, "~ only applies to title")
+        if raw.lower() in NONE_VALUES and self.kind != "string":
+            if op not in ("=", "!="):
+                raise InvalidCondition(expr, "only = and != compare with none")
+            self.value = None
+        elif self.kind == "string":
+            self.value = raw
+        elif self.kind in _ENUMS:
+            if op not in ("=", "!="):
+                raise InvalidCondition(expr, "only = and != apply to this field")
+            try:
+                self.value = _ENUMS[self.kind][raw.lower()]
+            except KeyError:
+                choices = ", ".join(_ENUMS[self.kind].values())
+                raise InvalidCondition(expr, f"expected one of {choices}")
+        else:
+            self.value = _parse_when(raw)
+
+    def __str__(self):
+        return f"{self.field} {self.op} {_quote(self.raw)}"
+
+    def conditions(self):
+        yield self
+
+    def odata(self):
+        """Return the OData $filter form, or None if Graph cannot evaluate it.
+
+        Comparisons with none and ordering of titles are checked locally.
+        """
+        if self.value is None:
+            return None
+        if self.op == "~":
+            return f"contains(title,'{wrapper._escape_odata_string(self.value)}')"
+        op = _ODATA_OPERATORS[self.op]
+        if self.kind == "string":
+            if op not in ("eq", "ne"):
+                return None
+            return f"title {op} '{wrapper._escape_odata_string(self.value)}'"
+        if self.kind in _ENUMS:
+            return f"{self.property} {op} '{self.value}'"
+        utc = self.value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        if self.kind == "timestamp":
+            return f"{self.property} {op} {utc}Z"
+        return f"{self.property}/dateTime {op} '{utc}'"
+
+    def plan(self):
+        odata = self.odata()
+        return (odata, None) if odata else (None, self)
+
+    def matches(self, record):
+        """Evaluate this condition on a raw task dict."""
+        actual = record.get(self.property)
+        if self.kind in ("datetime", "timestamp"):
+            actual = api_timestamp_to_datetime(actual) if actual else None
+            expected = self.value.astimezone() if self.value else None
+        elif self.kind == "string":
+            actual, expected = (actual or "").lower(), self.value.lower()
+        else:
+            expected = self.value
+
+        if self.op == "~":
+            return expected in actual
+        if self.op == "=":
+            return actual == expected
+        if self.op == "!=":
+            return actual != expected
+        if actual is None:
+            return False
+        return {
+            "<": actual < expected,
+            "<=": actual <= expected,
+            ">": actual > expected,
+            ">=": actual >= expected,
+        }[self.op]
+
+
+class And:
+    def __init__(self, operands):
+        self.operands = operands
+
+    def __str__(self):
+        return " and ".join(_group(operand, Or) for operand in self.operands)
+
+    def conditions(self):
+        for operand in self.operands:
+            yield from operand.conditions()
+
+    def plan(self):
+        pushed, residual = [], []
+        for operand in self.operands:
+            odata, rest = operand.plan()
+            if odata:
+                pushed.append(f"({odata})" if " or " in odata else odata)
+            if rest is not None:
+                residual.append(rest)
+        residual_node = None
+        if residual:
+            residual_node = residual[0] if len(residual) == 1 else And(residual)
+        return " and ".join(pushed) or None, residual_node
+
+    def matches(self, record):
+        return all(operand.matches(record) for operand in self.operands)
+
+
+class Or:
+    def __init__(self, operands):
+        self.operands = operands
+
+    def __str__(self):
+        return " or ".join(_group(operand, And) for operand in self.operands)
+
+    def conditions(self):
+        for operand in self.operands:
+            yield from operand.conditions()
+
+    def plan(self):
+        parts = [operand.plan() for operand in self.operands]
+        if all(odata and rest is None for odata, rest in parts):
+            return " or ".join(f"({odata})" for odata, _ in parts), None
+        return None, self
+
+    def matches(self, record):
+        return any(operand.matches(record) for operand in self.operands)
+
+
+class Not:
+    def __init__(self, operand):
+        self.operand = operand
+
+    def __str__(self):
+        return f"not {_group(self.operand, (And, Or))}"
+
+    def conditions(self):
+        yield from self.operand.conditions()
+
+    def plan(self):
+        return None, self
+
+    def matches(self, record):
+        return not self.operand.matches(record)
+
+
+def _group(node, kinds):
+    return f"({node})" if isinstance(node, kinds) else str(node)
+
+
+def _tokenize(text):
+    tokens, pos = [], 0
+    while pos < len(text):
+        if text[pos:].isspace():
+            break
+        match = _TOKEN_RE.match(text, pos)
+        if not match or match.end() == pos:
+            raise InvalidCondition(text, f"unexpected character at {pos + 1}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind in ("dquoted", "squoted"):
+            kind, value = "value", re.sub(r"\\(.)", r"\1", value)
+        elif kind == "word" and value.lower() in KEYWORDS:
+            kind, value = "keyword", value.lower()
+        tokens.append((kind, value))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    def __init__(self, text):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.pos = 0
+
+    def _peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def _next(self):
+        token = self._peek()
+        self.pos += 1
+        return token
+
+    def _error(self, reason):
+        return InvalidCondition(self.text, reason)
+
+    def parse(self):
+        if not self.tokens:
+            raise self._error("empty query")
+        node = self._or()
+        if self.pos < len(self.tokens):
+            raise self._error(f"unexpected '{self._peek()[1]}'")
+        return node
+
+    def _or(self):
+        operands = [self._and()]
+        while self._peek() == ("keyword", "or"):
+            self._next()
+            operands.append(self._and())
+        return operands[0] if len(operands) == 1 else Or(operands)
+
+    def _and(self):
+        operands = [self._not()]
+        while self._peek() == ("keyword", "and"):
+            self._next()
+            operands.append(self._not())
+        return operands[0] if len(operands) == 1 else And(operands)
+
+    def _not(self):
+        if self._peek() == ("keyword", "not"):
+            self._next()
+            return Not(self._not())
+        return self._primary()
+
+    def _primary(self):
+        kind, value = self._next()
+        if (kind, value) == ("paren", "("):
+            node = self._or()
+            if self._next() != ("paren", ")"):
+                raise self._error("missing ')'")
+            return node
+        if kind != "word":
+            raise self._error("expected a field name" if kind else "unexpected end")
+        field = value
+        kind, op = self._next()
+        if kind != "op":
+            raise self._error(f"expected an operator after '{field}'")
+        kind, raw = self._peek()
+        if kind in ("word", "value", "keyword"):
+            self._next()
+        else:
+            # FIELD OP with nothing after it compares with the empty value
+            raw = ""
+        return Condition(field, op, raw, expr=self.text)
+
+
+def parse_query(text):
+    """Parse a query into a tree of Condition/And/Or/Not nodes.
+
+    Raises InvalidCondition with the reason when the query is malformed.
+    """
+    return _Parser(text).parse()
+
+
+class Selection:
+    """A parsed query (several are combined with "and"), planned once."""
+
+    def __init__(self, exprs):
+        if isinstance(exprs, str):
+            exprs = [exprs]
+        nodes = [parse_query(expr) for expr in exprs]
+        self.query = nodes[0] if len(nodes) == 1 else And(nodes)
+        self.conditions = list(self.query.conditions())
+        self._odata, self.residual = self.query.plan()
+
+    def odata_filter(self):
+        """The $filter expression Graph evaluates, or None."""
+        return self._odata
+
+    def matches(self, record):
+        """Evaluate the residual part on a raw task dict."""
+        return self.residual is None or self.residual.matches(record)
+
+    def mentions(self, *fields):
+        return any(c.field in fields for c in self.conditions)
+
+
+def select_tasks(list_id, selection, include_completed=True):
+    """Yield raw task dicts of a list matching selection, page by page."""
+    records = wrapper.iter_task_records(
+        list_id, include_completed, odata_filter=selection.odata_filter()
+    )
+    for record in records:
+        if selection.matches(record):
+            yield record
+
+
+class QueryStats:
+    """What a query fetched, for --explain."""
+
+    def __init__(self):
+        self.lists = 0
+        self.pages = 0
+        self.bytes = 0
+        self.scanned = 0
+        self.matched = 0
+
+    def count_response(self, response, *args, **kwargs):
+        self.pages += 1
+        self.bytes += len(response.content)
+
+    def to_dict(self):
+        return dict(vars(self))
+
+
+def find_tasks(selection, list_ids, stats=None, select=None):
+    """Yield (list_id, task dict) for tasks of list_ids matching selection.
+
+    Completed tasks are only fetched when the query mentions status or
+    completed. With stats, responses of the current session are counted.
+    select limits the properties fetched; those the query tests are added.
+    """
+    include_completed = selection.mentions("status", "completed")
+    if select is not None:
+        tested = [condition.property for condition in selection.conditions]
+        select = ",".join(dict.fromkeys(select.split(",") + tested))
+    session = wrapper.get_oauth_session()
+    if stats is not None:
+        session.hooks["response"].append(stats.count_response)
+    try:
+        for list_id in list_ids:
+            if stats is not None:
+                stats.lists += 1
+            records = wrapper.iter_task_records(
+                list_id,
+                include_completed,
+                odata_filter=selection.odata_filter(),
+                select=select,
+            )
+            for record in records:
+                if stats is not None:
+                    stats.scanned += 1
+                if selection.matches(record):
+                    if stats is not None:
+                        stats.matched += 1
+                    yield list_id, record
+    finally:
+        if stats is not None:
+            session.hooks["response"].remove(stats.count_response)
+
+
+# --set fields -> keyword of wrapper.task_update_body
+ASSIGNABLE = ("title", "due", "reminder", "important", "recurrence")
+
+
+def parse_assignments(items):
+    """Turn ["due=tomorrow", "important=no", ...] into task_update_body kwargs.
+
+    The value "none" clears due, reminder and recurrence.
+    """
+    kwargs = {}
+    for item in items:
+        field, sep, value = item.partition("=")
+        field, value = field.strip(), value.strip()
+        if not sep or field not in ASSIGNABLE:
+            raise InvalidAssignment(
+                item, f"expected FIELD=VALUE with FIELD one of {', '.join(ASSIGNABLE)}"
+            )
+        clears = value.lower() in NONE_VALUES
+        if field == "title":
+            if not value:
+                raise InvalidAssignment(item, "title cannot be empty")
+            kwargs["title"] = value
+        elif field == "important":
+            if value.lower() in ("yes", "true", "1", "on"):
+                kwargs["important"] = True
+            elif value.lower() in ("no", "false", "0", "off"):
+                kwargs["important"] = False
+            else:
+                raise InvalidAssignment(item, "expected yes or no")
+        elif field == "recurrence":
+            if clears:
+                kwargs["clear_recurrence"] = True
+            else:
+                kwargs["recurrence"] = parse_recurrence(value)
+        elif clears:
+            kwargs[f"clear_{field}"] = True
+        else:
+            kwargs[f"{field}_datetime"] = parse_datetime(value)
+    return kwargs
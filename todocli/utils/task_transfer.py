@@ -0,0 +1,158 @@
+"""
+Copying and moving tasks between lists.
+
+Graph has no move operation, so a task is recreated in the target list with
+its note, steps, links and attachments. Source tasks are read with their
+steps and links expanded, one $batch request per 20 tasks; attachment
+metadata is read only for tasks that have attachments. Copies are created
+in $batch requests with their steps and links chained after them
+(dependsOn), and attachments are copied file by file. A copy counts as
+verified only when every request creating it succeeded; only then is the
+source deleted (for a move). An incomplete copy is deleted again so a retry
+does not leave duplicates behind.
+"""
+
+import os
+import tempfile
+
+import todocli.graphapi.wrapper as wrapper
+from todocli.graphapi.oauth import get_oauth_session
+from todocli.utils import task_import
+from todocli.utils.backup import creation_bodies
+
+
+def _read_sources(list_id, task_ids):
+    """Task, steps, links and attachments of each task, by task id."""
+    details = wrapper.get_tasks_expanded_batch(list_id, task_ids)
+    with_files = [tid for tid in task_ids if details[tid]["task"].get("hasAttachments")]
+    attachments = wrapper.get_task_parts_batch(list_id, with_files, ["attachments"])
+    for task_id in task_ids:
+        details[task_id]["attachments"] = attachments.get(task_id, {}).get(
+            "attachments", []
+        )
+    return details
+
+
+def _copy_attachments(source_list_id, source_task_id, list_id, task_id, atts):
+    """Copy attachment contents to the new task. Returns an error or None."""
+    if not atts:
+        return None
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for att in atts:
+            path = os.path.join(temp_dir, att["id"])
+            try:
+                wrapper.download_attachment(
+                    attachment_id=att["id"],
+                    output_path=path,
+                    list_id=source_list_id,
+                    task_id=source_task_id,
+                )
+                wrapper.create_attachment(
+                    path, list_id=list_id, task_id=task_id, file_name=att["name"]
+                )
+            except Exception as e:
+                return f"Attachment '{att['name']}': {e}"
+            finally:
+                if os.path.exists(path):
+                    os.remove(path)
+    return None
+
+
+def _delete_batch(session, targets):
+    """DELETE [(list_id, task_id)] in $batch requests.
+
+    Returns {(list_id, task_id): error message or None}.
+    """
+    errors = {}
+    for start in range(0, len(targets), wrapper.BATCH_MAX_REQUESTS):
+        chunk = targets[start : start + wrapper.BATCH_MAX_REQUESTS]
+        sub_requests = [
+            {
+                "id": str(i),
+                "method": "DELETE",
+                "url": f"{wrapper.BASE_RELATE_URL}/{list_id}/tasks/{task_id}",
+            }
+            for i, (list_id, task_id) in enumerate(chunk)
+        ]
+        try:
+            responses = wrapper._send_batch(session, sub_requests)
+        except Exception as e:
+            responses = {}
+            for target in chunk:
+                errors[target] = str(e)
+        for i, target in enumerate(chunk):
+            resp = responses.get(str(i))
+            if resp is None:
+                errors.setdefault(target, "No response for this task")
+            elif resp.get("status", 500) >= 400:
+                errors[target] = wrapper._batch_error_message(resp)
+            else:
+                errors[target] = None
+    return errors
+
+
+def transfer(source_list_id, task_ids, target_list_id, move=False):
+    """Copy (or move) tasks to another list with everything attached to them.
+
+    Tasks are handled one $batch worth at a time. Returns one dict per task
+    in input order: {"id", "new_id", "title", "ok", "error"}; new_id is None
+    when no verified copy exists.
+    """
+    task_ids = list(dict.fromkeys(task_ids))
+    session = get_oauth_session()
+    results = []
+
+    for start in range(0, len(task_ids), wrapper.BATCH_MAX_REQUESTS):
+        chunk = task_ids[start : start + wrapper.BATCH_MAX_REQUESTS]
+        details = _read_sources(source_list_id, chunk)
+
+        items, links = [], {}
+        for n, task_id in enumerate(chunk):
+            parts = details[task_id]
+            record = dict(parts["task"], steps=parts["steps"], links=parts["links"])
+            body, steps, links[n] = creation_bodies(record)
+            items.append((n, target_list_id, body, steps, None))
+        created = task_import.create_task_batch(session, items, links=links)
+
+        chunk_results = []
+        for n, task_id in enumerate(chunk):
+            new_id, error = created[n]
+            if new_id and not error:
+                error = _copy_attachments(
+                    source_list_id,
+                    task_id,
+                    target_list_id,
+                    new_id,
+                    details[task_id]["attachments"],
+                )
+            chunk_results.append(
+                {
+                    "id": task_id,
+                    "new_id": new_id,
+                    "title": details[task_id]["task"].get("title", ""),
+                    "ok": bool(new_id) and not error,
+                    "error": error,
+                }
+            )
+
+        # Sources of verified copies go (for a move); incomplete copies go too
+        to_delete = [
+            (source_list_id, r["id"]) if r["ok"] else (target_list_id, r["new_id"])
+            for r in chunk_results
+            if (r["ok"] and move) or (r["new_id"] and not r["ok"])
+        ]
+        deleted = _delete_batch(session, to_delete)
+        for r in chunk_results:
+            if r["ok"] and move:
+                error = deleted[(source_list_id, r["id"])]
+                if error:
+                    r["ok"] = False
+                    r["error"] = f"Copied, but the source was not deleted: {error}"
+                else:
+                    wrapper._forget_task(source_list_id, r["id"], removed=True)
+            elif r["new_id"] and not r["ok"]:
+                if deleted[(target_list_id, r["new_id"])] is None:
+                    r["new_id"] = None
+        results.extend(chunk_results)
+
+    return results